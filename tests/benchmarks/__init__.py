@@ -0,0 +1,45 @@
+"""
+Benchmarks for the package (throughput tracking per release).
+
+Benchmarks require `pytest-benchmark` package (`pip install .[benchmark]`).
+Baselines (results of benchmarks for each release) are stored in `tests/benchmarks/baseline` directory
+(separately for each platform and Python version).
+
+End-to-end transport benchmarks (`tests/benchmarks/can/test_transport_interface.py`) transmit diagnostic messages
+between two Transport Interfaces connected by python-can virtual bus. Apart from timing, they report
+(in `extra_info` of the results) messages/s, bytes/s, CPU time and latency percentiles (p50, p90, p99).
+Run them separately:
+
+    pytest tests/benchmarks/can/test_transport_interface.py --benchmark-json=transport_benchmarks.json
+
+Translator benchmarks (`tests/benchmarks/translator`) encode and decode example messages of all services
+supported by base translators. Apart from timing, they report (in `extra_info` of the results) memory allocated
+(peak number of bytes) by a single encoding/decoding.
+
+Compare with the latest baseline (fail if mean time got worse by more than 25%):
+
+    pytest tests/benchmarks --benchmark-storage=tests/benchmarks/baseline --benchmark-compare \
+--benchmark-compare-fail=mean:25%
+
+Save the baseline for a release:
+
+    pytest tests/benchmarks --benchmark-storage=tests/benchmarks/baseline --benchmark-save=<version>
+
+Create the comparison report for all releases:
+
+    pytest-benchmark --storage tests/benchmarks/baseline compare --group-by=fullname --csv=benchmarks_comparison
+"""
+
+from .common import (
+    ADDRESSING_FORMATS,
+    ADDRESSING_FORMATS_IDS,
+    DLCS,
+    DLCS_IDS,
+    HEAVY_ROUNDS,
+    MESSAGE_SIZES,
+    MESSAGE_SIZES_IDS,
+    make_message,
+    make_packets_records,
+    measure_allocated_memory,
+    run_benchmark,
+)
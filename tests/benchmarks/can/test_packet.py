@@ -0,0 +1,127 @@
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from tests.benchmarks import (
+    ADDRESSING_FORMATS,
+    ADDRESSING_FORMATS_IDS,
+    DLCS,
+    DLCS_IDS,
+    make_message,
+    make_packets_records,
+    run_benchmark,
+)
+from tests.conftest import make_can_addressing_information
+
+from uds.can import CanFlowStatus, CanPacket, CanPacketRecord, CanPacketType, CanSegmenter
+
+PACKET_TYPES = [CanPacketType.SINGLE_FRAME,
+                CanPacketType.FIRST_FRAME,
+                CanPacketType.CONSECUTIVE_FRAME,
+                CanPacketType.FLOW_CONTROL]
+PACKET_TYPES_IDS = ["SF", "FF", "CF", "FC"]
+
+
+def get_example_packet(addressing_format, dlc, packet_type):
+    """
+    Get example CAN packet.
+
+    :param addressing_format: CAN Addressing Format of the packet.
+    :param dlc: DLC of the packet.
+    :param packet_type: Type of the packet.
+
+    :return: CAN packet with provided attributes.
+    """
+    segmenter = CanSegmenter(addressing_information=make_can_addressing_information(addressing_format), dlc=dlc)
+    if packet_type == CanPacketType.FLOW_CONTROL:
+        return segmenter.get_flow_control_packet(flow_status=CanFlowStatus.ContinueToSend, block_size=8, st_min=1)
+    if packet_type == CanPacketType.SINGLE_FRAME:
+        return segmenter.segmentation(make_message(2))[0]
+    packets = segmenter.segmentation(make_message(4 * 1024))
+    return packets[0] if packet_type == CanPacketType.FIRST_FRAME else packets[1]
+
+
+def get_packet_kwargs(packet):
+    """
+    Get arguments for creating a copy of provided CAN packet.
+
+    :param packet: CAN packet to copy.
+
+    :return: Keyword arguments for :class:`~uds.can.packet.can_packet.CanPacket` class.
+    """
+    kwargs = {
+        "addressing_format": packet.addressing_format,
+        "packet_type": packet.packet_type,
+        "addressing_type": packet.addressing_type,
+        "can_id": packet.can_id,
+        "target_address": packet.target_address,
+        "source_address": packet.source_address,
+        "address_extension": packet.address_extension,
+        "dlc": packet.dlc,
+    }
+    if packet.packet_type == CanPacketType.SINGLE_FRAME:
+        kwargs["payload"] = packet.payload
+    elif packet.packet_type == CanPacketType.FIRST_FRAME:
+        kwargs.update(payload=packet.payload, data_length=packet.data_length)
+    elif packet.packet_type == CanPacketType.CONSECUTIVE_FRAME:
+        kwargs.update(payload=packet.payload, sequence_number=packet.sequence_number)
+    else:
+        kwargs.update(flow_status=packet.flow_status, block_size=packet.block_size, st_min=packet.st_min)
+    return kwargs
+
+
+def access_properties(packet_record):
+    """Access all properties of CAN packet record."""
+    return (packet_record.can_id,
+            packet_record.raw_frame_data,
+            packet_record.dlc,
+            packet_record.addressing_format,
+            packet_record.addressing_type,
+            packet_record.target_address,
+            packet_record.source_address,
+            packet_record.address_extension,
+            packet_record.packet_type,
+            packet_record.data_length,
+            packet_record.sequence_number,
+            packet_record.flow_status,
+            packet_record.block_size,
+            packet_record.st_min,
+            packet_record.payload,
+            packet_record.direction,
+            packet_record.transmission_time,
+            packet_record.transmission_timestamp)
+
+
+class TestCanPacketBenchmark:
+    """Benchmarks for `CanPacket` class."""
+
+    @pytest.mark.parametrize("packet_type", PACKET_TYPES, ids=PACKET_TYPES_IDS)
+    @pytest.mark.parametrize("dlc", DLCS, ids=DLCS_IDS)
+    @pytest.mark.parametrize("addressing_format", ADDRESSING_FORMATS, ids=ADDRESSING_FORMATS_IDS)
+    def test_init(self, benchmark, addressing_format, dlc, packet_type):
+        packet = get_example_packet(addressing_format=addressing_format, dlc=dlc, packet_type=packet_type)
+        kwargs = get_packet_kwargs(packet)
+        new_packet = run_benchmark(benchmark, lambda: CanPacket(**kwargs))
+        assert new_packet.raw_frame_data == packet.raw_frame_data
+
+
+class TestCanPacketRecordBenchmark:
+    """Benchmarks for `CanPacketRecord` class."""
+
+    @pytest.mark.parametrize("packet_type", PACKET_TYPES, ids=PACKET_TYPES_IDS)
+    @pytest.mark.parametrize("dlc", DLCS, ids=DLCS_IDS)
+    @pytest.mark.parametrize("addressing_format", ADDRESSING_FORMATS, ids=ADDRESSING_FORMATS_IDS)
+    def test_init(self, benchmark, addressing_format, dlc, packet_type):
+        packet = get_example_packet(addressing_format=addressing_format, dlc=dlc, packet_type=packet_type)
+        packet_record = run_benchmark(benchmark, lambda: make_packets_records([packet])[0])
+        assert isinstance(packet_record, CanPacketRecord)
+        assert packet_record.raw_frame_data == packet.raw_frame_data
+
+    @pytest.mark.parametrize("packet_type", PACKET_TYPES, ids=PACKET_TYPES_IDS)
+    @pytest.mark.parametrize("dlc", DLCS, ids=DLCS_IDS)
+    @pytest.mark.parametrize("addressing_format", ADDRESSING_FORMATS, ids=ADDRESSING_FORMATS_IDS)
+    def test_properties(self, benchmark, addressing_format, dlc, packet_type):
+        packet = get_example_packet(addressing_format=addressing_format, dlc=dlc, packet_type=packet_type)
+        packet_record = make_packets_records([packet])[0]
+        values = run_benchmark(benchmark, access_properties, packet_record)
+        assert values[1] == packet.raw_frame_data
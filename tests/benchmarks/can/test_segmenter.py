@@ -0,0 +1,46 @@
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from tests.benchmarks import (
+    ADDRESSING_FORMATS,
+    ADDRESSING_FORMATS_IDS,
+    DLCS,
+    DLCS_IDS,
+    MESSAGE_SIZES,
+    MESSAGE_SIZES_IDS,
+    make_message,
+    make_packets_records,
+    run_benchmark,
+)
+from tests.conftest import make_can_addressing_information
+
+from uds.can import CanSegmenter
+from uds.message import UdsMessageRecord
+
+HEAVY_MESSAGE_SIZE = 1024 * 1024
+
+
+class TestCanSegmenterBenchmark:
+    """Benchmarks for `CanSegmenter` class."""
+
+    @pytest.mark.parametrize("size", MESSAGE_SIZES, ids=MESSAGE_SIZES_IDS)
+    @pytest.mark.parametrize("dlc", DLCS, ids=DLCS_IDS)
+    @pytest.mark.parametrize("addressing_format", ADDRESSING_FORMATS, ids=ADDRESSING_FORMATS_IDS)
+    def test_segmentation(self, benchmark, addressing_format, dlc, size):
+        segmenter = CanSegmenter(addressing_information=make_can_addressing_information(addressing_format), dlc=dlc)
+        message = make_message(size)
+        packets = run_benchmark(benchmark, segmenter.segmentation, message, heavy=size >= HEAVY_MESSAGE_SIZE)
+        assert sum(len(packet.payload) for packet in packets if packet.payload is not None) >= size
+
+    @pytest.mark.parametrize("size", MESSAGE_SIZES, ids=MESSAGE_SIZES_IDS)
+    @pytest.mark.parametrize("dlc", DLCS, ids=DLCS_IDS)
+    @pytest.mark.parametrize("addressing_format", ADDRESSING_FORMATS, ids=ADDRESSING_FORMATS_IDS)
+    def test_desegmentation(self, benchmark, addressing_format, dlc, size):
+        segmenter = CanSegmenter(addressing_information=make_can_addressing_information(addressing_format), dlc=dlc)
+        message = make_message(size)
+        packets_records = make_packets_records(segmenter.segmentation(message))
+        message_record = run_benchmark(benchmark, segmenter.desegmentation, packets_records,
+                                       heavy=size >= HEAVY_MESSAGE_SIZE)
+        assert isinstance(message_record, UdsMessageRecord)
+        assert message_record.payload == bytes(message.payload)
@@ -0,0 +1,207 @@
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from asyncio import gather, new_event_loop
+from itertools import count
+from queue import Queue
+from statistics import quantiles
+from threading import Event, Thread
+from time import perf_counter, process_time
+
+from tests.benchmarks import make_message
+from tests.conftest import make_can_addressing_information
+
+from can import Bus
+from uds.can import CanAddressingFormat, CanVersion, DefaultFlowControlParametersGenerator, PythonCanTransportInterface
+
+ROUNDS = 10
+"""Number of measured transmissions of diagnostic message in each transport benchmark."""
+WARMUP_ROUNDS = 1
+"""Number of transmissions of diagnostic message (in each transport benchmark) that are excluded from statistics."""
+TRANSPORT_MESSAGE_SIZES = [1, 64, 4 * 1024]
+"""Sizes (number of payload bytes) of diagnostic messages to transmit."""
+TRANSPORT_MESSAGE_SIZES_IDS = ["1B", "64B", "4KB"]
+"""Names of benchmarks parameters with sizes of transmitted diagnostic messages."""
+FLOW_CONTROL_PARAMETERS = [(0, 0), (8, 0), (8, 0xF5)]
+"""Block Size and STmin values (used by the receiving peer) to benchmark."""
+FLOW_CONTROL_PARAMETERS_IDS = ["BS0_STmin0", "BS8_STmin0", "BS8_STmin500us"]
+"""Names of benchmarks parameters with Block Size and STmin values."""
+CAN_CONFIGURATIONS = [(CanVersion.CLASSIC_CAN, 8), (CanVersion.CAN_FD, 15)]
+"""CAN versions and DLC values to benchmark."""
+CAN_CONFIGURATIONS_IDS = ["CAN", "CAN_FD"]
+"""Names of benchmarks parameters with CAN versions and DLC values."""
+TIMEOUT = 5000
+"""Timeout [ms] for receiving a diagnostic message."""
+
+_channels_counter = count()
+
+
+class TransportInterfacesPair:
+    """
+    Two Transport Interfaces connected using python-can virtual bus.
+
+    The first one (client) sends diagnostic messages, the second one (peer) receives them and sends Flow Control.
+    """
+
+    def __init__(self, can_version, dlc, block_size, st_min):
+        """
+        Create Transport Interfaces on a new virtual bus channel.
+
+        :param can_version: CAN version to use by both Transport Interfaces.
+        :param dlc: Base DLC to use by both Transport Interfaces.
+        :param block_size: Block Size value to use in Flow Control sent by the peer.
+        :param st_min: STmin value to use in Flow Control sent by the peer.
+        """
+        channel = f"benchmark-{next(_channels_counter)}"
+        addressing_information = make_can_addressing_information(CanAddressingFormat.NORMAL_ADDRESSING)
+        self.buses = (Bus(channel=channel, interface="virtual", receive_own_messages=True),
+                      Bus(channel=channel, interface="virtual", receive_own_messages=True))
+        self.client = PythonCanTransportInterface(network_manager=self.buses[0],
+                                                  addressing_information=addressing_information,
+                                                  can_version=can_version,
+                                                  dlc=dlc)
+        fc_generator = DefaultFlowControlParametersGenerator(block_size=block_size, st_min=st_min)
+        self.peer = PythonCanTransportInterface(network_manager=self.buses[1],
+                                                addressing_information=addressing_information.get_other_end(),
+                                                flow_control_parameters_generator=fc_generator,
+                                                can_version=can_version,
+                                                dlc=dlc)
+        self.latencies = []
+        self.cpu_times = []
+
+    def close(self):
+        """Release Transport Interfaces and virtual bus."""
+        for transport_interface in (self.client, self.peer):
+            transport_interface.__del__()
+        for bus in self.buses:
+            bus.shutdown()
+
+    def measure(self, function, *args):
+        """
+        Call function and collect its latency and CPU time.
+
+        :param function: Function that transmits a diagnostic message.
+        :param args: Arguments for the function.
+
+        :return: Value returned by the function.
+        """
+        start_cpu_time = process_time()
+        start_time = perf_counter()
+        result = function(*args)
+        self.latencies.append(perf_counter() - start_time)
+        self.cpu_times.append(process_time() - start_cpu_time)
+        return result
+
+    def get_statistics(self, message_size):
+        """
+        Get statistics of measured transmissions.
+
+        :param message_size: Number of payload bytes in each transmitted diagnostic message.
+
+        :return: Dictionary with throughput, CPU time and latency percentiles.
+            Empty if there are not enough samples (e.g. when benchmarks are disabled and run only once).
+        """
+        latencies = self.latencies[WARMUP_ROUNDS:]
+        cpu_times = self.cpu_times[WARMUP_ROUNDS:]
+        if len(latencies) < 2:
+            return {}
+        total_time = sum(latencies)
+        percentiles = quantiles(latencies, n=100, method="inclusive")
+        return {
+            "messages_per_second": len(latencies) / total_time,
+            "bytes_per_second": message_size * len(latencies) / total_time,
+            "cpu_time": sum(cpu_times) / len(cpu_times),
+            "latency_p50": percentiles[49],
+            "latency_p90": percentiles[89],
+            "latency_p99": percentiles[98],
+        }
+
+
+class SyncTransportInterfacesPair(TransportInterfacesPair):
+    """Transport Interfaces pair that uses synchronous methods (the peer receives in a separate thread)."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.__received_messages = Queue()
+        self.__stop_event = Event()
+        self.__peer_thread = Thread(target=self.__receive_messages, daemon=True)
+        self.__peer_thread.start()
+
+    def __receive_messages(self):
+        """Receive diagnostic messages by the peer until stopped."""
+        while not self.__stop_event.is_set():
+            try:
+                self.__received_messages.put(self.peer.receive_message(start_timeout=100, end_timeout=TIMEOUT))
+            except TimeoutError:
+                pass
+
+    def close(self):
+        self.__stop_event.set()
+        self.__peer_thread.join()
+        super().close()
+
+    def transfer(self, message):
+        """
+        Send diagnostic message by the client and wait until the peer receives it.
+
+        :param message: Diagnostic message to send.
+
+        :return: Record of the diagnostic message received by the peer.
+        """
+        self.client.send_message(message)
+        return self.__received_messages.get(timeout=TIMEOUT / 1000.)
+
+
+class AsyncTransportInterfacesPair(TransportInterfacesPair):
+    """Transport Interfaces pair that uses asynchronous methods."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.__loop = new_event_loop()
+
+    def close(self):
+        super().close()
+        self.__loop.close()
+
+    async def __transfer(self, message):
+        received_message, _ = await gather(self.peer.async_receive_message(start_timeout=TIMEOUT,
+                                                                           end_timeout=TIMEOUT),
+                                           self.client.async_send_message(message))
+        return received_message
+
+    def transfer(self, message):
+        """
+        Send diagnostic message by the client and wait until the peer receives it.
+
+        :param message: Diagnostic message to send.
+
+        :return: Record of the diagnostic message received by the peer.
+        """
+        return self.__loop.run_until_complete(self.__transfer(message))
+
+
+@pytest.mark.parametrize("size", TRANSPORT_MESSAGE_SIZES, ids=TRANSPORT_MESSAGE_SIZES_IDS)
+@pytest.mark.parametrize("block_size, st_min", FLOW_CONTROL_PARAMETERS, ids=FLOW_CONTROL_PARAMETERS_IDS)
+@pytest.mark.parametrize("can_version, dlc", CAN_CONFIGURATIONS, ids=CAN_CONFIGURATIONS_IDS)
+class TestPythonCanTransportInterfaceBenchmark:
+    """End-to-end benchmarks for `PythonCanTransportInterface` class (using python-can virtual bus)."""
+
+    @staticmethod
+    def _run_transport_benchmark(benchmark, pair, size):
+        message = make_message(size)
+        try:
+            message_record = benchmark.pedantic(pair.measure, args=(pair.transfer, message),
+                                                rounds=ROUNDS, iterations=1, warmup_rounds=WARMUP_ROUNDS)
+        finally:
+            pair.close()
+        assert message_record.payload == bytes(message.payload)
+        benchmark.extra_info.update(pair.get_statistics(size))
+
+    def test_send_receive(self, benchmark, can_version, dlc, block_size, st_min, size):
+        pair = SyncTransportInterfacesPair(can_version=can_version, dlc=dlc, block_size=block_size, st_min=st_min)
+        self._run_transport_benchmark(benchmark, pair, size)
+
+    def test_async_send_receive(self, benchmark, can_version, dlc, block_size, st_min, size):
+        pair = AsyncTransportInterfacesPair(can_version=can_version, dlc=dlc, block_size=block_size, st_min=st_min)
+        self._run_transport_benchmark(benchmark, pair, size)
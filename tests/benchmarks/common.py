@@ -0,0 +1,100 @@
+"""Common configuration and helpers of benchmarks."""
+
+from datetime import datetime
+from time import perf_counter
+from tracemalloc import get_traced_memory, is_tracing, reset_peak, start, stop
+
+from can import Message as PythonCanFrame
+from uds.addressing import AddressingType, TransmissionDirection
+from uds.can import CanAddressingFormat, CanPacketRecord
+from uds.message import UdsMessage
+
+ADDRESSING_FORMATS = list(CanAddressingFormat)
+"""CAN Addressing Formats to benchmark."""
+ADDRESSING_FORMATS_IDS = [addressing_format.name for addressing_format in ADDRESSING_FORMATS]
+"""Names of benchmarks parameters with CAN Addressing Formats."""
+DLCS = [8, 15]
+"""DLC values to benchmark (CAN and CAN FD with 64 data bytes)."""
+DLCS_IDS = ["CAN", "CAN_FD"]
+"""Names of benchmarks parameters with DLC values."""
+MESSAGE_SIZES = [1, 4 * 1024, 1024 * 1024]
+"""Sizes (number of payload bytes) of diagnostic messages to benchmark."""
+MESSAGE_SIZES_IDS = ["1B", "4KB", "1MB"]
+"""Names of benchmarks parameters with sizes of diagnostic messages."""
+HEAVY_ROUNDS = 3
+"""Number of rounds for benchmarks which single iteration takes longer than a second."""
+
+
+def run_benchmark(benchmark, function, *args, heavy=False):
+    """
+    Benchmark function call.
+
+    :param benchmark: Fixture provided by pytest-benchmark.
+    :param function: Function to benchmark.
+    :param args: Arguments for the function.
+    :param heavy: Whether the function call is slow (it is called only a few times then).
+
+    :return: Value returned by the function.
+    """
+    if heavy:
+        return benchmark.pedantic(function, args=args, rounds=HEAVY_ROUNDS, iterations=1)
+    return benchmark(function, *args)
+
+
+def measure_allocated_memory(function, *args):
+    """
+    Measure memory allocated during a single function call.
+
+    :param function: Function to measure.
+    :param args: Arguments for the function.
+
+    :return: Peak number of bytes allocated (and not yet released) during the call.
+    """
+    tracing = is_tracing()
+    if not tracing:
+        start()
+    try:
+        initial_memory, _ = get_traced_memory()
+        reset_peak()
+        function(*args)
+        _, peak_memory = get_traced_memory()
+    finally:
+        if not tracing:
+            stop()
+    return peak_memory - initial_memory
+
+
+def make_message(size, addressing_type=AddressingType.PHYSICAL):
+    """
+    Create diagnostic message.
+
+    :param size: Number of payload bytes.
+    :param addressing_type: Addressing type of the message.
+
+    :return: Diagnostic message with provided number of payload bytes.
+    """
+    return UdsMessage(payload=b"\x36" + bytes(i & 0xFF for i in range(size - 1)), addressing_type=addressing_type)
+
+
+def make_packets_records(packets, direction=TransmissionDirection.RECEIVED):
+    """
+    Create records of CAN packets (as if they were transmitted).
+
+    :param packets: CAN packets to create records for.
+    :param direction: Transmission direction of the packets.
+
+    :return: List with CAN packets records.
+    """
+    transmission_time = datetime.now()
+    transmission_timestamp = perf_counter()
+    return [CanPacketRecord(frame=PythonCanFrame(arbitration_id=packet.can_id,
+                                                 data=packet.raw_frame_data,
+                                                 is_extended_id=packet.can_id > 0x7FF,
+                                                 is_fd=len(packet.raw_frame_data) > 8),
+                            direction=direction,
+                            addressing_type=packet.addressing_type,
+                            addressing_format=packet.addressing_format,
+                            transmission_time=transmission_time,
+                            transmission_timestamp=transmission_timestamp)
+            for packet in packets]
+
@@ -0,0 +1,56 @@
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from tests.benchmarks import (
+    ADDRESSING_FORMATS,
+    ADDRESSING_FORMATS_IDS,
+    DLCS,
+    DLCS_IDS,
+    MESSAGE_SIZES,
+    MESSAGE_SIZES_IDS,
+    make_message,
+    make_packets_records,
+    run_benchmark,
+)
+from tests.conftest import make_can_addressing_information
+
+from uds.can import CanSegmenter
+from uds.message import UdsMessageRecord
+
+HEAVY_MESSAGE_SIZE = 1024 * 1024
+
+
+def access_properties(message_record):
+    """Access all properties of diagnostic message record."""
+    return (message_record.payload,
+            message_record.addressing_type,
+            message_record.direction,
+            message_record.packets_records,
+            message_record.transmission_start_time,
+            message_record.transmission_end_time,
+            message_record.transmission_start_timestamp,
+            message_record.transmission_end_timestamp)
+
+
+class TestUdsMessageRecordBenchmark:
+    """Benchmarks for `UdsMessageRecord` class."""
+
+    @pytest.mark.parametrize("size", MESSAGE_SIZES, ids=MESSAGE_SIZES_IDS)
+    @pytest.mark.parametrize("dlc", DLCS, ids=DLCS_IDS)
+    @pytest.mark.parametrize("addressing_format", ADDRESSING_FORMATS, ids=ADDRESSING_FORMATS_IDS)
+    def test_init(self, benchmark, addressing_format, dlc, size):
+        segmenter = CanSegmenter(addressing_information=make_can_addressing_information(addressing_format), dlc=dlc)
+        packets_records = make_packets_records(segmenter.segmentation(make_message(size)))
+        message_record = run_benchmark(benchmark, UdsMessageRecord, packets_records,
+                                       heavy=size >= HEAVY_MESSAGE_SIZE)
+        assert len(message_record.payload) == size
+
+    @pytest.mark.parametrize("size", MESSAGE_SIZES, ids=MESSAGE_SIZES_IDS)
+    @pytest.mark.parametrize("dlc", DLCS, ids=DLCS_IDS)
+    def test_properties(self, benchmark, dlc, size):
+        segmenter = CanSegmenter(addressing_information=make_can_addressing_information(ADDRESSING_FORMATS[0]),
+                                 dlc=dlc)
+        message_record = UdsMessageRecord(make_packets_records(segmenter.segmentation(make_message(size))))
+        values = run_benchmark(benchmark, access_properties, message_record)
+        assert len(values[0]) == size
@@ -0,0 +1,208 @@
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from tests.benchmarks import measure_allocated_memory
+
+from uds.message import RequestSID, ResponseSID
+from uds.translator import BASE_TRANSLATOR_2013, BASE_TRANSLATOR_2020
+
+COMMON_PAYLOADS = [
+    # Diagnostic and Communication Management functional unit
+    "1082", "5004a1b2c3d4",
+    "1182", "5104ff",
+    "27dffb85a1", "67192d",
+    "2884cff1de", "6879",
+    "3eff", "7e80",
+    "850100", "c55a",
+    "878100", "c781",
+    # Data Transmission functional unit
+    "220000f184ffff", "622468123456789abcdef19513579cdff19500ff",
+    "2323f000120100", "63fb3ea7476782af2cb47aa5c432",
+    "24f188", "6442a8041123a5feff3f42516a748c91081001a043b123",
+    "2a020012ff", "6ac8f0e1d2c3b4a59687",
+    "2c01f3454321012bf19a1ed0", "6c03f369",
+    "2e928aa7bb3e0b1cbd6d76dc3ab9e8454d", "6e60fb",
+    "3d23f00012000aecfac927a3ec461cc772", "7dffd710a581f82e9ea6613bea76a37e1dab5b14f15047039ba040ef5c2899b0",
+    # Stored Data Transmission functional unit
+    "54",
+    # InputOutput Control functional unit
+    "2ff18d00", "6fcf400273a5ab16e4c88e33",
+    # Routine functional unit
+    "3182b97f93", "7181ffff00",
+    # Upload Download functional unit
+    "34f124803c577d97b1", "743f1a0e3d",
+    "352f243f578ae911c0", "75280075",
+    "36ffbfd1841de49afbdad713543cdc2c", "765f6d",
+    "37bfd184", "770069bf0e7bef080129dc85",
+]
+"""Example payloads (hex) of diagnostic messages that are compatible with ISO 14229-1:2020 and ISO 14229-1:2013."""
+PAYLOADS_2020 = COMMON_PAYLOADS + [
+    "14ffffff",
+    "19d5fe", "59835a6b7c20caffeec2",
+    "2903000a3c0380105e3a42207f3a000861b82d0da9155e53", "6906a287fa1dab9ce6c6ee26d37c5968a82cf00000",
+    "380100062f662e3132338c01b02c", "7803060000b670b271b2",
+    "8400795a0002f0b81627ec1e541ad6a4316d2c04", "c47ffad40000895804c7566365fe0cfc",
+    "8648ed7f", "c6090107960622",
+]
+"""Example payloads (hex) of diagnostic messages that are compatible with ISO 14229-1:2020."""
+PAYLOADS_2013 = COMMON_PAYLOADS + [
+    "14f0e1d2",
+    "1993fb", "5903a5b6c700caffeeff",
+    "8382", "c303e3",
+    "3804000866696c652e78797a00", "7804010cff00019de5",
+    "840019000000fedc7d", "c40000ff0005159d3fbfceb7e4ee",
+    "86c4e8", "c684010100ff00",
+]
+"""Example payloads (hex) of diagnostic messages that are compatible with ISO 14229-1:2013."""
+
+MAX_PAYLOAD_SIZE = 4095
+"""Maximal size of diagnostic message payload used in benchmarks."""
+
+
+def get_read_data_by_identifier_request(dids_number):
+    """Get ReadDataByIdentifier request payload with provided number of DIDs."""
+    return bytes([RequestSID.ReadDataByIdentifier]) + bytes([0xF1, 0x86]) * dids_number
+
+
+def get_read_data_by_identifier_response(dids_number):
+    """Get ReadDataByIdentifier positive response payload with provided number of DIDs."""
+    return bytes([ResponseSID.ReadDataByIdentifier]) + bytes([0xF1, 0x86, 0x03]) * dids_number
+
+
+def get_read_dtc_information_response(dtcs_number):
+    """Get ReadDTCInformation (reportDTCByStatusMask) positive response payload with provided number of DTCs."""
+    return (bytes([ResponseSID.ReadDTCInformation, 0x02, 0xFF])
+            + b"".join(bytes([0x12, dtc_index >> 8, dtc_index & 0xFF, 0x2F]) for dtc_index in range(dtcs_number)))
+
+
+def get_transfer_data_request(data_size):
+    """Get TransferData request payload with provided number of data bytes."""
+    return bytes([RequestSID.TransferData, 0x01]) + bytes(index & 0xFF for index in range(data_size))
+
+
+def get_transfer_data_response(data_size):
+    """Get TransferData positive response payload with provided number of data bytes."""
+    return bytes([ResponseSID.TransferData, 0x01]) + bytes(index & 0xFF for index in range(data_size))
+
+
+def get_request_file_transfer_request(path_length):
+    """Get RequestFileTransfer (AddFile) request payload with file path of provided length."""
+    file_path = (b"/files" * path_length)[:path_length - 4] + b".bin"
+    return (bytes([RequestSID.RequestFileTransfer, 0x01]) + path_length.to_bytes(2, "big") + file_path
+            + bytes([0x00, 0x02, 0x12, 0x34, 0x01, 0x00]))
+
+
+SIZES_IDS = ["small", "medium", "max"]
+"""Names of benchmarks parameters with size of diagnostic message."""
+SCALABLE_PAYLOADS = [
+    # ReadDataByIdentifier with many DIDs
+    *[get_read_data_by_identifier_request(dids_number)
+      for dids_number in (1, 32, (MAX_PAYLOAD_SIZE - 1) // 2)],
+    # response is limited by the number of DIDs in the translator
+    *[get_read_data_by_identifier_response(dids_number) for dids_number in (1, 32, 100)],
+    # ReadDTCInformation with hundreds of DTCs
+    *[get_read_dtc_information_response(dtcs_number)
+      for dtcs_number in (1, 255, (MAX_PAYLOAD_SIZE - 3) // 4)],
+    # TransferData with 4KB
+    *[get_transfer_data_request(data_size) for data_size in (1, 256, MAX_PAYLOAD_SIZE - 2)],
+    *[get_transfer_data_response(data_size) for data_size in (1, 256, MAX_PAYLOAD_SIZE - 2)],
+    # RequestFileTransfer with long paths
+    *[get_request_file_transfer_request(path_length) for path_length in (8, 255, MAX_PAYLOAD_SIZE - 10)],
+]
+"""Payloads of diagnostic messages (compatible with both ISO 14229-1:2020 and ISO 14229-1:2013) with various size."""
+SCALABLE_PAYLOADS_IDS = [f"{payload_id}-{size_id}"
+                         for payload_id in ("RDBI_request", "RDBI_response", "RDTCI_response",
+                                            "TD_request", "TD_response", "RFT_request")
+                         for size_id in SIZES_IDS]
+"""Names of benchmarks parameters with payloads of various size."""
+
+
+def get_payload_id(payload):
+    """
+    Get name of benchmark parameter with diagnostic message payload.
+
+    :param payload: Payload of a diagnostic message.
+
+    :return: Name of the diagnostic service and message type.
+    """
+    if RequestSID.is_member(payload[0]):
+        return f"{RequestSID(payload[0]).name}-request"
+    return f"{ResponseSID(payload[0]).name}-response"
+
+
+def get_parameters(translator, translator_id, payloads):
+    """
+    Get benchmarks parameters for provided translator.
+
+    :param translator: Translator to use.
+    :param translator_id: Name of the translator.
+    :param payloads: Payloads (hex) of diagnostic messages compatible with the translator.
+
+    :return: Parameters for benchmarks with translator and payloads.
+    """
+    return [pytest.param(translator, bytes.fromhex(payload),
+                         id=f"{translator_id}-{get_payload_id(bytes.fromhex(payload))}")
+            for payload in payloads]
+
+
+TRANSLATORS = [BASE_TRANSLATOR_2020, BASE_TRANSLATOR_2013]
+"""Translators to benchmark."""
+TRANSLATORS_IDS = ["2020", "2013"]
+"""Names of benchmarks parameters with translators."""
+TRANSLATORS_PAYLOADS = [*get_parameters(BASE_TRANSLATOR_2020, "2020", PAYLOADS_2020),
+                        *get_parameters(BASE_TRANSLATOR_2013, "2013", PAYLOADS_2013)]
+"""Translators with example payloads of all supported diagnostic messages."""
+
+
+def get_encoding_parameters(translator, payload):
+    """
+    Get parameters of encoding that result in provided payload.
+
+    :param translator: Translator to use.
+    :param payload: Payload of a diagnostic message.
+
+    :return: Keyword arguments for :meth:`~uds.translator.translator.Translator.encode` method.
+    """
+    decoded_message = translator.decode_payload(payload)
+    data_records_values = {data_record_info["name"]: (list(data_record_info["raw_value"])
+                                                      if isinstance(data_record_info["raw_value"], tuple)
+                                                      else data_record_info["raw_value"])
+                           for data_record_info in decoded_message[1:]}
+    if RequestSID.is_member(payload[0]):
+        return {"data_records_values": data_records_values, "sid": RequestSID(payload[0])}
+    return {"data_records_values": data_records_values, "rsid": ResponseSID(payload[0])}
+
+
+class TestTranslatorBenchmark:
+    """Benchmarks for base translators (`BASE_TRANSLATOR_2020` and `BASE_TRANSLATOR_2013`)."""
+
+    @staticmethod
+    def _run_translator_benchmark(benchmark, function, *args):
+        function(*args)  # services are loaded on the first use
+        benchmark.extra_info["allocated_memory"] = measure_allocated_memory(function, *args)
+        return benchmark(function, *args)
+
+    @pytest.mark.parametrize("translator, payload", TRANSLATORS_PAYLOADS)
+    def test_decode(self, benchmark, translator, payload):
+        decoded_message = self._run_translator_benchmark(benchmark, translator.decode_payload, payload)
+        assert decoded_message[0]["raw_value"] == payload[0]
+
+    @pytest.mark.parametrize("translator, payload", TRANSLATORS_PAYLOADS)
+    def test_encode(self, benchmark, translator, payload):
+        kwargs = get_encoding_parameters(translator=translator, payload=payload)
+        encoded_payload = self._run_translator_benchmark(benchmark, lambda: translator.encode(**kwargs))
+        assert encoded_payload == payload
+
+    @pytest.mark.parametrize("payload", SCALABLE_PAYLOADS, ids=SCALABLE_PAYLOADS_IDS)
+    @pytest.mark.parametrize("translator", TRANSLATORS, ids=TRANSLATORS_IDS)
+    def test_decode__size(self, benchmark, translator, payload):
+        decoded_message = self._run_translator_benchmark(benchmark, translator.decode_payload, payload)
+        assert decoded_message[0]["raw_value"] == payload[0]
+
+    @pytest.mark.parametrize("payload", SCALABLE_PAYLOADS, ids=SCALABLE_PAYLOADS_IDS)
+    @pytest.mark.parametrize("translator", TRANSLATORS, ids=TRANSLATORS_IDS)
+    def test_encode__size(self, benchmark, translator, payload):
+        kwargs = get_encoding_parameters(translator=translator, payload=payload)
+        encoded_payload = self._run_translator_benchmark(benchmark, lambda: translator.encode(**kwargs))
+        assert encoded_payload == payload
@@ -152,10 +152,11 @@ class TestAbstractCanPacketContainer:
         self.mock_can_ai_class.get_ai_data_bytes_number.return_value = ai_data_bytes_number
         self.mock_can_packet_container.raw_frame_data = raw_frame_data
         assert (AbstractCanPacketContainer.packet_type.fget(self.mock_can_packet_container)
-                == self.mock_can_packet_type_class.return_value)
+                == self.mock_can_packet_type_class.validate_member.return_value)
         self.mock_can_ai_class.get_ai_data_bytes_number.assert_called_once_with(
             self.mock_can_packet_container.addressing_format)
-        self.mock_can_packet_type_class.assert_called_once_with(raw_frame_data[ai_data_bytes_number] >> 4)
+        self.mock_can_packet_type_class.validate_member.assert_called_once_with(
+            raw_frame_data[ai_data_bytes_number] >> 4)
 
     # data_length
 
@@ -3,15 +3,16 @@ from time import perf_counter
 import pytest
 from mock import Mock, patch
 
+from can import Message as PythonCanFrame
 from uds.can import CanFlowStatus, CanPacketType
 from uds.can.packet.can_packet_record import (
     AddressingType,
     CanAddressingFormat,
     CanPacketRecord,
-    PythonCanFrame,
     ReassignmentError,
     TransmissionDirection,
     datetime,
+    is_python_can_frame,
 )
 
 SCRIPT_LOCATION = "uds.can.packet.can_packet_record"
@@ -170,6 +171,28 @@ class TestCanPacketRecord:
         self.mock_can_packet_type.validate_member.assert_called_once_with(self.mock_can_packet_record.packet_type)
 
 
+class TestFunctions:
+    """Unit tests for module functions."""
+
+    # is_python_can_frame
+
+    @pytest.mark.parametrize("value", [
+        PythonCanFrame(arbitration_id=0x7E0, data=[0x02, 0x3E, 0x00]),
+        Mock(spec=PythonCanFrame),
+    ])
+    def test_is_python_can_frame__true(self, value):
+        assert is_python_can_frame(value) is True
+
+    @pytest.mark.parametrize("value", [None, b"\x02\x3E\x00", Mock()])
+    def test_is_python_can_frame__false(self, value):
+        assert is_python_can_frame(value) is False
+
+    @patch(f"{SCRIPT_LOCATION}.sys")
+    def test_is_python_can_frame__python_can_not_imported(self, mock_sys):
+        mock_sys.modules = {}
+        assert is_python_can_frame(Mock(spec=PythonCanFrame)) is False
+
+
 @pytest.mark.integration
 class TestCanPacketRecordIntegration:
     """Integration tests for `CanPacketRecord` class."""
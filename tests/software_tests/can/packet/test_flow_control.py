@@ -471,9 +471,10 @@ class TestCanFlowControl:
     ])
     def test_extract_flow_status(self, addressing_format, raw_frame_data, ai_data_bytes_number):
         self.mock_can_addressing_information.get_ai_data_bytes_number.return_value = ai_data_bytes_number
-        assert extract_flow_status(addressing_format=addressing_format,
-                                   raw_frame_data=raw_frame_data) == self.mock_can_flow_status.return_value
-        self.mock_can_flow_status.assert_called_once_with(raw_frame_data[ai_data_bytes_number] & 0xF)
+        assert (extract_flow_status(addressing_format=addressing_format,
+                                    raw_frame_data=raw_frame_data)
+                == self.mock_can_flow_status.validate_member.return_value)
+        self.mock_can_flow_status.validate_member.assert_called_once_with(raw_frame_data[ai_data_bytes_number] & 0xF)
 
     # extract_block_size
 
@@ -0,0 +1,101 @@
+import subprocess
+import sys
+from ast import literal_eval
+from os import environ
+from statistics import median
+
+import pytest
+from mock import patch
+
+import uds.can
+
+SCRIPT_LOCATION = "uds.can"
+
+IMPORT_TIME_BUDGET = 0.1
+"""Maximal time (in seconds) of importing `uds.can` sub-package (in a fresh interpreter)."""
+IMPORT_TIME_CHECK_VARIABLE = "UDS_CHECK_IMPORT_TIME"
+"""Environment variable that enables the import time check (wall-clock measurements depend on the machine load)."""
+
+
+class TestCan:
+    """Unit tests for uds.can.__init__.py"""
+
+    # __getattr__
+
+    @pytest.mark.parametrize("name", ["something_that_is_not_defined", "_LAZY"])
+    @patch(f"{SCRIPT_LOCATION}.importlib")
+    def test_getattr__attribute_error(self, mock_importlib, name):
+        with pytest.raises(AttributeError):
+            uds.can.__getattr__(name)
+        mock_importlib.import_module.assert_not_called()
+
+    @pytest.mark.parametrize("name, module_name", [
+        ("CanReplayEngine", "uds.can.replay"),
+        ("CanReplayStatistics", "uds.can.replay"),
+        ("CanReplayStream", "uds.can.replay"),
+        ("PythonCanTransportInterface", "uds.can.transport_interface"),
+    ])
+    @patch.dict(f"{SCRIPT_LOCATION}.__dict__")
+    @patch(f"{SCRIPT_LOCATION}.importlib")
+    def test_getattr(self, mock_importlib, name, module_name):
+        value = getattr(mock_importlib.import_module.return_value, name)
+        assert uds.can.__getattr__(name) == value
+        mock_importlib.import_module.assert_called_once_with(module_name)
+        assert uds.can.__dict__[name] == value
+
+    # __dir__
+
+    def test_dir(self):
+        names = dir(uds.can)
+        assert names == sorted(names)
+        assert {"CanAddressingInformation", "CanSegmenter", "CanReplayEngine", "CanReplayStatistics",
+                "CanReplayStream", "PythonCanTransportInterface"}.issubset(names)
+
+
+@pytest.mark.performance
+class TestCanPerformance:
+    """Performance tests for uds.can sub-package."""
+
+    @staticmethod
+    def _get_modules(script):
+        output = subprocess.check_output([sys.executable, "-c", f"import sys; {script}; print(sorted(sys.modules))"])
+        return literal_eval(output.decode())
+
+    @staticmethod
+    def _measure_import_time(module_name, repetitions=5):
+        """
+        Measure import time with `python -X importtime`.
+
+        :param module_name: Name of the module to import.
+        :param repetitions: Number of measurements.
+
+        :return: The median of cumulative import times (in seconds) of the module.
+        """
+        import_times = []
+        for _ in range(repetitions):
+            process = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module_name}"],
+                                     capture_output=True, text=True, check=True)
+            for line in process.stderr.splitlines():
+                _, cumulative_time, imported_module_name = line.split("|")
+                if imported_module_name.strip() == module_name:
+                    import_times.append(int(cumulative_time) / 1_000_000)
+        return median(import_times)
+
+    @pytest.mark.parametrize("module_name", ["uds.can", "uds.can.transport_interface"])
+    def test_import__no_python_can(self, module_name):
+        """Make sure that python-can (and asyncio) is not imported until it is used."""
+        modules = self._get_modules(f"import {module_name}")
+        assert "can" not in modules
+        assert "asyncio" not in modules
+
+    def test_import__python_can_transport_interface(self):
+        modules = self._get_modules("import uds.can; uds.can.PythonCanTransportInterface")
+        assert "can" in modules
+        assert "uds.can.transport_interface.python_can" in modules
+
+    @pytest.mark.performance
+    @pytest.mark.skipif(not environ.get(IMPORT_TIME_CHECK_VARIABLE),
+                        reason=f"Set {IMPORT_TIME_CHECK_VARIABLE} environment variable to check import time.")
+    def test_import_time(self):
+        """Make sure that importing `uds.can` fits the startup budget."""
+        assert self._measure_import_time("uds.can") < IMPORT_TIME_BUDGET
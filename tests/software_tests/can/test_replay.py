@@ -0,0 +1,420 @@
+from datetime import datetime
+from threading import Thread, Timer
+from time import perf_counter
+
+import pytest
+from mock import MagicMock, Mock, patch
+
+from can import Bus
+from uds.can import CanSegmenter, PythonCanTransportInterface
+from uds.can.replay import (
+    BusABC,
+    CanPacketRecord,
+    CanReplayEngine,
+    CanReplayStream,
+    CanTraceEntry,
+    PythonCanFrame,
+    TraceEntryType,
+    TransmissionDirection,
+    UdsMessageRecord,
+    _get_statistics,
+)
+from uds.message import UdsMessage
+
+SCRIPT_LOCATION = "uds.can.replay"
+
+
+class TestFunctions:
+    """Unit tests for module functions."""
+
+    def test_get_statistics(self):
+        frames = [(10., Mock()), (10.5, Mock()), (11., Mock())]
+        timestamps = [100., 100.25, 100.5]
+        errors = [0.001, 0.002, 0.003]
+        statistics = _get_statistics(frames=frames, timestamps=timestamps, errors=errors)
+        assert statistics["frames_number"] == 3
+        assert statistics["original_duration"] == pytest.approx(1000.)
+        assert statistics["replay_duration"] == pytest.approx(500.)
+        assert statistics["min_error"] == pytest.approx(1.)
+        assert statistics["max_error"] == pytest.approx(3.)
+        assert statistics["mean_error"] == pytest.approx(2.)
+        assert statistics["stdev_error"] == pytest.approx((2 / 3) ** 0.5)
+
+    def test_get_statistics__no_errors(self):
+        statistics = _get_statistics(frames=[(1., Mock())], timestamps=[5.], errors=[])
+        assert statistics == {"frames_number": 1, "original_duration": 0., "replay_duration": 0.,
+                              "min_error": None, "max_error": None, "mean_error": None, "stdev_error": None}
+
+
+class TestCanReplayStream:
+    """Unit tests for `CanReplayStream` class."""
+
+    def setup_method(self):
+        self.mock_stream = Mock(spec=CanReplayStream)
+
+    # __init__
+
+    @pytest.mark.parametrize("bus", [None, Mock()])
+    def test_init__type_error(self, bus):
+        with pytest.raises(TypeError):
+            CanReplayStream(bus=bus, records=[])
+
+    @pytest.mark.parametrize("direction", [None, TransmissionDirection.RECEIVED])
+    @patch(f"{SCRIPT_LOCATION}.CanReplayStream._get_frames")
+    def test_init(self, mock_get_frames, direction):
+        mock_bus = Mock(spec=BusABC)
+        mock_records = Mock()
+        frame_1, frame_2, frame_3 = Mock(), Mock(), Mock()
+        mock_get_frames.return_value = [(2., frame_2), (1., frame_1), (3., frame_3)]
+        stream = CanReplayStream(bus=mock_bus, records=mock_records, direction=direction)
+        assert stream.bus == mock_bus
+        assert stream.direction == direction
+        assert stream.frames == ((1., frame_1), (2., frame_2), (3., frame_3))
+        assert stream.statistics is None
+        mock_get_frames.assert_called_once_with(records=mock_records, direction=direction)
+
+    # statistics
+
+    @patch(f"{SCRIPT_LOCATION}._get_statistics")
+    def test_statistics(self, mock_get_statistics):
+        self.mock_stream._CanReplayStream__frames = ((1., Mock()), (2., Mock()), (3., Mock()))
+        self.mock_stream._CanReplayStream__timestamps = [10., 11.]
+        self.mock_stream._CanReplayStream__errors = [0.001, 0.002]
+        assert CanReplayStream.statistics.fget(self.mock_stream) == mock_get_statistics.return_value
+        mock_get_statistics.assert_called_once_with(frames=self.mock_stream._CanReplayStream__frames[:2],
+                                                    timestamps=self.mock_stream._CanReplayStream__timestamps,
+                                                    errors=self.mock_stream._CanReplayStream__errors)
+
+    # _get_frames
+
+    @pytest.mark.parametrize("records", [
+        [None],
+        [Mock()],
+    ])
+    def test_get_frames__type_error(self, records):
+        with pytest.raises(TypeError):
+            CanReplayStream._get_frames(records=records, direction=None)
+
+    @pytest.mark.parametrize("direction", [None, TransmissionDirection.TRANSMITTED])
+    def test_get_frames__packet_records(self, direction):
+        record_tx = Mock(spec=CanPacketRecord, direction=TransmissionDirection.TRANSMITTED,
+                         transmission_timestamp=1.5)
+        record_rx = Mock(spec=CanPacketRecord, direction=TransmissionDirection.RECEIVED,
+                         transmission_timestamp=1.25)
+        frames = CanReplayStream._get_frames(records=[record_tx, record_rx], direction=direction)
+        if direction is None:
+            assert frames == [(1.5, record_tx.frame), (1.25, record_rx.frame)]
+        else:
+            assert frames == [(1.5, record_tx.frame)]
+
+    def test_get_frames__message_record(self):
+        packet_record_tx = Mock(spec=CanPacketRecord, direction=TransmissionDirection.TRANSMITTED,
+                                transmission_timestamp=1.)
+        packet_record_rx = Mock(spec=CanPacketRecord, direction=TransmissionDirection.RECEIVED,
+                                transmission_timestamp=2.)
+        message_record = Mock(spec=UdsMessageRecord, direction=TransmissionDirection.TRANSMITTED,
+                              packets_records=(packet_record_tx, packet_record_rx))
+        assert (CanReplayStream._get_frames(records=[message_record], direction=TransmissionDirection.RECEIVED)
+                == [(2., packet_record_rx.frame)])
+
+    def test_get_frames__trace_entries(self):
+        packet_entry = Mock(spec=CanTraceEntry, entry_type=TraceEntryType.PACKET,
+                            direction=TransmissionDirection.RECEIVED, transmission_timestamp=3.,
+                            can_id=0x18DAF110, is_extended_id=True, is_fd=True, bitrate_switch=False,
+                            data=bytes(range(12)))
+        message_entry = Mock(spec=CanTraceEntry, entry_type=TraceEntryType.MESSAGE,
+                             direction=TransmissionDirection.RECEIVED)
+        frames = CanReplayStream._get_frames(records=[packet_entry, message_entry], direction=None)
+        assert len(frames) == 1
+        timestamp, frame = frames[0]
+        assert timestamp == 3.
+        assert isinstance(frame, PythonCanFrame)
+        assert frame.arbitration_id == 0x18DAF110
+        assert frame.is_extended_id is True
+        assert frame.is_fd is True
+        assert frame.bitrate_switch is False
+        assert bytes(frame.data) == bytes(range(12))
+
+    # clear_results, add_result
+
+    def test_results(self):
+        stream = CanReplayStream(bus=Mock(spec=BusABC), records=[
+            Mock(spec=CanPacketRecord, direction=TransmissionDirection.RECEIVED, transmission_timestamp=1.),
+            Mock(spec=CanPacketRecord, direction=TransmissionDirection.RECEIVED, transmission_timestamp=2.)])
+        stream.add_result(timestamp=10., error=0.001)
+        stream.add_result(timestamp=11., error=None)
+        assert stream.statistics["frames_number"] == 2
+        assert stream.statistics["max_error"] == pytest.approx(1.)
+        stream.clear_results()
+        assert stream.statistics is None
+
+
+class TestCanReplayEngine:
+    """Unit tests for `CanReplayEngine` class."""
+
+    def setup_method(self):
+        self.mock_engine = Mock(spec=CanReplayEngine)
+
+    # __init__
+
+    @pytest.mark.parametrize("speed", [None, 1., 10])
+    def test_init(self, speed):
+        engine = CanReplayEngine(speed=speed)
+        assert engine.speed == speed
+        assert engine.streams == ()
+        assert engine.is_running is False
+
+    def test_init__default(self):
+        assert CanReplayEngine().speed == 1.
+
+    # speed
+
+    @pytest.mark.parametrize("value", ["1", (1,)])
+    def test_speed__set__type_error(self, value):
+        with pytest.raises(TypeError):
+            CanReplayEngine.speed.fset(self.mock_engine, value)
+
+    @pytest.mark.parametrize("value", [0, -1.5])
+    def test_speed__set__value_error(self, value):
+        with pytest.raises(ValueError):
+            CanReplayEngine.speed.fset(self.mock_engine, value)
+
+    @pytest.mark.parametrize("value", [None, 0.5, 2])
+    def test_speed__set__valid(self, value):
+        assert CanReplayEngine.speed.fset(self.mock_engine, value) is None
+        assert self.mock_engine._CanReplayEngine__speed == value
+
+    # add_stream
+
+    @pytest.mark.parametrize("direction", [None, TransmissionDirection.RECEIVED])
+    @patch(f"{SCRIPT_LOCATION}.CanReplayStream")
+    def test_add_stream(self, mock_can_replay_stream, direction):
+        engine = CanReplayEngine()
+        mock_bus = Mock()
+        mock_records = Mock()
+        assert (engine.add_stream(bus=mock_bus, records=mock_records, direction=direction)
+                == mock_can_replay_stream.return_value)
+        mock_can_replay_stream.assert_called_once_with(bus=mock_bus, records=mock_records, direction=direction)
+        assert engine.streams == (mock_can_replay_stream.return_value,)
+
+    @patch(f"{SCRIPT_LOCATION}.CanReplayStream")
+    def test_add_stream__running(self, mock_can_replay_stream):
+        engine = CanReplayEngine()
+        engine._CanReplayEngine__is_running = True
+        with pytest.raises(RuntimeError):
+            engine.add_stream(bus=Mock(), records=[])
+
+    # clear_streams
+
+    @patch(f"{SCRIPT_LOCATION}.CanReplayStream")
+    def test_clear_streams(self, mock_can_replay_stream):
+        engine = CanReplayEngine()
+        engine.add_stream(bus=Mock(), records=[])
+        assert engine.clear_streams() is None
+        assert engine.streams == ()
+
+    def test_clear_streams__running(self):
+        engine = CanReplayEngine()
+        engine._CanReplayEngine__is_running = True
+        with pytest.raises(RuntimeError):
+            engine.clear_streams()
+
+    # stop
+
+    def test_stop(self):
+        self.mock_engine._CanReplayEngine__stop_event = Mock()
+        assert CanReplayEngine.stop(self.mock_engine) is None
+        self.mock_engine._CanReplayEngine__stop_event.set.assert_called_once_with()
+
+    # _wait_until
+
+    @pytest.mark.parametrize("delay", [0, 0.001, 0.01])
+    def test_wait_until(self, delay):
+        engine = CanReplayEngine()
+        timestamp = perf_counter() + delay
+        assert engine._wait_until(timestamp) is True
+        assert perf_counter() >= timestamp
+
+    def test_wait_until__stopped(self):
+        engine = CanReplayEngine()
+        Timer(0.01, engine.stop).start()
+        timestamp_start = perf_counter()
+        assert engine._wait_until(timestamp_start + 10) is False
+        assert perf_counter() - timestamp_start < 1
+
+    # run
+
+    def test_run__running(self):
+        engine = CanReplayEngine()
+        engine._CanReplayEngine__is_running = True
+        with pytest.raises(RuntimeError):
+            engine.run()
+
+    def test_run__no_frames(self):
+        engine = CanReplayEngine()
+        engine.add_stream(bus=Mock(spec=BusABC), records=[])
+        assert engine.run() is None
+        assert engine.is_running is False
+
+    @pytest.mark.parametrize("speed", [None, 1., 100.])
+    def test_run__order(self, speed):
+        engine = CanReplayEngine(speed=speed)
+        sent_frames = []
+        mock_bus_1 = Mock(spec=BusABC, send=Mock(side_effect=lambda frame: sent_frames.append((1, frame))))
+        mock_bus_2 = Mock(spec=BusABC, send=Mock(side_effect=lambda frame: sent_frames.append((2, frame))))
+        records_1 = [Mock(spec=CanPacketRecord, direction=TransmissionDirection.RECEIVED,
+                          transmission_timestamp=timestamp) for timestamp in (0.000, 0.010, 0.020)]
+        records_2 = [Mock(spec=CanPacketRecord, direction=TransmissionDirection.RECEIVED,
+                          transmission_timestamp=timestamp) for timestamp in (0.005, 0.010, 0.030)]
+        stream_1 = engine.add_stream(bus=mock_bus_1, records=records_1)
+        stream_2 = engine.add_stream(bus=mock_bus_2, records=records_2)
+        statistics = engine.run()
+        assert sent_frames == [(1, records_1[0].frame), (2, records_2[0].frame), (1, records_1[1].frame),
+                               (2, records_2[1].frame), (1, records_1[2].frame), (2, records_2[2].frame)]
+        assert statistics["frames_number"] == 6
+        assert statistics["original_duration"] == pytest.approx(30.)
+        assert stream_1.statistics["frames_number"] == 3
+        assert stream_2.statistics["frames_number"] == 3
+        if speed is None:
+            assert statistics["max_error"] is None
+            assert stream_1.statistics["max_error"] is None
+        else:
+            assert statistics["min_error"] >= 0
+            assert statistics["replay_duration"] + statistics["max_error"] >= 30. / speed
+        assert engine.is_running is False
+
+    def test_run__stopped(self):
+        engine = CanReplayEngine()
+        mock_bus = Mock(spec=BusABC)
+        engine.add_stream(bus=mock_bus, records=[
+            Mock(spec=CanPacketRecord, direction=TransmissionDirection.RECEIVED, transmission_timestamp=timestamp)
+            for timestamp in (0., 0.01, 10.)])
+        Timer(0.05, engine.stop).start()
+        statistics = engine.run()
+        assert statistics["frames_number"] == 2
+        assert mock_bus.send.call_count == 2
+
+
+@pytest.mark.integration
+class TestCanReplayIntegration:
+    """Integration tests for replay of CAN communication."""
+
+    def setup_method(self):
+        self.buses = []
+
+    def teardown_method(self):
+        for bus in self.buses:
+            bus.shutdown()
+
+    def _make_bus(self, channel):
+        bus = Bus(channel, interface="virtual")
+        self.buses.append(bus)
+        return bus
+
+    @staticmethod
+    def _record_message(addressing_information, message, recording_start, interval):
+        segmenter = CanSegmenter(addressing_information=addressing_information)
+        return [CanPacketRecord(frame=PythonCanFrame(arbitration_id=packet.can_id,
+                                                     data=packet.raw_frame_data,
+                                                     is_extended_id=packet.can_id > 0x7FF),
+                                addressing_format=packet.addressing_format,
+                                addressing_type=packet.addressing_type,
+                                direction=TransmissionDirection.TRANSMITTED,
+                                transmission_time=datetime.now(),
+                                transmission_timestamp=recording_start + i * interval)
+                for i, packet in enumerate(segmenter.segmentation(message))]
+
+    @pytest.mark.parametrize("speed", [1., 5., None])
+    def test_receive_replayed_message(self, example_can_addressing_information, speed):
+        message = UdsMessage(payload=[0x62, 0xF1, 0x90] + list(range(60)),
+                             addressing_type=example_can_addressing_information.tx_physical_params[
+                                 "addressing_type"])
+        records = self._record_message(addressing_information=example_can_addressing_information,
+                                       message=message,
+                                       recording_start=perf_counter() - 10.,
+                                       interval=0.005)
+        transport_interface = PythonCanTransportInterface(
+            network_manager=self._make_bus("replay_message"),
+            addressing_information=example_can_addressing_information.get_other_end())
+        engine = CanReplayEngine(speed=speed)
+        engine.add_stream(bus=self._make_bus("replay_message"), records=records)
+        replay_thread = Thread(target=engine.run)
+        with pytest.warns(RuntimeWarning):  # Flow Control sent by the receiver is not observed on a virtual bus
+            replay_thread.start()
+            message_record = transport_interface.receive_message(start_timeout=1000, end_timeout=1000)
+        replay_thread.join()
+        assert message_record.payload == bytes(message.payload)
+
+    def test_multiple_ecus(self):
+        listener_bus = self._make_bus("replay_ecus")
+        engine = CanReplayEngine(speed=2.)
+        recording_start = perf_counter() - 10.
+        streams_frames = []
+        for ecu_index, can_id in enumerate((0x7E8, 0x7E9, 0x7EA)):
+            records = [CanPacketRecord(frame=PythonCanFrame(arbitration_id=can_id,
+                                                            data=[0x02, 0x7E, 0x00, 0, 0, 0, 0, frame_index],
+                                                            is_extended_id=False),
+                                       addressing_format="Normal Addressing",
+                                       addressing_type="Physical",
+                                       direction=TransmissionDirection.TRANSMITTED,
+                                       transmission_time=datetime.now(),
+                                       transmission_timestamp=recording_start + 0.01 * frame_index + 0.001 * ecu_index)
+                       for frame_index in range(5)]
+            streams_frames.append(records)
+            engine.add_stream(bus=self._make_bus("replay_ecus"), records=records)
+        statistics = engine.run()
+        received_frames = []
+        while (frame := listener_bus.recv(timeout=0.1)) is not None:
+            received_frames.append((frame.arbitration_id, frame.data[-1]))
+        assert received_frames == [(can_id, frame_index) for frame_index in range(5)
+                                   for can_id in (0x7E8, 0x7E9, 0x7EA)]
+        assert statistics["frames_number"] == 15
+        assert all(stream.statistics["frames_number"] == 5 for stream in engine.streams)
+
+
+@pytest.mark.performance
+class TestCanReplayPerformance:
+    """Performance tests for replay of CAN communication."""
+
+    def setup_method(self):
+        self.bus = Bus("replay_performance", interface="virtual")
+        self.listener_bus = Bus("replay_performance", interface="virtual")
+
+    def teardown_method(self):
+        self.bus.shutdown()
+        self.listener_bus.shutdown()
+
+    @pytest.mark.parametrize("speed, interval, frames_number", [
+        (1., 0.001, 200),
+        (1., 0.010, 50),
+        (10., 0.010, 200),
+    ])
+    def test_timing_accuracy(self, performance_tolerance_ms, mean_performance_tolerance_ms,
+                             speed, interval, frames_number):
+        recording_start = perf_counter() - 100.
+        records = [MagicMock(spec=CanPacketRecord, direction=TransmissionDirection.RECEIVED,
+                             transmission_timestamp=recording_start + i * interval,
+                             frame=PythonCanFrame(arbitration_id=0x7E8, data=[0x21, i % 256], is_extended_id=False))
+                   for i in range(frames_number)]
+        engine = CanReplayEngine(speed=speed)
+        engine.add_stream(bus=self.bus, records=records)
+        statistics = engine.run()
+        print(statistics)
+        assert statistics["frames_number"] == frames_number
+        assert statistics["replay_duration"] == pytest.approx(statistics["original_duration"] / speed,
+                                                              abs=performance_tolerance_ms)
+        assert 0 <= statistics["mean_error"] <= mean_performance_tolerance_ms
+        assert statistics["max_error"] <= performance_tolerance_ms
+
+    def test_as_fast_as_possible(self):
+        recording_start = perf_counter() - 100.
+        records = [MagicMock(spec=CanPacketRecord, direction=TransmissionDirection.RECEIVED,
+                             transmission_timestamp=recording_start + i * 0.01,
+                             frame=PythonCanFrame(arbitration_id=0x7E8, data=[0x21, i % 256], is_extended_id=False))
+                   for i in range(1000)]
+        engine = CanReplayEngine(speed=None)
+        engine.add_stream(bus=self.bus, records=records)
+        statistics = engine.run()
+        print(statistics)
+        assert statistics["frames_number"] == 1000
+        assert statistics["replay_duration"] < statistics["original_duration"] / 10
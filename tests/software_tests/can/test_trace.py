@@ -0,0 +1,350 @@
+from datetime import datetime, timedelta
+from io import BytesIO
+from logging import DEBUG, StreamHandler, getLogger
+from time import perf_counter
+
+import pytest
+from mock import Mock, patch
+
+from can import Message as PythonCanFrame
+from uds.can.trace import (
+    _FILE_HEADER,
+    _FOOTER,
+    AddressingType,
+    CanAddressingFormat,
+    CanPacketRecord,
+    CanTraceEntry,
+    CanTraceReader,
+    CanTraceWriter,
+    TraceEntryType,
+    TransmissionDirection,
+    UdsMessageRecord,
+    _ns_to_time,
+    _time_to_ns,
+)
+from uds.transport_interface import TraceHandler, TransportLogger
+
+SCRIPT_LOCATION = "uds.can.trace"
+
+
+def _make_packet_record(data=b"\x02\x10\x03", can_id=0x7E0, direction=TransmissionDirection.TRANSMITTED,
+                        transmission_time=None, **frame_kwargs):
+    """Create CAN packet record (with Normal Addressing)."""
+    return CanPacketRecord(frame=PythonCanFrame(arbitration_id=can_id, data=data, **frame_kwargs),
+                           addressing_format=CanAddressingFormat.NORMAL_ADDRESSING,
+                           addressing_type=AddressingType.PHYSICAL,
+                           direction=direction,
+                           transmission_time=datetime.now() if transmission_time is None else transmission_time,
+                           transmission_timestamp=perf_counter())
+
+
+class TestFunctions:
+    """Unit tests for module functions."""
+
+    @pytest.mark.parametrize("value", [
+        datetime(2024, 1, 1, 12, 0, 0, 0),
+        datetime(2025, 6, 30, 23, 59, 59, 999999),
+    ])
+    def test_time_conversion(self, value):
+        time_ns = _time_to_ns(value)
+        assert isinstance(time_ns, int)
+        assert time_ns % 1000 == 0
+        assert _ns_to_time(time_ns) == value
+
+
+class TestCanTraceEntry:
+    """Unit tests for `CanTraceEntry` class."""
+
+    def setup_method(self):
+        self.mock_entry = Mock(spec=CanTraceEntry)
+
+    @patch(f"{SCRIPT_LOCATION}._ns_to_time")
+    def test_transmission_time(self, mock_ns_to_time):
+        assert CanTraceEntry.transmission_time.fget(self.mock_entry) == mock_ns_to_time.return_value
+        mock_ns_to_time.assert_called_once_with(self.mock_entry.transmission_time_ns)
+
+    @pytest.mark.parametrize("timestamp_ns, expected_timestamp", [
+        (0, 0.),
+        (1_234_567_891, 1.234567891),
+    ])
+    def test_transmission_timestamp(self, timestamp_ns, expected_timestamp):
+        self.mock_entry.transmission_timestamp_ns = timestamp_ns
+        assert CanTraceEntry.transmission_timestamp.fget(self.mock_entry) == pytest.approx(expected_timestamp)
+
+
+class TestCanTraceWriter:
+    """Unit tests for `CanTraceWriter` class."""
+
+    def setup_method(self):
+        self.stream = BytesIO()
+
+    # __init__
+
+    @pytest.mark.parametrize("index_interval", [None, 1.5, "1"])
+    def test_init__type_error(self, index_interval):
+        with pytest.raises(TypeError):
+            CanTraceWriter(self.stream, index_interval=index_interval)
+
+    @pytest.mark.parametrize("index_interval", [0, -1])
+    def test_init__value_error(self, index_interval):
+        with pytest.raises(ValueError):
+            CanTraceWriter(self.stream, index_interval=index_interval)
+
+    @pytest.mark.parametrize("index_interval", [1, 100])
+    def test_init__stream(self, index_interval):
+        writer = CanTraceWriter(self.stream, index_interval=index_interval)
+        assert writer.index_interval == index_interval
+        assert writer.entries_number == 0
+        assert writer.is_closed is False
+        writer.flush()
+        assert self.stream.getvalue() == _FILE_HEADER.pack(b"UDSTRACE", 1, index_interval)
+
+    def test_init__file(self, tmp_path):
+        writer = CanTraceWriter(tmp_path / "trace.udstrace")
+        assert writer.index_interval == CanTraceWriter.DEFAULT_INDEX_INTERVAL
+        writer.close()
+        assert (tmp_path / "trace.udstrace").stat().st_size == _FILE_HEADER.size
+
+    # write
+
+    @pytest.mark.parametrize("record", [None, Mock(), b"\x02\x10\x03"])
+    def test_write__type_error(self, record):
+        with pytest.raises(TypeError):
+            CanTraceWriter(self.stream).write(record)
+
+    def test_write__packet_record(self):
+        mock_writer = Mock(spec=CanTraceWriter)
+        mock_record = Mock(spec=CanPacketRecord)
+        assert CanTraceWriter.write(mock_writer, mock_record) is None
+        mock_writer.write_packet_record.assert_called_once_with(mock_record)
+        mock_writer.write_message_record.assert_not_called()
+
+    def test_write__message_record(self):
+        mock_writer = Mock(spec=CanTraceWriter)
+        mock_record = Mock(spec=UdsMessageRecord)
+        assert CanTraceWriter.write(mock_writer, mock_record) is None
+        mock_writer.write_message_record.assert_called_once_with(mock_record)
+        mock_writer.write_packet_record.assert_not_called()
+
+    def test_write__closed(self):
+        writer = CanTraceWriter(self.stream)
+        writer.close()
+        with pytest.raises(ValueError):
+            writer.write(_make_packet_record())
+
+    # write_packet_record
+
+    @pytest.mark.parametrize("data, frame_kwargs", [
+        (b"\x02\x10\x03", {}),
+        (bytes(range(64)), {"is_extended_id": True, "is_fd": True, "bitrate_switch": True}),
+    ])
+    def test_write_packet_record(self, data, frame_kwargs):
+        writer = CanTraceWriter(self.stream)
+        writer.write_packet_record(_make_packet_record(data=data, **frame_kwargs))
+        assert writer.entries_number == 1
+        writer.flush()
+        assert self.stream.getvalue().endswith(data)
+
+    # write_message_record
+
+    def test_write_message_record(self):
+        writer = CanTraceWriter(self.stream)
+        packet_record = _make_packet_record(data=b"\x02\x3E\x00")
+        writer.write_message_record(UdsMessageRecord([packet_record]))
+        assert writer.entries_number == 1
+        writer.flush()
+        assert self.stream.getvalue().endswith(b"\x3E\x00")
+
+    # close
+
+    def test_close__no_entries(self):
+        writer = CanTraceWriter(self.stream)
+        assert writer.close() is None
+        assert writer.is_closed is True
+        assert self.stream.getvalue() == _FILE_HEADER.pack(b"UDSTRACE", 1, CanTraceWriter.DEFAULT_INDEX_INTERVAL)
+
+    def test_close__footer(self):
+        writer = CanTraceWriter(self.stream)
+        writer.write(_make_packet_record())
+        assert writer.close() is None
+        assert writer.close() is None
+        last_index_offset, magic = _FOOTER.unpack(self.stream.getvalue()[-_FOOTER.size:])
+        assert magic == b"UDSTRIDX"
+        assert _FILE_HEADER.size < last_index_offset < len(self.stream.getvalue()) - _FOOTER.size
+
+    def test_context_manager(self, tmp_path):
+        with CanTraceWriter(tmp_path / "trace.udstrace") as writer:
+            writer.write(_make_packet_record())
+        assert writer.is_closed is True
+
+
+class TestCanTraceReader:
+    """Unit tests for `CanTraceReader` class."""
+
+    @pytest.mark.parametrize("content", [
+        b"",
+        b"UDSTRACE",
+        b"NOTTRACE\x01\x00\x00\x04\x00\x00",
+        b"UDSTRACE\x02\x00\x00\x04\x00\x00",
+    ])
+    def test_init__value_error(self, tmp_path, content):
+        file_path = tmp_path / "trace.udstrace"
+        file_path.write_bytes(content)
+        with pytest.raises(ValueError):
+            CanTraceReader(file_path)
+
+    def test_init__no_entries(self, tmp_path):
+        file_path = tmp_path / "trace.udstrace"
+        CanTraceWriter(file_path, index_interval=16).close()
+        with CanTraceReader(file_path) as reader:
+            assert reader.index_interval == 16
+            assert reader.is_complete is False
+            assert reader.chunks == []
+            assert list(reader) == []
+
+    def test_iter(self, tmp_path):
+        file_path = tmp_path / "trace.udstrace"
+        records = [_make_packet_record(data=b"\x02\x10\x03"),
+                   _make_packet_record(data=b"\x06\x50\x03\x00\x32\x01\xF4", can_id=0x18DAF110,
+                                       direction=TransmissionDirection.RECEIVED, is_extended_id=True)]
+        with CanTraceWriter(file_path) as writer:
+            for record in records:
+                writer.write(record)
+        with CanTraceReader(file_path) as reader:
+            entries = list(reader)
+        assert len(entries) == 2
+        for entry, record in zip(entries, records):
+            assert entry.entry_type == TraceEntryType.PACKET
+            assert entry.direction == record.direction
+            assert entry.addressing_type == record.addressing_type
+            assert entry.addressing_format == record.addressing_format
+            assert entry.can_id == record.can_id
+            assert entry.is_extended_id is record.frame.is_extended_id
+            assert entry.is_fd is False
+            assert entry.bitrate_switch is False
+            assert entry.dlc == record.dlc
+            assert entry.data == record.raw_frame_data
+            assert entry.transmission_time == record.transmission_time
+            assert entry.transmission_timestamp == pytest.approx(record.transmission_timestamp, abs=1e-9)
+
+    def test_iter__incomplete(self, tmp_path):
+        file_path = tmp_path / "trace.udstrace"
+        writer = CanTraceWriter(file_path)
+        for _ in range(3):
+            writer.write(_make_packet_record())
+        writer.flush()
+        # simulate interrupted writing - the last entry is truncated and there is no footer
+        file_path.write_bytes(file_path.read_bytes()[:-2])
+        with CanTraceReader(file_path) as reader:
+            assert reader.is_complete is False
+            assert len(list(reader)) == 2
+        writer.close()
+
+    def test_chunks(self, tmp_path):
+        file_path = tmp_path / "trace.udstrace"
+        with CanTraceWriter(file_path, index_interval=2) as writer:
+            for _ in range(5):
+                writer.write(_make_packet_record())
+        with CanTraceReader(file_path) as reader:
+            assert reader.is_complete is True
+            chunks = reader.chunks
+            assert len(chunks) == 3
+            assert chunks[0][1] == _FILE_HEADER.size
+            assert [time_ns for time_ns, _ in chunks] == sorted(time_ns for time_ns, _ in chunks)
+
+    @pytest.mark.parametrize("index_interval", [1, 3, 1024])
+    def test_iter_entries__start_time(self, tmp_path, index_interval):
+        file_path = tmp_path / "trace.udstrace"
+        start_time = datetime.now() - timedelta(seconds=10)
+        records = [_make_packet_record(data=bytes([0x02, 0x10, i]), transmission_time=start_time + timedelta(seconds=i))
+                   for i in range(10)]
+        with CanTraceWriter(file_path, index_interval=index_interval) as writer:
+            for record in records:
+                writer.write(record)
+        with CanTraceReader(file_path) as reader:
+            entries = list(reader.iter_entries(start_time=records[6].transmission_time))
+        assert [entry.data for entry in entries] == [record.raw_frame_data for record in records[6:]]
+
+
+@pytest.mark.integration
+class TestCanTraceIntegration:
+    """Integration tests for binary traces of CAN packets and UDS messages."""
+
+    def setup_method(self):
+        self.logger = getLogger(f"{SCRIPT_LOCATION}.integration")
+        self.logger.setLevel(DEBUG)
+        self.logger.propagate = False
+
+    def test_transport_logger(self, tmp_path):
+        file_path = tmp_path / "trace.udstrace"
+        trace_handler = TraceHandler(CanTraceWriter(file_path))
+        self.logger.addHandler(trace_handler)
+        transport_logger = TransportLogger(logger_name=self.logger.name, use_queue=True)
+        try:
+            packet_records = [_make_packet_record(data=b"\x10\x0A\x2E\xF1\x90\x01\x02\x03"),
+                              _make_packet_record(data=b"\x30\x00\x00", direction=TransmissionDirection.RECEIVED,
+                                                  can_id=0x7E8),
+                              _make_packet_record(data=b"\x21\x04\x05\x06\x07\xCC\xCC\xCC")]
+            message_record = UdsMessageRecord([packet_records[0], packet_records[2]])
+            for packet_record in packet_records:
+                transport_logger.log_packet(packet_record)
+            transport_logger.log_message(message_record)
+        finally:
+            transport_logger.stop_queue_listener()
+            self.logger.removeHandler(trace_handler)
+            trace_handler.close()
+        with CanTraceReader(file_path) as reader:
+            entries = list(reader)
+        assert [entry.entry_type for entry in entries] == 3 * [TraceEntryType.PACKET] + [TraceEntryType.MESSAGE]
+        assert [entry.data for entry in entries[:3]] == [record.raw_frame_data for record in packet_records]
+        assert entries[3].data == message_record.payload
+        assert entries[3].can_id == 0x7E0
+        assert entries[3].addressing_format == CanAddressingFormat.NORMAL_ADDRESSING
+
+
+@pytest.mark.performance
+class TestCanTracePerformance:
+    """Performance tests for binary traces of CAN packets and UDS messages."""
+
+    def setup_method(self):
+        self.logger = getLogger(f"{SCRIPT_LOCATION}.performance")
+        self.logger.setLevel(DEBUG)
+        self.logger.propagate = False
+
+    @pytest.mark.parametrize("packets_number", [5000])
+    def test_binary_trace_vs_text_log(self, tmp_path, packets_number):
+        packet_records = [_make_packet_record(data=bytes([0x21 + i % 15, i % 256]) + 6 * b"\xCC")
+                          for i in range(packets_number)]
+        # handlers attached by pytest logging plugin would distort the measurement
+        for handler in self.logger.handlers[:]:
+            self.logger.removeHandler(handler)
+        transport_logger = TransportLogger(logger_name=self.logger.name)
+        # text log
+        with open(tmp_path / "trace.log", "w") as text_file:
+            text_handler = StreamHandler(text_file)
+            self.logger.addHandler(text_handler)
+            timestamp_start = perf_counter()
+            for packet_record in packet_records:
+                transport_logger.log_packet(packet_record)
+            text_duration = perf_counter() - timestamp_start
+            self.logger.removeHandler(text_handler)
+        # binary trace
+        trace_handler = TraceHandler(CanTraceWriter(tmp_path / "trace.udstrace"))
+        self.logger.addHandler(trace_handler)
+        timestamp_start = perf_counter()
+        for packet_record in packet_records:
+            transport_logger.log_packet(packet_record)
+        binary_duration = perf_counter() - timestamp_start
+        self.logger.removeHandler(trace_handler)
+        trace_handler.close()
+        text_size = (tmp_path / "trace.log").stat().st_size
+        binary_size = (tmp_path / "trace.udstrace").stat().st_size
+        print(f"Text log: {text_duration * 1000:.1f} ms, {text_size} B; "
+              f"binary trace: {binary_duration * 1000:.1f} ms, {binary_size} B")
+        assert binary_duration < text_duration
+        assert binary_size * 4 < text_size
+        # reading
+        timestamp_start = perf_counter()
+        with CanTraceReader(tmp_path / "trace.udstrace") as reader:
+            assert sum(1 for _ in reader) == packets_number
+        print(f"Reading binary trace: {(perf_counter() - timestamp_start) * 1000:.1f} ms")
@@ -1,7 +1,7 @@
 from datetime import datetime
 
 import pytest
-from mock import MagicMock, Mock, patch
+from mock import MagicMock, Mock, call, patch
 
 from uds.can import CanPacketRecord
 from uds.can.transport_interface.common import (
@@ -10,6 +10,7 @@ from uds.can.transport_interface.common import (
     AbstractFlowControlParametersGenerator,
     CanPacketType,
     CanVersion,
+    MetricsRegistry,
     TransmissionDirection,
     UdsMessageRecord,
 )
@@ -63,19 +64,22 @@ class TestAbstractCanTransportInterface:
                 == AbstractCanTransportInterface.DEFAULT_FLOW_CONTROL_PARAMETERS)
         assert self.mock_can_transport_interface.can_version == CanVersion.CLASSIC_CAN
         assert self.mock_can_transport_interface.bitrate_switch == False
+        assert self.mock_can_transport_interface.metrics is None
         self.mock_can_transport_interface.segmenter = self.mock_can_segmenter.return_value
         self.mock_abstract_transport_interface_init.assert_called_once_with(network_manager=network_manager)
         self.mock_can_segmenter.assert_called_once_with(addressing_information=addressing_information)
 
     @pytest.mark.parametrize("network_manager, addressing_information, "
                              "n_as_timeout, n_ar_timeout, n_bs_timeout, n_br, n_cs, n_cr_timeout, "
-                             "flow_control_parameters_generator, can_version, bitrate_switch, segmenter_configuration", [
-        (Mock(), Mock(), Mock(), Mock(), Mock(), Mock(), Mock(), Mock(), Mock(), Mock(), Mock(),
+                             "flow_control_parameters_generator, can_version, bitrate_switch, metrics, "
+                             "segmenter_configuration", [
+        (Mock(), Mock(), Mock(), Mock(), Mock(), Mock(), Mock(), Mock(), Mock(), Mock(), Mock(), Mock(),
          {"a": 1, "bc": 2, "def_xyz": Mock()})
     ])
     def test_init__all_args(self, network_manager, addressing_information,
                             n_as_timeout, n_ar_timeout, n_bs_timeout, n_br, n_cs, n_cr_timeout,
-                            flow_control_parameters_generator, can_version, bitrate_switch, segmenter_configuration):
+                            flow_control_parameters_generator, can_version, bitrate_switch, metrics,
+                            segmenter_configuration):
         assert AbstractCanTransportInterface.__init__(
             self.mock_can_transport_interface,
             network_manager=network_manager,
@@ -89,6 +93,7 @@ class TestAbstractCanTransportInterface:
             flow_control_parameters_generator=flow_control_parameters_generator,
             can_version=can_version,
             bitrate_switch=bitrate_switch,
+            metrics=metrics,
             **segmenter_configuration) is None
         assert self.mock_can_transport_interface._AbstractCanTransportInterface__n_ar_measured is None
         assert self.mock_can_transport_interface._AbstractCanTransportInterface__n_as_measured is None
@@ -104,11 +109,29 @@ class TestAbstractCanTransportInterface:
                 == flow_control_parameters_generator)
         assert self.mock_can_transport_interface.can_version == can_version
         assert self.mock_can_transport_interface.bitrate_switch == bitrate_switch
+        assert self.mock_can_transport_interface.metrics == metrics
         self.mock_can_transport_interface.segmenter = self.mock_can_segmenter.return_value
         self.mock_abstract_transport_interface_init.assert_called_once_with(network_manager=network_manager)
         self.mock_can_segmenter.assert_called_once_with(addressing_information=addressing_information,
                                                         **segmenter_configuration)
 
+    # metrics
+
+    def test_metrics__get(self):
+        self.mock_can_transport_interface._AbstractCanTransportInterface__metrics = Mock()
+        assert (AbstractCanTransportInterface.metrics.fget(self.mock_can_transport_interface)
+                == self.mock_can_transport_interface._AbstractCanTransportInterface__metrics)
+
+    @pytest.mark.parametrize("value", [Mock(), "Some metrics"])
+    def test_metrics__set__type_error(self, value):
+        with pytest.raises(TypeError):
+            AbstractCanTransportInterface.metrics.fset(self.mock_can_transport_interface, value)
+
+    @pytest.mark.parametrize("value", [None, Mock(spec=MetricsRegistry)])
+    def test_metrics__set__valid(self, value):
+        assert AbstractCanTransportInterface.metrics.fset(self.mock_can_transport_interface, value) is None
+        assert self.mock_can_transport_interface._AbstractCanTransportInterface__metrics == value
+
     # segmenter
 
     def test_segmenter__get(self):
@@ -598,6 +621,13 @@ class TestAbstractCanTransportInterface:
         assert AbstractCanTransportInterface._update_n_ar_measured(self.mock_can_transport_interface, value) is None
         assert self.mock_can_transport_interface._AbstractCanTransportInterface__n_ar_measured == value
         self.mock_warn.assert_not_called()
+        self.mock_can_transport_interface.metrics.record.assert_called_once_with("n_ar", value)
+
+    def test_update_n_ar_measured__no_metrics(self):
+        self.mock_can_transport_interface.n_ar_timeout = AbstractCanTransportInterface.N_AR_TIMEOUT
+        self.mock_can_transport_interface.metrics = None
+        assert AbstractCanTransportInterface._update_n_ar_measured(self.mock_can_transport_interface, 1.5) is None
+        assert self.mock_can_transport_interface._AbstractCanTransportInterface__n_ar_measured == 1.5
 
     @pytest.mark.parametrize("value, n_ar_timeout", [
         (AbstractCanTransportInterface.N_AR_TIMEOUT + 1, AbstractCanTransportInterface.N_AR_TIMEOUT),
@@ -633,6 +663,13 @@ class TestAbstractCanTransportInterface:
         assert AbstractCanTransportInterface._update_n_as_measured(self.mock_can_transport_interface, value) is None
         assert self.mock_can_transport_interface._AbstractCanTransportInterface__n_as_measured == value
         self.mock_warn.assert_not_called()
+        self.mock_can_transport_interface.metrics.record.assert_called_once_with("n_as", value)
+
+    def test_update_n_as_measured__no_metrics(self):
+        self.mock_can_transport_interface.n_as_timeout = AbstractCanTransportInterface.N_AS_TIMEOUT
+        self.mock_can_transport_interface.metrics = None
+        assert AbstractCanTransportInterface._update_n_as_measured(self.mock_can_transport_interface, 1.5) is None
+        assert self.mock_can_transport_interface._AbstractCanTransportInterface__n_as_measured == 1.5
 
     @pytest.mark.parametrize("value, n_as_timeout", [
         (AbstractCanTransportInterface.N_AS_TIMEOUT + 1, AbstractCanTransportInterface.N_AS_TIMEOUT),
@@ -709,6 +746,26 @@ class TestAbstractCanTransportInterface:
         assert (self.mock_can_transport_interface._AbstractCanTransportInterface__n_bs_measured
                 == expected_n_bs_measurements)
 
+    def test_update_n_bs_measured__metrics(self):
+        message_record = Mock(spec=UdsMessageRecord, direction=TransmissionDirection.TRANSMITTED, packets_records=(
+            Mock(spec=CanPacketRecord, packet_type=CanPacketType.FIRST_FRAME, transmission_timestamp=1.000),
+            Mock(spec=CanPacketRecord, packet_type=CanPacketType.FLOW_CONTROL, transmission_timestamp=1.002),
+            Mock(spec=CanPacketRecord, packet_type=CanPacketType.CONSECUTIVE_FRAME, transmission_timestamp=1.003),
+            Mock(spec=CanPacketRecord, packet_type=CanPacketType.CONSECUTIVE_FRAME, transmission_timestamp=1.008),
+            Mock(spec=CanPacketRecord, packet_type=CanPacketType.FLOW_CONTROL, transmission_timestamp=1.010),
+            Mock(spec=CanPacketRecord, packet_type=CanPacketType.CONSECUTIVE_FRAME, transmission_timestamp=1.011),
+            Mock(spec=CanPacketRecord, packet_type=CanPacketType.CONSECUTIVE_FRAME, transmission_timestamp=1.017),
+        ))
+        self.mock_can_transport_interface.metrics = Mock(spec=MetricsRegistry)
+        assert AbstractCanTransportInterface._update_n_bs_measured(self.mock_can_transport_interface,
+                                                                   message_record=message_record) is None
+        assert self.mock_can_transport_interface.metrics.record.call_args_list == [
+            call("n_bs", 2),
+            call("n_bs", 2),
+            call("st_min_achieved", pytest.approx(5)),
+            call("st_min_achieved", pytest.approx(6)),
+        ]
+
     # _update_n_cr_measured
 
     @pytest.mark.parametrize("message_record", [
@@ -774,6 +831,21 @@ class TestAbstractCanTransportInterface:
         assert (self.mock_can_transport_interface._AbstractCanTransportInterface__n_cr_measured
                 == expected_n_cr_measurements)
 
+    @pytest.mark.parametrize("metrics", [None, Mock(spec=MetricsRegistry)])
+    def test_update_n_cr_measured__metrics(self, metrics):
+        message_record = Mock(spec=UdsMessageRecord, direction=TransmissionDirection.RECEIVED, packets_records=(
+            Mock(spec=CanPacketRecord, packet_type=CanPacketType.FIRST_FRAME, transmission_timestamp=1.000),
+            Mock(spec=CanPacketRecord, packet_type=CanPacketType.FLOW_CONTROL, transmission_timestamp=1.001),
+            Mock(spec=CanPacketRecord, packet_type=CanPacketType.CONSECUTIVE_FRAME, transmission_timestamp=1.004),
+            Mock(spec=CanPacketRecord, packet_type=CanPacketType.CONSECUTIVE_FRAME, transmission_timestamp=1.009),
+        ))
+        self.mock_can_transport_interface.metrics = metrics
+        assert AbstractCanTransportInterface._update_n_cr_measured(self.mock_can_transport_interface,
+                                                                   message_record=message_record) is None
+        assert self.mock_can_transport_interface._AbstractCanTransportInterface__n_cr_measured == (3, 5)
+        if metrics is not None:
+            assert metrics.record.call_args_list == [call("n_cr", 3), call("n_cr", 5)]
+
     # clear_measurements
 
     def test_clear_measurements(self):
@@ -2487,6 +2487,8 @@ class TestPythonCanTransportInterface:
         self.mock_can_transport_interface._message_receive_start.assert_called_once_with(
             initial_packet=self.mock_can_transport_interface.receive_packet.return_value,
             timestamp_end=None if end_timeout is None else self.mock_perf_counter.return_value)
+        self.mock_can_transport_interface._update_n_cr_measured.assert_called_once_with(
+            self.mock_can_transport_interface._message_receive_start.return_value)
         self.mock_can_transport_interface.receive_packet.assert_called_once()
         self.mock_can_transport_interface._PythonCanTransportInterface__setup_sync_listening.assert_called_once_with()
         self.mock_warn.assert_not_called()
@@ -2513,6 +2515,8 @@ class TestPythonCanTransportInterface:
         self.mock_can_transport_interface._message_receive_start.assert_called_once_with(
             initial_packet=self.mock_can_transport_interface.receive_packet.return_value,
             timestamp_end=None if end_timeout is None else self.mock_perf_counter.return_value)
+        self.mock_can_transport_interface._update_n_cr_measured.assert_called_once_with(
+            self.mock_can_transport_interface._message_receive_start.return_value)
         self.mock_can_transport_interface.receive_packet.assert_has_calls(
             calls=[call(timeout=None if start_timeout is None else self.mock_perf_counter.return_value),
                    call(timeout=None if start_timeout is None else self.mock_perf_counter.return_value)]
@@ -2593,6 +2597,8 @@ class TestPythonCanTransportInterface:
             initial_packet=self.mock_can_transport_interface.async_receive_packet.return_value,
             timestamp_end=None if end_timeout is None else self.mock_perf_counter.return_value,
             loop=mock_loop)
+        self.mock_can_transport_interface._update_n_cr_measured.assert_called_once_with(
+            self.mock_can_transport_interface._async_message_receive_start.return_value)
         self.mock_can_transport_interface.async_receive_packet.assert_called_once()
         self.mock_warn.assert_not_called()
 
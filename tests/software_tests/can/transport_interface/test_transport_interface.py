@@ -0,0 +1,34 @@
+import pytest
+from mock import patch
+
+import uds.can.transport_interface
+
+SCRIPT_LOCATION = "uds.can.transport_interface"
+
+
+class TestTransportInterface:
+    """Unit tests for uds.can.transport_interface.__init__.py"""
+
+    # __getattr__
+
+    @pytest.mark.parametrize("name", ["something_that_is_not_defined", "python_can_transport_interface"])
+    @patch(f"{SCRIPT_LOCATION}.importlib")
+    def test_getattr__attribute_error(self, mock_importlib, name):
+        with pytest.raises(AttributeError):
+            uds.can.transport_interface.__getattr__(name)
+        mock_importlib.import_module.assert_not_called()
+
+    @patch.dict(f"{SCRIPT_LOCATION}.__dict__")
+    @patch(f"{SCRIPT_LOCATION}.importlib")
+    def test_getattr(self, mock_importlib):
+        value = mock_importlib.import_module.return_value.PythonCanTransportInterface
+        assert uds.can.transport_interface.__getattr__("PythonCanTransportInterface") == value
+        mock_importlib.import_module.assert_called_once_with("uds.can.transport_interface.python_can")
+        assert uds.can.transport_interface.__dict__["PythonCanTransportInterface"] == value
+
+    # __dir__
+
+    def test_dir(self):
+        names = dir(uds.can.transport_interface)
+        assert names == sorted(names)
+        assert {"AbstractCanTransportInterface", "PythonCanTransportInterface"}.issubset(names)
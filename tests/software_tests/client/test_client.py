@@ -1,3 +1,5 @@
+from collections import deque
+from threading import active_count
 from time import perf_counter, sleep
 
 import pytest
@@ -13,13 +15,16 @@ from uds.client import (
     InconsistencyError,
     Lock,
     MessageTransmissionNotStartedError,
+    MetricsRegistry,
     Queue,
     ReassignmentError,
     RequestSID,
     ResponseSID,
+    TesterPresentScheduler,
     Thread,
     UdsMessage,
     UdsMessageRecord,
+    _ResponseMatcher,
 )
 
 SCRIPT_LOCATION = "uds.client"
@@ -34,12 +39,13 @@ class TestClient:
                                      _Client__physical_transmission_lock=MagicMock(),
                                      _Client__functional_transmission_lock=MagicMock(),
                                      _Client__transmission_lock=MagicMock(),
-                                     _Client__receiving_lock=MagicMock(),
                                      _Client__transmission_not_in_progress_event=Mock(),
-                                     _Client__receiving_not_in_progress_event=Mock(),
                                      _Client__background_receiving_task_event=Mock(),
-                                     _Client__break_in_background_receiving_event=Mock(),
-                                     _Client__send_and_receive_not_in_progress_event=Mock(),
+                                     _Client__receiving_condition=MagicMock(),
+                                     _Client__requests_in_progress_number=0,
+                                     _Client__is_receiving_directly=False,
+                                     _Client__receiving_attempt_timestamp=None,
+                                     _Client__response_matchers=[],
                                      _Client__last_physical_request=Mock(),
                                      _Client__last_functional_request=Mock(),
                                      _Client__last_physical_response=Mock(),
@@ -61,6 +67,8 @@ class TestClient:
         self.mock_event = self._patcher_event.start()
         self._patcher_lock = patch(f"{SCRIPT_LOCATION}.Lock")
         self.mock_lock = self._patcher_lock.start()
+        self._patcher_condition = patch(f"{SCRIPT_LOCATION}.Condition")
+        self.mock_condition = self._patcher_condition.start()
         self._patcher_queue = patch(f"{SCRIPT_LOCATION}.Queue")
         self.mock_queue = self._patcher_queue.start()
         self._patcher_tester_present = patch(f"{SCRIPT_LOCATION}.TESTER_PRESENT")
@@ -76,6 +84,7 @@ class TestClient:
         self._patcher_thread.stop()
         self._patcher_event.stop()
         self._patcher_lock.stop()
+        self._patcher_condition.stop()
         self._patcher_queue.stop()
         self._patcher_tester_present.stop()
         self._patcher_validate_request_sid.stop()
@@ -108,17 +117,19 @@ class TestClient:
         assert self.mock_client.p6_client_timeout == Client.DEFAULT_P6_CLIENT_TIMEOUT
         assert self.mock_client.p6_ext_client_timeout == Client.DEFAULT_P6_EXT_CLIENT_TIMEOUT
         assert self.mock_client.s3_client == Client.DEFAULT_S3_CLIENT
+        assert self.mock_client.metrics is None
         # internal attributes
         assert self.mock_client._Client__tester_present_task_event == self.mock_event.return_value
         assert self.mock_client._Client__tester_present_thread is None
         assert self.mock_client._Client__background_receiving_task_event == self.mock_event.return_value
-        assert self.mock_client._Client__break_in_background_receiving_event == self.mock_event.return_value
         assert self.mock_client._Client__background_receiving_thread is None
-        assert self.mock_client._Client__send_and_receive_not_in_progress_event == self.mock_event.return_value
-        assert self.mock_client._Client__receiving_not_in_progress_event == self.mock_event.return_value
         assert self.mock_client._Client__transmission_not_in_progress_event == self.mock_event.return_value
-        assert self.mock_client._Client__receiving_lock == self.mock_lock.return_value
         assert self.mock_client._Client__transmission_lock == self.mock_lock.return_value
+        assert self.mock_client._Client__receiving_condition == self.mock_condition.return_value
+        assert self.mock_client._Client__requests_in_progress_number == 0
+        assert self.mock_client._Client__is_receiving_directly is False
+        assert self.mock_client._Client__receiving_attempt_timestamp is None
+        assert self.mock_client._Client__response_matchers == []
         assert self.mock_client._Client__physical_transmission_lock == self.mock_lock.return_value
         assert self.mock_client._Client__functional_transmission_lock == self.mock_lock.return_value
         assert self.mock_client._Client__response_queue == self.mock_queue.return_value
@@ -130,13 +141,14 @@ class TestClient:
 
     @pytest.mark.parametrize("transport_interface, p2_client_timeout, p2_ext_client_timeout, "
                              "p3_client_physical, p3_client_functional, p6_client_timeout, p6_ext_client_timeout, "
-                             "s3_client", [
-        (Mock(), Mock(), Mock(), Mock(), Mock(),  Mock(), Mock() ,Mock()),
-        ("TI", "P2Client", "P2*Client", "P3Client_Phys", "P3Client_Func", "P6Client", "P6*Client", "S3Client"),
+                             "s3_client, metrics", [
+        (Mock(), Mock(), Mock(), Mock(), Mock(),  Mock(), Mock() ,Mock(), Mock()),
+        ("TI", "P2Client", "P2*Client", "P3Client_Phys", "P3Client_Func", "P6Client", "P6*Client", "S3Client",
+         "Metrics"),
     ])
     def test_init__all_args(self, transport_interface, p2_client_timeout, p2_ext_client_timeout,
                             p3_client_physical, p3_client_functional, p6_client_timeout, p6_ext_client_timeout,
-                            s3_client):
+                            s3_client, metrics):
         assert Client.__init__(self.mock_client,
                                transport_interface=transport_interface,
                                p2_client_timeout=p2_client_timeout,
@@ -145,7 +157,8 @@ class TestClient:
                                p3_client_functional=p3_client_functional,
                                p6_client_timeout=p6_client_timeout,
                                p6_ext_client_timeout=p6_ext_client_timeout,
-                               s3_client=s3_client) is None
+                               s3_client=s3_client,
+                               metrics=metrics) is None
         # measurements
         assert self.mock_client._Client__p2_client_measured is None
         assert self.mock_client._Client__p2_ext_client_measured is None
@@ -168,17 +181,19 @@ class TestClient:
         assert self.mock_client.p6_client_timeout == p6_client_timeout
         assert self.mock_client.p6_ext_client_timeout == p6_ext_client_timeout
         assert self.mock_client.s3_client == s3_client
+        assert self.mock_client.metrics == metrics
         # internal attributes
         assert self.mock_client._Client__tester_present_task_event == self.mock_event.return_value
         assert self.mock_client._Client__tester_present_thread is None
         assert self.mock_client._Client__background_receiving_task_event == self.mock_event.return_value
-        assert self.mock_client._Client__break_in_background_receiving_event == self.mock_event.return_value
         assert self.mock_client._Client__background_receiving_thread is None
-        assert self.mock_client._Client__send_and_receive_not_in_progress_event == self.mock_event.return_value
-        assert self.mock_client._Client__receiving_not_in_progress_event == self.mock_event.return_value
         assert self.mock_client._Client__transmission_not_in_progress_event == self.mock_event.return_value
-        assert self.mock_client._Client__receiving_lock == self.mock_lock.return_value
         assert self.mock_client._Client__transmission_lock == self.mock_lock.return_value
+        assert self.mock_client._Client__receiving_condition == self.mock_condition.return_value
+        assert self.mock_client._Client__requests_in_progress_number == 0
+        assert self.mock_client._Client__is_receiving_directly is False
+        assert self.mock_client._Client__receiving_attempt_timestamp is None
+        assert self.mock_client._Client__response_matchers == []
         assert self.mock_client._Client__physical_transmission_lock == self.mock_lock.return_value
         assert self.mock_client._Client__functional_transmission_lock == self.mock_lock.return_value
         assert self.mock_client._Client__response_queue == self.mock_queue.return_value
@@ -235,6 +250,22 @@ class TestClient:
         assert Client.transport_interface.fset(self.mock_client, transport_interface) is None
         assert self.mock_client._Client__transport_interface == transport_interface
 
+    # metrics
+
+    def test_metrics__get(self):
+        self.mock_client._Client__metrics = Mock()
+        assert Client.metrics.fget(self.mock_client) == self.mock_client._Client__metrics
+
+    @pytest.mark.parametrize("value", [Mock(), "Some metrics"])
+    def test_metrics__set__type_error(self, value):
+        with pytest.raises(TypeError):
+            Client.metrics.fset(self.mock_client, value)
+
+    @pytest.mark.parametrize("value", [None, Mock(spec=MetricsRegistry)])
+    def test_metrics__set__valid(self, value):
+        assert Client.metrics.fset(self.mock_client, value) is None
+        assert self.mock_client._Client__metrics == value
+
     # p2_client_timeout
 
     def test_p2_client_timeout__get(self):
@@ -663,27 +694,27 @@ class TestClient:
 
     # is_ready_for_physical_transmission
 
-    @pytest.mark.parametrize("transmission_not_in_progress, receiving_not_in_progress,"
+    @pytest.mark.parametrize("transmission_not_in_progress, receiving_directly,"
                              "last_physical_request, last_physical_response,"
                              "p3_client_physical, perf_counter_value,"
                              "excepted_output", [
-        (True, True, None, None, 100, 0, True),
-        (False, True, None, None, 100, 0, False),
-        (True, False, None, None, 100, 0, False),
-        (True, True, Mock(transmission_end_timestamp=1.), None, 125, 1.125, False),
-        (True, True, Mock(transmission_end_timestamp=1.), None, 125, 1.125001, True),
-        (True, True, Mock(transmission_end_timestamp=5.6), None, 1000, 6.6, False),
-        (True, True, Mock(transmission_end_timestamp=5.6), None, 1000, 6.60001, True),
-        (True, True, Mock(transmission_end_timestamp=5.6), Mock(), 1000, 5.7, True),
+        (True, False, None, None, 100, 0, True),
+        (False, False, None, None, 100, 0, False),
+        (True, True, None, None, 100, 0, False),
+        (True, False, Mock(transmission_end_timestamp=1.), None, 125, 1.125, False),
+        (True, False, Mock(transmission_end_timestamp=1.), None, 125, 1.125001, True),
+        (True, False, Mock(transmission_end_timestamp=5.6), None, 1000, 6.6, False),
+        (True, False, Mock(transmission_end_timestamp=5.6), None, 1000, 6.60001, True),
+        (True, False, Mock(transmission_end_timestamp=5.6), Mock(), 1000, 5.7, True),
     ])
     def test_is_ready_for_physical_transmission(self, transmission_not_in_progress,
-                                                receiving_not_in_progress,
+                                                receiving_directly,
                                                 last_physical_request,
                                                 last_physical_response,
                                                 p3_client_physical, perf_counter_value,
                                                 excepted_output):
         self.mock_client._Client__transmission_not_in_progress_event = Mock(is_set=Mock(return_value=transmission_not_in_progress))
-        self.mock_client._Client__receiving_not_in_progress_event = Mock(is_set=Mock(return_value=receiving_not_in_progress))
+        self.mock_client._Client__is_receiving_directly = receiving_directly
         self.mock_client._Client__last_physical_request = last_physical_request
         self.mock_client._Client__last_physical_response = last_physical_response
         self.mock_client.p3_client_physical = p3_client_physical
@@ -872,31 +903,46 @@ class TestClient:
         self.mock_client.transport_interface.receive_message.assert_not_called()
 
     @pytest.mark.parametrize("cycle", [10])
-    def test_receiving_task__send_and_receive_in_progress__no_message(self, cycle):
+    def test_receiving_task__no_message(self, cycle):
         def _stop_background_receiving(*_, **__):
             self.mock_client.is_background_receiving = False
             raise TimeoutError
 
-        mock_send_and_receive_not_in_progress = Mock(return_value=False)
-        mock_set_break_in_background_receiving = Mock()
-        mock_clear_break_in_background_receiving = Mock()
-        mock_wait = Mock()
         self.mock_client.is_background_receiving = True
-        self.mock_client._Client__send_and_receive_not_in_progress_event = Mock(
-            is_set=mock_send_and_receive_not_in_progress,
-            wait=mock_wait)
-        self.mock_client._Client__break_in_background_receiving_event = Mock(
-            set=mock_set_break_in_background_receiving,
-            clear=mock_clear_break_in_background_receiving)
-        self.mock_client._receive_response.side_effect = _stop_background_receiving
+        self.mock_client.transport_interface.receive_message.side_effect = _stop_background_receiving
+        assert Client._Client__receiving_task(self.mock_client, cycle=cycle) is None
+        self.mock_sleep.assert_not_called()
+        self.mock_client.transport_interface.receive_message.assert_called_once_with(
+            start_timeout=cycle,
+            end_timeout=self.mock_client.p6_ext_client_timeout)
+        self.mock_client._update_last_response.assert_not_called()
+        self.mock_client._dispatch_response.assert_not_called()
+        assert self.mock_client._Client__receiving_attempt_timestamp is None
+        self.mock_client._Client__receiving_condition.notify_all.assert_called_once_with()
+
+    @pytest.mark.parametrize("cycle", [10])
+    def test_receiving_task__receiving_directly(self, cycle):
+        def _stop_background_receiving(*_, **__):
+            self.mock_client.is_background_receiving = False
+
+        self.mock_client.is_background_receiving = True
+        self.mock_client._Client__is_receiving_directly = True
+        self.mock_client._Client__receiving_condition.wait.side_effect = _stop_background_receiving
+        assert Client._Client__receiving_task(self.mock_client, cycle=cycle) is None
+        self.mock_client._Client__receiving_condition.wait.assert_called_once_with(timeout=cycle / 1000.)
+        self.mock_client.transport_interface.receive_message.assert_not_called()
+
+    @pytest.mark.parametrize("cycle", [10])
+    def test_receiving_task__attempt_timestamp(self, cycle):
+        def _stop_background_receiving(*_, **__):
+            assert self.mock_client._Client__receiving_attempt_timestamp == self.mock_perf_counter.return_value
+            self.mock_client.is_background_receiving = False
+            raise MessageTransmissionNotStartedError
+
+        self.mock_client.is_background_receiving = True
+        self.mock_client.transport_interface.receive_message.side_effect = _stop_background_receiving
         assert Client._Client__receiving_task(self.mock_client, cycle=cycle) is None
-        self.mock_sleep.assert_called_once_with(cycle / 1000.)
-        mock_send_and_receive_not_in_progress.assert_called_once_with()
-        mock_set_break_in_background_receiving.assert_called_once_with()
-        mock_wait.assert_called_once_with()
-        mock_clear_break_in_background_receiving.assert_called_once_with()
-        self.mock_client._receive_response.assert_called_once_with(start_timeout=cycle,
-                                                                   end_timeout=self.mock_client.p6_ext_client_timeout)
+        assert self.mock_client._Client__receiving_attempt_timestamp is None
 
     @pytest.mark.parametrize("cycle", [13])
     def test_receiving_task__received_message(self, cycle):
@@ -905,18 +951,147 @@ class TestClient:
             self.mock_client.is_background_receiving = False
             return mock_message
 
-        mock_send_and_receive_not_in_progress = Mock(return_value=True)
         self.mock_client.is_background_receiving = True
-        self.mock_client._Client__send_and_receive_not_in_progress_event = Mock(
-            is_set=mock_send_and_receive_not_in_progress)
-        self.mock_client._receive_response.side_effect = _stop_background_receiving
+        self.mock_client.transport_interface.receive_message.side_effect = _stop_background_receiving
         assert Client._Client__receiving_task(self.mock_client, cycle=cycle) is None
-        self.mock_sleep.assert_called_once_with(cycle / 1000.)
-        mock_send_and_receive_not_in_progress.assert_called_once_with()
-        self.mock_client._receive_response.assert_called_once_with(start_timeout=cycle,
-                                                                   end_timeout=self.mock_client.p6_ext_client_timeout)
-        self.mock_client._Client__response_queue.put_nowait.assert_called_once_with(mock_message)
+        self.mock_sleep.assert_not_called()
+        self.mock_client.transport_interface.receive_message.assert_called_once_with(
+            start_timeout=cycle,
+            end_timeout=self.mock_client.p6_ext_client_timeout)
+        self.mock_client._update_last_response.assert_called_once_with(mock_message)
+        self.mock_client._dispatch_response.assert_called_once_with(mock_message)
+        assert self.mock_client._Client__receiving_attempt_timestamp is None
+        self.mock_client._Client__receiving_condition.notify_all.assert_called_once_with()
+
+    # _dispatch_response
+
+    def test_dispatch_response__unexpected(self):
+        mock_response_record = Mock(spec=UdsMessageRecord)
+        mock_response_matcher = Mock(spec=_ResponseMatcher, request=Mock(), responses=Mock())
+        self.mock_client._Client__response_matchers = [mock_response_matcher]
+        self.mock_client.is_response_to_request.return_value = False
+        assert Client._dispatch_response(self.mock_client, mock_response_record) is None
+        self.mock_client.is_response_to_request.assert_called_once_with(
+            response_message=mock_response_record,
+            request_message=mock_response_matcher.request)
+        mock_response_matcher.responses.append.assert_not_called()
+        self.mock_client._Client__response_queue.put_nowait.assert_called_once_with(mock_response_record)
+
+    def test_dispatch_response__expected(self):
+        mock_response_record = Mock(spec=UdsMessageRecord)
+        mock_response_matchers = [Mock(spec=_ResponseMatcher, request=Mock(), responses=Mock()) for _ in range(3)]
+        self.mock_client._Client__response_matchers = mock_response_matchers
+        self.mock_client.is_response_to_request.side_effect = [False, True]
+        assert Client._dispatch_response(self.mock_client, mock_response_record) is None
+        assert self.mock_client.is_response_to_request.call_count == 2
+        mock_response_matchers[0].responses.append.assert_not_called()
+        mock_response_matchers[1].responses.append.assert_called_once_with(mock_response_record)
+        mock_response_matchers[2].responses.append.assert_not_called()
+        self.mock_client._Client__response_queue.put_nowait.assert_not_called()
+
+    # _update_metrics
+
+    @pytest.mark.parametrize("metrics, response_records", [
+        (None, (Mock(spec=UdsMessageRecord),)),
+        (Mock(spec=MetricsRegistry), ()),
+    ])
+    def test_update_metrics__not_collected(self, metrics, response_records):
+        self.mock_client.metrics = metrics
+        assert Client._update_metrics(self.mock_client,
+                                      request_record=Mock(spec=UdsMessageRecord),
+                                      response_records=response_records) is None
+        self.mock_client.get_response_source.assert_not_called()
+
+    @pytest.mark.parametrize("source, ecu_label", [(0x7E8, "0x7E8"), (None, None), ("ECU1", "ECU1")])
+    def test_update_metrics__direct_response(self, source, ecu_label):
+        self.mock_client.metrics = Mock(spec=MetricsRegistry)
+        self.mock_client.get_response_source.return_value = source
+        request_record = Mock(spec=UdsMessageRecord, payload=b"\x22\x12\x34", transmission_end_timestamp=1.)
+        response_record = Mock(spec=UdsMessageRecord, payload=b"\x7F\x22\x31",
+                               transmission_start_timestamp=1.0125, transmission_end_timestamp=1.015)
+        assert Client._update_metrics(self.mock_client,
+                                      request_record=request_record,
+                                      response_records=(response_record,)) is None
+        self.mock_client.get_response_source.assert_called_once_with(response_record)
+        assert self.mock_client.metrics.record.call_args_list == [
+            call("p2_client", pytest.approx(12.5), sid="0x22", ecu=ecu_label),
+            call("p6_client", pytest.approx(15.), sid="0x22", ecu=ecu_label),
+        ]
+        self.mock_client.metrics.increment.assert_called_once_with("negative_responses", nrc="0x31",
+                                                                   sid="0x22", ecu=ecu_label)
+
+    def test_update_metrics__delayed_response(self):
+        self.mock_client.metrics = Mock(spec=MetricsRegistry)
+        self.mock_client.get_response_source.return_value = 0x10
+        request_record = Mock(spec=UdsMessageRecord, payload=b"\x31\x01\xFF\x00", transmission_end_timestamp=5.)
+        response_records = (
+            Mock(spec=UdsMessageRecord, payload=b"\x7F\x31\x78",
+                 transmission_start_timestamp=5.01, transmission_end_timestamp=5.01),
+            Mock(spec=UdsMessageRecord, payload=b"\x7F\x31\x78",
+                 transmission_start_timestamp=6.01, transmission_end_timestamp=6.01),
+            Mock(spec=UdsMessageRecord, payload=b"\x71\x01\xFF\x00",
+                 transmission_start_timestamp=6.5, transmission_end_timestamp=6.51),
+        )
+        assert Client._update_metrics(self.mock_client,
+                                      request_record=request_record,
+                                      response_records=response_records) is None
+        assert self.mock_client.metrics.record.call_args_list == [
+            call("p2_client", pytest.approx(10.), sid="0x31", ecu="0x10"),
+            call("p2_ext_client", pytest.approx(1000.), sid="0x31", ecu="0x10"),
+            call("p2_ext_client", pytest.approx(500.), sid="0x31", ecu="0x10"),
+            call("p6_ext_client", pytest.approx(1510.), sid="0x31", ecu="0x10"),
+        ]
+        assert self.mock_client.metrics.increment.call_args_list == [
+            call("negative_responses", nrc="0x78", sid="0x31", ecu="0x10"),
+        ] * 2
+
+    def test_update_metrics__negative_values(self):
+        self.mock_client.metrics = Mock(spec=MetricsRegistry)
+        self.mock_client.get_response_source.return_value = 0x10
+        request_record = Mock(spec=UdsMessageRecord, payload=b"\x22\x12\x34", transmission_end_timestamp=1.)
+        response_record = Mock(spec=UdsMessageRecord, payload=b"\x62\x12\x34\x00",
+                               transmission_start_timestamp=0.999, transmission_end_timestamp=1.002)
+        assert Client._update_metrics(self.mock_client,
+                                      request_record=request_record,
+                                      response_records=(response_record,)) is None
+        self.mock_client.metrics.record.assert_called_once_with("p6_client", pytest.approx(2.), sid="0x22",
+                                                                ecu="0x10")
+        self.mock_client.metrics.increment.assert_not_called()
+
+    # __register_response_matcher
+
+    def test_register_response_matcher__not_background_receiving(self):
+        self.mock_client.is_background_receiving = False
+        assert Client._Client__register_response_matcher(self.mock_client, Mock()) is None
+        assert self.mock_client._Client__response_matchers == []
+        assert self.mock_client._Client__requests_in_progress_number == 1
 
+    def test_register_response_matcher__background_receiving(self):
+        mock_request = Mock(spec=UdsMessage)
+        self.mock_client.is_background_receiving = True
+        response_matcher = Client._Client__register_response_matcher(self.mock_client, mock_request)
+        assert isinstance(response_matcher, _ResponseMatcher)
+        assert response_matcher.request is mock_request
+        assert self.mock_client._Client__response_matchers == [response_matcher]
+        assert self.mock_client._Client__requests_in_progress_number == 1
+
+    # __unregister_response_matcher
+
+    def test_unregister_response_matcher__none(self):
+        mock_response_matcher = Mock()
+        self.mock_client._Client__response_matchers = [mock_response_matcher]
+        self.mock_client._Client__requests_in_progress_number = 2
+        assert Client._Client__unregister_response_matcher(self.mock_client, None) is None
+        assert self.mock_client._Client__response_matchers == [mock_response_matcher]
+        assert self.mock_client._Client__requests_in_progress_number == 1
+
+    def test_unregister_response_matcher(self):
+        mock_response_matchers = [Mock(), Mock()]
+        self.mock_client._Client__response_matchers = list(mock_response_matchers)
+        self.mock_client._Client__requests_in_progress_number = 2
+        assert Client._Client__unregister_response_matcher(self.mock_client, mock_response_matchers[0]) is None
+        assert self.mock_client._Client__response_matchers == mock_response_matchers[1:]
+        assert self.mock_client._Client__requests_in_progress_number == 1
 
     # __send_tester_present_task
 
@@ -925,14 +1100,11 @@ class TestClient:
         self.mock_client.s3_client = s3_client
         self.mock_client.is_tester_present_sent = False
         assert Client._Client__send_tester_present_task(self.mock_client, tester_present_request=Mock()) is None
-        self.mock_client.transport_interface.send_message.assert_not_called()
+        self.mock_client._send_tester_present.assert_not_called()
         self.mock_sleep.assert_called_once_with(s3_client / 1000.)
 
-    @pytest.mark.parametrize("s3_client, last_sent_request", [
-        (100, Mock(addressing_type=AddressingType.PHYSICAL)),
-        (2000, Mock(addressing_type=AddressingType.FUNCTIONAL)),
-    ])
-    def test_send_tester_present_task__send_and_receive_in_progress__no_sending(self, s3_client, last_sent_request):
+    @pytest.mark.parametrize("s3_client", [100, 2000])
+    def test_send_tester_present_task__sending(self, s3_client):
         cycles = 0
         def _stop_tester_present(*_, **__):
             nonlocal cycles
@@ -940,80 +1112,57 @@ class TestClient:
                 self.mock_client.is_tester_present_sent = False
             cycles += 1
 
-        mock_tp = Mock(addressing_type=last_sent_request.addressing_type)
-        mock_send_and_receive_not_in_progress = Mock(return_value=False)
+        mock_tp = Mock()
         self.mock_perf_counter.return_value = MagicMock(__add__=lambda this, other: this,
                                                         __iadd__=lambda this, other: this,
                                                         __sub__=lambda this, other: this,
                                                         __gt__=Mock(return_value=True))
         self.mock_sleep.side_effect = _stop_tester_present
         self.mock_client.s3_client = s3_client
-        self.mock_client.last_sent_request = last_sent_request
         self.mock_client.is_tester_present_sent = True
-        self.mock_client._Client__send_and_receive_not_in_progress_event = Mock(
-            is_set=mock_send_and_receive_not_in_progress)
         assert Client._Client__send_tester_present_task(self.mock_client, tester_present_request=mock_tp) is None
         assert self.mock_sleep.call_count == 3
-        self.mock_client._send_request.assert_not_called()
+        self.mock_client._send_tester_present.assert_has_calls([call(mock_tp), call(mock_tp)])
+
+    # _send_tester_present
 
-    @pytest.mark.parametrize("s3_client, last_sent_request", [
-        (100, Mock(addressing_type=AddressingType.PHYSICAL)),
-        (2000, Mock(addressing_type=AddressingType.FUNCTIONAL)),
+    @pytest.mark.parametrize("last_sent_request", [
+        Mock(addressing_type=AddressingType.PHYSICAL),
+        Mock(addressing_type=AddressingType.FUNCTIONAL),
     ])
-    def test_send_tester_present_task__send_and_receive_in_progress__sending(self, s3_client, last_sent_request):
-        cycles = 0
-        def _stop_tester_present(*_, **__):
-            nonlocal cycles
-            if cycles > 0:
-                self.mock_client.is_tester_present_sent = False
-            cycles += 1
+    def test_send_tester_present__send_and_receive_in_progress__no_sending(self, last_sent_request):
+        mock_tp = Mock(addressing_type=last_sent_request.addressing_type)
+        self.mock_client.last_sent_request = last_sent_request
+        self.mock_client._Client__requests_in_progress_number = 1
+        assert Client._send_tester_present(self.mock_client, tester_present_request=mock_tp) is None
+        self.mock_client._send_request.assert_not_called()
+        assert self.mock_client._Client__last_tester_present_requests == []
 
+    @pytest.mark.parametrize("last_sent_request", [
+        Mock(addressing_type=AddressingType.PHYSICAL),
+        Mock(addressing_type=AddressingType.FUNCTIONAL),
+    ])
+    def test_send_tester_present__send_and_receive_in_progress__sending(self, last_sent_request):
         mock_tp = Mock(addressing_type=Mock())
-        mock_send_and_receive_not_in_progress = Mock(return_value=False)
-        self.mock_perf_counter.return_value = MagicMock(__add__=lambda this, other: this,
-                                                        __iadd__=lambda this, other: this,
-                                                        __sub__=lambda this, other: this,
-                                                        __gt__=Mock(return_value=True))
-        self.mock_sleep.side_effect = _stop_tester_present
-        self.mock_client.s3_client = s3_client
         self.mock_client.last_sent_request = last_sent_request
-        self.mock_client.is_tester_present_sent = True
-        self.mock_client._Client__send_and_receive_not_in_progress_event = Mock(
-            is_set=mock_send_and_receive_not_in_progress)
-        assert Client._Client__send_tester_present_task(self.mock_client, tester_present_request=mock_tp) is None
-        assert self.mock_client._Client__last_tester_present_requests == [self.mock_client._send_request.return_value]
-        assert self.mock_sleep.call_count == 2
+        self.mock_client._Client__requests_in_progress_number = 1
+        assert (Client._send_tester_present(self.mock_client, tester_present_request=mock_tp)
+                == self.mock_client._send_request.return_value)
         self.mock_client._send_request.assert_called_once_with(mock_tp)
+        assert self.mock_client._Client__last_tester_present_requests == [self.mock_client._send_request.return_value]
 
-    @pytest.mark.parametrize("s3_client, last_sent_request", [
-        (100, Mock(addressing_type=AddressingType.PHYSICAL)),
-        (2000, Mock(addressing_type=AddressingType.FUNCTIONAL)),
-    ])
-    def test_send_tester_present_task__send_and_receive_not_in_progress__sending(self, s3_client, last_sent_request):
-        cycles = 0
-        def _stop_tester_present(*_, **__):
-            nonlocal cycles
-            if cycles > 0:
-                self.mock_client.is_tester_present_sent = False
-            cycles += 1
-            return True
-
+    @pytest.mark.parametrize("previous_records_number", [0, 4, 5, 10])
+    def test_send_tester_present__send_and_receive_not_in_progress__sending(self, previous_records_number):
         mock_tp = Mock(addressing_type=Mock())
-        mock_send_and_receive_not_in_progress = Mock(side_effect=_stop_tester_present)
-        self.mock_perf_counter.return_value = MagicMock(__add__=lambda this, other: this,
-                                                        __iadd__=lambda this, other: this,
-                                                        __sub__=lambda this, other: this,
-                                                        __gt__=Mock(return_value=False))
-        self.mock_client.s3_client = s3_client
-        self.mock_client.last_sent_request = last_sent_request
-        self.mock_client.is_tester_present_sent = True
-        self.mock_client._Client__send_and_receive_not_in_progress_event = Mock(
-            is_set=mock_send_and_receive_not_in_progress)
-        assert Client._Client__send_tester_present_task(self.mock_client, tester_present_request=mock_tp) is None
-        assert self.mock_client._Client__last_tester_present_requests == [self.mock_client._send_request.return_value,
-                                                                          self.mock_client._send_request.return_value]
-        assert self.mock_sleep.call_count == 1
-        assert self.mock_client._send_request.call_count == 2
+        previous_records = [Mock() for _ in range(previous_records_number)]
+        self.mock_client._Client__last_tester_present_requests = list(previous_records)
+        self.mock_client._Client__requests_in_progress_number = 0
+        assert (Client._send_tester_present(self.mock_client, tester_present_request=mock_tp)
+                == self.mock_client._send_request.return_value)
+        self.mock_client._send_request.assert_called_once_with(mock_tp)
+        assert self.mock_client._Client__last_tester_present_requests \
+               == ([self.mock_client._send_request.return_value]
+                   + previous_records)[:self.mock_client.tester_present_storage_size]
 
     # _update_last_response
 
@@ -1238,10 +1387,42 @@ class TestClient:
         self.mock_min.assert_called_once_with(start_timeout, end_timeout)
         self.mock_client._update_last_response.assert_called_once_with(
             self.mock_client.transport_interface.receive_message.return_value)
-        self.mock_client._Client__receiving_lock.__enter__.assert_called_once_with()
-        self.mock_client._Client__receiving_lock.__exit__.assert_called_once()
-        self.mock_client._Client__receiving_not_in_progress_event.set.assert_called_once_with()
-        self.mock_client._Client__receiving_not_in_progress_event.clear.assert_called_once_with()
+        self.mock_client._Client__receiving_condition.wait.assert_not_called()
+        self.mock_client._Client__receiving_condition.notify_all.assert_called_once_with()
+        assert self.mock_client._Client__is_receiving_directly is False
+
+    def test_receive_response__wait_for_receiver(self):
+        def _finish_receiving_attempt(*_, **__):
+            self.mock_client._Client__receiving_attempt_timestamp = None
+
+        def _receive_message(*_, **__):
+            assert self.mock_client._Client__is_receiving_directly is True
+            return mock_response_record
+
+        mock_response_record = Mock(spec=UdsMessageRecord)
+        self.mock_client._Client__receiving_attempt_timestamp = 1.
+        self.mock_client._Client__receiving_condition.wait.side_effect = _finish_receiving_attempt
+        self.mock_client.transport_interface.receive_message.side_effect = _receive_message
+        assert Client._receive_response(self.mock_client, start_timeout=50, end_timeout=1000) == mock_response_record
+        self.mock_client._Client__receiving_condition.wait.assert_called_once_with()
+        assert self.mock_client._Client__is_receiving_directly is False
+
+    @pytest.mark.parametrize("start_timeout, end_timeout", [
+        (Mock(), Mock()),
+    ])
+    def test_receive_response__response_matcher(self, start_timeout, end_timeout):
+        mock_response_matcher = Mock(spec=_ResponseMatcher)
+        assert (Client._receive_response(self.mock_client,
+                                        start_timeout=start_timeout,
+                                        end_timeout=end_timeout,
+                                        response_matcher=mock_response_matcher)
+                == self.mock_client._receive_matched_response.return_value)
+        self.mock_client._receive_matched_response.assert_called_once_with(start_timeout=self.mock_min.return_value,
+                                                                           end_timeout=end_timeout,
+                                                                           response_matcher=mock_response_matcher)
+        self.mock_min.assert_called_once_with(start_timeout, end_timeout)
+        self.mock_client.transport_interface.receive_message.assert_not_called()
+        self.mock_client._update_last_response.assert_not_called()
 
     @pytest.mark.parametrize("start_timeout, end_timeout", [
         (Mock(), Mock()),
@@ -1257,10 +1438,90 @@ class TestClient:
             end_timeout=end_timeout)
         self.mock_min.assert_called_once_with(start_timeout, end_timeout)
         self.mock_client._update_last_response.assert_not_called()
-        self.mock_client._Client__receiving_lock.__enter__.assert_called_once_with()
-        self.mock_client._Client__receiving_lock.__exit__.assert_called_once()
-        self.mock_client._Client__receiving_not_in_progress_event.set.assert_called_once_with()
-        self.mock_client._Client__receiving_not_in_progress_event.clear.assert_called_once_with()
+        self.mock_client._Client__receiving_condition.notify_all.assert_called_once_with()
+        assert self.mock_client._Client__is_receiving_directly is False
+
+    # _receive_matched_response
+
+    @pytest.mark.parametrize("start_timeout, end_timeout, transmission_start_timestamp", [
+        (50, 1000, 10.01),
+        (100, 150, 10.1),
+    ])
+    def test_receive_matched_response__delivered(self, start_timeout, end_timeout, transmission_start_timestamp):
+        self.mock_perf_counter.return_value = 10.
+        mock_response_record = Mock(spec=UdsMessageRecord, transmission_start_timestamp=transmission_start_timestamp)
+        mock_response_matcher = Mock(spec=_ResponseMatcher, responses=deque([mock_response_record]))
+        assert Client._receive_matched_response(self.mock_client,
+                                                start_timeout=start_timeout,
+                                                end_timeout=end_timeout,
+                                                response_matcher=mock_response_matcher) == mock_response_record
+        assert not mock_response_matcher.responses
+        self.mock_client._Client__receiving_condition.wait.assert_not_called()
+        self.mock_client._Client__response_queue.put_nowait.assert_not_called()
+
+    def test_receive_matched_response__wait_before_start_timeout(self):
+        def _deliver_response(*_, **__):
+            mock_response_matcher.responses.append(mock_response_record)
+
+        self.mock_perf_counter.side_effect = [10., 10.02]
+        mock_response_record = Mock(spec=UdsMessageRecord, transmission_start_timestamp=10.03)
+        mock_response_matcher = Mock(spec=_ResponseMatcher, responses=deque())
+        self.mock_client._Client__receiving_condition.wait.side_effect = _deliver_response
+        assert Client._receive_matched_response(self.mock_client,
+                                                start_timeout=50,
+                                                end_timeout=1000,
+                                                response_matcher=mock_response_matcher) == mock_response_record
+        self.mock_client._Client__receiving_condition.wait.assert_called_once_with(timeout=pytest.approx(0.03))
+
+    @pytest.mark.parametrize("receiving_attempt_timestamp", [None, 10.05, 10.06])
+    def test_receive_matched_response__not_started(self, receiving_attempt_timestamp):
+        self.mock_perf_counter.side_effect = [10., 10.05]
+        self.mock_client._Client__receiving_attempt_timestamp = receiving_attempt_timestamp
+        mock_response_matcher = Mock(spec=_ResponseMatcher, responses=deque())
+        with pytest.raises(MessageTransmissionNotStartedError):
+            Client._receive_matched_response(self.mock_client,
+                                             start_timeout=50,
+                                             end_timeout=1000,
+                                             response_matcher=mock_response_matcher)
+        self.mock_client._Client__receiving_condition.wait.assert_not_called()
+
+    def test_receive_matched_response__not_finished(self):
+        self.mock_perf_counter.side_effect = [10., 11.]
+        self.mock_client._Client__receiving_attempt_timestamp = 10.04
+        mock_response_matcher = Mock(spec=_ResponseMatcher, responses=deque())
+        with pytest.raises(TimeoutError) as exception_info:
+            Client._receive_matched_response(self.mock_client,
+                                             start_timeout=50,
+                                             end_timeout=1000,
+                                             response_matcher=mock_response_matcher)
+        assert not isinstance(exception_info.value, MessageTransmissionNotStartedError)
+        self.mock_client._Client__receiving_condition.wait.assert_not_called()
+
+    def test_receive_matched_response__wait_for_started_reception(self):
+        def _deliver_response(*_, **__):
+            mock_response_matcher.responses.append(mock_response_record)
+
+        self.mock_perf_counter.side_effect = [10., 10.06]
+        self.mock_client._Client__receiving_attempt_timestamp = 10.04
+        mock_response_record = Mock(spec=UdsMessageRecord, transmission_start_timestamp=10.045)
+        mock_response_matcher = Mock(spec=_ResponseMatcher, responses=deque())
+        self.mock_client._Client__receiving_condition.wait.side_effect = _deliver_response
+        assert Client._receive_matched_response(self.mock_client,
+                                                start_timeout=50,
+                                                end_timeout=1000,
+                                                response_matcher=mock_response_matcher) == mock_response_record
+        self.mock_client._Client__receiving_condition.wait.assert_called_once_with(timeout=pytest.approx(0.94))
+
+    def test_receive_matched_response__late_start(self):
+        self.mock_perf_counter.return_value = 10.
+        mock_response_record = Mock(spec=UdsMessageRecord, transmission_start_timestamp=10.051)
+        mock_response_matcher = Mock(spec=_ResponseMatcher, responses=deque([mock_response_record]))
+        with pytest.raises(MessageTransmissionNotStartedError):
+            Client._receive_matched_response(self.mock_client,
+                                             start_timeout=50,
+                                             end_timeout=1000,
+                                             response_matcher=mock_response_matcher)
+        self.mock_client._Client__response_queue.put_nowait.assert_called_once_with(mock_response_record)
 
     # _receive_initial_response
 
@@ -1320,6 +1581,7 @@ class TestClient:
         self.mock_client.p6_client_timeout = p6_client_timeout
         self.mock_client._receive_response.side_effect = MessageTransmissionNotStartedError
         self.mock_perf_counter.return_value = MagicMock(__lt__=Mock(return_value=True))
+        self.mock_validate_request_sid.side_effect = RequestSID
         assert Client._receive_initial_response(self.mock_client, request_record) is None
         self.mock_client._receive_response.assert_called_once()
 
@@ -1511,6 +1773,91 @@ class TestClient:
             response_message=self.mock_client._receive_response.return_value,
             request_message=request_record)
 
+    # get_response_source
+
+    @pytest.mark.parametrize("packet_record, expected_source", [
+        (Mock(source_address=0x12, can_id=0x18DAF112), 0x12),
+        (Mock(source_address=None, can_id=0x7E8), 0x7E8),
+        (Mock(spec=[]), None),
+    ])
+    def test_get_response_source(self, packet_record, expected_source):
+        response_record = Mock(spec=UdsMessageRecord, packets_records=(packet_record, Mock()))
+        assert Client.get_response_source(response_record) == expected_source
+
+    # _receive_responses_from_servers
+
+    def _setup_receive_responses_from_servers(self, events):
+        """Configure the mock client to receive scripted response messages (one per perf_counter tick)."""
+        self.mock_min.side_effect = min
+        self.mock_client.p2_client_timeout = 50
+        self.mock_client.p2_ext_client_timeout = 2000
+        self.mock_client.p6_ext_client_timeout = 10000
+        self.mock_perf_counter.side_effect = [10. + i / 1000. for i in range(len(events) + 1)]
+        self.mock_client._receive_response.side_effect = events
+        self.mock_client.get_response_source.side_effect = lambda response_record: response_record.source
+        self.mock_client.is_response_to_request.side_effect \
+            = lambda response_message, request_message: response_message.payload[0] != 0x7E
+        self.mock_client.is_response_pending_message.side_effect \
+            = lambda response_message, request_sid: response_message.payload[-1] == 0x78
+
+    @staticmethod
+    def _response_record(source, payload, timestamp):
+        return Mock(spec=UdsMessageRecord, source=source, payload=payload,
+                    transmission_start_timestamp=timestamp, transmission_end_timestamp=timestamp)
+
+    def test_receive_responses_from_servers__no_response(self):
+        request_record = Mock(spec=UdsMessageRecord, payload=b"\x3E\x00", transmission_end_timestamp=10.)
+        self._setup_receive_responses_from_servers([MessageTransmissionNotStartedError])
+        assert Client._receive_responses_from_servers(self.mock_client, request_record) == {}
+        self.mock_client._receive_response.assert_called_once_with(start_timeout=pytest.approx(50.),
+                                                                   end_timeout=pytest.approx(10000.),
+                                                                   response_matcher=None)
+        self.mock_warn.assert_not_called()
+
+    def test_receive_responses_from_servers__multiple_servers(self):
+        request_record = Mock(spec=UdsMessageRecord, payload=b"\x19\x02\xFF", transmission_end_timestamp=10.)
+        response_1 = self._response_record(0x10, b"\x59\x02\xFF", 10.010)
+        response_2_pending = self._response_record(0x20, b"\x7F\x19\x78", 10.020)
+        response_3_pending = self._response_record(0x30, b"\x7F\x19\x78", 10.030)
+        unrelated = self._response_record(0x10, b"\x7E\x00", 10.040)
+        response_2_pending_2 = self._response_record(0x20, b"\x7F\x19\x78", 11.0)
+        response_3 = self._response_record(0x30, b"\x59\x02\xFF\x12\x34\x56\x08", 11.5)
+        response_2 = self._response_record(0x20, b"\x59\x02\xFF", 12.0)
+        self._setup_receive_responses_from_servers([response_1, response_2_pending, response_3_pending, unrelated,
+                                                     response_2_pending_2, response_3, response_2])
+        self.mock_perf_counter.side_effect = [10., 10.010, 10.020, 10.030, 10.040, 11.0, 11.5, 12.0]
+        assert Client._receive_responses_from_servers(self.mock_client, request_record) == {
+            0x10: [response_1],
+            0x20: [response_2_pending, response_2_pending_2, response_2],
+            0x30: [response_3_pending, response_3],
+        }
+        self.mock_client._Client__response_queue.put_nowait.assert_called_once_with(unrelated)
+        assert self.mock_client._receive_response.call_args_list[-1] \
+               == call(start_timeout=pytest.approx(1500.), end_timeout=pytest.approx(8500.), response_matcher=None)
+        self.mock_warn.assert_not_called()
+
+    def test_receive_responses_from_servers__late_responses(self):
+        request_record = Mock(spec=UdsMessageRecord, payload=b"\x3E\x00", transmission_end_timestamp=10.)
+        response_1 = self._response_record(0x10, b"\x7E\x00", 10.010)
+        response_1_repeated = self._response_record(0x10, b"\x7E\x00", 10.020)
+        response_2_late = self._response_record(0x20, b"\x7E\x00", 10.060)
+        self._setup_receive_responses_from_servers([response_1, response_1_repeated, response_2_late])
+        self.mock_client.is_response_to_request.side_effect = None
+        self.mock_client.is_response_to_request.return_value = True
+        self.mock_perf_counter.side_effect = [10., 10.010, 10.020, 10.065]
+        assert Client._receive_responses_from_servers(self.mock_client, request_record) == {0x10: [response_1]}
+        self.mock_client._Client__response_queue.put_nowait.assert_has_calls([call(response_1_repeated),
+                                                                              call(response_2_late)])
+        assert self.mock_warn.call_count == 2
+
+    @pytest.mark.parametrize("last_event", [MessageTransmissionNotStartedError, TimeoutError])
+    def test_receive_responses_from_servers__not_finished(self, last_event):
+        request_record = Mock(spec=UdsMessageRecord, payload=b"\x31\x01\x12\x34", transmission_end_timestamp=10.)
+        response_pending = self._response_record(0x10, b"\x7F\x31\x78", 10.010)
+        self._setup_receive_responses_from_servers([response_pending, last_event])
+        assert Client._receive_responses_from_servers(self.mock_client, request_record) == {0x10: [response_pending]}
+        self.mock_warn.assert_called()
+
     # is_response_pending_message
 
     @pytest.mark.parametrize("message, sid", [
@@ -1698,7 +2045,7 @@ class TestClient:
         self.mock_client._Client__transmission_not_in_progress_event.wait.side_effect = _ready_for_physical_transmission
         assert Client.wait_till_ready_for_physical_transmission(self.mock_client) is None
         self.mock_client._Client__transmission_not_in_progress_event.wait.assert_called_once_with()
-        self.mock_client._Client__receiving_not_in_progress_event.wait.assert_called_once_with()
+        self.mock_client._Client__receiving_condition.wait.assert_not_called()
         self.mock_perf_counter.assert_not_called()
 
     def test_wait_till_ready_for_physical_transmission__wait_for_p3_timeout(self):
@@ -1715,7 +2062,7 @@ class TestClient:
         self.mock_perf_counter.return_value = MagicMock(__lt__=Mock(return_value=True))
         assert Client.wait_till_ready_for_physical_transmission(self.mock_client) is None
         self.mock_client._Client__transmission_not_in_progress_event.wait.assert_called_once_with()
-        self.mock_client._Client__receiving_not_in_progress_event.wait.assert_called_once_with()
+        self.mock_client._Client__receiving_condition.wait.assert_not_called()
         self.mock_perf_counter.assert_called_once_with()
         self.mock_sleep.assert_called_once()
 
@@ -1733,10 +2080,22 @@ class TestClient:
         self.mock_perf_counter.return_value = MagicMock(__lt__=Mock(return_value=False))
         assert Client.wait_till_ready_for_physical_transmission(self.mock_client) is None
         self.mock_client._Client__transmission_not_in_progress_event.wait.assert_called_once_with()
-        self.mock_client._Client__receiving_not_in_progress_event.wait.assert_called_once_with()
+        self.mock_client._Client__receiving_condition.wait.assert_not_called()
         self.mock_perf_counter.assert_called_once_with()
         self.mock_sleep.assert_not_called()
 
+    def test_wait_till_ready_for_physical_transmission__receiving_directly(self):
+        def _finish_receiving(*_, **__):
+            self.mock_client._Client__is_receiving_directly = False
+            self.mock_client.is_ready_for_physical_transmission = True
+
+        self.mock_client.is_ready_for_physical_transmission = False
+        self.mock_client._Client__is_receiving_directly = True
+        self.mock_client._Client__last_physical_request = None
+        self.mock_client._Client__receiving_condition.wait.side_effect = _finish_receiving
+        assert Client.wait_till_ready_for_physical_transmission(self.mock_client) is None
+        self.mock_client._Client__receiving_condition.wait.assert_called_once_with()
+
     # wait_till_ready_for_functional_transmission
 
     def test_wait_till_ready_for_functional_transmission__no_request_sent(self):
@@ -1748,7 +2107,7 @@ class TestClient:
         self.mock_client._Client__transmission_not_in_progress_event.wait.side_effect = _ready_for_functional_transmission
         assert Client.wait_till_ready_for_functional_transmission(self.mock_client) is None
         self.mock_client._Client__transmission_not_in_progress_event.wait.assert_called_once_with()
-        self.mock_client._Client__receiving_not_in_progress_event.wait.assert_not_called()
+        self.mock_client._Client__receiving_condition.wait.assert_not_called()
         self.mock_perf_counter.assert_not_called()
 
     def test_wait_till_ready_for_functional_transmission__wait_for_p3_timeout(self):
@@ -1765,7 +2124,7 @@ class TestClient:
         self.mock_perf_counter.return_value = MagicMock(__lt__=Mock(return_value=True))
         assert Client.wait_till_ready_for_functional_transmission(self.mock_client) is None
         self.mock_client._Client__transmission_not_in_progress_event.wait.assert_called_once_with()
-        self.mock_client._Client__receiving_not_in_progress_event.wait.assert_not_called()
+        self.mock_client._Client__receiving_condition.wait.assert_not_called()
         self.mock_perf_counter.assert_called_once_with()
         self.mock_sleep.assert_called_once()
 
@@ -1783,7 +2142,7 @@ class TestClient:
         self.mock_perf_counter.return_value = MagicMock(__lt__=Mock(return_value=False))
         assert Client.wait_till_ready_for_functional_transmission(self.mock_client) is None
         self.mock_client._Client__transmission_not_in_progress_event.wait.assert_called_once_with()
-        self.mock_client._Client__receiving_not_in_progress_event.wait.assert_not_called()
+        self.mock_client._Client__receiving_condition.wait.assert_not_called()
         self.mock_perf_counter.assert_called_once_with()
         self.mock_sleep.assert_not_called()
 
@@ -1882,6 +2241,29 @@ class TestClient:
         self.mock_thread.return_value.start.assert_called_once_with()
         self.mock_warn.assert_not_called()
 
+    @pytest.mark.parametrize("addressing_type, sprmib", [
+        (AddressingType.FUNCTIONAL, True),
+        (AddressingType.PHYSICAL, False),
+    ])
+    def test_start_tester_present__scheduler(self, addressing_type, sprmib):
+        mock_event = Mock(spec=Event)
+        mock_scheduler = Mock(spec=TesterPresentScheduler)
+        self.mock_client.is_tester_present_sent = False
+        self.mock_client._Client__tester_present_task_event = mock_event
+        self.mock_client._Client__tester_present_thread = None
+        assert Client.start_tester_present(self.mock_client,
+                                           addressing_type=addressing_type,
+                                           sprmib=sprmib,
+                                           scheduler=mock_scheduler) is None
+        mock_scheduler.register.assert_called_once_with(client=self.mock_client,
+                                                        addressing_type=addressing_type,
+                                                        sprmib=sprmib)
+        assert self.mock_client._Client__tester_present_scheduler == mock_scheduler
+        assert self.mock_client._Client__tester_present_thread is None
+        mock_event.set.assert_called_once_with()
+        self.mock_thread.assert_not_called()
+        self.mock_warn.assert_not_called()
+
     def test_start_tester_present__started(self):
         self.mock_client.is_tester_present_sent = True
         assert Client.start_tester_present(self.mock_client) is None
@@ -1893,6 +2275,7 @@ class TestClient:
         mock_thread = Mock(spec=Thread)
         mock_event = Mock(spec=Event)
         self.mock_client.is_tester_present_sent = True
+        self.mock_client._Client__tester_present_scheduler = None
         self.mock_client._Client__tester_present_thread = mock_thread
         self.mock_client._Client__tester_present_task_event = mock_event
         assert Client.stop_tester_present(self.mock_client) is None
@@ -1905,12 +2288,26 @@ class TestClient:
         mock_event = Mock(spec=Event)
         self.mock_client.is_tester_present_sent = True
         self.mock_client._Client__tester_present_thread = None
+        self.mock_client._Client__tester_present_scheduler = None
         self.mock_client._Client__tester_present_task_event = mock_event
         assert Client.stop_tester_present(self.mock_client) is None
         assert self.mock_client._Client__tester_present_thread is None
         mock_event.clear.assert_called_once_with()
         self.mock_warn.assert_not_called()
 
+    def test_stop_tester_present__stop_scheduler(self):
+        mock_event = Mock(spec=Event)
+        mock_scheduler = Mock(spec=TesterPresentScheduler)
+        self.mock_client.is_tester_present_sent = True
+        self.mock_client._Client__tester_present_thread = None
+        self.mock_client._Client__tester_present_scheduler = mock_scheduler
+        self.mock_client._Client__tester_present_task_event = mock_event
+        assert Client.stop_tester_present(self.mock_client) is None
+        assert self.mock_client._Client__tester_present_scheduler is None
+        mock_scheduler.unregister.assert_called_once_with(self.mock_client)
+        mock_event.clear.assert_called_once_with()
+        self.mock_warn.assert_not_called()
+
     def test_stop_tester_present__stopped(self):
         self.mock_client.is_tester_present_sent = False
         assert Client.stop_tester_present(self.mock_client) is None
@@ -1978,14 +2375,16 @@ class TestClient:
         self.mock_client._receive_initial_response.return_value = None
         assert (Client.send_request_receive_responses(self.mock_client, request_message)
                 == (self.mock_client._send_request.return_value, ()))
+        assert (self.mock_client._Client__register_response_matcher.return_value.request
+                == self.mock_client._send_request.return_value)
         self.mock_client._send_request.assert_called_once_with(request_message)
-        self.mock_client._receive_initial_response.assert_called_once_with(self.mock_client._send_request.return_value)
+        self.mock_client._receive_initial_response.assert_called_once_with(
+            request_record=self.mock_client._send_request.return_value,
+            response_matcher=self.mock_client._Client__register_response_matcher.return_value)
         self.mock_client._receive_following_response.assert_not_called()
-        self.mock_client._Client__send_and_receive_not_in_progress_event.clear.assert_called_once_with()
-        self.mock_client._Client__send_and_receive_not_in_progress_event.set.assert_called_once_with()
-        self.mock_client._Client__receiving_not_in_progress_event.wait.assert_called_once_with(
-            timeout=self.mock_client.p6_ext_client_timeout)
-        self.mock_client._Client__break_in_background_receiving_event.wait.assert_called_once()
+        self.mock_client._Client__register_response_matcher.assert_called_once_with(request_message)
+        self.mock_client._Client__unregister_response_matcher.assert_called_once_with(
+            self.mock_client._Client__register_response_matcher.return_value)
 
     @pytest.mark.parametrize("request_message", [
         Mock(spec=UdsMessage, payload=[0x3E, 0x00]),
@@ -1998,12 +2397,12 @@ class TestClient:
                 == (self.mock_client._send_request.return_value,
                     (self.mock_client._receive_initial_response.return_value,)))
         self.mock_client._send_request.assert_called_once_with(request_message)
-        self.mock_client._receive_initial_response.assert_called_once_with(self.mock_client._send_request.return_value)
+        self.mock_client._receive_initial_response.assert_called_once_with(
+            request_record=self.mock_client._send_request.return_value,
+            response_matcher=self.mock_client._Client__register_response_matcher.return_value)
         self.mock_client._receive_following_response.assert_not_called()
-        self.mock_client._Client__send_and_receive_not_in_progress_event.clear.assert_called_once_with()
-        self.mock_client._Client__send_and_receive_not_in_progress_event.set.assert_called_once_with()
-        self.mock_client._Client__receiving_not_in_progress_event.wait.assert_not_called()
-        self.mock_client._Client__break_in_background_receiving_event.wait.assert_not_called()
+        self.mock_client._Client__unregister_response_matcher.assert_called_once_with(
+            self.mock_client._Client__register_response_matcher.return_value)
         self.mock_client._update_measured_client_values.assert_called_once_with(
             request_record=self.mock_client._send_request.return_value,
             response_records=[self.mock_client._receive_initial_response.return_value])
@@ -2020,15 +2419,83 @@ class TestClient:
         assert (Client.send_request_receive_responses(self.mock_client, request_message)
                 == (self.mock_client._send_request.return_value, response_records))
         self.mock_client._send_request.assert_called_once_with(request_message)
-        self.mock_client._receive_initial_response.assert_called_once_with(self.mock_client._send_request.return_value)
+        self.mock_client._receive_initial_response.assert_called_once_with(
+            request_record=self.mock_client._send_request.return_value,
+            response_matcher=self.mock_client._Client__register_response_matcher.return_value)
         assert self.mock_client._receive_following_response.call_count == response_pending_count
-        self.mock_client._Client__send_and_receive_not_in_progress_event.clear.assert_called_once_with()
-        self.mock_client._Client__send_and_receive_not_in_progress_event.set.assert_called_once_with()
-        self.mock_client._Client__receiving_not_in_progress_event.wait.assert_not_called()
-        self.mock_client._Client__break_in_background_receiving_event.wait.assert_not_called()
+        self.mock_client._Client__unregister_response_matcher.assert_called_once_with(
+            self.mock_client._Client__register_response_matcher.return_value)
         self.mock_client._update_measured_client_values.assert_called_once_with(
             request_record=self.mock_client._send_request.return_value,
             response_records=list(response_records))
+        self.mock_client._update_metrics.assert_called_once_with(
+            request_record=self.mock_client._send_request.return_value,
+            response_records=list(response_records))
+
+    @pytest.mark.parametrize("request_message", [
+        Mock(spec=UdsMessage, payload=[0x22, 0x12, 0x34]),
+    ])
+    def test_send_request_receive_responses__initial_timeout_error(self, request_message):
+        self.mock_client.metrics = Mock(spec=MetricsRegistry)
+        self.mock_client._receive_initial_response.side_effect = TimeoutError
+        self.mock_validate_request_sid.side_effect = RequestSID
+        with pytest.raises(TimeoutError):
+            Client.send_request_receive_responses(self.mock_client, request_message)
+        self.mock_client.metrics.increment.assert_called_once_with("timeouts", sid="0x22", stage="initial_response")
+        self.mock_client._update_metrics.assert_not_called()
+        self.mock_client._Client__unregister_response_matcher.assert_called_once_with(
+            self.mock_client._Client__register_response_matcher.return_value)
+
+    @pytest.mark.parametrize("metrics", [None, Mock(spec=MetricsRegistry)])
+    @pytest.mark.parametrize("request_message", [
+        Mock(spec=UdsMessage, payload=[0x31, 0x01, 0xFF, 0x00]),
+    ])
+    def test_send_request_receive_responses__timeout_error(self, request_message, metrics):
+        self.mock_client.metrics = metrics
+        self.mock_client.is_response_pending_message.return_value = True
+        self.mock_client._receive_following_response.side_effect = TimeoutError
+        self.mock_validate_request_sid.side_effect = RequestSID
+        with pytest.raises(TimeoutError):
+            Client.send_request_receive_responses(self.mock_client, request_message)
+        if metrics is not None:
+            metrics.increment.assert_called_once_with("timeouts", sid="0x31", stage="following_response")
+        self.mock_client._update_metrics.assert_not_called()
+        self.mock_client._Client__unregister_response_matcher.assert_called_once_with(
+            self.mock_client._Client__register_response_matcher.return_value)
+
+    # send_request_receive_responses_from_servers
+
+    @patch(f"{SCRIPT_LOCATION}.isinstance")
+    def test_send_request_receive_responses_from_servers__type_error(self, mock_isinstance):
+        mock_isinstance.return_value = False
+        mock_request = Mock()
+        with pytest.raises(TypeError):
+            Client.send_request_receive_responses_from_servers(self.mock_client, mock_request)
+        mock_isinstance.assert_called_once_with(mock_request, UdsMessage)
+
+    @pytest.mark.parametrize("is_background_receiving", [True, False])
+    @pytest.mark.parametrize("responses", [
+        {},
+        {0x10: [Mock()], 0x7E8: [Mock(), Mock()]},
+    ])
+    def test_send_request_receive_responses_from_servers(self, is_background_receiving, responses):
+        request_message = Mock(spec=UdsMessage, payload=[0x3E, 0x00])
+        self.mock_client.is_background_receiving = is_background_receiving
+        self.mock_client._receive_responses_from_servers.return_value = responses
+        request_record, collected_responses \
+            = Client.send_request_receive_responses_from_servers(self.mock_client, request_message)
+        assert request_record == self.mock_client._send_request.return_value
+        assert collected_responses == {source: tuple(records) for source, records in responses.items()}
+        assert self.mock_client._Client__register_response_matcher.return_value.request == request_record
+        self.mock_client._send_request.assert_called_once_with(request_message)
+        self.mock_client._receive_responses_from_servers.assert_called_once_with(
+            request_record=request_record,
+            response_matcher=self.mock_client._Client__register_response_matcher.return_value)
+        assert self.mock_client._update_measured_client_values.call_count == len(responses)
+        assert self.mock_client._update_metrics.call_count == len(responses)
+        self.mock_client._Client__register_response_matcher.assert_called_once_with(request_message)
+        self.mock_client._Client__unregister_response_matcher.assert_called_once_with(
+            self.mock_client._Client__register_response_matcher.return_value)
 
 
 @pytest.mark.integration
@@ -2094,3 +2561,458 @@ class TestClientIntegration:
     def test_init__value_error(self, kwargs):
         with pytest.raises(ValueError):
             Client(**kwargs)
+
+    @pytest.mark.parametrize("scheduled_responses, expected_sources", [
+        ([], {}),
+        ([(0.005, 0x10, b"\x50\x01"), (0.010, 0x20, b"\x7F\x10\x78"), (0.015, 0x30, b"\x50\x01"),
+          (0.080, 0x20, b"\x7F\x10\x78"), (0.150, 0x20, b"\x50\x01")],
+         {0x10: 1, 0x20: 3, 0x30: 1}),
+    ])
+    def test_send_request_receive_responses_from_servers(self, scheduled_responses, expected_sources):
+        scheduled_responses = list(scheduled_responses)
+        mock_transport_interface = Mock(spec=AbstractTransportInterface)
+        request_timestamp = []
+
+        def _send_message(message):
+            request_timestamp.append(perf_counter())
+            return Mock(spec=UdsMessageRecord, payload=bytes(message.payload),
+                        addressing_type=message.addressing_type, transmission_end_timestamp=request_timestamp[0])
+
+        def _receive_message(start_timeout, end_timeout):
+            timestamp_start_timeout = perf_counter() + start_timeout / 1000.
+            if scheduled_responses and request_timestamp[0] + scheduled_responses[0][0] < timestamp_start_timeout:
+                delay, source, payload = scheduled_responses.pop(0)
+                sleep(max(0., request_timestamp[0] + delay - perf_counter()))
+                timestamp = perf_counter()
+                return Mock(spec=UdsMessageRecord, payload=payload, addressing_type=AddressingType.FUNCTIONAL,
+                            packets_records=(Mock(source_address=source),),
+                            transmission_start_timestamp=timestamp, transmission_end_timestamp=timestamp)
+            sleep(max(0., timestamp_start_timeout - perf_counter()))
+            raise MessageTransmissionNotStartedError
+
+        mock_transport_interface.send_message.side_effect = _send_message
+        mock_transport_interface.receive_message.side_effect = _receive_message
+        client = Client(transport_interface=mock_transport_interface, p2_client_timeout=30, p2_ext_client_timeout=100)
+        request = UdsMessage(payload=b"\x10\x01", addressing_type=AddressingType.FUNCTIONAL)
+        request_record, responses = client.send_request_receive_responses_from_servers(request)
+        assert request_record.payload == b"\x10\x01"
+        assert {source: len(response_records) for source, response_records in responses.items()} == expected_sources
+        assert all(response_records[-1].payload == b"\x50\x01" for response_records in responses.values())
+        assert client.get_response_no_wait() is None
+
+    @pytest.mark.parametrize("cycle", [500])
+    def test_send_request_receive_responses__background_receiving(self, cycle):
+        messages_to_receive = Queue()
+        mock_transport_interface = Mock(spec=AbstractTransportInterface)
+
+        def _send_message(message):
+            timestamp = perf_counter()
+            messages_to_receive.put((timestamp + 0.002, b"\x7E\x00"))  # unrelated response
+            messages_to_receive.put((timestamp + 0.005, b"\x62" + bytes(message.payload[1:]) + b"\x00"))
+            return Mock(spec=UdsMessageRecord, payload=bytes(message.payload), addressing_type=message.addressing_type,
+                        transmission_start_timestamp=timestamp, transmission_end_timestamp=timestamp)
+
+        def _receive_message(start_timeout, end_timeout):
+            try:
+                timestamp_receive, payload = messages_to_receive.get(timeout=start_timeout / 1000.)
+            except Empty as exception:
+                raise MessageTransmissionNotStartedError from exception
+            sleep(max(0., timestamp_receive - perf_counter()))
+            timestamp = perf_counter()
+            return Mock(spec=UdsMessageRecord, payload=payload, addressing_type=AddressingType.PHYSICAL,
+                        transmission_start_timestamp=timestamp, transmission_end_timestamp=timestamp)
+
+        mock_transport_interface.send_message.side_effect = _send_message
+        mock_transport_interface.receive_message.side_effect = _receive_message
+        client = Client(transport_interface=mock_transport_interface)
+        client.start_background_receiving(cycle=cycle)
+        try:
+            sleep(0.05)  # the receiving task waits for a message now
+            timestamp_start = perf_counter()
+            request_record, response_records = client.send_request_receive_responses(
+                UdsMessage(payload=b"\x22\x12\x34", addressing_type=AddressingType.PHYSICAL))
+            duration_ms = (perf_counter() - timestamp_start) * 1000.
+        finally:
+            client.stop_background_receiving()
+        assert request_record.payload == b"\x22\x12\x34"
+        assert [response_record.payload for response_record in response_records] == [b"\x62\x12\x34\x00"]
+        assert duration_ms < cycle / 2
+        assert client.get_response_no_wait().payload == b"\x7E\x00"
+        assert client.get_response_no_wait() is None
+
+    @pytest.mark.parametrize("cycle", [10])
+    @pytest.mark.parametrize("payload, addressing_type", [
+        (b"\x3E\x80", AddressingType.PHYSICAL),
+        (b"\x3E\x80", AddressingType.FUNCTIONAL),
+        (b"\x3E\x00", AddressingType.FUNCTIONAL),
+        (b"\x3E\x00", AddressingType.PHYSICAL),
+    ])
+    def test_send_request_receive_responses__background_receiving__no_response(self, cycle, payload,
+                                                                                addressing_type):
+        mock_transport_interface = Mock(spec=AbstractTransportInterface)
+
+        def _send_message(message):
+            timestamp = perf_counter()
+            return Mock(spec=UdsMessageRecord, payload=bytes(message.payload), addressing_type=message.addressing_type,
+                        transmission_start_timestamp=timestamp, transmission_end_timestamp=timestamp)
+
+        def _receive_message(start_timeout, end_timeout):
+            sleep(start_timeout / 1000.)
+            raise MessageTransmissionNotStartedError
+
+        mock_transport_interface.send_message.side_effect = _send_message
+        mock_transport_interface.receive_message.side_effect = _receive_message
+        client = Client(transport_interface=mock_transport_interface, p2_client_timeout=50)
+        client.start_background_receiving(cycle=cycle)
+        try:
+            timestamp_start = perf_counter()
+            try:
+                request_record, response_records = client.send_request_receive_responses(
+                    UdsMessage(payload=payload, addressing_type=addressing_type))
+            except TimeoutError:
+                assert payload == b"\x3E\x00" and addressing_type == AddressingType.PHYSICAL
+            else:
+                assert request_record.payload == payload
+                assert response_records == ()
+            duration_ms = (perf_counter() - timestamp_start) * 1000.
+        finally:
+            client.stop_background_receiving()
+        assert duration_ms < client.p6_client_timeout / 2
+
+    @pytest.mark.parametrize("addressing_type", [AddressingType.PHYSICAL, AddressingType.FUNCTIONAL])
+    def test_send_request_receive_responses__background_receiving__segmented_response(self, addressing_type):
+        """Segmented response that starts within P2Client, but ends after it, is received."""
+        messages_to_receive = Queue()
+        mock_transport_interface = Mock(spec=AbstractTransportInterface)
+
+        def _send_message(message):
+            timestamp = perf_counter()
+            messages_to_receive.put((timestamp - 0.005, timestamp - 0.001, b"\x62\x12\x34\xFF"))  # before request
+            messages_to_receive.put((timestamp + 0.010, timestamp + 0.150, b"\x62\x12\x34" + bytes(range(100))))
+            return Mock(spec=UdsMessageRecord, payload=bytes(message.payload), addressing_type=message.addressing_type,
+                        transmission_start_timestamp=timestamp, transmission_end_timestamp=timestamp)
+
+        def _receive_message(start_timeout, end_timeout):
+            try:
+                timestamp_start, timestamp_end, payload = messages_to_receive.get(timeout=start_timeout / 1000.)
+            except Empty as exception:
+                raise MessageTransmissionNotStartedError from exception
+            sleep(max(0., timestamp_end - perf_counter()))
+            return Mock(spec=UdsMessageRecord, payload=payload, addressing_type=addressing_type,
+                        transmission_start_timestamp=timestamp_start, transmission_end_timestamp=timestamp_end)
+
+        mock_transport_interface.send_message.side_effect = _send_message
+        mock_transport_interface.receive_message.side_effect = _receive_message
+        client = Client(transport_interface=mock_transport_interface, p2_client_timeout=100, p6_client_timeout=1000)
+        client.start_background_receiving(cycle=20)
+        try:
+            request_record, response_records = client.send_request_receive_responses(
+                UdsMessage(payload=b"\x22\x12\x34", addressing_type=addressing_type))
+        finally:
+            client.stop_background_receiving()
+        assert [response_record.payload for response_record in response_records] \
+            == [b"\x62\x12\x34" + bytes(range(100))]
+        assert response_records[0].transmission_end_timestamp - request_record.transmission_end_timestamp > 0.1
+        assert client.get_response_no_wait().payload == b"\x62\x12\x34\xFF"
+        assert client.get_response_no_wait() is None
+
+    def test_send_request_receive_responses__metrics(self):
+        responses = [(0.002, b"\x7F\x22\x78"), (0.010, b"\x62\x12\x34\x00")]
+        mock_transport_interface = Mock(spec=AbstractTransportInterface)
+
+        def _send_message(message):
+            timestamp = perf_counter()
+            return Mock(spec=UdsMessageRecord, payload=bytes(message.payload), addressing_type=message.addressing_type,
+                        transmission_start_timestamp=timestamp, transmission_end_timestamp=timestamp)
+
+        def _receive_message(start_timeout, end_timeout):
+            if not responses:
+                sleep(start_timeout / 1000.)
+                raise MessageTransmissionNotStartedError
+            delay, payload = responses.pop(0)
+            sleep(delay)
+            timestamp = perf_counter()
+            return Mock(spec=UdsMessageRecord, payload=payload, addressing_type=AddressingType.PHYSICAL,
+                        packets_records=(Mock(source_address=None, can_id=0x7E8),),
+                        transmission_start_timestamp=timestamp, transmission_end_timestamp=timestamp)
+
+        mock_transport_interface.send_message.side_effect = _send_message
+        mock_transport_interface.receive_message.side_effect = _receive_message
+        metrics = MetricsRegistry()
+        client = Client(transport_interface=mock_transport_interface, p2_client_timeout=20, metrics=metrics)
+        request = UdsMessage(payload=b"\x22\x12\x34", addressing_type=AddressingType.PHYSICAL)
+        client.send_request_receive_responses(request)
+        with pytest.raises(TimeoutError):
+            client.send_request_receive_responses(request)
+        snapshot = metrics.snapshot()
+        labels = (("ecu", "0x7E8"), ("sid", "0x22"))
+        assert snapshot["histograms"][("p2_client", labels)]["count"] == 1
+        assert snapshot["histograms"][("p2_ext_client", labels)]["count"] == 1
+        assert snapshot["histograms"][("p6_ext_client", labels)]["count"] == 1
+        assert snapshot["histograms"][("p6_ext_client", labels)]["min"] >= 12
+        assert snapshot["counters"] == {
+            ("negative_responses", (("ecu", "0x7E8"), ("nrc", "0x78"), ("sid", "0x22"))): 1,
+            ("timeouts", (("sid", "0x22"), ("stage", "initial_response"))): 1,
+        }
+
+
+class TestResponseMatcher:
+    """Unit tests for `_ResponseMatcher` class."""
+
+    # __init__
+
+    def test_init(self):
+        mock_request = Mock(spec=UdsMessage)
+        response_matcher = _ResponseMatcher(mock_request)
+        assert response_matcher.request is mock_request
+        assert isinstance(response_matcher.responses, deque)
+        assert not response_matcher.responses
+
+
+class TestTesterPresentScheduler:
+    """Unit tests for `TesterPresentScheduler` class."""
+
+    def setup_method(self):
+        self.mock_scheduler = Mock(spec=TesterPresentScheduler)
+
+    # __init__
+
+    @pytest.mark.parametrize("coalesce", [True, False])
+    def test_init(self, coalesce):
+        scheduler = TesterPresentScheduler(coalesce=coalesce)
+        assert scheduler.coalesce is coalesce
+        assert scheduler.is_running is False
+        assert scheduler.clients_number == scheduler.tasks_number == scheduler.skipped_transmissions_number == 0
+        assert scheduler.failed_transmissions_number == 0
+        assert scheduler.jitter_statistics is None
+
+    # coalesce
+
+    @pytest.mark.parametrize("value", [None, 1, "True"])
+    def test_coalesce__set__type_error(self, value):
+        with pytest.raises(TypeError):
+            TesterPresentScheduler.coalesce.fset(self.mock_scheduler, value)
+
+    @pytest.mark.parametrize("value", [True, False])
+    def test_coalesce__set__valid(self, value):
+        TesterPresentScheduler.coalesce.fset(self.mock_scheduler, value)
+        assert self.mock_scheduler._TesterPresentScheduler__coalesce is value
+
+    # jitter_statistics
+
+    def test_jitter_statistics(self):
+        self.mock_scheduler._TesterPresentScheduler__jitters = [0.5, 1.5, 4.0]
+        assert TesterPresentScheduler.jitter_statistics.fget(self.mock_scheduler) == {
+            "samples_number": 3,
+            "min": 0.5,
+            "max": 4.0,
+            "mean": 2.0,
+            "stdev": pytest.approx(1.4719601),
+        }
+
+    # _get_tester_present_request
+
+    @pytest.mark.parametrize("addressing_type, sprmib, expected_payload", [
+        (AddressingType.FUNCTIONAL, True, b"\x3E\x80"),
+        (AddressingType.PHYSICAL, False, b"\x3E\x00"),
+    ])
+    def test_get_tester_present_request(self, addressing_type, sprmib, expected_payload):
+        assert (TesterPresentScheduler._get_tester_present_request(addressing_type=addressing_type, sprmib=sprmib)
+                == UdsMessage(payload=expected_payload, addressing_type=addressing_type))
+
+    # _get_task_key
+
+    @pytest.mark.parametrize("addressing_type", [AddressingType.PHYSICAL, AddressingType.FUNCTIONAL])
+    def test_get_task_key__coalesced(self, addressing_type):
+        self.mock_scheduler.coalesce = True
+        mock_client = Mock(spec=Client)
+        mock_client.transport_interface.addressing_information.tx_functional_params = {"can_id": 0x7DF,
+                                                                                       "addressing_type": None}
+        assert TesterPresentScheduler._get_task_key(self.mock_scheduler, client=mock_client,
+                                                    addressing_type=addressing_type, sprmib=True) \
+               == (id(mock_client.transport_interface.network_manager), (("addressing_type", None), ("can_id", 0x7DF)))
+
+    @pytest.mark.parametrize("coalesce, sprmib", [(True, False), (False, True), (False, False)])
+    def test_get_task_key__not_coalesced(self, coalesce, sprmib):
+        self.mock_scheduler.coalesce = coalesce
+        mock_client = Mock(spec=Client)
+        assert TesterPresentScheduler._get_task_key(self.mock_scheduler, client=mock_client,
+                                                    addressing_type=AddressingType.PHYSICAL, sprmib=sprmib) \
+               == (id(mock_client), AddressingType.PHYSICAL, sprmib)
+
+    # register
+
+    @pytest.mark.parametrize("client", [None, Mock()])
+    def test_register__type_error(self, client):
+        with pytest.raises(TypeError):
+            TesterPresentScheduler().register(client=client)
+
+    # unregister
+
+    def test_unregister__value_error(self):
+        with pytest.raises(ValueError):
+            TesterPresentScheduler().unregister(Mock(spec=Client))
+
+    # __send_tester_present
+
+    def _setup_send_tester_present(self, clients):
+        self.mock_scheduler._TesterPresentScheduler__jitters = []
+        self.mock_scheduler._TesterPresentScheduler__skipped_transmissions_number = 0
+        self.mock_scheduler._TesterPresentScheduler__failed_transmissions_number = 0
+        return Mock(clients=clients, timestamp_due=10.)
+
+    @patch(f"{SCRIPT_LOCATION}.warn")
+    def test_send_tester_present(self, mock_warn):
+        clients = [Mock(spec=Client), Mock(spec=Client)]
+        mock_task = self._setup_send_tester_present(clients)
+        TesterPresentScheduler._TesterPresentScheduler__send_tester_present(self.mock_scheduler, task=mock_task,
+                                                                            timestamp_send=10.0015)
+        clients[0]._send_tester_present.assert_called_once_with(mock_task.tester_present_request)
+        clients[1]._send_tester_present.assert_not_called()
+        assert self.mock_scheduler._TesterPresentScheduler__jitters == [1.5]
+        assert self.mock_scheduler._TesterPresentScheduler__skipped_transmissions_number == 0
+        assert self.mock_scheduler._TesterPresentScheduler__failed_transmissions_number == 0
+        mock_warn.assert_not_called()
+
+    @patch(f"{SCRIPT_LOCATION}.warn")
+    def test_send_tester_present__skipped(self, mock_warn):
+        clients = [Mock(spec=Client), Mock(spec=Client)]
+        for mock_client in clients:
+            mock_client._send_tester_present.return_value = None
+        mock_task = self._setup_send_tester_present(clients)
+        TesterPresentScheduler._TesterPresentScheduler__send_tester_present(self.mock_scheduler, task=mock_task,
+                                                                            timestamp_send=10.)
+        for mock_client in clients:
+            mock_client._send_tester_present.assert_called_once_with(mock_task.tester_present_request)
+        assert self.mock_scheduler._TesterPresentScheduler__jitters == []
+        assert self.mock_scheduler._TesterPresentScheduler__skipped_transmissions_number == 1
+        assert self.mock_scheduler._TesterPresentScheduler__failed_transmissions_number == 0
+        mock_warn.assert_not_called()
+
+    @pytest.mark.parametrize("following_result", [None, Mock(spec=UdsMessageRecord), OSError("bus is down")])
+    @patch(f"{SCRIPT_LOCATION}.warn")
+    def test_send_tester_present__failure(self, mock_warn, following_result):
+        clients = [Mock(spec=Client), Mock(spec=Client)]
+        clients[0]._send_tester_present.side_effect = RuntimeError("transport error")
+        clients[1]._send_tester_present.side_effect = [following_result]
+        mock_task = self._setup_send_tester_present(clients)
+        TesterPresentScheduler._TesterPresentScheduler__send_tester_present(self.mock_scheduler, task=mock_task,
+                                                                            timestamp_send=10.)
+        clients[1]._send_tester_present.assert_called_once_with(mock_task.tester_present_request)
+        assert self.mock_scheduler._TesterPresentScheduler__jitters == ([0.] if isinstance(following_result, Mock) else [])
+        assert self.mock_scheduler._TesterPresentScheduler__skipped_transmissions_number == 0
+        expected_failures_number = 2 if isinstance(following_result, Exception) else 1
+        assert self.mock_scheduler._TesterPresentScheduler__failed_transmissions_number == expected_failures_number
+        assert mock_warn.call_count == expected_failures_number
+        assert all(call_args.kwargs["category"] is RuntimeWarning for call_args in mock_warn.call_args_list)
+
+
+@pytest.mark.integration
+class TestTesterPresentSchedulerIntegration:
+    """Integration tests for `TesterPresentScheduler` class."""
+
+    @staticmethod
+    def _create_clients(number, s3_client, network_manager=None):
+        clients = []
+        for i in range(number):
+            mock_client = Mock(spec=Client, s3_client=s3_client)
+            mock_client.transport_interface.network_manager = network_manager if network_manager is not None else i
+            mock_client.transport_interface.addressing_information.tx_functional_params = {"can_id": 0x7DF}
+            clients.append(mock_client)
+        return clients
+
+    @staticmethod
+    def _wait_till_stopped(scheduler, timeout=1.):
+        timestamp_timeout = perf_counter() + timeout
+        while scheduler.is_running and perf_counter() < timestamp_timeout:
+            sleep(0.001)
+        return not scheduler.is_running
+
+    def test_coalesced(self):
+        threads_number = active_count()
+        clients = self._create_clients(number=40, s3_client=40, network_manager=Mock())
+        scheduler = TesterPresentScheduler(coalesce=True)
+        for mock_client in clients:
+            scheduler.register(client=mock_client, addressing_type=AddressingType.PHYSICAL, sprmib=True)
+        assert active_count() <= threads_number + 1
+        assert scheduler.clients_number == 40
+        assert scheduler.tasks_number == 1
+        sleep(0.190)
+        for mock_client in clients:
+            scheduler.unregister(mock_client)
+        assert self._wait_till_stopped(scheduler)
+        sent_requests = [call_args.args[0] for mock_client in clients
+                         for call_args in mock_client._send_tester_present.call_args_list]
+        assert 3 <= len(sent_requests) <= 5
+        assert all(request == UdsMessage(payload=b"\x3E\x80", addressing_type=AddressingType.FUNCTIONAL)
+                   for request in sent_requests)
+        assert scheduler.jitter_statistics["samples_number"] == len(sent_requests)
+
+    def test_not_coalesced(self):
+        clients = self._create_clients(number=5, s3_client=30)
+        scheduler = TesterPresentScheduler(coalesce=True)
+        for mock_client in clients:
+            scheduler.register(client=mock_client, addressing_type=AddressingType.PHYSICAL, sprmib=False)
+        assert scheduler.tasks_number == 5
+        with pytest.raises(ValueError):
+            scheduler.register(client=clients[0])
+        sleep(0.100)
+        for mock_client in clients:
+            scheduler.unregister(mock_client)
+        assert self._wait_till_stopped(scheduler)
+        for mock_client in clients:
+            assert 2 <= mock_client._send_tester_present.call_count <= 4
+            mock_client._send_tester_present.assert_called_with(
+                UdsMessage(payload=b"\x3E\x00", addressing_type=AddressingType.PHYSICAL))
+        jitter_statistics = scheduler.jitter_statistics
+        assert jitter_statistics["samples_number"] == sum(mock_client._send_tester_present.call_count
+                                                          for mock_client in clients)
+        assert 0 <= jitter_statistics["min"] <= jitter_statistics["mean"] <= jitter_statistics["max"]
+
+    def test_skipped_transmissions(self):
+        clients = self._create_clients(number=2, s3_client=20, network_manager=Mock())
+        for mock_client in clients:
+            mock_client._send_tester_present.return_value = None
+        scheduler = TesterPresentScheduler()
+        for mock_client in clients:
+            scheduler.register(client=mock_client)
+        sleep(0.070)
+        for mock_client in clients:
+            scheduler.unregister(mock_client)
+        assert self._wait_till_stopped(scheduler)
+        assert scheduler.skipped_transmissions_number >= 2
+        assert scheduler.jitter_statistics is None
+        assert clients[0]._send_tester_present.call_count == clients[1]._send_tester_present.call_count
+
+    def test_failed_transmissions(self):
+        clients = self._create_clients(number=2, s3_client=20)
+        clients[0]._send_tester_present.side_effect = OSError("bus is down")
+        scheduler = TesterPresentScheduler()
+        for mock_client in clients:
+            scheduler.register(client=mock_client)
+        with pytest.warns(RuntimeWarning):
+            sleep(0.070)
+        assert scheduler.is_running is True
+        for mock_client in clients:
+            scheduler.unregister(mock_client)
+        assert self._wait_till_stopped(scheduler)
+        assert scheduler.failed_transmissions_number == clients[0]._send_tester_present.call_count >= 2
+        assert 2 <= clients[1]._send_tester_present.call_count <= 4
+
+    def test_client(self):
+        mock_transport_interface = Mock(spec=AbstractTransportInterface)
+        mock_transport_interface.addressing_information.tx_functional_params = {"can_id": 0x7DF}
+        mock_transport_interface.send_message.side_effect \
+            = lambda message: Mock(spec=UdsMessageRecord, addressing_type=message.addressing_type,
+                                   transmission_end_timestamp=perf_counter())
+        client = Client(transport_interface=mock_transport_interface, p2_client_timeout=10,
+                        p3_client_functional=10, p3_client_physical=10, s3_client=20)
+        scheduler = TesterPresentScheduler()
+        client.start_tester_present(scheduler=scheduler)
+        assert client.is_tester_present_sent is True
+        sleep(0.070)
+        client.stop_tester_present()
+        assert client.is_tester_present_sent is False
+        assert self._wait_till_stopped(scheduler)
+        assert 2 <= len(client.last_sent_tester_present_requests) <= 4
+        assert mock_transport_interface.send_message.call_count == len(client.last_sent_tester_present_requests)
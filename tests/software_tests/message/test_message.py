@@ -0,0 +1,56 @@
+import subprocess
+import sys
+
+import pytest
+from mock import patch
+
+import uds.message
+
+SCRIPT_LOCATION = "uds.message"
+
+
+class TestMessage:
+    """Unit tests for uds.message.__init__.py"""
+
+    # __getattr__
+
+    @pytest.mark.parametrize("name", ["something_that_is_not_defined", "nrc"])
+    @patch(f"{SCRIPT_LOCATION}.importlib")
+    def test_getattr__attribute_error(self, mock_importlib, name):
+        with pytest.raises(AttributeError):
+            uds.message.__getattr__(name)
+        mock_importlib.import_module.assert_not_called()
+
+    @pytest.mark.parametrize("name, module_name", [
+        ("NRC", "uds.message.nrc"),
+        ("RequestSID", "uds.message.service_identifiers"),
+        ("ResponseSID", "uds.message.service_identifiers"),
+        ("define_service", "uds.message.service_identifiers"),
+    ])
+    @patch.dict(f"{SCRIPT_LOCATION}.__dict__")
+    @patch(f"{SCRIPT_LOCATION}.importlib")
+    def test_getattr(self, mock_importlib, name, module_name):
+        value = getattr(mock_importlib.import_module.return_value, name)
+        assert uds.message.__getattr__(name) == value
+        mock_importlib.import_module.assert_called_once_with(module_name)
+        assert uds.message.__dict__[name] == value
+
+    # __dir__
+
+    def test_dir(self):
+        names = dir(uds.message)
+        assert names == sorted(names)
+        assert {"NRC", "RequestSID", "ResponseSID", "UdsMessage", "UdsMessageRecord"}.issubset(names)
+
+
+@pytest.mark.performance
+class TestMessagePerformance:
+    """Performance tests for uds.message sub-package."""
+
+    def test_import__no_enums(self):
+        """Make sure that enums with SID and NRC values are not built until they are used."""
+        output = subprocess.check_output([sys.executable, "-c",
+                                          "import sys, uds.message; "
+                                          "print(sorted(name for name in sys.modules "
+                                          "if name in ('uds.message.nrc', 'uds.message.service_identifiers')))"])
+        assert output.strip() == b"[]"
@@ -48,6 +48,8 @@ class TestAbstractPacketRecord:
 
     def teardown_method(self):
         self._patcher_warn.stop()
+        self._patcher_perf_counter.stop()
+        self._patcher_datetime.stop()
         self._patcher_validate_direction.stop()
 
     # __init__
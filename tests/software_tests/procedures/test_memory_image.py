@@ -0,0 +1,163 @@
+import pytest
+
+from uds.procedures.memory_image import (
+    InconsistencyError,
+    MemorySegment,
+    _merge_data_records,
+    mmap,
+    read_binary_file,
+    read_intel_hex_file,
+    read_s_record_file,
+)
+
+
+class TestMemorySegment:
+    """Unit tests for `MemorySegment` class."""
+
+    # __init__
+
+    @pytest.mark.parametrize("address, data", [
+        (None, b"\x00"),
+        (1.0, b"\x00"),
+        (0, [0x00, 0x01]),
+        (0, "data"),
+    ])
+    def test_init__type_error(self, address, data):
+        with pytest.raises(TypeError):
+            MemorySegment(address=address, data=data)
+
+    @pytest.mark.parametrize("address, data", [
+        (-1, b"\x00"),
+        (0, b""),
+        (0x1000, bytearray()),
+    ])
+    def test_init__value_error(self, address, data):
+        with pytest.raises(ValueError):
+            MemorySegment(address=address, data=data)
+
+    @pytest.mark.parametrize("address, data", [
+        (0, b"\x00"),
+        (0x8000_0000, bytearray(range(256))),
+        (0x1234, memoryview(b"\x01\x02\x03")),
+    ])
+    def test_init__valid(self, address, data):
+        segment = MemorySegment(address=address, data=data)
+        assert segment.address == address
+        assert isinstance(segment.data, memoryview)
+        assert segment.data == data
+        assert segment.size == len(segment) == len(data)
+        assert segment.end_address == address + len(data)
+        assert repr(segment) == f"MemorySegment(address=0x{address:X}, size={len(data)})"
+
+    def test_init__no_copy(self):
+        data = bytearray(b"\x00\x01")
+        segment = MemorySegment(address=0, data=data)
+        data[0] = 0xFF
+        assert segment.data[0] == 0xFF
+
+
+class TestFunctions:
+    """Unit tests for module functions."""
+
+    # _merge_data_records
+
+    @pytest.mark.parametrize("data_records, expected_segments", [
+        ([], []),
+        ([(0x100, b"\x01\x02"), (0x102, b"\x03"), (0x200, b""), (0x104, b"\x05")],
+         [(0x100, b"\x01\x02\x03"), (0x104, b"\x05")]),
+        ([(0x200, b"\x01"), (0x100, b"\x02"), (0x101, b"\x03")],
+         [(0x100, b"\x02\x03"), (0x200, b"\x01")]),
+    ])
+    def test_merge_data_records(self, data_records, expected_segments):
+        segments = _merge_data_records(data_records)
+        assert [(segment.address, bytes(segment.data)) for segment in segments] == expected_segments
+
+    @pytest.mark.parametrize("data_records", [
+        [(0x100, b"\x01\x02"), (0x101, b"\x03")],
+        [(0x200, b"\x01"), (0x100, b"\x02" * 0x101)],
+    ])
+    def test_merge_data_records__inconsistency_error(self, data_records):
+        with pytest.raises(InconsistencyError):
+            _merge_data_records(data_records)
+
+    # read_binary_file
+
+    @pytest.mark.parametrize("address", [0, 0x8000])
+    def test_read_binary_file(self, tmp_path, address):
+        file_path = tmp_path / "image.bin"
+        file_path.write_bytes(bytes(range(256)) * 4)
+        segment = read_binary_file(file_path, address=address)
+        assert segment.address == address
+        assert segment.data == bytes(range(256)) * 4
+        assert isinstance(segment.data.obj, mmap)
+
+    def test_read_binary_file__empty(self, tmp_path):
+        file_path = tmp_path / "image.bin"
+        file_path.write_bytes(b"")
+        with pytest.raises(ValueError):
+            read_binary_file(file_path)
+
+    # read_intel_hex_file
+
+    def test_read_intel_hex_file(self, tmp_path):
+        file_path = tmp_path / "image.hex"
+        file_path.write_text(":0400000001020304F2\n"
+                             ":020000040010EA\n"
+                             ":03000000AABBCCCC\n"
+                             ":03000300DDEEFF30\n"
+                             "\n"
+                             ":020000021000EC\n"
+                             ":0100000011EE\n"
+                             ":00000001FF\n"
+                             ":0100100022CD\n")
+        segments = read_intel_hex_file(file_path)
+        assert [(segment.address, bytes(segment.data)) for segment in segments] == [
+            (0x0000, b"\x01\x02\x03\x04"),
+            (0x10000, b"\x11"),
+            (0x100000, b"\xAA\xBB\xCC\xDD\xEE\xFF"),
+        ]
+
+    @pytest.mark.parametrize("content", [
+        "0400000001020304F2\n",
+        ":0400000001020304F3\n",
+        ":0500000001020304F2\n",
+        ":04000000010203XXF2\n",
+        ":00\n",
+    ])
+    def test_read_intel_hex_file__value_error(self, tmp_path, content):
+        file_path = tmp_path / "image.hex"
+        file_path.write_text(content)
+        with pytest.raises(ValueError):
+            read_intel_hex_file(file_path)
+
+    # read_s_record_file
+
+    def test_read_s_record_file(self, tmp_path):
+        file_path = tmp_path / "image.s19"
+        file_path.write_text("S00600004844521B\n"
+                             "S1060000010203F3\n"
+                             "S1050003040FE4\n"
+                             "S2060100001122C5\n"
+                             "\n"
+                             "S308001000003344551B\n"
+                             "S5030003F9\n"
+                             "S9030000FC\n")
+        segments = read_s_record_file(file_path)
+        assert [(segment.address, bytes(segment.data)) for segment in segments] == [
+            (0x0000, b"\x01\x02\x03\x04\x0F"),
+            (0x10000, b"\x11\x22"),
+            (0x100000, b"\x33\x44\x55"),
+        ]
+
+    @pytest.mark.parametrize("content", [
+        "X1060000010203F3\n",
+        "S1060000010203F4\n",
+        "S1070000010203F3\n",
+        "S\n",
+        "S303000000FC\n",
+    ])
+    def test_read_s_record_file__value_error(self, tmp_path, content):
+        file_path = tmp_path / "image.s19"
+        file_path.write_text(content)
+        with pytest.raises(ValueError):
+            read_s_record_file(file_path)
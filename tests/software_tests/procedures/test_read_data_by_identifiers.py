@@ -0,0 +1,522 @@
+import pytest
+from mock import MagicMock, Mock, patch
+
+from uds.addressing import AddressingType
+from uds.client import Client
+from uds.message import UdsMessage, UdsMessageRecord
+from uds.procedures.read_data_by_identifiers import (
+    NRC,
+    DataIdentifiersReader,
+    DataIdentifiersReadResult,
+    InconsistencyError,
+    MappingProxyType,
+    Translator,
+    _get_did_data_lengths,
+)
+from uds.translator import (
+    BASE_TRANSLATOR,
+    BASE_TRANSLATOR_2013,
+    BASE_TRANSLATOR_2020,
+    ConditionalMappingDataRecord,
+    MappingDataRecord,
+    RawDataRecord,
+    Service,
+)
+
+SCRIPT_LOCATION = "uds.procedures.read_data_by_identifiers"
+
+
+class TestFunctions:
+    """Unit tests for module functions."""
+
+    # _get_did_data_lengths
+
+    def test_get_did_data_lengths(self):
+        mapping = {
+            0x0001: (RawDataRecord(name="a", length=8), RawDataRecord(name="b", length=16)),
+            0x0002: (RawDataRecord(name="a", length=8, min_occurrences=3, max_occurrences=3),),
+            0x0003: (RawDataRecord(name="a", length=8, min_occurrences=1, max_occurrences=None),),
+            0x0004: (RawDataRecord(name="a", length=4), RawDataRecord(name="b", length=4)),
+        }
+        mock_service = Mock(spec=Service,
+                            response_structure=(MappingDataRecord(name="DID",
+                                                                  length=16,
+                                                                  values_mapping={did: f"DID {did}"
+                                                                                  for did in range(7)}),
+                                                ConditionalMappingDataRecord(mapping=mapping)))
+        mock_translator = Mock(spec=Translator, services_mapping={0x22: mock_service})
+        assert _get_did_data_lengths(mock_translator) == {0x0001: 3, 0x0002: 3, 0x0004: 1}
+
+    @pytest.mark.parametrize("services_mapping", [
+        {},
+        {0x22: Mock(spec=Service, response_structure=(RawDataRecord(name="DID", length=16),))},
+        {0x22: Mock(spec=Service, response_structure=(RawDataRecord(name="DID", length=16),
+                                                      RawDataRecord(name="data", length=8)))},
+    ])
+    def test_get_did_data_lengths__no_did_definitions(self, services_mapping):
+        mock_translator = Mock(spec=Translator, services_mapping=services_mapping)
+        assert _get_did_data_lengths(mock_translator) == {}
+
+    @pytest.mark.parametrize("translator", [BASE_TRANSLATOR_2013, BASE_TRANSLATOR_2020])
+    def test_get_did_data_lengths__base_translators(self, translator):
+        assert _get_did_data_lengths(translator)[0xF186] == 1
+
+
+class TestDataIdentifiersReadResult:
+    """Unit tests for `DataIdentifiersReadResult` class."""
+
+    # __init__
+
+    @pytest.mark.parametrize("data, errors, records", [
+        ({}, {}, []),
+        ({0x1234: b"\x01\x02"}, {0xF190: NRC.RequestOutOfRange}, [(Mock(), (Mock(),))]),
+    ])
+    def test_init(self, data, errors, records):
+        mock_translator = Mock()
+        result = DataIdentifiersReadResult(data=data, errors=errors, records=records, translator=mock_translator)
+        assert isinstance(result.data, MappingProxyType)
+        assert result.data == data
+        assert isinstance(result.errors, MappingProxyType)
+        assert result.errors == errors
+        assert result.records == tuple(records)
+        assert result.requests_number == len(records)
+
+    # decode
+
+    def test_decode(self):
+        mock_translator = Mock()
+        result = DataIdentifiersReadResult(data={0x1234: b"\xAB\xCD"}, errors={}, records=[],
+                                           translator=mock_translator)
+        assert result.decode(0x1234) == mock_translator.decode_payload.return_value
+        mock_translator.decode_payload.assert_called_once_with(b"\x62\x12\x34\xAB\xCD")
+
+    def test_decode__key_error(self):
+        result = DataIdentifiersReadResult(data={}, errors={}, records=[], translator=Mock())
+        with pytest.raises(KeyError):
+            result.decode(0x1234)
+
+
+class TestDataIdentifiersReader:
+    """Unit tests for `DataIdentifiersReader` class."""
+
+    def setup_method(self):
+        self.mock_reader = Mock(spec=DataIdentifiersReader,
+                                _DataIdentifiersReader__did_data_lengths={0x0001: 1, 0x0002: 10, 0x0003: 4,
+                                                                          0x0004: 2, 0x0005: 6},
+                                _DataIdentifiersReader__translator_did_data_lengths={},
+                                _DataIdentifiersReader__custom_did_data_lengths={},
+                                max_response_length=DataIdentifiersReader.DEFAULT_MAX_RESPONSE_LENGTH,
+                                max_dids_per_request=None)
+
+    # __init__
+
+    @pytest.mark.parametrize("client, translator, did_data_lengths, max_response_length, max_dids_per_request", [
+        (Mock(), Mock(), {0x1234: 1}, 100, 5),
+        ("client", "translator", None, 8, None),
+    ])
+    def test_init(self, client, translator, did_data_lengths, max_response_length, max_dids_per_request):
+        assert DataIdentifiersReader.__init__(self.mock_reader,
+                                              client=client,
+                                              translator=translator,
+                                              did_data_lengths=did_data_lengths,
+                                              max_response_length=max_response_length,
+                                              max_dids_per_request=max_dids_per_request) is None
+        assert self.mock_reader.client == client
+        assert self.mock_reader.translator == translator
+        assert self.mock_reader.did_data_lengths == (did_data_lengths or {})
+        assert self.mock_reader.max_response_length == max_response_length
+        assert self.mock_reader.max_dids_per_request == max_dids_per_request
+
+    # client
+
+    def test_client__get(self):
+        self.mock_reader._DataIdentifiersReader__client = Mock()
+        assert DataIdentifiersReader.client.fget(self.mock_reader) == self.mock_reader._DataIdentifiersReader__client
+
+    def test_client__set__type_error(self):
+        with pytest.raises(TypeError):
+            DataIdentifiersReader.client.fset(self.mock_reader, Mock())
+
+    def test_client__set__valid(self):
+        mock_client = Mock(spec=Client)
+        DataIdentifiersReader.client.fset(self.mock_reader, mock_client)
+        assert self.mock_reader._DataIdentifiersReader__client == mock_client
+
+    # translator
+
+    def test_translator__get(self):
+        self.mock_reader._DataIdentifiersReader__translator = Mock()
+        assert (DataIdentifiersReader.translator.fget(self.mock_reader)
+                == self.mock_reader._DataIdentifiersReader__translator)
+
+    def test_translator__set__type_error(self):
+        with pytest.raises(TypeError):
+            DataIdentifiersReader.translator.fset(self.mock_reader, Mock())
+
+    @patch(f"{SCRIPT_LOCATION}._get_did_data_lengths")
+    def test_translator__set__valid(self, mock_get_did_data_lengths):
+        mock_get_did_data_lengths.return_value = {0xF186: 1, 0xF190: 17}
+        self.mock_reader._DataIdentifiersReader__custom_did_data_lengths = {0xF190: 20, 0x1234: 2}
+        mock_translator = Mock(spec=Translator)
+        DataIdentifiersReader.translator.fset(self.mock_reader, mock_translator)
+        assert self.mock_reader._DataIdentifiersReader__translator == mock_translator
+        assert self.mock_reader._DataIdentifiersReader__did_data_lengths == {0xF186: 1, 0xF190: 20, 0x1234: 2}
+        mock_get_did_data_lengths.assert_called_once_with(mock_translator)
+
+    # did_data_lengths
+
+    def test_did_data_lengths__get(self):
+        assert (DataIdentifiersReader.did_data_lengths.fget(self.mock_reader)
+                == self.mock_reader._DataIdentifiersReader__did_data_lengths)
+
+    @pytest.mark.parametrize("value", [None, [(0x1234, 1)], 5])
+    def test_did_data_lengths__set__type_error(self, value):
+        with pytest.raises(TypeError):
+            DataIdentifiersReader.did_data_lengths.fset(self.mock_reader, value)
+
+    @pytest.mark.parametrize("value", [
+        {-1: 1},
+        {0x10000: 1},
+        {"0x1234": 1},
+        {0x1234: 0},
+        {0x1234: 1.5},
+    ])
+    def test_did_data_lengths__set__value_error(self, value):
+        with pytest.raises(ValueError):
+            DataIdentifiersReader.did_data_lengths.fset(self.mock_reader, value)
+
+    @pytest.mark.parametrize("value", [{}, {0x1234: 1, 0xF186: 2}])
+    def test_did_data_lengths__set__valid(self, value):
+        self.mock_reader._DataIdentifiersReader__translator_did_data_lengths = {0xF186: 1, 0xF190: 17}
+        DataIdentifiersReader.did_data_lengths.fset(self.mock_reader, value)
+        did_data_lengths = self.mock_reader._DataIdentifiersReader__did_data_lengths
+        assert isinstance(did_data_lengths, MappingProxyType)
+        assert did_data_lengths == {0xF186: 1, 0xF190: 17, **value}
+        assert self.mock_reader._DataIdentifiersReader__custom_did_data_lengths == value
+
+    # max_response_length
+
+    def test_max_response_length__get(self):
+        self.mock_reader._DataIdentifiersReader__max_response_length = Mock()
+        assert (DataIdentifiersReader.max_response_length.fget(self.mock_reader)
+                == self.mock_reader._DataIdentifiersReader__max_response_length)
+
+    @pytest.mark.parametrize("value", [None, 4.0, "4095"])
+    def test_max_response_length__set__type_error(self, value):
+        with pytest.raises(TypeError):
+            DataIdentifiersReader.max_response_length.fset(self.mock_reader, value)
+
+    @pytest.mark.parametrize("value", [-1, 0, 3])
+    def test_max_response_length__set__value_error(self, value):
+        with pytest.raises(ValueError):
+            DataIdentifiersReader.max_response_length.fset(self.mock_reader, value)
+
+    @pytest.mark.parametrize("value", [4, 4095])
+    def test_max_response_length__set__valid(self, value):
+        DataIdentifiersReader.max_response_length.fset(self.mock_reader, value)
+        assert self.mock_reader._DataIdentifiersReader__max_response_length == value
+
+    # max_dids_per_request
+
+    def test_max_dids_per_request__get(self):
+        self.mock_reader._DataIdentifiersReader__max_dids_per_request = Mock()
+        assert (DataIdentifiersReader.max_dids_per_request.fget(self.mock_reader)
+                == self.mock_reader._DataIdentifiersReader__max_dids_per_request)
+
+    @pytest.mark.parametrize("value", [1.0, "5"])
+    def test_max_dids_per_request__set__type_error(self, value):
+        with pytest.raises(TypeError):
+            DataIdentifiersReader.max_dids_per_request.fset(self.mock_reader, value)
+
+    @pytest.mark.parametrize("value", [-1, 0])
+    def test_max_dids_per_request__set__value_error(self, value):
+        with pytest.raises(ValueError):
+            DataIdentifiersReader.max_dids_per_request.fset(self.mock_reader, value)
+
+    @pytest.mark.parametrize("value", [None, 1, 20])
+    def test_max_dids_per_request__set__valid(self, value):
+        DataIdentifiersReader.max_dids_per_request.fset(self.mock_reader, value)
+        assert self.mock_reader._DataIdentifiersReader__max_dids_per_request == value
+
+    # get_response_length
+
+    @pytest.mark.parametrize("dids, expected_length", [
+        ([], 1),
+        ([0x0001], 4),
+        ([0x0002, 0x0003, 0x0001], 22),
+        ([0x0001, 0x1234], None),
+    ])
+    def test_get_response_length(self, dids, expected_length):
+        assert DataIdentifiersReader.get_response_length(self.mock_reader, dids) == expected_length
+
+    # plan
+
+    @pytest.mark.parametrize("dids", [None, {0x0001, 0x0002}, 0x0001])
+    def test_plan__type_error(self, dids):
+        with pytest.raises(TypeError):
+            DataIdentifiersReader.plan(self.mock_reader, dids)
+
+    @pytest.mark.parametrize("dids", [[-1], [0x0001, 0x10000], ["0x0001"]])
+    def test_plan__value_error(self, dids):
+        with pytest.raises(ValueError):
+            DataIdentifiersReader.plan(self.mock_reader, dids)
+
+    @pytest.mark.parametrize("dids, max_response_length, max_dids_per_request, expected_plan", [
+        ([], 4095, None, ()),
+        ([0x0001, 0x0002, 0x0003, 0x0004, 0x0005], 4095, None, ((0x0002, 0x0005, 0x0003, 0x0004, 0x0001),)),
+        ([0x0001, 0x0002, 0x0003, 0x0004, 0x0005], 4095, 2, ((0x0002, 0x0005), (0x0003, 0x0004), (0x0001,))),
+        ([0x0001, 0x0002, 0x0003, 0x0004, 0x0005], 15, None, ((0x0002,), (0x0005, 0x0003), (0x0004, 0x0001))),
+        ([0x0001, 0x0002, 0x0003, 0x0004, 0x0005], 13, None, ((0x0002,), (0x0005, 0x0004), (0x0003, 0x0001))),
+        ([0x0002, 0x0002, 0x1234, 0x0001, 0x4321], 4095, None, ((0x0002, 0x0001), (0x1234,), (0x4321,))),
+    ])
+    def test_plan(self, dids, max_response_length, max_dids_per_request, expected_plan):
+        self.mock_reader.max_response_length = max_response_length
+        self.mock_reader.max_dids_per_request = max_dids_per_request
+        self.mock_reader._pack.side_effect = lambda **kwargs: DataIdentifiersReader._pack(self.mock_reader, **kwargs)
+        assert DataIdentifiersReader.plan(self.mock_reader, dids) == expected_plan
+        self.mock_reader._pack.assert_called_once_with(dids=tuple(dict.fromkeys(dids)),
+                                                       max_response_length=max_response_length,
+                                                       max_dids_per_request=max_dids_per_request)
+
+    # _split_response
+
+    @pytest.mark.parametrize("dids, payload, expected_data", [
+        ([0x1234], b"\x62\x12\x34\xFF", {0x1234: b"\xFF"}),
+        ([0x0001], b"\x62\x00\x01\x01\x02\x03", {0x0001: b"\x01\x02\x03"}),
+        ([0x0001, 0x0004], b"\x62\x00\x04\xAB\xCD\x00\x01\xEF", {0x0001: b"\xEF", 0x0004: b"\xAB\xCD"}),
+        ([0x0001, 0x0004, 0x0003], b"\x62\x00\x01\xEF", {0x0001: b"\xEF"}),
+    ])
+    def test_split_response(self, dids, payload, expected_data):
+        assert DataIdentifiersReader._split_response(self.mock_reader, dids=dids, payload=payload) == expected_data
+
+    @pytest.mark.parametrize("dids, payload", [
+        ([0x1234], b"\x62\x12\x35\xFF"),
+        ([0x1234], b"\x62\x12\x34"),
+        ([0x0001, 0x0004], b"\x62\x00\x04\xAB\xCD\x00\x01"),
+        ([0x0001, 0x0004], b"\x62\x00\x04\xAB\xCD\x00\x03\x00"),
+        ([0x0001, 0x0004], b"\x62\x00\x01\xAB\x00\x01\xCD"),
+    ])
+    def test_split_response__mismatch(self, dids, payload):
+        assert DataIdentifiersReader._split_response(self.mock_reader, dids=dids, payload=payload) is None
+
+    # _reduce_limits
+
+    @pytest.mark.parametrize("dids, expected_value", [
+        ((0x0001, 0x0002), 1),
+        ((0x0001, 0x0002, 0x0003), 2),
+        ((0x0001, 0x0002, 0x0003, 0x0004, 0x0005), 3),
+    ])
+    def test_reduce_limits__incorrect_message_length(self, dids, expected_value):
+        assert DataIdentifiersReader._reduce_limits(self.mock_reader,
+                                                    dids=dids,
+                                                    nrc=NRC.IncorrectMessageLengthOrInvalidFormat,
+                                                    max_response_length=100,
+                                                    max_dids_per_request=None) == (100, expected_value)
+        assert self.mock_reader.max_dids_per_request is None
+
+    @pytest.mark.parametrize("dids, response_length, expected_value", [
+        ((0x0001, 0x0002), 18, 13),
+        ((0x0001, 0x0003, 0x0004), 14, 7),
+        ((0x0001, 0x0003, 0x0004, 0x0005), 22, 11),
+    ])
+    def test_reduce_limits__response_too_long(self, dids, response_length, expected_value):
+        self.mock_reader.get_response_length.return_value = response_length
+        assert DataIdentifiersReader._reduce_limits(self.mock_reader,
+                                                    dids=dids,
+                                                    nrc=NRC.ResponseTooLong,
+                                                    max_response_length=response_length - 1,
+                                                    max_dids_per_request=5) == (expected_value, 5)
+        assert self.mock_reader.max_response_length == DataIdentifiersReader.DEFAULT_MAX_RESPONSE_LENGTH
+        self.mock_reader.get_response_length.assert_called_once_with(dids)
+
+    def test_reduce_limits__unknown_length(self):
+        self.mock_reader.get_response_length.return_value = None
+        assert DataIdentifiersReader._reduce_limits(self.mock_reader,
+                                                    dids=(0x0001, 0x1234),
+                                                    nrc=NRC.ResponseTooLong,
+                                                    max_response_length=100,
+                                                    max_dids_per_request=5) == (100, 5)
+
+    # read
+
+    def _set_responses(self, *payloads):
+        self.mock_reader.client.send_request_receive_responses.side_effect = [
+            (Mock(spec=UdsMessageRecord), tuple(Mock(spec=UdsMessageRecord, payload=payload) for payload in group))
+            for group in payloads]
+
+    @patch(f"{SCRIPT_LOCATION}.DataIdentifiersReadResult")
+    def test_read__no_dids(self, mock_result_class):
+        self.mock_reader.plan.return_value = ()
+        assert DataIdentifiersReader.read(self.mock_reader, []) == mock_result_class.return_value
+        self.mock_reader.client.send_request_receive_responses.assert_not_called()
+        mock_result_class.assert_called_once_with(data={}, errors={}, records=[],
+                                                  translator=self.mock_reader.translator)
+
+    def test_read__inconsistency_error__no_response(self):
+        self.mock_reader.plan.return_value = ((0x0001,),)
+        self._set_responses(())
+        with pytest.raises(InconsistencyError):
+            DataIdentifiersReader.read(self.mock_reader, [0x0001])
+
+    @pytest.mark.parametrize("payload", [b"\x7F", b"\x7F\x22"])
+    def test_read__inconsistency_error__short_negative_response(self, payload):
+        self.mock_reader.plan.return_value = ((0x0001, 0x0004),)
+        self._set_responses((payload,))
+        with pytest.raises(InconsistencyError):
+            DataIdentifiersReader.read(self.mock_reader, [0x0001, 0x0004])
+        self.mock_reader._reduce_limits.assert_not_called()
+
+    def test_read__inconsistency_error__other_did(self):
+        self.mock_reader.plan.return_value = ((0x0001,),)
+        self.mock_reader._split_response.return_value = None
+        self._set_responses((b"\x62\x00\x02\x00",))
+        with pytest.raises(InconsistencyError):
+            DataIdentifiersReader.read(self.mock_reader, [0x0001])
+
+    @patch(f"{SCRIPT_LOCATION}.DataIdentifiersReadResult")
+    def test_read__positive(self, mock_result_class):
+        self.mock_reader.plan.return_value = ((0x0001, 0x0004), (0x1234,))
+        self.mock_reader._split_response.side_effect = [{0x0001: b"\x01"}, {0x1234: b"\x02"}]
+        self._set_responses((b"\x7F\x22\x78", b"\x62\x00\x01\x01"), (b"\x62\x12\x34\x02",))
+        assert DataIdentifiersReader.read(self.mock_reader, Mock()) == mock_result_class.return_value
+        requests = [call_args.args[0]
+                    for call_args in self.mock_reader.client.send_request_receive_responses.call_args_list]
+        assert requests == [UdsMessage(payload=b"\x22\x00\x01\x00\x04", addressing_type=AddressingType.PHYSICAL),
+                            UdsMessage(payload=b"\x22\x12\x34", addressing_type=AddressingType.PHYSICAL)]
+        kwargs = mock_result_class.call_args.kwargs
+        assert kwargs["data"] == {0x0001: b"\x01", 0x1234: b"\x02"}
+        assert kwargs["errors"] == {0x0004: NRC.RequestOutOfRange}
+        assert len(kwargs["records"]) == 2
+
+    @pytest.mark.parametrize("nrc", [NRC.IncorrectMessageLengthOrInvalidFormat, NRC.ResponseTooLong])
+    @patch(f"{SCRIPT_LOCATION}.DataIdentifiersReadResult")
+    def test_read__reduce_limits(self, mock_result_class, nrc):
+        self.mock_reader.plan.return_value = ((0x0001, 0x0004), (0x0003,))
+        self.mock_reader._reduce_limits.return_value = (10, 1)
+        self.mock_reader._pack.return_value = ((0x0001,), (0x0004, 0x0003))
+        self.mock_reader._split_response.side_effect = [{0x0001: b"\x01"}, {0x0004: b"\x02\x03", 0x0003: b"\x04"}]
+        self._set_responses((bytes([0x7F, 0x22, nrc]),), (b"\x62",), (b"\x62",))
+        assert DataIdentifiersReader.read(self.mock_reader, Mock()) == mock_result_class.return_value
+        self.mock_reader._reduce_limits.assert_called_once_with(
+            dids=(0x0001, 0x0004),
+            nrc=nrc,
+            max_response_length=DataIdentifiersReader.DEFAULT_MAX_RESPONSE_LENGTH,
+            max_dids_per_request=None)
+        self.mock_reader._pack.assert_called_once_with(dids=[0x0001, 0x0004, 0x0003],
+                                                       max_response_length=10,
+                                                       max_dids_per_request=1)
+        assert self.mock_reader.max_response_length == DataIdentifiersReader.DEFAULT_MAX_RESPONSE_LENGTH
+        assert self.mock_reader.max_dids_per_request is None
+        kwargs = mock_result_class.call_args.kwargs
+        assert kwargs["data"] == {0x0001: b"\x01", 0x0004: b"\x02\x03", 0x0003: b"\x04"}
+        assert kwargs["errors"] == {}
+        assert len(kwargs["records"]) == 3
+
+    @pytest.mark.parametrize("dids, nrc, expected_nrc", [
+        ((0x0001,), NRC.ResponseTooLong, NRC.ResponseTooLong),
+        ((0x0001,), NRC.IncorrectMessageLengthOrInvalidFormat, NRC.IncorrectMessageLengthOrInvalidFormat),
+        ((0x0001, 0x0004), NRC.SecurityAccessDenied, NRC.SecurityAccessDenied),
+        ((0x0001, 0x0004), 0xF5, 0xF5),
+    ])
+    @patch(f"{SCRIPT_LOCATION}.DataIdentifiersReadResult")
+    def test_read__negative(self, mock_result_class, dids, nrc, expected_nrc):
+        self.mock_reader.plan.return_value = (dids,)
+        self._set_responses((bytes([0x7F, 0x22, nrc]),))
+        assert DataIdentifiersReader.read(self.mock_reader, Mock()) == mock_result_class.return_value
+        self.mock_reader._reduce_limits.assert_not_called()
+        kwargs = mock_result_class.call_args.kwargs
+        assert kwargs["data"] == {}
+        assert kwargs["errors"] == {did: expected_nrc for did in dids}
+
+    @patch(f"{SCRIPT_LOCATION}.DataIdentifiersReadResult")
+    def test_read__split_mismatch(self, mock_result_class):
+        self.mock_reader.plan.return_value = ((0x0001, 0x0004),)
+        self.mock_reader._split_response.side_effect = [None, {0x0001: b"\x01\x02"}, {0x0004: b"\x03"}]
+        self._set_responses((b"\x62",), (b"\x62",), (b"\x62",))
+        assert DataIdentifiersReader.read(self.mock_reader, Mock()) == mock_result_class.return_value
+        requests_payloads = [call_args.args[0].payload
+                             for call_args in self.mock_reader.client.send_request_receive_responses.call_args_list]
+        assert requests_payloads == [b"\x22\x00\x01\x00\x04", b"\x22\x00\x01", b"\x22\x00\x04"]
+        kwargs = mock_result_class.call_args.kwargs
+        assert kwargs["data"] == {0x0001: b"\x01\x02", 0x0004: b"\x03"}
+        assert kwargs["errors"] == {}
+
+
+@pytest.mark.integration
+class TestDataIdentifiersReaderIntegration:
+    """Integration tests for `DataIdentifiersReader` class."""
+
+    DIDS_DATA = {0x0100 + index: bytes(range(index % 7 + 1)) for index in range(50)}
+
+    def setup_method(self):
+        self.mock_client = MagicMock(spec=Client)
+        self.mock_client.send_request_receive_responses.side_effect = self._respond
+        self.server_max_response_length = 64
+        self.server_max_dids = 8
+        self.requests_payloads = []
+        self.rejected_requests_number = 0
+
+    def _respond(self, request):
+        """Simulate server which limits the number of DIDs in a request and the response length."""
+        payload = bytes(request.payload)
+        self.requests_payloads.append(payload)
+        dids = [int.from_bytes(payload[index:index + 2], "big") for index in range(1, len(payload), 2)]
+        response_payload = b"\x62" + b"".join(did.to_bytes(2, "big") + self.DIDS_DATA[did]
+                                              for did in dids if did in self.DIDS_DATA)
+        if len(dids) > self.server_max_dids:
+            response_payload = b"\x7F\x22\x13"
+            self.rejected_requests_number += 1
+        elif len(response_payload) > self.server_max_response_length:
+            response_payload = b"\x7F\x22\x14"
+            self.rejected_requests_number += 1
+        elif len(response_payload) == 1:
+            response_payload = b"\x7F\x22\x31"
+        request_record = Mock(spec=UdsMessageRecord, payload=payload)
+        response_record = Mock(spec=UdsMessageRecord, payload=response_payload)
+        return request_record, (response_record,)
+
+    @pytest.mark.parametrize("max_response_length, max_dids_per_request", [
+        (64, 8),
+        (4095, None),
+        (200, 8),
+        (64, 50),
+    ])
+    def test_read(self, max_response_length, max_dids_per_request):
+        reader = DataIdentifiersReader(client=self.mock_client,
+                                       did_data_lengths={did: len(data) for did, data in self.DIDS_DATA.items()},
+                                       max_response_length=max_response_length,
+                                       max_dids_per_request=max_dids_per_request)
+        dids = [*self.DIDS_DATA, 0xF186, 0x1234]
+        result = reader.read(dids)
+        assert result.data == self.DIDS_DATA
+        assert result.errors == {0xF186: NRC.RequestOutOfRange, 0x1234: NRC.RequestOutOfRange}
+        assert result.requests_number == len(self.requests_payloads)
+        assert result.requests_number < len(dids) // 3
+        # limits reduced during the reading do not change the configuration of the reader
+        assert reader.max_response_length == max_response_length
+        assert reader.max_dids_per_request == max_dids_per_request
+        rejected_requests_number = self.rejected_requests_number
+        self.requests_payloads.clear()
+        self.rejected_requests_number = 0
+        assert reader.read(dids).data == self.DIDS_DATA
+        assert self.rejected_requests_number == rejected_requests_number
+
+    @pytest.mark.parametrize("translator", [BASE_TRANSLATOR_2013, BASE_TRANSLATOR_2020])
+    def test_read__translator_did_definitions(self, translator):
+        self.DIDS_DATA = {0xF186: b"\x03", 0x0100: b"\x01\x02"}
+        reader = DataIdentifiersReader(client=self.mock_client, translator=translator,
+                                       did_data_lengths={0x0100: 2})
+        assert reader.plan([0xF186, 0x0100]) == ((0x0100, 0xF186),)
+        assert reader.read([0xF186, 0x0100]).data == self.DIDS_DATA
+
+    def test_read__decode(self):
+        self.DIDS_DATA = {0xF186: b"\x03", 0xF190: b"ABCDEFGHIJKLMNOPQ"}
+        reader = DataIdentifiersReader(client=self.mock_client, translator=BASE_TRANSLATOR,
+                                       did_data_lengths={0xF190: 17})
+        result = reader.read([0xF186, 0xF190])
+        assert result.requests_number == 1
+        assert result.errors == {}
+        decoded_session = result.decode(0xF186)
+        assert decoded_session[1]["raw_value"] == 0xF186
+        assert decoded_session[2]["children"][1]["physical_value"] == "extendedDiagnosticSession"
+        assert result.decode(0xF190)[2]["raw_value"] == tuple(b"ABCDEFGHIJKLMNOPQ")
@@ -0,0 +1,824 @@
+from gc import collect, disable, enable
+from time import perf_counter
+from types import MethodType
+from zlib import crc32
+
+import pytest
+from mock import ANY, MagicMock, Mock, call, patch
+
+from uds.addressing import AddressingType
+from uds.client import Client
+from uds.message import RequestSID, UdsMessage, UdsMessageRecord
+from uds.procedures.memory_image import MemorySegment, read_binary_file
+from uds.procedures.transfer import (
+    BLOCK_SEQUENCE_COUNTER_START,
+    AbstractDataTransfer,
+    DataDownloader,
+    DataUploader,
+    InconsistencyError,
+    NegativeResponseError,
+    TransferStatistics,
+)
+
+SCRIPT_LOCATION = "uds.procedures.transfer"
+
+
+class TestTransferStatistics:
+    """Unit tests for `TransferStatistics` class."""
+
+    def setup_method(self):
+        self._patcher_perf_counter = patch(f"{SCRIPT_LOCATION}.perf_counter")
+        self.mock_perf_counter = self._patcher_perf_counter.start()
+
+    def teardown_method(self):
+        self._patcher_perf_counter.stop()
+
+    # __init__
+
+    def test_init(self):
+        self.mock_perf_counter.side_effect = [10., 10.5]
+        statistics = TransferStatistics()
+        assert statistics.bytes_number == 0
+        assert statistics.blocks_number == 0
+        assert statistics.response_pending_number == 0
+        assert statistics.min_block_latency is None
+        assert statistics.max_block_latency is None
+        assert statistics.average_block_latency is None
+        assert statistics.duration == 500.
+
+    # __repr__
+
+    def test_repr(self):
+        self.mock_perf_counter.side_effect = [1., 2., 2., 2.]
+        statistics = TransferStatistics()
+        assert repr(statistics) == ("TransferStatistics(bytes_number=0, blocks_number=0, duration=1000.000 ms, "
+                                    "throughput=0.0 B/s)")
+
+    # throughput
+
+    @pytest.mark.parametrize("duration, expected_throughput", [(0., 0.), (2000., 0.)])
+    def test_throughput__no_data(self, duration, expected_throughput):
+        self.mock_perf_counter.side_effect = [0., duration / 1000.]
+        assert TransferStatistics().throughput == expected_throughput
+
+    # add_block, finish
+
+    def test_add_block_and_finish(self):
+        self.mock_perf_counter.side_effect = [0., 4.]
+        statistics = TransferStatistics()
+        statistics.add_block(bytes_number=100,
+                             request_record=Mock(transmission_end_timestamp=1.),
+                             response_records=[Mock(transmission_end_timestamp=1.002)])
+        statistics.add_block(bytes_number=50,
+                             request_record=Mock(transmission_end_timestamp=2.),
+                             response_records=[Mock(), Mock(), Mock(transmission_end_timestamp=2.008)])
+        statistics.add_block(bytes_number=50,
+                             request_record=Mock(transmission_end_timestamp=3.),
+                             response_records=[Mock(), Mock(transmission_end_timestamp=3.005)])
+        statistics.finish()
+        assert statistics.bytes_number == 200
+        assert statistics.blocks_number == 3
+        assert statistics.response_pending_number == 3
+        assert statistics.min_block_latency == pytest.approx(2.)
+        assert statistics.max_block_latency == pytest.approx(8.)
+        assert statistics.average_block_latency == pytest.approx(5.)
+        assert statistics.duration == 4000.
+        assert statistics.throughput == 50.
+        assert statistics.duration == 4000.
+
+
+class TestAbstractDataTransfer:
+    """Unit tests for `AbstractDataTransfer` class."""
+
+    def setup_method(self):
+        self.mock_transfer = Mock(spec=AbstractDataTransfer,
+                                    memory_address_length=4,
+                                    memory_size_length=4,
+                                    data_format_identifier=0x00,
+                                    max_block_length=None)
+
+    # __init__
+
+    @pytest.mark.parametrize("client, data_format_identifier, memory_address_length, memory_size_length, "
+                             "max_block_length", [
+                                 (Mock(), 0x00, 4, 4, None),
+                                 ("client", 0x11, 3, 2, 4095),
+                             ])
+    def test_init(self, client, data_format_identifier, memory_address_length, memory_size_length, max_block_length):
+        assert AbstractDataTransfer.__init__(self.mock_transfer,
+                                       client=client,
+                                       data_format_identifier=data_format_identifier,
+                                       memory_address_length=memory_address_length,
+                                       memory_size_length=memory_size_length,
+                                       max_block_length=max_block_length) is None
+        assert self.mock_transfer.client == client
+        assert self.mock_transfer.data_format_identifier == data_format_identifier
+        assert self.mock_transfer.memory_address_length == memory_address_length
+        assert self.mock_transfer.memory_size_length == memory_size_length
+        assert self.mock_transfer.max_block_length == max_block_length
+
+    # client
+
+    def test_client__get(self):
+        self.mock_transfer._AbstractDataTransfer__client = Mock()
+        assert AbstractDataTransfer.client.fget(self.mock_transfer) == self.mock_transfer._AbstractDataTransfer__client
+
+    def test_client__set__type_error(self):
+        with pytest.raises(TypeError):
+            AbstractDataTransfer.client.fset(self.mock_transfer, Mock())
+
+    def test_client__set__valid(self):
+        mock_client = Mock(spec=Client)
+        AbstractDataTransfer.client.fset(self.mock_transfer, mock_client)
+        assert self.mock_transfer._AbstractDataTransfer__client == mock_client
+
+    # data_format_identifier
+
+    def test_data_format_identifier__get(self):
+        self.mock_transfer._AbstractDataTransfer__data_format_identifier = Mock()
+        assert (AbstractDataTransfer.data_format_identifier.fget(self.mock_transfer)
+                == self.mock_transfer._AbstractDataTransfer__data_format_identifier)
+
+    @pytest.mark.parametrize("value", [0x00, 0x11])
+    @patch(f"{SCRIPT_LOCATION}.validate_raw_byte")
+    def test_data_format_identifier__set(self, mock_validate_raw_byte, value):
+        AbstractDataTransfer.data_format_identifier.fset(self.mock_transfer, value)
+        assert self.mock_transfer._AbstractDataTransfer__data_format_identifier == value
+        mock_validate_raw_byte.assert_called_once_with(value)
+
+    # memory_address_length
+
+    def test_memory_address_length__get(self):
+        self.mock_transfer._AbstractDataTransfer__memory_address_length = Mock()
+        assert (AbstractDataTransfer.memory_address_length.fget(self.mock_transfer)
+                == self.mock_transfer._AbstractDataTransfer__memory_address_length)
+
+    @pytest.mark.parametrize("value", [None, 4.0])
+    def test_memory_address_length__set__type_error(self, value):
+        with pytest.raises(TypeError):
+            AbstractDataTransfer.memory_address_length.fset(self.mock_transfer, value)
+
+    @pytest.mark.parametrize("value", [0, 16])
+    def test_memory_address_length__set__value_error(self, value):
+        with pytest.raises(ValueError):
+            AbstractDataTransfer.memory_address_length.fset(self.mock_transfer, value)
+
+    @pytest.mark.parametrize("value", [1, 15])
+    def test_memory_address_length__set__valid(self, value):
+        AbstractDataTransfer.memory_address_length.fset(self.mock_transfer, value)
+        assert self.mock_transfer._AbstractDataTransfer__memory_address_length == value
+
+    # memory_size_length
+
+    def test_memory_size_length__get(self):
+        self.mock_transfer._AbstractDataTransfer__memory_size_length = Mock()
+        assert (AbstractDataTransfer.memory_size_length.fget(self.mock_transfer)
+                == self.mock_transfer._AbstractDataTransfer__memory_size_length)
+
+    @pytest.mark.parametrize("value", [None, 4.0])
+    def test_memory_size_length__set__type_error(self, value):
+        with pytest.raises(TypeError):
+            AbstractDataTransfer.memory_size_length.fset(self.mock_transfer, value)
+
+    @pytest.mark.parametrize("value", [0, 16])
+    def test_memory_size_length__set__value_error(self, value):
+        with pytest.raises(ValueError):
+            AbstractDataTransfer.memory_size_length.fset(self.mock_transfer, value)
+
+    @pytest.mark.parametrize("value", [1, 15])
+    def test_memory_size_length__set__valid(self, value):
+        AbstractDataTransfer.memory_size_length.fset(self.mock_transfer, value)
+        assert self.mock_transfer._AbstractDataTransfer__memory_size_length == value
+
+    # max_block_length
+
+    def test_max_block_length__get(self):
+        self.mock_transfer._AbstractDataTransfer__max_block_length = Mock()
+        assert (AbstractDataTransfer.max_block_length.fget(self.mock_transfer)
+                == self.mock_transfer._AbstractDataTransfer__max_block_length)
+
+    @pytest.mark.parametrize("value", [4095.0, "4095"])
+    def test_max_block_length__set__type_error(self, value):
+        with pytest.raises(TypeError):
+            AbstractDataTransfer.max_block_length.fset(self.mock_transfer, value)
+
+    @pytest.mark.parametrize("value", [-1, 0, 2])
+    def test_max_block_length__set__value_error(self, value):
+        with pytest.raises(ValueError):
+            AbstractDataTransfer.max_block_length.fset(self.mock_transfer, value)
+
+    @pytest.mark.parametrize("value", [None, 3, 4095])
+    def test_max_block_length__set__valid(self, value):
+        AbstractDataTransfer.max_block_length.fset(self.mock_transfer, value)
+        assert self.mock_transfer._AbstractDataTransfer__max_block_length == value
+
+    # _exchange
+
+    def test_exchange__inconsistency_error(self):
+        self.mock_transfer.client.send_request_receive_responses.return_value = (Mock(), ())
+        with pytest.raises(InconsistencyError):
+            AbstractDataTransfer._exchange(self.mock_transfer, b"\x37")
+
+    @pytest.mark.parametrize("response_payload", [b"\x7F", bytearray(b"\x7F\x37")])
+    def test_exchange__inconsistency_error__short_negative_response(self, response_payload):
+        self.mock_transfer.client.send_request_receive_responses.return_value \
+            = (Mock(), (Mock(payload=response_payload),))
+        with pytest.raises(InconsistencyError):
+            AbstractDataTransfer._exchange(self.mock_transfer, b"\x37")
+
+    @pytest.mark.parametrize("payload, response_payload", [
+        (b"\x37", b"\x7F\x37\x24"),
+        (b"\x36\x01\x00", b"\x7F\x36\xF5"),
+    ])
+    def test_exchange__negative_response_error(self, payload, response_payload):
+        self.mock_transfer.client.send_request_receive_responses.return_value \
+            = (Mock(), (Mock(payload=b"\x7F\x37\x78"), Mock(payload=response_payload)))
+        with pytest.raises(NegativeResponseError):
+            AbstractDataTransfer._exchange(self.mock_transfer, payload)
+
+    @pytest.mark.parametrize("payload", [b"\x37", bytearray(b"\x36\x01\x00")])
+    def test_exchange__valid(self, payload):
+        response_records = (Mock(payload=b"\x7F\x37\x78"), Mock(payload=b"\x77"))
+        self.mock_transfer.client.send_request_receive_responses.return_value = (Mock(), response_records)
+        assert (AbstractDataTransfer._exchange(self.mock_transfer, payload)
+                == self.mock_transfer.client.send_request_receive_responses.return_value)
+        self.mock_transfer.client.send_request_receive_responses.assert_called_once_with(
+            UdsMessage(payload=payload, addressing_type=AddressingType.PHYSICAL))
+
+    # _get_address_and_size
+
+    @pytest.mark.parametrize("memory_address_length, memory_size_length, address, size, expected_value", [
+        (4, 4, 0x8000_0000, 0x1234, b"\x44\x80\x00\x00\x00\x00\x00\x12\x34"),
+        (1, 2, 0xFF, 0xFFFF, b"\x21\xFF\xFF\xFF"),
+    ])
+    def test_get_address_and_size(self, memory_address_length, memory_size_length, address, size, expected_value):
+        self.mock_transfer.memory_address_length = memory_address_length
+        self.mock_transfer.memory_size_length = memory_size_length
+        assert AbstractDataTransfer._get_address_and_size(self.mock_transfer,
+                                                          address=address, size=size) == expected_value
+
+    @pytest.mark.parametrize("address, size", [(0x1_0000_0000, 1), (0, 0x1_0000_0000), (-1, 1)])
+    def test_get_address_and_size__value_error(self, address, size):
+        with pytest.raises(ValueError):
+            AbstractDataTransfer._get_address_and_size(self.mock_transfer, address=address, size=size)
+
+    # _request_transfer
+
+    @pytest.mark.parametrize("address, size", [(0x1_0000_0000, 1), (0, 0x1_0000_0000), (-1, 1)])
+    def test_request_transfer__value_error(self, address, size):
+        self.mock_transfer._get_address_and_size = MethodType(AbstractDataTransfer._get_address_and_size,
+                                                              self.mock_transfer)
+        with pytest.raises(ValueError):
+            AbstractDataTransfer._request_transfer(self.mock_transfer, request_sid=RequestSID.RequestDownload,
+                                                   address=address, size=size)
+        self.mock_transfer._exchange.assert_not_called()
+
+    @pytest.mark.parametrize("response_payload", [b"\x74", b"\x74\x00", b"\x74\x20\x10", b"\x74\x10\x02"])
+    def test_request_transfer__inconsistency_error(self, response_payload):
+        self.mock_transfer._get_address_and_size.return_value = b"\x11\x00\x01"
+        self.mock_transfer._exchange.return_value = (Mock(), (Mock(payload=response_payload),))
+        with pytest.raises(InconsistencyError):
+            AbstractDataTransfer._request_transfer(self.mock_transfer, request_sid=RequestSID.RequestUpload,
+                                                   address=0, size=1)
+
+    @pytest.mark.parametrize("data_format_identifier, memory_address_length, memory_size_length, address, size, "
+                             "expected_payload", [
+                                 (0x00, 4, 4, 0x8000_0000, 0x1234, b"\x34\x00\x44\x80\x00\x00\x00\x00\x00\x12\x34"),
+                                 (0x11, 3, 2, 0x0A_BCDE, 0xFFFF, b"\x34\x11\x23\x0A\xBC\xDE\xFF\xFF"),
+                             ])
+    @pytest.mark.parametrize("response_payload, expected_block_length", [
+        (b"\x74\x20\x0F\xFF", 0xFFF),
+        (b"\x74\x10\x81", 0x81),
+    ])
+    def test_request_transfer__valid(self, data_format_identifier, memory_address_length, memory_size_length,
+                                     address, size, expected_payload, response_payload, expected_block_length):
+        self.mock_transfer.data_format_identifier = data_format_identifier
+        self.mock_transfer.memory_address_length = memory_address_length
+        self.mock_transfer.memory_size_length = memory_size_length
+        self.mock_transfer._get_address_and_size = MethodType(AbstractDataTransfer._get_address_and_size,
+                                                              self.mock_transfer)
+        self.mock_transfer._exchange.return_value = (Mock(), (Mock(payload=response_payload),))
+        assert AbstractDataTransfer._request_transfer(self.mock_transfer,
+                                                      request_sid=RequestSID.RequestDownload,
+                                                      address=address,
+                                                      size=size) == expected_block_length
+        self.mock_transfer._exchange.assert_called_once_with(expected_payload)
+
+    # request_transfer_exit
+
+    @pytest.mark.parametrize("transfer_request_parameter, response_payload", [
+        (b"", b"\x77"),
+        (b"\x12\x34", b"\x77\xAB\xCD"),
+    ])
+    def test_request_transfer_exit(self, transfer_request_parameter, response_payload):
+        self.mock_transfer._exchange.return_value = (Mock(), (Mock(payload=bytearray(response_payload)),))
+        assert AbstractDataTransfer.request_transfer_exit(self.mock_transfer,
+                                                          transfer_request_parameter) == response_payload[1:]
+        self.mock_transfer._exchange.assert_called_once_with(b"\x37" + transfer_request_parameter)
+
+
+class TestDataDownloader:
+    """Unit tests for `DataDownloader` class."""
+
+    def setup_method(self):
+        self.mock_downloader = Mock(spec=DataDownloader)
+
+    # request_download
+
+    @pytest.mark.parametrize("address, size", [(0x1000, 0x100), (0x8000_0000, 1)])
+    @pytest.mark.parametrize("max_number_of_block_length, max_block_length, expected_block_length", [
+        (0xFFF, None, 0xFFF),
+        (0xFFF, 0x102, 0x102),
+        (0x81, 0x102, 0x81),
+    ])
+    def test_request_download(self, address, size, max_number_of_block_length, max_block_length,
+                              expected_block_length):
+        self.mock_downloader.max_block_length = max_block_length
+        self.mock_downloader._request_transfer.return_value = max_number_of_block_length
+        assert DataDownloader.request_download(self.mock_downloader,
+                                               address=address, size=size) == expected_block_length
+        self.mock_downloader._request_transfer.assert_called_once_with(request_sid=RequestSID.RequestDownload,
+                                                                       address=address, size=size)
+
+    # transfer_data
+
+    def test_transfer_data__inconsistency_error(self):
+        self.mock_downloader._exchange.return_value = (Mock(), (Mock(payload=b"\x76\x02"),))
+        with pytest.raises(InconsistencyError):
+            DataDownloader.transfer_data(self.mock_downloader, data=b"\x00\x01\x02", max_number_of_block_length=3)
+
+    @pytest.mark.parametrize("data, max_number_of_block_length, block_sequence_counter, expected_payloads", [
+        (b"\x00\x01\x02\x03\x04", 4, 0x01, [b"\x36\x01\x00\x01", b"\x36\x02\x02\x03", b"\x36\x03\x04"]),
+        (bytearray(b"\xAA\xBB\xCC"), 3, 0xFE, [b"\x36\xFE\xAA", b"\x36\xFF\xBB", b"\x36\x00\xCC"]),
+        (memoryview(b"\xAA\xBB\xCC"), 0xFFF, 0x00, [b"\x36\x00\xAA\xBB\xCC"]),
+    ])
+    def test_transfer_data(self, data, max_number_of_block_length, block_sequence_counter, expected_payloads):
+        sent_payloads = []
+
+        def _exchange(payload):
+            sent_payloads.append(bytes(payload))
+            return Mock(), (Mock(payload=bytes([0x76, payload[1]])),)
+
+        self.mock_downloader._exchange.side_effect = _exchange
+        mock_statistics = Mock(spec=TransferStatistics)
+        assert DataDownloader.transfer_data(self.mock_downloader,
+                                            data=data,
+                                            max_number_of_block_length=max_number_of_block_length,
+                                            statistics=mock_statistics,
+                                            block_sequence_counter=block_sequence_counter) \
+               == (block_sequence_counter + len(expected_payloads)) & 0xFF
+        assert sent_payloads == expected_payloads
+        assert [call_args.kwargs["bytes_number"] for call_args in mock_statistics.add_block.call_args_list] \
+               == [len(payload) - 2 for payload in expected_payloads]
+
+    def test_transfer_data__no_statistics(self):
+        self.mock_downloader._exchange.return_value = (Mock(), (Mock(payload=b"\x76\x01"),))
+        assert (DataDownloader.transfer_data(self.mock_downloader, data=b"\x00", max_number_of_block_length=3)
+                == BLOCK_SEQUENCE_COUNTER_START + 1)
+        self.mock_downloader._exchange.assert_called_once_with(bytearray(b"\x36\x01\x00"))
+
+    # download
+
+    @pytest.mark.parametrize("segments", [None, b"\x00", [MemorySegment(0, b"\x00"), b"\x00"]])
+    def test_download__type_error(self, segments):
+        with pytest.raises(TypeError):
+            DataDownloader.download(self.mock_downloader, segments)
+
+    @pytest.mark.parametrize("segments", [
+        MemorySegment(0x1000, b"\x00\x01"),
+        (MemorySegment(0x1000, b"\x00\x01"), MemorySegment(0x2000, bytes(100))),
+    ])
+    @patch(f"{SCRIPT_LOCATION}.TransferStatistics")
+    def test_download(self, mock_transfer_statistics, segments):
+        statistics = DataDownloader.download(self.mock_downloader, segments)
+        assert statistics == mock_transfer_statistics.return_value
+        if isinstance(segments, MemorySegment):
+            segments = (segments,)
+        self.mock_downloader.request_download.assert_has_calls(
+            [call(address=segment.address, size=segment.size) for segment in segments])
+        self.mock_downloader.transfer_data.assert_has_calls(
+            [call(data=segment.data,
+                  max_number_of_block_length=self.mock_downloader.request_download.return_value,
+                  statistics=statistics) for segment in segments])
+        assert self.mock_downloader.request_transfer_exit.call_count == len(segments)
+        statistics.finish.assert_called_once_with()
+
+
+class TestDataUploader:
+    """Unit tests for `DataUploader` class."""
+
+    def setup_method(self):
+        self.mock_uploader = Mock(spec=DataUploader, max_block_length=None,
+                                  DEFAULT_READ_MEMORY_BLOCK_LENGTH=DataUploader.DEFAULT_READ_MEMORY_BLOCK_LENGTH)
+
+    # request_upload
+
+    @pytest.mark.parametrize("address, size", [(0x1000, 0x100), (0x8000_0000, 1)])
+    def test_request_upload(self, address, size):
+        assert (DataUploader.request_upload(self.mock_uploader, address=address, size=size)
+                == self.mock_uploader._request_transfer.return_value)
+        self.mock_uploader._request_transfer.assert_called_once_with(request_sid=RequestSID.RequestUpload,
+                                                                     address=address, size=size)
+
+    # _get_sink_view
+
+    @pytest.mark.parametrize("sink", [None, [0x00, 0x01], b"\x00\x01", memoryview(b"\x00\x01")])
+    def test_get_sink_view__type_error(self, sink):
+        with pytest.raises(TypeError):
+            DataUploader._get_sink_view(sink=sink, size=1, offset=0)
+
+    @pytest.mark.parametrize("sink, size, offset", [
+        (bytearray(1), 2, 0),
+        (bytearray(10), 5, 6),
+        (bytearray(10), 5, -1),
+        (bytearray(10), 5, 1.0),
+    ])
+    def test_get_sink_view__value_error(self, sink, size, offset):
+        with pytest.raises(ValueError):
+            DataUploader._get_sink_view(sink=sink, size=size, offset=offset)
+
+    @pytest.mark.parametrize("sink, size, offset", [
+        (bytearray(10), 10, 0),
+        (bytearray(10), 5, 5),
+        (memoryview(bytearray(16)).cast("H"), 16, 3),
+    ])
+    def test_get_sink_view__valid(self, sink, size, offset):
+        view = DataUploader._get_sink_view(sink=sink, size=size, offset=offset)
+        assert len(view) == size
+        assert view.format == "B"
+        view[0] = 0xFF
+        assert memoryview(sink).cast("B")[0] == 0xFF
+
+    # transfer_data
+
+    @pytest.mark.parametrize("response_payload", [b"\x76", b"\x76\x02\x00", b"\x76\x01", b"\x76\x01\x00\x01\x02"])
+    def test_transfer_data__inconsistency_error(self, response_payload):
+        self.mock_uploader._exchange.return_value = (Mock(), (Mock(payload=response_payload),))
+        with pytest.raises(InconsistencyError):
+            DataUploader.transfer_data(self.mock_uploader, sink=memoryview(bytearray(10)), offset=8,
+                                       max_number_of_block_length=0xFF)
+
+    @pytest.mark.parametrize("data, offset, max_number_of_block_length, block_sequence_counter", [
+        (b"\x00\x01\x02\x03\x04", 0, 4, 0x01),
+        (b"\xAA\xBB\xCC\xDD", 1, 3, 0xFE),
+        (bytes(range(256)), 100, 0xFFF, 0x00),
+    ])
+    def test_transfer_data(self, data, offset, max_number_of_block_length, block_sequence_counter):
+        sent_payloads = []
+        position = offset
+
+        def _exchange(payload):
+            nonlocal position
+            sent_payloads.append(bytes(payload))
+            block = data[position:position + max_number_of_block_length - 2]
+            position += len(block)
+            return Mock(), (Mock(payload=bytes([0x76, payload[1]]) + block),)
+
+        self.mock_uploader._exchange.side_effect = _exchange
+        mock_statistics = Mock(spec=TransferStatistics)
+        sink = bytearray(len(data))
+        sink[:offset] = data[:offset]
+        assert DataUploader.transfer_data(self.mock_uploader,
+                                          sink=memoryview(sink),
+                                          offset=offset,
+                                          max_number_of_block_length=max_number_of_block_length,
+                                          statistics=mock_statistics,
+                                          checksum=crc32(data[:offset]),
+                                          block_sequence_counter=block_sequence_counter) == crc32(data)
+        assert sink == data
+        assert sent_payloads == [bytes([0x36, (block_sequence_counter + i) & 0xFF])
+                                 for i in range(len(sent_payloads))]
+        assert sum(call_args.kwargs["bytes_number"] for call_args in mock_statistics.add_block.call_args_list) \
+               == len(data) - offset
+
+    # read_memory
+
+    @pytest.mark.parametrize("response_payload", [b"\x63", b"\x63\x00", b"\x63\x00\x01\x02"])
+    def test_read_memory__inconsistency_error(self, response_payload):
+        self.mock_uploader._get_address_and_size.return_value = b"\x11\x00\x02"
+        self.mock_uploader._exchange.return_value = (Mock(), (Mock(payload=response_payload),))
+        with pytest.raises(InconsistencyError):
+            DataUploader.read_memory(self.mock_uploader, sink=memoryview(bytearray(2)), address=0, offset=0)
+
+    @pytest.mark.parametrize("data_size, address, offset, max_block_length, expected_sizes", [
+        (5, 0x1000, 0, 3, [2, 2, 1]),
+        (5120, 0x8000_0000, 1000, None, [4094, 26]),
+    ])
+    def test_read_memory(self, data_size, address, offset, max_block_length, expected_sizes):
+        data = (bytes(range(256)) * (data_size // 256 + 1))[:data_size]
+        self.mock_uploader.max_block_length = max_block_length
+        self.mock_uploader.memory_address_length = 4
+        self.mock_uploader.memory_size_length = 2
+        self.mock_uploader._get_address_and_size = MethodType(DataUploader._get_address_and_size,
+                                                              self.mock_uploader)
+        requested_sizes = []
+
+        def _exchange(payload):
+            assert payload[:2] == b"\x23\x24"
+            position = int.from_bytes(payload[2:6], "big") - address
+            requested_sizes.append(int.from_bytes(payload[6:8], "big"))
+            return Mock(), (Mock(payload=b"\x63" + data[position:position + requested_sizes[-1]]),)
+
+        self.mock_uploader._exchange.side_effect = _exchange
+        sink = bytearray(len(data))
+        sink[:offset] = data[:offset]
+        mock_statistics = Mock(spec=TransferStatistics)
+        assert DataUploader.read_memory(self.mock_uploader,
+                                        sink=memoryview(sink),
+                                        address=address,
+                                        offset=offset,
+                                        statistics=mock_statistics,
+                                        checksum=crc32(data[:offset])) == crc32(data)
+        assert sink == data
+        assert requested_sizes == expected_sizes
+        assert [call_args.kwargs["bytes_number"]
+                for call_args in mock_statistics.add_block.call_args_list] == expected_sizes
+
+    # upload
+
+    @pytest.mark.parametrize("address, size, offset", [(0x1000, 0x100, 0), (0x8000_0000, 10, 4)])
+    @patch(f"{SCRIPT_LOCATION}.TransferStatistics")
+    def test_upload__transfer_data(self, mock_transfer_statistics, address, size, offset):
+        sink = bytearray(size)
+        self.mock_uploader._get_sink_view = DataUploader._get_sink_view
+        self.mock_uploader.transfer_data.return_value = 0x1234
+        assert DataUploader.upload(self.mock_uploader, address=address, size=size, sink=sink, offset=offset,
+                                   expected_crc32=0x1234) == mock_transfer_statistics.return_value
+        self.mock_uploader.request_upload.assert_called_once_with(address=address + offset, size=size - offset)
+        self.mock_uploader.transfer_data.assert_called_once_with(
+            sink=ANY, offset=offset,
+            max_number_of_block_length=self.mock_uploader.request_upload.return_value,
+            statistics=mock_transfer_statistics.return_value,
+            checksum=crc32(bytes(offset)))
+        self.mock_uploader.request_transfer_exit.assert_called_once_with()
+        self.mock_uploader.read_memory.assert_not_called()
+        mock_transfer_statistics.return_value.finish.assert_called_once_with()
+
+    @pytest.mark.parametrize("address, size, offset", [(0x1000, 0x100, 0), (0x8000_0000, 10, 4)])
+    def test_upload__read_memory_by_address(self, address, size, offset):
+        sink = bytearray(size)
+        mock_statistics = Mock(spec=TransferStatistics)
+        self.mock_uploader._get_sink_view = DataUploader._get_sink_view
+        assert DataUploader.upload(self.mock_uploader, address=address, size=size, sink=sink, offset=offset,
+                                   use_read_memory_by_address=True, statistics=mock_statistics) == mock_statistics
+        self.mock_uploader.read_memory.assert_called_once_with(sink=ANY, address=address, offset=offset,
+                                                               statistics=mock_statistics,
+                                                               checksum=crc32(bytes(offset)))
+        self.mock_uploader.request_upload.assert_not_called()
+        self.mock_uploader.transfer_data.assert_not_called()
+        self.mock_uploader.request_transfer_exit.assert_not_called()
+        mock_statistics.finish.assert_called_once_with()
+
+    def test_upload__finished(self):
+        mock_statistics = Mock(spec=TransferStatistics)
+        self.mock_uploader._get_sink_view = DataUploader._get_sink_view
+        assert DataUploader.upload(self.mock_uploader, address=0, size=3, sink=bytearray(b"\x01\x02\x03"),
+                                   offset=3, expected_crc32=crc32(b"\x01\x02\x03"),
+                                   statistics=mock_statistics) == mock_statistics
+        self.mock_uploader.request_upload.assert_not_called()
+        self.mock_uploader.read_memory.assert_not_called()
+
+    def test_upload__inconsistency_error(self):
+        mock_statistics = Mock(spec=TransferStatistics)
+        self.mock_uploader._get_sink_view = DataUploader._get_sink_view
+        self.mock_uploader.transfer_data.return_value = 0x1234
+        with pytest.raises(InconsistencyError):
+            DataUploader.upload(self.mock_uploader, address=0, size=3, sink=bytearray(3), expected_crc32=0x4321,
+                                statistics=mock_statistics)
+        mock_statistics.finish.assert_called_once_with()
+
+    # upload_to_file
+
+    @pytest.mark.parametrize("size", [None, 0, -1, 1.0])
+    def test_upload_to_file__value_error(self, tmp_path, size):
+        with pytest.raises(ValueError):
+            DataUploader.upload_to_file(self.mock_uploader, file_path=tmp_path / "dump.bin", address=0, size=size)
+        assert not (tmp_path / "dump.bin").exists()
+
+    @pytest.mark.parametrize("offset", [0, 2])
+    def test_upload_to_file(self, tmp_path, offset):
+        file_path = tmp_path / "dump.bin"
+        file_path.write_bytes(b"\xAA\xBB\xCC\xDD\xEE\xFF\x00")
+
+        mock_statistics = Mock(spec=TransferStatistics)
+
+        def _upload(sink, **_):
+            sink[4] = 0x44
+            return mock_statistics
+
+        self.mock_uploader.upload.side_effect = _upload
+        assert DataUploader.upload_to_file(self.mock_uploader, file_path=file_path, address=0x10, size=5,
+                                           offset=offset) == mock_statistics
+        self.mock_uploader.upload.assert_called_once_with(address=0x10, size=5, sink=ANY, offset=offset,
+                                                          expected_crc32=None, use_read_memory_by_address=False,
+                                                          statistics=None)
+        assert file_path.read_bytes() == (b"\xAA\xBB\xCC\xDD\x44" if offset else b"\x00\x00\x00\x00\x44")
+
+
+class _Server:
+    """Simulation of a server that accepts downloads and uploads."""
+
+    def __init__(self, max_number_of_block_length, response_pending_period=None, image_address=0, image=b"",
+                 failure_request_number=None):
+        self.max_number_of_block_length = max_number_of_block_length
+        self.response_pending_period = response_pending_period
+        self.image_address = image_address
+        self.image = image
+        self.failure_request_number = failure_request_number
+        self.memory = {}
+        self.requests_number = 0
+        self.__address = None
+        self.__remaining_size = None
+        self.__upload = None
+        self.__expected_counter = None
+
+    def __call__(self, request):
+        payload = request.payload
+        self.requests_number += 1
+        response_payloads = []
+        if self.response_pending_period and self.requests_number % self.response_pending_period == 0:
+            response_payloads.append(bytes([0x7F, payload[0], 0x78]))
+        if self.requests_number == self.failure_request_number:
+            response_payloads.append(bytes([0x7F, payload[0], 0x72]))
+        elif payload[0] in (0x34, 0x35):
+            address_length = payload[2] & 0xF
+            size_length = payload[2] >> 4
+            self.__address = int.from_bytes(payload[3:3 + address_length], "big")
+            self.__remaining_size = int.from_bytes(payload[3 + address_length:3 + address_length + size_length],
+                                                   "big")
+            self.__upload = payload[0] == 0x35
+            self.__expected_counter = 0x01
+            response_payloads.append(bytes([payload[0] + 0x40, 0x20])
+                                     + self.max_number_of_block_length.to_bytes(2, "big"))
+        elif payload[0] == 0x36:
+            if payload[1] != self.__expected_counter:
+                response_payloads.append(b"\x7F\x36\x73")
+            elif self.__upload:
+                bytes_number = min(self.max_number_of_block_length - 2, self.__remaining_size)
+                response_payloads.append(b"\x76" + bytes(payload[1:2])
+                                         + self.read_image(self.__address, bytes_number))
+                self.__address += bytes_number
+                self.__remaining_size -= bytes_number
+                self.__expected_counter = (self.__expected_counter + 1) & 0xFF
+            else:
+                self.memory[self.__address] = bytes(payload[2:])
+                self.__address += len(payload) - 2
+                self.__expected_counter = (self.__expected_counter + 1) & 0xFF
+                response_payloads.append(b"\x76" + bytes(payload[1:2]))
+        elif payload[0] == 0x37:
+            response_payloads.append(b"\x77")
+        elif payload[0] == 0x23:
+            address_length = payload[1] & 0xF
+            address = int.from_bytes(payload[2:2 + address_length], "big")
+            size = int.from_bytes(payload[2 + address_length:], "big")
+            response_payloads.append(b"\x63" + self.read_image(address, size))
+        timestamp = perf_counter()
+        request_record = Mock(spec=UdsMessageRecord, payload=bytes(payload), transmission_end_timestamp=timestamp)
+        return request_record, tuple(Mock(spec=UdsMessageRecord, payload=response_payload,
+                                          transmission_end_timestamp=timestamp)
+                                     for response_payload in response_payloads)
+
+    def get_data(self, address, size):
+        data = bytearray()
+        while len(data) < size:
+            data += self.memory[address + len(data)]
+        return bytes(data)
+
+    def read_image(self, address, size):
+        position = address - self.image_address
+        return self.image[position:position + size]
+
+
+@pytest.mark.integration
+class TestDataDownloaderIntegration:
+    """Integration tests for `DataDownloader` class."""
+
+    def setup_method(self):
+        self.mock_client = MagicMock(spec=Client)
+
+    @pytest.mark.parametrize("image_size, max_number_of_block_length, max_block_length, response_pending_period", [
+        (76800, 0x102, None, None),
+        (76800, 0xFFF, 0x82, 7),
+        (300, 0x03, None, 100),
+    ])
+    def test_download__binary_file(self, tmp_path, image_size, max_number_of_block_length, max_block_length,
+                                   response_pending_period):
+        server = _Server(max_number_of_block_length, response_pending_period)
+        self.mock_client.send_request_receive_responses.side_effect = server
+        file_path = tmp_path / "image.bin"
+        image = (bytes(range(256)) * (image_size // 256 + 1))[:image_size]
+        file_path.write_bytes(image)
+        downloader = DataDownloader(client=self.mock_client, max_block_length=max_block_length)
+        statistics = downloader.download(read_binary_file(file_path, address=0x8000_0000))
+        assert server.get_data(0x8000_0000, len(image)) == image
+        block_data_length = min(max_number_of_block_length, max_block_length or max_number_of_block_length) - 2
+        assert statistics.bytes_number == len(image)
+        assert statistics.blocks_number == -(-len(image) // block_data_length)
+        assert statistics.blocks_number > 0x100  # block sequence counter wrapped around
+        if response_pending_period is not None:
+            assert 0 < statistics.response_pending_number <= server.requests_number // response_pending_period
+        assert statistics.throughput > 0
+
+    def test_download__segments(self):
+        server = _Server(0x400)
+        self.mock_client.send_request_receive_responses.side_effect = server
+        segments = (MemorySegment(0x0000, bytes(range(256)) * 10), MemorySegment(0x10000, b"\x01\x02\x03"))
+        statistics = DataDownloader(client=self.mock_client, memory_address_length=3,
+                                    memory_size_length=2).download(segments)
+        assert server.get_data(0x0000, 2560) == bytes(range(256)) * 10
+        assert server.get_data(0x10000, 3) == b"\x01\x02\x03"
+        assert statistics.bytes_number == 2563
+        assert statistics.blocks_number == 4
+        assert server.requests_number == 2 + 4 + 2
+
+
+@pytest.mark.integration
+class TestDataUploaderIntegration:
+    """Integration tests for `DataUploader` class."""
+
+    IMAGE = bytes(range(256)) * 300
+
+    def setup_method(self):
+        self.mock_client = MagicMock(spec=Client)
+
+    @pytest.mark.parametrize("max_number_of_block_length, max_block_length, response_pending_period", [
+        (0x102, None, None),
+        (0xFFF, 0x82, 7),
+    ])
+    @pytest.mark.parametrize("use_read_memory_by_address", [False, True])
+    def test_upload_to_file(self, tmp_path, max_number_of_block_length, max_block_length, response_pending_period,
+                            use_read_memory_by_address):
+        server = _Server(max_number_of_block_length, response_pending_period,
+                         image_address=0x8000_0000, image=self.IMAGE)
+        self.mock_client.send_request_receive_responses.side_effect = server
+        file_path = tmp_path / "dump.bin"
+        uploader = DataUploader(client=self.mock_client, max_block_length=max_block_length)
+        statistics = uploader.upload_to_file(file_path, address=0x8000_0000, size=len(self.IMAGE),
+                                             expected_crc32=crc32(self.IMAGE),
+                                             use_read_memory_by_address=use_read_memory_by_address)
+        assert file_path.read_bytes() == self.IMAGE
+        assert statistics.bytes_number == len(self.IMAGE)
+        if response_pending_period is not None:
+            assert statistics.response_pending_number > 0
+        assert statistics.throughput > 0
+
+    @pytest.mark.parametrize("use_read_memory_by_address", [False, True])
+    def test_upload_to_file__resume(self, tmp_path, use_read_memory_by_address):
+        server = _Server(0x402, image_address=0x1000, image=self.IMAGE, failure_request_number=20)
+        self.mock_client.send_request_receive_responses.side_effect = server
+        file_path = tmp_path / "dump.bin"
+        uploader = DataUploader(client=self.mock_client, max_block_length=0x401)
+        statistics = TransferStatistics()
+        with pytest.raises(NegativeResponseError):
+            uploader.upload_to_file(file_path, address=0x1000, size=len(self.IMAGE), statistics=statistics,
+                                    use_read_memory_by_address=use_read_memory_by_address)
+        offset = statistics.bytes_number
+        assert 0 < offset < len(self.IMAGE)
+        assert file_path.read_bytes()[:offset] == self.IMAGE[:offset]
+        statistics = uploader.upload_to_file(file_path, address=0x1000, size=len(self.IMAGE), offset=offset,
+                                             expected_crc32=crc32(self.IMAGE),
+                                             use_read_memory_by_address=use_read_memory_by_address)
+        assert file_path.read_bytes() == self.IMAGE
+        assert statistics.bytes_number == len(self.IMAGE) - offset
+
+    def test_upload__crc_mismatch(self):
+        server = _Server(0x102, image_address=0x0, image=self.IMAGE)
+        self.mock_client.send_request_receive_responses.side_effect = server
+        sink = bytearray(1000)
+        with pytest.raises(InconsistencyError):
+            DataUploader(client=self.mock_client).upload(address=0x0, size=1000, sink=sink,
+                                                         expected_crc32=crc32(self.IMAGE[1:1001]))
+        assert sink == self.IMAGE[:1000]
+
+
+@pytest.mark.performance
+class TestDataDownloaderPerformance:
+    """Performance tests for `DataDownloader` class."""
+
+    IMAGE_SIZE = 4 * 1024 * 1024
+
+    def test_download__overhead(self):
+        """Check that slicing data into blocks does not depend on the image size (no copies of the whole image)."""
+        mock_client = MagicMock(spec=Client)
+        request_record = Mock(spec=UdsMessageRecord, transmission_end_timestamp=0.)
+        response_record = Mock(spec=UdsMessageRecord, payload=b"\x76\x00", transmission_end_timestamp=0.)
+
+        def _respond(request):
+            response_record.payload = b"\x76" + bytes(request.payload[1:2])
+            return request_record, (response_record,)
+
+        mock_client.send_request_receive_responses.side_effect = _respond
+        downloader = DataDownloader(client=mock_client)
+        timings = []
+        for size in (self.IMAGE_SIZE // 4, self.IMAGE_SIZE):
+            data = bytes(size)
+            collect()
+            disable()  # full garbage collection of objects created by other tests would distort the measurement
+            try:
+                timestamp_start = perf_counter()
+                downloader.transfer_data(data=data, max_number_of_block_length=0xFFF)
+                timings.append(perf_counter() - timestamp_start)
+            finally:
+                enable()
+        assert timings[1] < 8 * timings[0]
+        assert self.IMAGE_SIZE / timings[1] > 10 * 1024 * 1024  # bytes per second processed by the engine
@@ -0,0 +1,659 @@
+from threading import Thread
+from time import perf_counter
+
+import pytest
+from mock import MagicMock, Mock, call, patch
+
+from can import Bus
+from uds.addressing import AddressingType
+from uds.can import CanAddressingFormat, CanAddressingInformation, DefaultFlowControlParametersGenerator
+from uds.can.transport_interface import PythonCanTransportInterface
+from uds.client import Client
+from uds.server import (
+    NRC,
+    AbstractTransportInterface,
+    ReassignmentError,
+    ResponseSID,
+    Server,
+    ServerResponse,
+    Translator,
+    UdsMessage,
+    UdsMessageRecord,
+)
+from uds.translator import BASE_TRANSLATOR
+
+SCRIPT_LOCATION = "uds.server"
+
+
+class TestServerResponse:
+    """Unit tests for `ServerResponse` class."""
+
+    # __init__
+
+    @pytest.mark.parametrize("kwargs", [
+        {},
+        {"payload": [0x50, 0x01], "nrc": NRC.GeneralReject},
+        {"payload": [0x50, 0x01], "data_records_values": {}},
+        {"payload": [0x50, 0x01], "data_records_values": {}, "nrc": NRC.GeneralReject},
+    ])
+    def test_init__value_error__content(self, kwargs):
+        with pytest.raises(ValueError):
+            ServerResponse(**kwargs)
+
+    @pytest.mark.parametrize("kwargs", [
+        {"data_records_values": [("SubFunction", 1)]},
+        {"nrc": NRC.GeneralReject, "delay": "1"},
+        {"nrc": NRC.GeneralReject, "response_pending_period": None},
+        {"nrc": NRC.GeneralReject, "response_pending_number": 1.},
+    ])
+    def test_init__type_error(self, kwargs):
+        with pytest.raises(TypeError):
+            ServerResponse(**kwargs)
+
+    @pytest.mark.parametrize("kwargs", [
+        {"nrc": NRC.GeneralReject, "delay": -1},
+        {"nrc": NRC.GeneralReject, "response_pending_period": -0.1},
+        {"nrc": NRC.GeneralReject, "response_pending_number": -1},
+        {"nrc": 0x100},
+    ])
+    def test_init__value_error(self, kwargs):
+        with pytest.raises(ValueError):
+            ServerResponse(**kwargs)
+
+    def test_init__payload(self):
+        response = ServerResponse(payload=[0x50, 0x01, 0x00, 0x32, 0x01, 0xF4])
+        assert response.payload == b"\x50\x01\x00\x32\x01\xF4"
+        assert response.data_records_values is None
+        assert response.nrc is None
+        assert response.delay == 0
+        assert response.response_pending_number == 0
+        assert response.response_pending_period == ServerResponse.DEFAULT_RESPONSE_PENDING_PERIOD
+
+    def test_init__data_records_values(self):
+        data_records_values = {"SubFunction": 0x01}
+        response = ServerResponse(data_records_values=data_records_values,
+                                  delay=12.5,
+                                  response_pending_number=3,
+                                  response_pending_period=100)
+        assert response.payload is None
+        assert response.data_records_values == data_records_values
+        assert response.data_records_values is not data_records_values
+        assert response.nrc is None
+        assert response.delay == 12.5
+        assert response.response_pending_number == 3
+        assert response.response_pending_period == 100
+
+    def test_init__nrc(self):
+        response = ServerResponse(nrc=0x22)
+        assert response.payload is None
+        assert response.data_records_values is None
+        assert response.nrc == NRC.ConditionsNotCorrect
+
+    # __repr__
+
+    def test_repr(self):
+        response = ServerResponse(nrc=NRC.GeneralReject, delay=5)
+        assert repr(response).startswith("ServerResponse(")
+        assert "delay=5" in repr(response)
+
+
+class TestServer:
+    """Unit tests for `Server` class."""
+
+    def setup_method(self):
+        self.mock_server = MagicMock(spec=Server,
+                                     _Server__responses={},
+                                     _Server__handlers={},
+                                     _Server__counters_lock=MagicMock(),
+                                     _Server__received_requests_number=0,
+                                     _Server__sent_responses_number=0,
+                                     _Server__serving_task_event=Mock(),
+                                     SUPPRESSED_FUNCTIONAL_NRCS=Server.SUPPRESSED_FUNCTIONAL_NRCS)
+        # patching
+        self._patcher_warn = patch(f"{SCRIPT_LOCATION}.warn")
+        self.mock_warn = self._patcher_warn.start()
+        self._patcher_sleep = patch(f"{SCRIPT_LOCATION}.sleep")
+        self.mock_sleep = self._patcher_sleep.start()
+        self._patcher_thread = patch(f"{SCRIPT_LOCATION}.Thread")
+        self.mock_thread = self._patcher_thread.start()
+        self._patcher_uds_message = patch(f"{SCRIPT_LOCATION}.UdsMessage")
+        self.mock_uds_message = self._patcher_uds_message.start()
+
+    def teardown_method(self):
+        self._patcher_warn.stop()
+        self._patcher_sleep.stop()
+        self._patcher_thread.stop()
+        self._patcher_uds_message.stop()
+
+    # __init__
+
+    @pytest.mark.parametrize("transport_interface", [Mock(), "Some Transport Interface"])
+    def test_init__mandatory_args(self, transport_interface):
+        assert Server.__init__(self.mock_server, transport_interface=transport_interface) is None
+        assert self.mock_server.transport_interface == transport_interface
+        assert self.mock_server.responses == {}
+        assert self.mock_server.handlers == {}
+        assert self.mock_server.translator is None
+        assert self.mock_server.default_response == Server.DEFAULT_RESPONSE
+        assert self.mock_server._Server__received_requests_number == 0
+        assert self.mock_server._Server__sent_responses_number == 0
+        assert self.mock_server._Server__serving_thread is None
+
+    def test_init__all_args(self):
+        mock_responses = Mock()
+        mock_handlers = Mock()
+        mock_translator = Mock()
+        mock_default_response = Mock()
+        assert Server.__init__(self.mock_server,
+                               transport_interface=self.mock_server.transport_interface,
+                               responses=mock_responses,
+                               handlers=mock_handlers,
+                               translator=mock_translator,
+                               default_response=mock_default_response) is None
+        assert self.mock_server.responses == mock_responses
+        assert self.mock_server.handlers == mock_handlers
+        assert self.mock_server.translator == mock_translator
+        assert self.mock_server.default_response == mock_default_response
+
+    # __del__
+
+    def test_del__running(self):
+        self.mock_server.is_running = True
+        assert Server.__del__(self.mock_server) is None
+        self.mock_server.stop.assert_called_once_with()
+
+    def test_del__not_running(self):
+        self.mock_server.is_running = False
+        assert Server.__del__(self.mock_server) is None
+        self.mock_server.stop.assert_not_called()
+
+    # transport_interface
+
+    def test_transport_interface__get(self):
+        self.mock_server._Server__transport_interface = Mock()
+        assert (Server.transport_interface.fget(self.mock_server)
+                == self.mock_server._Server__transport_interface)
+
+    @pytest.mark.parametrize("value", [None, Mock()])
+    def test_transport_interface__set__type_error(self, value):
+        with pytest.raises(TypeError):
+            Server.transport_interface.fset(self.mock_server, value)
+
+    def test_transport_interface__set__reassignment_error(self):
+        self.mock_server._Server__transport_interface = Mock()
+        with pytest.raises(ReassignmentError):
+            Server.transport_interface.fset(self.mock_server, Mock(spec=AbstractTransportInterface))
+
+    def test_transport_interface__set__valid(self):
+        mock_transport_interface = Mock(spec=AbstractTransportInterface)
+        assert Server.transport_interface.fset(self.mock_server, mock_transport_interface) is None
+        assert self.mock_server._Server__transport_interface == mock_transport_interface
+
+    # responses
+
+    def test_responses__get(self):
+        self.mock_server._Server__responses = {b"\x3E\x00": Mock()}
+        assert Server.responses.fget(self.mock_server) == self.mock_server._Server__responses
+
+    @pytest.mark.parametrize("value", [
+        None,
+        [(b"\x3E\x00", ServerResponse(payload=b"\x7E\x00"))],
+        {b"\x3E\x00": b"\x7E\x00"},
+    ])
+    def test_responses__set__type_error(self, value):
+        with pytest.raises(TypeError):
+            Server.responses.fset(self.mock_server, value)
+
+    def test_responses__set__value_error(self):
+        with pytest.raises(ValueError):
+            Server.responses.fset(self.mock_server, {(0x3E, 0x100): ServerResponse(payload=b"\x7E\x00")})
+
+    def test_responses__set__valid(self):
+        response_1 = ServerResponse(payload=b"\x7E\x00")
+        response_2 = ServerResponse(nrc=NRC.SecurityAccessDenied)
+        assert Server.responses.fset(self.mock_server, {(0x3E, 0x00): response_1,
+                                                        (0x27, 0x01): response_2}) is None
+        assert self.mock_server._Server__responses == {b"\x3E\x00": response_1, b"\x27\x01": response_2}
+
+    # handlers
+
+    def test_handlers__get(self):
+        self.mock_server._Server__handlers = {0x22: Mock()}
+        assert Server.handlers.fget(self.mock_server) == self.mock_server._Server__handlers
+
+    @pytest.mark.parametrize("value", [
+        None,
+        {"0x22": Mock()},
+        {0x22: "not callable"},
+    ])
+    def test_handlers__set__type_error(self, value):
+        with pytest.raises(TypeError):
+            Server.handlers.fset(self.mock_server, value)
+
+    @pytest.mark.parametrize("value", [
+        {-1: Mock()},
+        {0x100: Mock()},
+    ])
+    def test_handlers__set__value_error(self, value):
+        with pytest.raises(ValueError):
+            Server.handlers.fset(self.mock_server, value)
+
+    def test_handlers__set__valid(self):
+        mock_handler = Mock()
+        assert Server.handlers.fset(self.mock_server, {0x22: mock_handler}) is None
+        assert self.mock_server._Server__handlers == {0x22: mock_handler}
+
+    # translator
+
+    def test_translator__get(self):
+        self.mock_server._Server__translator = Mock()
+        assert Server.translator.fget(self.mock_server) == self.mock_server._Server__translator
+
+    def test_translator__set__type_error(self):
+        with pytest.raises(TypeError):
+            Server.translator.fset(self.mock_server, Mock())
+
+    @pytest.mark.parametrize("value", [None, Mock(spec=Translator)])
+    def test_translator__set__valid(self, value):
+        assert Server.translator.fset(self.mock_server, value) is None
+        assert self.mock_server._Server__translator == value
+
+    # default_response
+
+    def test_default_response__get(self):
+        self.mock_server._Server__default_response = Mock()
+        assert Server.default_response.fget(self.mock_server) == self.mock_server._Server__default_response
+
+    def test_default_response__set__type_error(self):
+        with pytest.raises(TypeError):
+            Server.default_response.fset(self.mock_server, b"\x7F\x22\x11")
+
+    @pytest.mark.parametrize("value", [None, Mock(spec=ServerResponse)])
+    def test_default_response__set__valid(self, value):
+        assert Server.default_response.fset(self.mock_server, value) is None
+        assert self.mock_server._Server__default_response == value
+
+    # is_running
+
+    @pytest.mark.parametrize("value", [True, False])
+    def test_is_running(self, value):
+        self.mock_server._Server__serving_task_event.is_set.return_value = value
+        assert Server.is_running.fget(self.mock_server) is value
+
+    # received_requests_number
+
+    def test_received_requests_number(self):
+        self.mock_server._Server__received_requests_number = 15
+        assert Server.received_requests_number.fget(self.mock_server) == 15
+
+    # sent_responses_number
+
+    def test_sent_responses_number(self):
+        self.mock_server._Server__sent_responses_number = 7
+        assert Server.sent_responses_number.fget(self.mock_server) == 7
+
+    # __serving_task
+
+    def test_serving_task(self):
+        mock_request_record = Mock(spec=UdsMessageRecord)
+        type(self.mock_server).is_running = property(Mock(side_effect=[True, True, True, False]))
+        self.mock_server.transport_interface.receive_message.side_effect = [TimeoutError, mock_request_record,
+                                                                            TimeoutError]
+        assert Server._Server__serving_task(self.mock_server, cycle=5) is None
+        self.mock_server.transport_interface.receive_message.assert_has_calls([call(start_timeout=5)] * 3)
+        self.mock_server.process_request.assert_called_once_with(mock_request_record)
+        self.mock_server._Server__serving_task_event.clear.assert_called_once_with()
+        self.mock_warn.assert_not_called()
+
+    def test_serving_task__processing_error(self):
+        mock_request_records = [Mock(spec=UdsMessageRecord), Mock(spec=UdsMessageRecord)]
+        type(self.mock_server).is_running = property(Mock(side_effect=[True, True, False]))
+        self.mock_server.transport_interface.receive_message.side_effect = mock_request_records
+        self.mock_server.process_request.side_effect = [ValueError, None]
+        assert Server._Server__serving_task(self.mock_server, cycle=5) is None
+        assert self.mock_server.process_request.call_args_list == [call(mock_request_records[0]),
+                                                                  call(mock_request_records[1])]
+        self.mock_warn.assert_called_once()
+        self.mock_server._Server__serving_task_event.clear.assert_called_once_with()
+
+    def test_serving_task__transport_error(self):
+        type(self.mock_server).is_running = property(Mock(return_value=True))
+        self.mock_server.transport_interface.receive_message.side_effect = OSError
+        with pytest.raises(OSError):
+            Server._Server__serving_task(self.mock_server, cycle=5)
+        self.mock_server.process_request.assert_not_called()
+        self.mock_server._Server__serving_task_event.clear.assert_called_once_with()
+
+    # _send_response
+
+    @pytest.mark.parametrize("payload", [[0x7E, 0x00], b"\x7F\x22\x78"])
+    def test_send_response(self, payload):
+        assert (Server._send_response(self.mock_server, payload)
+                == self.mock_server.transport_interface.send_message.return_value)
+        self.mock_uds_message.assert_called_once_with(payload=payload, addressing_type=AddressingType.PHYSICAL)
+        self.mock_server.transport_interface.send_message.assert_called_once_with(self.mock_uds_message.return_value)
+        assert self.mock_server._Server__sent_responses_number == 1
+
+    # encode_response
+
+    def test_encode_response__payload(self):
+        response = ServerResponse(payload=b"\x62\xF1\x90\x00")
+        assert Server.encode_response(self.mock_server, request_sid=0x22, response=response) == b"\x62\xF1\x90\x00"
+
+    @pytest.mark.parametrize("request_sid, nrc", [
+        (0x22, NRC.RequestOutOfRange),
+        (0x31, NRC.GeneralProgrammingFailure),
+    ])
+    def test_encode_response__nrc(self, request_sid, nrc):
+        response = ServerResponse(nrc=nrc)
+        assert (Server.encode_response(self.mock_server, request_sid=request_sid, response=response)
+                == bytes([ResponseSID.NegativeResponse, request_sid, nrc]))
+
+    def test_encode_response__no_translator(self):
+        self.mock_server.translator = None
+        with pytest.raises(ValueError):
+            Server.encode_response(self.mock_server, request_sid=0x10,
+                                   response=ServerResponse(data_records_values={}))
+
+    def test_encode_response__unknown_response_sid(self):
+        with pytest.raises(ValueError):
+            Server.encode_response(self.mock_server, request_sid=0xBF,
+                                   response=ServerResponse(data_records_values={}))
+
+    def test_encode_response__data_records_values(self):
+        response = ServerResponse(data_records_values={"SubFunction": 0x01})
+        self.mock_server.translator.encode.return_value = bytearray([0x50, 0x01])
+        assert Server.encode_response(self.mock_server, request_sid=0x10, response=response) == b"\x50\x01"
+        self.mock_server.translator.encode.assert_called_once_with(
+            data_records_values=response.data_records_values,
+            rsid=ResponseSID.DiagnosticSessionControl)
+
+    # decode_request
+
+    def test_decode_request__no_translator(self):
+        self.mock_server.translator = None
+        with pytest.raises(ValueError):
+            Server.decode_request(self.mock_server, Mock(spec=UdsMessageRecord))
+
+    def test_decode_request(self):
+        mock_request = Mock(spec=UdsMessageRecord)
+        assert (Server.decode_request(self.mock_server, mock_request)
+                == self.mock_server.translator.decode.return_value)
+        self.mock_server.translator.decode.assert_called_once_with(mock_request)
+
+    # get_response
+
+    def test_get_response__table(self):
+        mock_response = Mock()
+        mock_handler = Mock()
+        self.mock_server._Server__responses = {b"\x22\xF1\x90": mock_response}
+        self.mock_server._Server__handlers = {0x22: mock_handler}
+        assert Server.get_response(self.mock_server,
+                                   Mock(spec=UdsMessageRecord, payload=b"\x22\xF1\x90")) == mock_response
+        mock_handler.assert_not_called()
+
+    def test_get_response__handler(self):
+        mock_request = Mock(spec=UdsMessageRecord, payload=b"\x22\xF1\x91")
+        mock_handler = Mock()
+        self.mock_server._Server__responses = {b"\x22\xF1\x90": Mock()}
+        self.mock_server._Server__handlers = {0x22: mock_handler}
+        assert Server.get_response(self.mock_server, mock_request) == mock_handler.return_value
+        mock_handler.assert_called_once_with(mock_request)
+
+    def test_get_response__default(self):
+        self.mock_server._Server__handlers = {0x22: Mock()}
+        assert (Server.get_response(self.mock_server, Mock(spec=UdsMessageRecord, payload=b"\x3E\x00"))
+                == self.mock_server.default_response)
+
+    # process_request
+
+    def test_process_request__type_error(self):
+        with pytest.raises(TypeError):
+            Server.process_request(self.mock_server, Mock(spec=UdsMessage))
+
+    def test_process_request__no_response(self):
+        self.mock_server.get_response.return_value = None
+        assert Server.process_request(self.mock_server, Mock(spec=UdsMessageRecord, payload=b"\x3E\x00")) == ()
+        self.mock_server._send_response.assert_not_called()
+        assert self.mock_server._Server__received_requests_number == 1
+
+    @pytest.mark.parametrize("payload, addressing_type", [
+        (b"\x3E\x00", AddressingType.PHYSICAL),
+        (b"\x3E\x00", AddressingType.FUNCTIONAL),
+        (b"\x22\x80\x00", AddressingType.FUNCTIONAL),  # no Sub-Function for Read Data By Identifier
+    ])
+    def test_process_request__positive_response(self, payload, addressing_type):
+        mock_request = Mock(spec=UdsMessageRecord, payload=payload, addressing_type=addressing_type)
+        self.mock_server.get_response.return_value = ServerResponse(payload=[0x40 + payload[0], payload[1]])
+        self.mock_server.encode_response.return_value = bytes([0x40 + payload[0], payload[1]])
+        assert Server.process_request(self.mock_server, mock_request) == (self.mock_server._send_response.return_value,)
+        self.mock_server.get_response.assert_called_once_with(mock_request)
+        self.mock_server.encode_response.assert_called_once_with(request_sid=payload[0],
+                                                                 response=self.mock_server.get_response.return_value)
+        self.mock_server._send_response.assert_called_once_with(self.mock_server.encode_response.return_value)
+        self.mock_sleep.assert_not_called()
+
+    @pytest.mark.parametrize("payload", [b"\x3E\x80", b"\x10\x83"])
+    def test_process_request__suppressed_positive_response(self, payload):
+        mock_request = Mock(spec=UdsMessageRecord, payload=payload, addressing_type=AddressingType.PHYSICAL)
+        self.mock_server.get_response.return_value = ServerResponse(payload=[0x40 + payload[0], payload[1]])
+        self.mock_server.encode_response.return_value = bytes([0x40 + payload[0], payload[1]])
+        assert Server.process_request(self.mock_server, mock_request) == ()
+        self.mock_server._send_response.assert_not_called()
+
+    @pytest.mark.parametrize("nrc", [NRC.ServiceNotSupported, NRC.RequestOutOfRange])
+    def test_process_request__suppressed_negative_response(self, nrc):
+        mock_request = Mock(spec=UdsMessageRecord, payload=b"\x22\xF1\x90", addressing_type=AddressingType.FUNCTIONAL)
+        self.mock_server.get_response.return_value = ServerResponse(nrc=nrc)
+        self.mock_server.encode_response.return_value = bytes([0x7F, 0x22, nrc])
+        assert Server.process_request(self.mock_server, mock_request) == ()
+        self.mock_server._send_response.assert_not_called()
+
+    @pytest.mark.parametrize("payload, addressing_type, nrc", [
+        (b"\x22\xF1\x90", AddressingType.PHYSICAL, NRC.ServiceNotSupported),
+        (b"\x22\xF1\x90", AddressingType.FUNCTIONAL, NRC.ConditionsNotCorrect),
+        (b"\x3E\x80", AddressingType.FUNCTIONAL, NRC.IncorrectMessageLengthOrInvalidFormat),
+    ])
+    def test_process_request__negative_response(self, payload, addressing_type, nrc):
+        mock_request = Mock(spec=UdsMessageRecord, payload=payload, addressing_type=addressing_type)
+        self.mock_server.get_response.return_value = ServerResponse(nrc=nrc)
+        self.mock_server.encode_response.return_value = bytes([0x7F, payload[0], nrc])
+        assert Server.process_request(self.mock_server, mock_request) == (self.mock_server._send_response.return_value,)
+        self.mock_server._send_response.assert_called_once_with(self.mock_server.encode_response.return_value)
+
+    @pytest.mark.parametrize("delay, response_pending_number, response_pending_period", [
+        (0, 1, 0),
+        (10, 3, 20.5),
+    ])
+    def test_process_request__response_pending(self, delay, response_pending_number, response_pending_period):
+        mock_request = Mock(spec=UdsMessageRecord, payload=b"\x31\x81\x12\x34",
+                            addressing_type=AddressingType.FUNCTIONAL)
+        self.mock_server.get_response.return_value = ServerResponse(payload=b"\x71\x01\x12\x34",
+                                                                    delay=delay,
+                                                                    response_pending_number=response_pending_number,
+                                                                    response_pending_period=response_pending_period)
+        self.mock_server.encode_response.return_value = b"\x71\x01\x12\x34"
+        responses_records = Server.process_request(self.mock_server, mock_request)
+        assert len(responses_records) == response_pending_number + 1
+        self.mock_server._send_response.assert_has_calls(
+            [call([ResponseSID.NegativeResponse, 0x31, NRC.RequestCorrectlyReceived_ResponsePending])]
+            * response_pending_number + [call(b"\x71\x01\x12\x34")])
+        expected_sleeps = [call(response_pending_period / 1000.)] * response_pending_number
+        if delay > 0:
+            expected_sleeps.insert(0, call(delay / 1000.))
+        assert self.mock_sleep.call_args_list == expected_sleeps
+
+    # start
+
+    @pytest.mark.parametrize("cycle", [Mock(), 5])
+    def test_start__not_running(self, cycle):
+        self.mock_server.is_running = False
+        assert Server.start(self.mock_server, cycle=cycle) is None
+        assert self.mock_server._Server__serving_thread == self.mock_thread.return_value
+        self.mock_thread.return_value.start.assert_called_once_with()
+        self.mock_server._Server__serving_task_event.set.assert_called_once_with()
+        self.mock_warn.assert_not_called()
+
+    def test_start__running(self):
+        self.mock_server.is_running = True
+        assert Server.start(self.mock_server) is None
+        self.mock_thread.return_value.start.assert_not_called()
+        self.mock_warn.assert_called_once()
+
+    # stop
+
+    def test_stop__running(self):
+        self.mock_server.is_running = True
+        mock_thread = Mock(spec=Thread)
+        self.mock_server._Server__serving_thread = mock_thread
+        assert Server.stop(self.mock_server) is None
+        assert self.mock_server._Server__serving_thread is None
+        self.mock_server._Server__serving_task_event.clear.assert_called_once_with()
+        mock_thread.join.assert_called_once_with()
+        self.mock_warn.assert_not_called()
+
+    def test_stop__not_running(self):
+        self.mock_server.is_running = False
+        assert Server.stop(self.mock_server) is None
+        self.mock_warn.assert_called_once()
+
+
+@pytest.mark.integration
+class TestServerIntegration:
+    """Integration tests for `Server` class."""
+
+    def setup_method(self):
+        self.buses = []
+        self.transport_interfaces = []
+        self.servers = []
+
+    def teardown_method(self):
+        for server in self.servers:
+            if server.is_running:
+                server.stop()
+        for transport_interface in self.transport_interfaces:
+            transport_interface.__del__()
+        for bus in self.buses:
+            bus.shutdown()
+
+    def _make_transport_interface(self, channel, addressing_information, **configuration_params):
+        bus = Bus(channel, interface="virtual")
+        self.buses.append(bus)
+        transport_interface = PythonCanTransportInterface(network_manager=bus,
+                                                          addressing_information=addressing_information,
+                                                          **configuration_params)
+        self.transport_interfaces.append(transport_interface)
+        return transport_interface
+
+    @staticmethod
+    def _make_addressing_information(index):
+        return CanAddressingInformation(addressing_format=CanAddressingFormat.NORMAL_ADDRESSING,
+                                        rx_physical_params={"can_id": 0x700 + index},
+                                        tx_physical_params={"can_id": 0x780 + index},
+                                        rx_functional_params={"can_id": 0x7DF},
+                                        tx_functional_params={"can_id": 0x780 + index})
+
+    def _make_server(self, channel, index, **kwargs):
+        server = Server(transport_interface=self._make_transport_interface(
+                            channel=channel,
+                            addressing_information=self._make_addressing_information(index),
+                            flow_control_parameters_generator=DefaultFlowControlParametersGenerator(block_size=2,
+                                                                                                    st_min=1)),
+                        **kwargs)
+        self.servers.append(server)
+        server.start(cycle=5)
+        return server
+
+    def _make_client(self, channel, index):
+        return Client(transport_interface=self._make_transport_interface(
+            channel=channel,
+            addressing_information=self._make_addressing_information(index).get_other_end()))
+
+    @pytest.mark.filterwarnings("ignore::RuntimeWarning")  # Flow Control frames are not observed on a virtual bus
+    def test_responses(self):
+        server = self._make_server(channel="server_responses", index=0,
+                                   responses={
+                                       b"\x3E\x00": ServerResponse(payload=b"\x7E\x00"),
+                                       b"\x10\x03": ServerResponse(data_records_values={
+                                           "SubFunction": {"suppressPosRspMsgIndicationBit": 0,
+                                                           "diagnosticSessionType": 3},
+                                           "sessionParameterRecord": {"P2Server_max": 50, "P2*Server_max": 500}}),
+                                       b"\x11\x01": ServerResponse(payload=b"\x51\x01",
+                                                                   response_pending_number=2,
+                                                                   response_pending_period=20),
+                                   },
+                                   handlers={0x2E: lambda request: ServerResponse(payload=request.payload[:3]
+                                                                                  .replace(b"\x2E", b"\x6E", 1))},
+                                   translator=BASE_TRANSLATOR)
+        client = self._make_client(channel="server_responses", index=0)
+        # table
+        _, responses = client.send_request_receive_responses(UdsMessage(payload=[0x3E, 0x00],
+                                                                        addressing_type=AddressingType.PHYSICAL))
+        assert [bytes(response.payload) for response in responses] == [b"\x7E\x00"]
+        # translator
+        _, responses = client.send_request_receive_responses(UdsMessage(payload=[0x10, 0x03],
+                                                                        addressing_type=AddressingType.PHYSICAL))
+        assert [bytes(response.payload) for response in responses] == [b"\x50\x03\x00\x32\x01\xF4"]
+        # Response Pending
+        _, responses = client.send_request_receive_responses(UdsMessage(payload=[0x11, 0x01],
+                                                                        addressing_type=AddressingType.PHYSICAL))
+        assert [bytes(response.payload) for response in responses] == [b"\x7F\x11\x78", b"\x7F\x11\x78", b"\x51\x01"]
+        # handler (segmented request - Flow Control sent by the server)
+        _, responses = client.send_request_receive_responses(UdsMessage(payload=[0x2E, 0xF1, 0x90] + list(range(40)),
+                                                                        addressing_type=AddressingType.PHYSICAL))
+        assert [bytes(response.payload) for response in responses] == [b"\x6E\xF1\x90"]
+        # default response
+        _, responses = client.send_request_receive_responses(UdsMessage(payload=[0x22, 0xF1, 0x90],
+                                                                        addressing_type=AddressingType.PHYSICAL))
+        assert [bytes(response.payload) for response in responses] == [b"\x7F\x22\x11"]
+        server.stop()  # the server might still be finishing the transmission of the last response
+        assert server.received_requests_number == 5
+        assert server.sent_responses_number == 7
+
+    @pytest.mark.filterwarnings("ignore::RuntimeWarning")
+    def test_handler_error(self):
+        def _handler(request):
+            if request.payload[1] == 0xFF:
+                raise ValueError("Unsupported Data Identifier.")
+            return ServerResponse(payload=b"\x62" + request.payload[1:] + b"\x00")
+
+        server = self._make_server(channel="server_handler_error", index=0, handlers={0x22: _handler})
+        client = self._make_client(channel="server_handler_error", index=0)
+        with pytest.warns(RuntimeWarning, match="Request message could not be answered"):
+            with pytest.raises(TimeoutError):
+                client.send_request_receive_responses(UdsMessage(payload=[0x22, 0xFF, 0xFF],
+                                                                 addressing_type=AddressingType.PHYSICAL))
+        assert server.is_running
+        _, responses = client.send_request_receive_responses(UdsMessage(payload=[0x22, 0xF1, 0x90],
+                                                                        addressing_type=AddressingType.PHYSICAL))
+        assert [bytes(response.payload) for response in responses] == [b"\x62\xF1\x90\x00"]
+
+    @pytest.mark.filterwarnings("ignore::RuntimeWarning")
+    def test_many_servers(self):
+        servers_number = 4
+        requests_number = 5
+        channel = "server_many"
+        servers = [self._make_server(channel=channel, index=index,
+                                     responses={b"\x3E\x00": ServerResponse(payload=b"\x7E\x00")},
+                                     handlers={0x22: lambda request, i=index: ServerResponse(
+                                         payload=b"\x62" + request.payload[1:] + bytes([i] * 20))})
+                   for index in range(servers_number)]
+        clients = [self._make_client(channel=channel, index=index) for index in range(servers_number)]
+        results = {}
+
+        def _communicate(index):
+            results[index] = [client_responses[-1].payload
+                              for client_responses in (clients[index].send_request_receive_responses(
+                                  UdsMessage(payload=[0x22, 0xF1, 0x90], addressing_type=AddressingType.PHYSICAL))[1]
+                                  for _ in range(requests_number))]
+
+        threads = [Thread(target=_communicate, args=(index,)) for index in range(servers_number)]
+        timestamp_start = perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=30)
+        assert perf_counter() - timestamp_start < 30
+        for index in range(servers_number):
+            assert results[index] == [b"\x62\xF1\x90" + bytes([index] * 20)] * requests_number
+            assert servers[index].received_requests_number == requests_number
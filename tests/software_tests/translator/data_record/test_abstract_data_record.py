@@ -18,6 +18,17 @@ class TestAbstractDataRecord:
     def setup_method(self):
         self.mock_data_record = Mock(spec=AbstractDataRecord)
 
+    def _set_children(self, children):
+        self.mock_data_record.children = children
+        offset = sum(child.length for child in children)
+        children_layout = []
+        for child in children:
+            offset -= child.length
+            children_layout.append((child.name, offset, (1 << child.length) - 1, child))
+        self.mock_data_record._AbstractDataRecord__children_layout = tuple(children_layout)
+        self.mock_data_record._AbstractDataRecord__children_indexes = {child.name: i
+                                                                       for i, child in enumerate(children)}
+
     # __init__
 
     @pytest.mark.parametrize("name, length, children, min_occurrences, max_occurrences", [
@@ -223,7 +234,13 @@ class TestAbstractDataRecord:
     def test_children__set__valid(self, length, children):
         self.mock_data_record.length = length
         assert AbstractDataRecord.children.fset(self.mock_data_record, children) is None
-        self.mock_data_record._AbstractDataRecord__children = tuple(children)
+        assert self.mock_data_record._AbstractDataRecord__children == tuple(children)
+        children_length = sum(child.length for child in children)
+        assert self.mock_data_record._AbstractDataRecord__children_layout == tuple(
+            (child.name, children_length - sum(c.length for c in children[:i + 1]), (1 << child.length) - 1, child)
+            for i, child in enumerate(children))
+        assert self.mock_data_record._AbstractDataRecord__children_indexes == {child.name: i
+                                                                              for i, child in enumerate(children)}
 
     # min_occurrences
     
@@ -400,7 +417,7 @@ class TestAbstractDataRecord:
         ([Mock(length=1) for _ in range(8)], 0xAA, [1, 0]*4),
     ])
     def test_get_children_values(self, children, raw_value, expected_children_values):
-        self.mock_data_record.children = children
+        self._set_children(children)
         self.mock_data_record.length = sum(child.length for child in children)
         output = AbstractDataRecord.get_children_values(self.mock_data_record, raw_value)
         assert isinstance(output, OrderedDict)
@@ -410,22 +427,20 @@ class TestAbstractDataRecord:
 
     # get_children_occurrence_info
 
-    @pytest.mark.parametrize("raw_value", [0, 0x55])
-    @pytest.mark.parametrize("children", [
-        (Mock(), Mock(), Mock()),
-        (Mock(), Mock()),
+    @pytest.mark.parametrize("raw_value, children, children_values", [
+        (0, (Mock(length=2), Mock(length=3), Mock(length=3)), (0, 0, 0)),
+        (0x55, (Mock(length=2), Mock(length=3), Mock(length=3)), (0b01, 0b010, 0b101)),
+        (0xA5F, (Mock(length=4), Mock(length=8)), (0xA, 0x5F)),
     ])
-    def test_get_children_occurrence_info(self, raw_value, children):
-        self.mock_data_record.children = children
-        children_values = {child.name: Mock() for child in children}
-        self.mock_data_record.get_children_values = Mock(return_value=children_values)
+    def test_get_children_occurrence_info(self, raw_value, children, children_values):
+        self._set_children(children)
         output = AbstractDataRecord.get_children_occurrence_info(self.mock_data_record, raw_value=raw_value)
-        self.mock_data_record.get_children_values.assert_called_once_with(raw_value)
+        self.mock_data_record._validate_raw_value.assert_called_once_with(raw_value)
         assert isinstance(output, tuple)
         assert len(output) == len(children)
         for i, child in enumerate(children):
             assert output[i] == child.get_occurrence_info.return_value
-            child.get_occurrence_info.assert_called_with(children_values[child.name])
+            child.get_occurrence_info.assert_called_once_with(children_values[i])
 
     # get_occurrence_info
 
@@ -517,9 +532,10 @@ class TestAbstractDataRecord:
     @patch(f"{SCRIPT_LOCATION}.isinstance")
     def test_get_raw_value_from_children__value_error__children_names(self, mock_isinstance,
                                                                       children_names, children_values):
-        self.mock_data_record.children = [Mock() for _ in children_names]
-        for i, name in enumerate(children_names):
-            self.mock_data_record.children[i].name = name
+        children = [Mock(length=8) for _ in children_names]
+        for child, name in zip(children, children_names):
+            child.name = name
+        self._set_children(children)
         mock_isinstance.return_value = True
         with pytest.raises(ValueError):
             AbstractDataRecord.get_raw_value_from_children(self.mock_data_record, children_values)
@@ -543,7 +559,7 @@ class TestAbstractDataRecord:
     def test_get_raw_value_from_children__value_error__children_value_type(self, children, children_values):
         for child in children:
             child.name = child._extract_mock_name()
-        self.mock_data_record.children = children
+        self._set_children(children)
         self.mock_data_record.length = sum([child.length for child in children])
         with pytest.raises(ValueError):
             AbstractDataRecord.get_raw_value_from_children(self.mock_data_record, children_values)
@@ -568,7 +584,7 @@ class TestAbstractDataRecord:
     def test_get_raw_value_from_children__valid__raw_values(self, children, children_values, raw_value):
         for child in children:
             child.name = child._extract_mock_name()
-        self.mock_data_record.children = children
+        self._set_children(children)
         self.mock_data_record.length = sum([child.length for child in children])
         assert AbstractDataRecord.get_raw_value_from_children(self.mock_data_record,
                                                               children_values) == raw_value
@@ -602,7 +618,7 @@ class TestAbstractDataRecord:
         for child in children:
             child.name = child._extract_mock_name()
             child.get_raw_value_from_children.return_value = children_raw_values_mapping[child.name]
-        self.mock_data_record.children = children
+        self._set_children(children)
         self.mock_data_record.length = sum([child.length for child in children])
         assert AbstractDataRecord.get_raw_value_from_children(self.mock_data_record,
                                                               children_values) == raw_value
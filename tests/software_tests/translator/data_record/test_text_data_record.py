@@ -1,8 +1,10 @@
 import pytest
-from mock import MagicMock, Mock, patch
+from mock import MagicMock, Mock, call, patch
 
 from uds.translator.data_record.text_data_record import (
     MAX_DTC_VALUE,
+    MultipleOccurrencesInfo,
+    SingleOccurrenceInfo,
     TextDataRecord,
     TextEncoding,
     decode_ascii,
@@ -209,6 +211,111 @@ class TestTextDataRecord:
         with pytest.raises(NotImplementedError):
             TextDataRecord.max_raw_value.fget(self.mock_data_record)
 
+    # is_bulk_convertible
+
+    @pytest.mark.parametrize("encoding", [TextEncoding.ASCII, TextEncoding.BCD])
+    def test_is_bulk_convertible__true(self, encoding):
+        self.mock_data_record.encoding = encoding
+        assert TextDataRecord.is_bulk_convertible.fget(self.mock_data_record) is True
+
+    @pytest.mark.parametrize("encoding", [TextEncoding.DTC_OBD_FORMAT, Mock()])
+    def test_is_bulk_convertible__false(self, encoding):
+        self.mock_data_record.encoding = encoding
+        assert TextDataRecord.is_bulk_convertible.fget(self.mock_data_record) is False
+
+    # get_occurrence_info_from_bytes
+
+    @pytest.mark.parametrize("payload, offset, occurrences_number", [
+        (Mock(), Mock(), Mock()),
+        (b"\x00\x01", 0, 2),
+    ])
+    def test_get_occurrence_info_from_bytes__runtime_error__encoding(self, payload, offset, occurrences_number):
+        self.mock_data_record.is_bulk_convertible = False
+        with pytest.raises(RuntimeError):
+            TextDataRecord.get_occurrence_info_from_bytes(self.mock_data_record,
+                                                          payload=payload,
+                                                          offset=offset,
+                                                          occurrences_number=occurrences_number)
+
+    @pytest.mark.parametrize("length, offset", [
+        (8, 4),
+        (4, 2),
+    ])
+    def test_get_occurrence_info_from_bytes__runtime_error__offset(self, length, offset):
+        self.mock_data_record.is_bulk_convertible = True
+        self.mock_data_record.length = length
+        with pytest.raises(RuntimeError):
+            TextDataRecord.get_occurrence_info_from_bytes(self.mock_data_record,
+                                                          payload=b"\x30\x31",
+                                                          offset=offset,
+                                                          occurrences_number=1)
+
+    @pytest.mark.parametrize("min_occurrences, max_occurrences, occurrences_number", [
+        (0, None, 0),
+        (2, 5, 1),
+        (1, 3, 4),
+    ])
+    def test_get_occurrence_info_from_bytes__value_error(self, min_occurrences, max_occurrences, occurrences_number):
+        self.mock_data_record.is_bulk_convertible = True
+        self.mock_data_record.length = 8
+        self.mock_data_record.min_occurrences = min_occurrences
+        self.mock_data_record.max_occurrences = max_occurrences
+        with pytest.raises(ValueError):
+            TextDataRecord.get_occurrence_info_from_bytes(self.mock_data_record,
+                                                          payload=b"\x30\x31\x32\x33\x34",
+                                                          offset=0,
+                                                          occurrences_number=occurrences_number)
+
+    @pytest.mark.parametrize("payload, offset, occurrences_number", [
+        (b"\x30\x31\x32\x33\x34", 8, 3),
+        ([0x41, 0x42], 0, 2),
+    ])
+    def test_get_occurrence_info_from_bytes__multiple(self, payload, offset, occurrences_number):
+        self.mock_data_record.is_bulk_convertible = True
+        self.mock_data_record.length = 8
+        self.mock_data_record.min_occurrences = 1
+        self.mock_data_record.max_occurrences = None
+        self.mock_data_record.is_reoccurring = True
+        mock_raw_values = Mock()
+        mock_text = Mock()
+        self.mock_data_record._decode_bytes.return_value = (mock_raw_values, mock_text)
+        assert TextDataRecord.get_occurrence_info_from_bytes(self.mock_data_record,
+                                                             payload=payload,
+                                                             offset=offset,
+                                                             occurrences_number=occurrences_number) \
+            == MultipleOccurrencesInfo(name=self.mock_data_record.name,
+                                       length=self.mock_data_record.length,
+                                       raw_value=mock_raw_values,
+                                       physical_value=mock_text,
+                                       children=((),) * occurrences_number,
+                                       unit=self.mock_data_record.unit)
+        self.mock_data_record._decode_bytes.assert_called_once_with(payload=payload,
+                                                                    offset=offset,
+                                                                    occurrences_number=occurrences_number)
+
+    def test_get_occurrence_info_from_bytes__single(self):
+        self.mock_data_record.is_bulk_convertible = True
+        self.mock_data_record.length = 4
+        self.mock_data_record.min_occurrences = 1
+        self.mock_data_record.max_occurrences = 1
+        self.mock_data_record.is_reoccurring = False
+        mock_raw_value = Mock()
+        mock_text = Mock()
+        self.mock_data_record._decode_bytes.return_value = ((mock_raw_value,), mock_text)
+        assert TextDataRecord.get_occurrence_info_from_bytes(self.mock_data_record,
+                                                             payload=b"\x12",
+                                                             offset=4,
+                                                             occurrences_number=1) \
+            == SingleOccurrenceInfo(name=self.mock_data_record.name,
+                                    length=self.mock_data_record.length,
+                                    raw_value=mock_raw_value,
+                                    physical_value=mock_text,
+                                    children=(),
+                                    unit=self.mock_data_record.unit)
+        self.mock_data_record._decode_bytes.assert_called_once_with(payload=b"\x12",
+                                                                    offset=4,
+                                                                    occurrences_number=1)
+
     # get_physical_values
 
     @pytest.mark.parametrize("raw_values, characters", [
@@ -254,6 +361,54 @@ class TestTextDataRecord:
         mock_encodings.__getitem__.assert_called_once_with(self.mock_data_record.encoding)
         mock_encoding.__getitem__.assert_called_once_with("decode")
 
+    # get_raw_values
+
+    @pytest.mark.parametrize("physical_values", [Mock(), 123])
+    def test_get_raw_values__type_error(self, physical_values):
+        with pytest.raises(TypeError):
+            TextDataRecord.get_raw_values(self.mock_data_record, physical_values=physical_values)
+
+    @pytest.mark.parametrize("encoding, physical_values", [
+        (TextEncoding.ASCII, "Zażółć"),
+        (TextEncoding.BCD, "12A4"),
+        (TextEncoding.BCD, "0١"),
+    ])
+    def test_get_raw_values__value_error(self, encoding, physical_values):
+        self.mock_data_record.encoding = encoding
+        with pytest.raises(ValueError):
+            TextDataRecord.get_raw_values(self.mock_data_record, physical_values=physical_values)
+
+    @pytest.mark.parametrize("physical_values, raw_values", [
+        ("VIN", (0x56, 0x49, 0x4E)),
+        ("\x00\x7F", (0x00, 0x7F)),
+    ])
+    def test_get_raw_values__ascii(self, physical_values, raw_values):
+        self.mock_data_record.encoding = TextEncoding.ASCII
+        assert TextDataRecord.get_raw_values(self.mock_data_record, physical_values=physical_values) == raw_values
+        self.mock_data_record.get_raw_value.assert_not_called()
+
+    @pytest.mark.parametrize("physical_values, raw_values", [
+        ("0123456789", tuple(range(10))),
+        ("90", (9, 0)),
+    ])
+    def test_get_raw_values__bcd(self, physical_values, raw_values):
+        self.mock_data_record.encoding = TextEncoding.BCD
+        assert TextDataRecord.get_raw_values(self.mock_data_record, physical_values=physical_values) == raw_values
+        self.mock_data_record.get_raw_value.assert_not_called()
+
+    @pytest.mark.parametrize("physical_values", ["P0123-45", "U1FED-CB"])
+    def test_get_raw_values__other_encoding__str(self, physical_values):
+        self.mock_data_record.encoding = TextEncoding.DTC_OBD_FORMAT
+        assert (TextDataRecord.get_raw_values(self.mock_data_record, physical_values=physical_values)
+                == (self.mock_data_record.get_raw_value.return_value,))
+        self.mock_data_record.get_raw_value.assert_called_once_with(physical_values)
+
+    @pytest.mark.parametrize("physical_values", [["P0123-45", "U1FED-CB"], ("a", "b", "c")])
+    def test_get_raw_values__sequence(self, physical_values):
+        assert (TextDataRecord.get_raw_values(self.mock_data_record, physical_values=physical_values)
+                == tuple(self.mock_data_record.get_raw_value.return_value for _ in physical_values))
+        self.mock_data_record.get_raw_value.assert_has_calls([call(value) for value in physical_values])
+
 
 @pytest.mark.integration
 class TestTextDataRecordIntegration:
@@ -335,3 +490,68 @@ class TestTextDataRecordIntegration:
     def test_get_physical_value_get_raw_value__dtc(self, uds_dtc):
         obd_dtc = self.dtc.get_physical_value(uds_dtc)
         assert self.dtc.get_raw_value(obd_dtc) == uds_dtc
+
+    # get_occurrence_info_from_bytes
+
+    @pytest.mark.parametrize("payload, offset, occurrences_number", [
+        (b"\x01\x23\x45\x67\x89", 0, 10),
+        (b"\x01\x23\x45\x67\x89", 4, 9),
+        (b"\x01\x23\x45\x67\x89", 4, 6),
+        (b"\xFF\x90\x52", 8, 3),
+    ])
+    def test_get_occurrence_info_from_bytes__bcd(self, payload, offset, occurrences_number):
+        payload_int = int.from_bytes(payload, "big")
+        remaining_length = 8 * len(payload) - offset
+        raw_values = []
+        for _ in range(occurrences_number):
+            remaining_length -= 4
+            raw_values.append((payload_int >> remaining_length) & 0xF)
+        assert (self.bcd.get_occurrence_info_from_bytes(payload=payload,
+                                                        offset=offset,
+                                                        occurrences_number=occurrences_number)
+                == self.bcd.get_occurrence_info(*raw_values))
+
+    @pytest.mark.parametrize("payload, offset, occurrences_number", [
+        (b"WVWZZZ1JZXW000001", 0, 17),
+        (bytearray(b"\x00/var/log/ecu.bin"), 8, 16),
+    ])
+    def test_get_occurrence_info_from_bytes__ascii(self, payload, offset, occurrences_number):
+        raw_values = payload[offset // 8:offset // 8 + occurrences_number]
+        assert (self.ascii.get_occurrence_info_from_bytes(payload=payload,
+                                                          offset=offset,
+                                                          occurrences_number=occurrences_number)
+                == self.ascii.get_occurrence_info(*raw_values))
+
+    @pytest.mark.parametrize("payload, offset, occurrences_number", [
+        (b"\x12\xA4", 4, 3),
+        (b"\x12\x3F", 0, 4),
+    ])
+    def test_get_occurrence_info_from_bytes__bcd__value_error(self, payload, offset, occurrences_number):
+        with pytest.raises(ValueError):
+            self.bcd.get_occurrence_info_from_bytes(payload=payload,
+                                                    offset=offset,
+                                                    occurrences_number=occurrences_number)
+
+    @pytest.mark.parametrize("payload, offset, occurrences_number", [
+        (b"VIN\x80", 0, 4),
+        (b"\xFFVIN", 0, 2),
+    ])
+    def test_get_occurrence_info_from_bytes__ascii__value_error(self, payload, offset, occurrences_number):
+        with pytest.raises(ValueError):
+            self.ascii.get_occurrence_info_from_bytes(payload=payload,
+                                                      offset=offset,
+                                                      occurrences_number=occurrences_number)
+
+    # get_raw_values
+
+    @pytest.mark.parametrize("text", ["WVWZZZ1JZXW000001", "/var/log/ecu.bin"])
+    def test_get_raw_values__ascii(self, text):
+        assert self.ascii.get_raw_values(text) == tuple(self.ascii.get_raw_value(character) for character in text)
+
+    @pytest.mark.parametrize("text", ["0123456789", "909052"])
+    def test_get_raw_values__bcd(self, text):
+        assert self.bcd.get_raw_values(text) == tuple(self.bcd.get_raw_value(character) for character in text)
+
+    @pytest.mark.parametrize("dtcs", [["P0123-45", "U1FED-CB"], ("C2345-67",)])
+    def test_get_raw_values__dtc(self, dtcs):
+        assert self.dtc.get_raw_values(dtcs) == tuple(self.dtc.get_raw_value(dtc) for dtc in dtcs)
@@ -0,0 +1,236 @@
+import pytest
+from mock import MagicMock, Mock
+
+from uds.translator.data_record_definitions import (
+    DTC,
+    DTC_AND_STATUS,
+    DTC_STATUS,
+    MULTIPLE_DTC_AND_STATUS,
+    MULTIPLE_DTC_SEVERITY_DTC_AND_STATUS,
+    OPTIONAL_DTC_AND_STATUS,
+)
+from uds.translator.dtc_and_status_records import (
+    DTCAndStatusRecords,
+    MappingProxyType,
+    RawDataRecord,
+    TextDataRecord,
+    TextEncoding,
+)
+
+SCRIPT_LOCATION = "uds.translator.dtc_and_status_records"
+
+
+class TestDTCAndStatusRecords:
+    """Unit tests for `DTCAndStatusRecords` class."""
+
+    def setup_method(self):
+        self.mock_records = Mock(spec=DTCAndStatusRecords)
+
+    # __init__
+
+    @pytest.mark.parametrize("data_record, payload", [
+        (Mock(), b""),
+        (MULTIPLE_DTC_SEVERITY_DTC_AND_STATUS, b"\x00\x01\x02\x03\x04"),
+    ])
+    def test_init__value_error__data_record(self, data_record, payload):
+        self.mock_records.is_dtc_and_status_record.return_value = False
+        with pytest.raises(ValueError):
+            DTCAndStatusRecords.__init__(self.mock_records, data_record=data_record, payload=payload)
+        self.mock_records.is_dtc_and_status_record.assert_called_once_with(data_record)
+
+    @pytest.mark.parametrize("payload", [b"\x00", bytearray(range(7)), list(range(9))])
+    def test_init__value_error__length(self, payload):
+        self.mock_records.RECORD_LENGTH = 4
+        self.mock_records.is_dtc_and_status_record.return_value = True
+        with pytest.raises(ValueError):
+            DTCAndStatusRecords.__init__(self.mock_records,
+                                         data_record=Mock(min_occurrences=0, max_occurrences=None),
+                                         payload=payload)
+
+    @pytest.mark.parametrize("min_occurrences, max_occurrences, payload", [
+        (1, 1, b""),
+        (0, 1, b"\x00" * 8),
+        (2, None, b"\x12\x34\x56\x78"),
+    ])
+    def test_init__value_error__occurrences(self, min_occurrences, max_occurrences, payload):
+        self.mock_records.RECORD_LENGTH = 4
+        self.mock_records.is_dtc_and_status_record.return_value = True
+        with pytest.raises(ValueError):
+            DTCAndStatusRecords.__init__(self.mock_records,
+                                         data_record=Mock(min_occurrences=min_occurrences,
+                                                          max_occurrences=max_occurrences),
+                                         payload=payload)
+
+    @pytest.mark.parametrize("payload, dtcs, statuses", [
+        (b"", (), b""),
+        (b"\x12\x34\x56\x78", (0x123456,), b"\x78"),
+        (bytearray(b"\xFF\xFF\xFF\x00\x00\x00\x00\xFF\xAB\xCD\xEF\x2F"),
+         (0xFFFFFF, 0x000000, 0xABCDEF), b"\x00\xFF\x2F"),
+    ])
+    def test_init__valid(self, payload, dtcs, statuses):
+        self.mock_records.RECORD_LENGTH = 4
+        self.mock_records.is_dtc_and_status_record.return_value = True
+        self.mock_records._status_info_cache = MagicMock()
+        mock_data_record = MagicMock(min_occurrences=0, max_occurrences=None)
+        DTCAndStatusRecords.__init__(self.mock_records, data_record=mock_data_record, payload=payload)
+        assert self.mock_records._DTCAndStatusRecords__data_record == mock_data_record
+        assert self.mock_records._DTCAndStatusRecords__dtcs == dtcs
+        assert self.mock_records._DTCAndStatusRecords__statuses == statuses
+        assert self.mock_records._DTCAndStatusRecords__status_bits == {}
+        assert (self.mock_records._DTCAndStatusRecords__status_info
+                == self.mock_records._status_info_cache.setdefault.return_value)
+        self.mock_records._status_info_cache.setdefault.assert_called_once_with(mock_data_record.children[1], {})
+
+    # __len__
+
+    @pytest.mark.parametrize("dtcs", [(), (0x123456, 0xFFFFFF)])
+    def test_len(self, dtcs):
+        self.mock_records._DTCAndStatusRecords__dtcs = dtcs
+        assert DTCAndStatusRecords.__len__(self.mock_records) == len(dtcs)
+
+    # __getitem__
+
+    @pytest.mark.parametrize("dtcs, statuses, index, expected_value", [
+        ((0x123456, 0xFFFFFF), b"\x01\x02", 0, (0x123456, 0x01)),
+        ((0x123456, 0xFFFFFF), b"\x01\x02", -1, (0xFFFFFF, 0x02)),
+        ((0x123456, 0xFFFFFF, 0), b"\x01\x02\x03", slice(1, None), ((0xFFFFFF, 0x02), (0, 0x03))),
+    ])
+    def test_getitem(self, dtcs, statuses, index, expected_value):
+        self.mock_records._DTCAndStatusRecords__dtcs = dtcs
+        self.mock_records._DTCAndStatusRecords__statuses = statuses
+        assert DTCAndStatusRecords.__getitem__(self.mock_records, index) == expected_value
+
+    # data_record, dtcs, statuses
+
+    def test_data_record(self):
+        self.mock_records._DTCAndStatusRecords__data_record = Mock()
+        assert (DTCAndStatusRecords.data_record.fget(self.mock_records)
+                == self.mock_records._DTCAndStatusRecords__data_record)
+
+    def test_dtcs(self):
+        self.mock_records._DTCAndStatusRecords__dtcs = Mock()
+        assert DTCAndStatusRecords.dtcs.fget(self.mock_records) == self.mock_records._DTCAndStatusRecords__dtcs
+
+    def test_statuses(self):
+        self.mock_records._DTCAndStatusRecords__statuses = Mock()
+        assert (DTCAndStatusRecords.statuses.fget(self.mock_records)
+                == self.mock_records._DTCAndStatusRecords__statuses)
+
+    # raw_values
+
+    @pytest.mark.parametrize("dtcs, statuses, raw_values", [
+        ((), b"", ()),
+        ((0x123456, 0xFFFFFF), b"\x01\x02", (0x12345601, 0xFFFFFF02)),
+    ])
+    def test_raw_values(self, dtcs, statuses, raw_values):
+        self.mock_records._DTCAndStatusRecords__dtcs = dtcs
+        self.mock_records._DTCAndStatusRecords__statuses = statuses
+        assert DTCAndStatusRecords.raw_values.fget(self.mock_records) == raw_values
+
+    # is_dtc_and_status_record
+
+    @pytest.mark.parametrize("data_record", [
+        Mock(),
+        Mock(spec=RawDataRecord, length=24, children=(Mock(), Mock())),
+        Mock(spec=RawDataRecord, length=32, children=(Mock(),)),
+        Mock(spec=RawDataRecord, length=32, children=(Mock(), Mock(length=8))),
+        Mock(spec=RawDataRecord, length=32, children=(Mock(spec=TextDataRecord, encoding=TextEncoding.ASCII),
+                                                      Mock(length=8))),
+        Mock(spec=RawDataRecord, length=32, children=(Mock(spec=TextDataRecord,
+                                                           encoding=TextEncoding.DTC_OBD_FORMAT),
+                                                      Mock(length=16))),
+    ])
+    def test_is_dtc_and_status_record__false(self, data_record):
+        assert DTCAndStatusRecords.is_dtc_and_status_record(data_record) is False
+
+    @pytest.mark.parametrize("data_record", [
+        Mock(spec=RawDataRecord, length=32, children=(Mock(spec=TextDataRecord,
+                                                           encoding=TextEncoding.DTC_OBD_FORMAT),
+                                                      Mock(length=8))),
+    ])
+    def test_is_dtc_and_status_record__true(self, data_record):
+        assert DTCAndStatusRecords.is_dtc_and_status_record(data_record) is True
+
+    # get_status_bits
+
+    @pytest.mark.parametrize("statuses, index", [
+        (b"\x00\xFF", 0),
+        (b"\x00\xFF", 1),
+    ])
+    def test_get_status_bits__cached(self, statuses, index):
+        mock_status_bits = Mock()
+        self.mock_records._DTCAndStatusRecords__statuses = statuses
+        self.mock_records._DTCAndStatusRecords__status_bits = {statuses[index]: mock_status_bits}
+        self.mock_records._DTCAndStatusRecords__data_record = Mock(children=(Mock(), Mock()))
+        assert DTCAndStatusRecords.get_status_bits(self.mock_records, index) == mock_status_bits
+        self.mock_records._DTCAndStatusRecords__data_record.children[1].get_children_values.assert_not_called()
+
+    @pytest.mark.parametrize("statuses, index", [
+        (b"\x00\xFF", 0),
+        (b"\x2F", -1),
+    ])
+    def test_get_status_bits__not_cached(self, statuses, index):
+        mock_status_record = Mock()
+        mock_status_record.get_children_values.return_value = {"a": 1}
+        self.mock_records._DTCAndStatusRecords__statuses = statuses
+        self.mock_records._DTCAndStatusRecords__status_bits = {}
+        self.mock_records._DTCAndStatusRecords__data_record = Mock(children=(Mock(), mock_status_record))
+        status_bits = DTCAndStatusRecords.get_status_bits(self.mock_records, index)
+        assert status_bits == {"a": 1}
+        assert isinstance(status_bits, MappingProxyType)
+        assert self.mock_records._DTCAndStatusRecords__status_bits == {statuses[index]: status_bits}
+        mock_status_record.get_children_values.assert_called_once_with(statuses[index])
+
+    # get_dtcs_with_status
+
+    @pytest.mark.parametrize("dtcs, statuses, status_mask, expected_dtcs", [
+        ((0x123456, 0xFFFFFF, 0x000001), b"\x01\x08\x09", 0x01, (0x123456, 0x000001)),
+        ((0x123456, 0xFFFFFF, 0x000001), b"\x01\x08\x09", 0x0A, (0xFFFFFF, 0x000001)),
+        ((0x123456, 0xFFFFFF, 0x000001), b"\x01\x08\x09", 0xF0, ()),
+    ])
+    def test_get_dtcs_with_status(self, dtcs, statuses, status_mask, expected_dtcs):
+        self.mock_records._DTCAndStatusRecords__dtcs = dtcs
+        self.mock_records._DTCAndStatusRecords__statuses = statuses
+        assert DTCAndStatusRecords.get_dtcs_with_status(self.mock_records, status_mask) == expected_dtcs
+
+
+@pytest.mark.integration
+class TestDTCAndStatusRecordsIntegration:
+    """Integration tests for `DTCAndStatusRecords` class."""
+
+    @pytest.mark.parametrize("data_record", [MULTIPLE_DTC_AND_STATUS, DTC_AND_STATUS, OPTIONAL_DTC_AND_STATUS])
+    def test_is_dtc_and_status_record(self, data_record):
+        assert DTCAndStatusRecords.is_dtc_and_status_record(data_record) is True
+
+    @pytest.mark.parametrize("data_record", [MULTIPLE_DTC_SEVERITY_DTC_AND_STATUS, DTC, DTC_STATUS])
+    def test_is_dtc_and_status_record__false(self, data_record):
+        assert DTCAndStatusRecords.is_dtc_and_status_record(data_record) is False
+
+    @pytest.mark.parametrize("payload", [
+        b"",
+        b"\x12\x34\x56\x2F",
+        bytes(range(256)),
+        b"\xFF\xFF\xFF\xFF\x00\x00\x00\x00\xC1\x23\x45\x09",
+    ])
+    def test_get_occurrence_info__multiple(self, payload):
+        records = DTCAndStatusRecords(data_record=MULTIPLE_DTC_AND_STATUS, payload=payload)
+        raw_values = [int.from_bytes(payload[i:i + 4], "big") for i in range(0, len(payload), 4)]
+        assert records.raw_values == tuple(raw_values)
+        if raw_values:
+            assert records.get_occurrence_info() == MULTIPLE_DTC_AND_STATUS.get_occurrence_info(*raw_values)
+            assert records.get_occurrence_info(-1) == DTC_AND_STATUS.get_occurrence_info(raw_values[-1])
+            assert records.get_status_bits(-1) == DTC_STATUS.get_children_values(raw_values[-1] & 0xFF)
+
+    @pytest.mark.parametrize("payload", [b"\x12\x34\x56\x2F", b"\xC1\x23\x45\x09"])
+    def test_get_occurrence_info__single(self, payload):
+        records = DTCAndStatusRecords(data_record=OPTIONAL_DTC_AND_STATUS, payload=payload)
+        assert records.get_occurrence_info() == OPTIONAL_DTC_AND_STATUS.get_occurrence_info(
+            int.from_bytes(payload, "big"))
+
+    def test_get_occurrence_info__not_shared(self):
+        records = DTCAndStatusRecords(data_record=MULTIPLE_DTC_AND_STATUS, payload=b"\x12\x34\x56\x2F" * 2)
+        occurrence_info = records.get_occurrence_info()
+        raw_value = occurrence_info["children"][0][1]["children"][0]["raw_value"]
+        occurrence_info["children"][0][1]["children"][0]["raw_value"] = 0xFF
+        assert occurrence_info["children"][1][1]["children"][0]["raw_value"] == raw_value
+        assert records.get_occurrence_info()["children"][0][1]["children"][0]["raw_value"] == raw_value
@@ -1,8 +1,10 @@
 from copy import deepcopy
+from time import perf_counter
 
 import pytest
 from mock import MagicMock, Mock, call, patch
 
+from uds.translator.data_record import RawDataRecord, TextEncoding
 from uds.translator.service import (
     NRC,
     RESPONSE_REQUEST_SID_DIFF,
@@ -14,7 +16,9 @@ from uds.translator.service import (
     Sequence,
     Service,
     SingleOccurrenceInfo,
+    TextDataRecord,
 )
+from uds.translator.service_definitions import READ_DTC_INFORMATION
 
 SCRIPT_LOCATION = "uds.translator.service"
 
@@ -442,6 +446,109 @@ class TestService:
     def test_get_remaining_length(self, message_structure, remaining_length):
         assert Service._get_remaining_length(message_structure=message_structure) == remaining_length
 
+    # _get_fixed_stride_raw_values
+
+    @pytest.mark.parametrize("payload, offset, length, occurrences_number, raw_values", [
+        (b"\x00\x01\x02\x03", 0, 8, 4, (0, 1, 2, 3)),
+        ([0xFF, 0x12, 0x34, 0x56, 0x78], 8, 16, 2, (0x1234, 0x5678)),
+        (b"\xAB\xCD\xEF\x01\x23\x45\x67", 8, 24, 2, (0xCDEF01, 0x234567)),
+        (bytearray(range(9)), 8, 32, 2, (0x01020304, 0x05060708)),
+        (bytes(range(12)), 16, 40, 2, (0x0203040506, 0x0708090A0B)),
+        (bytes(range(17)), 8, 64, 2, (0x0102030405060708, 0x090A0B0C0D0E0F10)),
+        (b"\x00\x01\x02\x03", 8, 16, 1, (0x0102,)),
+    ])
+    def test_get_fixed_stride_raw_values(self, payload, offset, length, occurrences_number, raw_values):
+        assert Service._get_fixed_stride_raw_values(payload=payload,
+                                                    offset=offset,
+                                                    length=length,
+                                                    occurrences_number=occurrences_number) == raw_values
+
+    # _get_raw_values
+
+    @pytest.mark.parametrize("payload, remaining_length, length, occurrences_number, raw_values", [
+        (b"\x12\x34\x56", 24, 4, 3, [0x1, 0x2, 0x3]),
+        (b"\x12\x34\x56", 20, 8, 2, [0x23, 0x45]),
+        (b"\x12\x34\x56", 16, 16, 1, [0x3456]),
+        (b"\xFF\x00", 16, 1, 4, [1, 1, 1, 1]),
+    ])
+    def test_get_raw_values(self, payload, remaining_length, length, occurrences_number, raw_values):
+        assert Service._get_raw_values(payload=payload,
+                                       payload_int=int.from_bytes(payload, "big"),
+                                       remaining_length=remaining_length,
+                                       length=length,
+                                       occurrences_number=occurrences_number) == raw_values
+
+    @patch(f"{SCRIPT_LOCATION}.Service._get_fixed_stride_raw_values")
+    def test_get_raw_values__fixed_stride(self, mock_get_fixed_stride_raw_values):
+        mock_get_fixed_stride_raw_values.return_value = (0x12, 0x34)
+        assert Service._get_raw_values(payload=b"\xFF\x12\x34",
+                                       payload_int=0xFF1234,
+                                       remaining_length=16,
+                                       length=8,
+                                       occurrences_number=2) == [0x12, 0x34]
+        mock_get_fixed_stride_raw_values.assert_called_once_with(payload=b"\xFF\x12\x34",
+                                                                 offset=8,
+                                                                 length=8,
+                                                                 occurrences_number=2)
+
+    # _decode_data_record_from_bytes
+
+    @pytest.mark.parametrize("data_record, offset", [
+        (Mock(spec=TextDataRecord, is_bulk_convertible=True, length=8), 0),
+        (Mock(spec=RawDataRecord, length=32), 16),
+    ])
+    def test_decode_data_record_from_bytes__no_occurrences(self, data_record, offset):
+        assert Service._decode_data_record_from_bytes(data_record=data_record,
+                                                      payload=b"\x00" * 10,
+                                                      offset=offset,
+                                                      occurrences_number=0) is None
+
+    @pytest.mark.parametrize("data_record, offset", [
+        (Mock(spec=TextDataRecord, is_bulk_convertible=False, length=8), 0),
+        (Mock(spec=TextDataRecord, is_bulk_convertible=True, length=8), 4),
+        (Mock(spec=AbstractDataRecord, length=8), 8),
+    ])
+    @patch(f"{SCRIPT_LOCATION}.DTCAndStatusRecords")
+    def test_decode_data_record_from_bytes__not_supported(self, mock_dtc_and_status_records, data_record, offset):
+        mock_dtc_and_status_records.is_dtc_and_status_record.return_value = False
+        assert Service._decode_data_record_from_bytes(data_record=data_record,
+                                                      payload=b"\x00" * 10,
+                                                      offset=offset,
+                                                      occurrences_number=2) is None
+
+    @pytest.mark.parametrize("payload, offset, occurrences_number", [
+        (b"\x00" * 10, 0, 10),
+        (b"\x12\x34\x56\x78", 8, 2),
+    ])
+    def test_decode_data_record_from_bytes__text(self, payload, offset, occurrences_number):
+        mock_data_record = Mock(spec=TextDataRecord, is_bulk_convertible=True, length=8)
+        assert (Service._decode_data_record_from_bytes(data_record=mock_data_record,
+                                                       payload=payload,
+                                                       offset=offset,
+                                                       occurrences_number=occurrences_number)
+                == mock_data_record.get_occurrence_info_from_bytes.return_value)
+        mock_data_record.get_occurrence_info_from_bytes.assert_called_once_with(payload=payload,
+                                                                               offset=offset,
+                                                                               occurrences_number=occurrences_number)
+
+    @pytest.mark.parametrize("payload, offset, occurrences_number, records_payload", [
+        (b"\x59\x02\xFF\x12\x34\x56\x78", 24, 1, b"\x12\x34\x56\x78"),
+        (bytes(range(20)), 32, 3, bytes(range(4, 16))),
+    ])
+    @patch(f"{SCRIPT_LOCATION}.DTCAndStatusRecords")
+    def test_decode_data_record_from_bytes__dtc_and_status(self, mock_dtc_and_status_records,
+                                                           payload, offset, occurrences_number, records_payload):
+        mock_dtc_and_status_records.is_dtc_and_status_record.return_value = True
+        mock_dtc_and_status_records.RECORD_LENGTH = 4
+        mock_data_record = Mock(spec=RawDataRecord, length=32)
+        assert (Service._decode_data_record_from_bytes(data_record=mock_data_record,
+                                                       payload=payload,
+                                                       offset=offset,
+                                                       occurrences_number=occurrences_number)
+                == mock_dtc_and_status_records.return_value.get_occurrence_info.return_value)
+        mock_dtc_and_status_records.is_dtc_and_status_record.assert_called_once_with(mock_data_record)
+        mock_dtc_and_status_records.assert_called_once_with(data_record=mock_data_record, payload=records_payload)
+
     # _decode_payload
 
     @pytest.mark.parametrize("payload, message_structure", [
@@ -501,6 +608,31 @@ class TestService:
                                         message_structure=message_structure)
                 == tuple(data_record.get_occurrence_info.return_value for data_record in message_structure))
 
+    @pytest.mark.parametrize("payload, data_record, offset, occurrences_number", [
+        (b"\x12\x34\x56\x78\x9A", Mock(spec=AbstractDataRecord, length=8, min_occurrences=2, max_occurrences=2),
+         8, 2),
+        (list(range(100)), Mock(spec=AbstractDataRecord, length=16, min_occurrences=10, max_occurrences=None,
+                                is_reoccurring=True, fixed_total_length=False),
+         8, 49),
+    ])
+    @patch(f"{SCRIPT_LOCATION}.Service._get_fixed_stride_raw_values")
+    def test_decode_payload__valid__fixed_stride(self, mock_get_fixed_stride_raw_values,
+                                                 payload, data_record, offset, occurrences_number):
+        mock_get_fixed_stride_raw_values.return_value = tuple(range(occurrences_number))
+        mock_first_data_record = Mock(spec=AbstractDataRecord, length=8, min_occurrences=1, max_occurrences=1)
+        message_structure = [mock_first_data_record, data_record]
+        with patch(f"{SCRIPT_LOCATION}.Service._get_remaining_length", return_value=0):
+            assert (Service._decode_payload(payload=payload,
+                                            message_structure=message_structure,
+                                            check_remaining_length=False)
+                    == (mock_first_data_record.get_occurrence_info.return_value,
+                        data_record.get_occurrence_info.return_value))
+        mock_get_fixed_stride_raw_values.assert_called_once_with(payload=payload,
+                                                                 offset=offset,
+                                                                 length=data_record.length,
+                                                                 occurrences_number=occurrences_number)
+        data_record.get_occurrence_info.assert_called_once_with(*range(occurrences_number))
+
     @pytest.mark.parametrize("payload, message_structure", [
         ([0xFF, 0x00],
          [Mock(spec=AbstractDataRecord, length=8, min_occurrences=0, max_occurrences=None, is_reoccurring=True, fixed_total_length=False),
@@ -670,6 +802,14 @@ class TestService:
                                     message_structure=message_structure)
         self.mock_int_to_bytes.assert_not_called()
 
+    def test_encode_message__inconsistency_error__conditional_first(self):
+        mock_conditional_data_record = Mock(spec=AbstractConditionalDataRecord)
+        with pytest.raises(InconsistencyError):
+            Service._encode_message(data_records_values={},
+                                    message_structure=[mock_conditional_data_record])
+        mock_conditional_data_record.get_message_continuation.assert_not_called()
+        self.mock_int_to_bytes.assert_not_called()
+
     @pytest.mark.parametrize("message_structure, data_records_values, payload", [
         ([Mock(spec=AbstractDataRecord, name="Param 1", length=8)],
          {"Param 1": 0},
@@ -689,12 +829,14 @@ class TestService:
           "Data Record - 2": [{"Data Record - 2.1": 0, "Data Record - 2.2": 2}]},
          [0xCa, 0xFF, 0xE, 0x56]),
     ])
+    @patch(f"{SCRIPT_LOCATION}.Service._pack_message_fields")
     @patch(f"{SCRIPT_LOCATION}.Service._get_data_record_occurrences")
     def test_encode_message__valid__no_condition(self, mock_get_data_record_occurrences,
+                                                 mock_pack_message_fields,
                                                  message_structure, data_records_values,
                                                  payload):
         values_copy = deepcopy(data_records_values)
-        self.mock_int_to_bytes.return_value = payload
+        mock_pack_message_fields.return_value = bytearray(payload)
         mock_get_data_record_occurrences.side_effect = self.get_data_record_occurrences
         for data_record in message_structure:
             data_record.name = data_record._extract_mock_name()
@@ -702,7 +844,7 @@ class TestService:
                                        message_structure=message_structure) == bytearray(payload)
         mock_get_data_record_occurrences.assert_has_calls([call(data_record=dr, value=values_copy[dr.name])
                                                            for dr in message_structure], any_order=False)
-        self.mock_int_to_bytes.assert_called_once()
+        mock_pack_message_fields.assert_called_once()
 
     @pytest.mark.parametrize("message_structure, data_records_values, message_continuation, payload", [
         ([Mock(spec=AbstractDataRecord, name="PAram", length=8),
@@ -726,12 +868,14 @@ class TestService:
          [Mock(spec=AbstractDataRecord, name="Data Record - 2", length=24)],
          [0xCA, 0xFF, 0x0E, 0x56]),
     ])
+    @patch(f"{SCRIPT_LOCATION}.Service._pack_message_fields")
     @patch(f"{SCRIPT_LOCATION}.Service._get_data_record_occurrences")
     def test_encode_message__valid__condition(self, mock_get_data_record_occurrences,
+                                              mock_pack_message_fields,
                                               message_structure, data_records_values,
                                               message_continuation, payload):
         values_copy = deepcopy(data_records_values)
-        self.mock_int_to_bytes.return_value = payload
+        mock_pack_message_fields.return_value = bytearray(payload)
         mock_get_data_record_occurrences.side_effect = self.get_data_record_occurrences
         for data_record in message_structure + message_continuation:
             data_record.name = data_record._extract_mock_name()
@@ -743,7 +887,7 @@ class TestService:
                                                            for dr in message_structure + message_continuation
                                                            if isinstance(dr, AbstractDataRecord)],
                                                           any_order=True)
-        self.mock_int_to_bytes.assert_called()
+        mock_pack_message_fields.assert_called_once()
         mock_get_message_continuation.assert_called_once()
 
     @pytest.mark.parametrize("message_structure, data_records_values, message_continuation_1, message_continuation_2, "
@@ -772,12 +916,14 @@ class TestService:
          [Mock(spec=AbstractDataRecord, name="C", length=8, min_occurrences=0)],
          [0xF0, 0xE1, 0xD2, 0xC3, 0xB4, 0xA5]),
     ])
+    @patch(f"{SCRIPT_LOCATION}.Service._pack_message_fields")
     @patch(f"{SCRIPT_LOCATION}.Service._get_data_record_occurrences")
     def test_encode_message__valid__condition_after_condition(self, mock_get_data_record_occurrences,
+                                                              mock_pack_message_fields,
                                                               message_structure, data_records_values,
                                                               message_continuation_1, message_continuation_2, payload):
         values_copy = deepcopy(data_records_values)
-        self.mock_int_to_bytes.return_value = payload
+        mock_pack_message_fields.return_value = bytearray(payload)
         mock_get_data_record_occurrences.side_effect = self.get_data_record_occurrences
         for data_record in message_structure + message_continuation_1 + message_continuation_2:
             data_record.name = data_record._extract_mock_name()
@@ -792,7 +938,7 @@ class TestService:
              for dr in message_structure + message_continuation_1 + message_continuation_2
              if isinstance(dr, AbstractDataRecord)],
             any_order=True)
-        self.mock_int_to_bytes.assert_called()
+        mock_pack_message_fields.assert_called_once()
         mock_get_message_continuation_1.assert_called_once()
         mock_get_message_continuation_2.assert_called_once()
 
@@ -816,11 +962,13 @@ class TestService:
           Mock(spec=AbstractConditionalDataRecord, get_message_continuation=Mock(return_value=[]))],
          [0xF0, 0xE1, 0xD2]),
     ])
+    @patch(f"{SCRIPT_LOCATION}.Service._pack_message_fields")
     @patch(f"{SCRIPT_LOCATION}.Service._get_data_record_occurrences")
     def test_encode_message__valid__condition_in_condition(self, mock_get_data_record_occurrences,
+                                                           mock_pack_message_fields,
                                                            message_structure, data_records_values,
                                                            message_continuation, payload):
-        self.mock_int_to_bytes.return_value = payload
+        mock_pack_message_fields.return_value = bytearray(payload)
         mock_get_data_record_occurrences.side_effect = self.get_data_record_occurrences
         for data_record in message_structure + message_continuation:
             data_record.name = data_record._extract_mock_name()
@@ -828,7 +976,7 @@ class TestService:
         message_structure[1].get_message_continuation = mock_get_message_continuation
         assert Service._encode_message(data_records_values=data_records_values,
                                        message_structure=message_structure) == bytearray(payload)
-        self.mock_int_to_bytes.assert_called()
+        mock_pack_message_fields.assert_called_once()
         mock_get_message_continuation.assert_called_once()
 
     @pytest.mark.parametrize("message_structure, data_records_values, payload", [
@@ -841,17 +989,54 @@ class TestService:
          {},
          b""),
     ])
+    @patch(f"{SCRIPT_LOCATION}.Service._pack_message_fields")
     @patch(f"{SCRIPT_LOCATION}.Service._get_data_record_occurrences")
     def test_encode_message__valid__with_uncalled_condition(self, mock_get_data_record_occurrences,
+                                                            mock_pack_message_fields,
                                                             message_structure, data_records_values,
                                                             payload):
-        self.mock_int_to_bytes.return_value = payload
+        mock_pack_message_fields.return_value = bytearray(payload)
         mock_get_data_record_occurrences.side_effect = self.get_data_record_occurrences
         for data_record in message_structure:
             data_record.name = data_record._extract_mock_name()
         assert Service._encode_message(data_records_values=data_records_values,
-                                       message_structure=message_structure) == bytearray(payload + payload)
-        self.mock_int_to_bytes.assert_called()
+                                       message_structure=message_structure) == bytearray(payload)
+        mock_pack_message_fields.assert_called_once()
+
+    # _pack_message_fields
+
+    @pytest.mark.parametrize("fields, total_length, payload", [
+        ([], 0, b""),
+        ([(8, [0x12, 0x34, 0x56])], 24, b"\x12\x34\x56"),
+        ([(16, [0x1234, 0xABCD]), (32, [0xFEDCBA98]), (64, [0x0123456789ABCDEF])], 128,
+         bytes.fromhex("1234ABCDFEDCBA980123456789ABCDEF")),
+        ([(24, [0x123456, 0x789ABC]), (8, [0xDE])], 56, bytes.fromhex("123456789ABCDE")),
+        ([(4, [0x1, 0x2, 0x3]), (12, [0x456]), (16, [0x789A])], 40, bytes.fromhex("123456789A")),
+        ([(1, [1, 0, 1, 0, 1, 1, 1, 1]), (3, [0x5]), (13, [0x1ABC]), (8, [0xFF])], 32,
+         bytes.fromhex("AFBABCFF")),
+    ])
+    def test_pack_message_fields(self, fields, total_length, payload):
+        assert Service._pack_message_fields(fields=fields, total_length=total_length) == bytearray(payload)
+
+    @pytest.mark.parametrize("fields, total_length, payload", [
+        ([(8, [0x12, 0x34, 0x56])], 24, b"\x12\x34\x56"),
+        ([(4, [0x1, 0x2, 0x3]), (12, [0x456]), (16, [0x789A])], 40, bytes.fromhex("123456789A")),
+    ])
+    @pytest.mark.parametrize("buffer_size, offset", [(5, 0), (10, 3), (10, 5)])
+    def test_pack_message_fields__buffer(self, fields, total_length, payload, buffer_size, offset):
+        buffer = bytearray(b"\xFF" * buffer_size)
+        output = Service._pack_message_fields(fields=fields, total_length=total_length, buffer=buffer, offset=offset)
+        assert isinstance(output, memoryview)
+        assert output == payload
+        assert buffer == b"\xFF" * offset + payload + b"\xFF" * (buffer_size - offset - len(payload))
+
+    @pytest.mark.parametrize("buffer_size, offset", [(2, 0), (10, 8), (10, -1)])
+    def test_pack_message_fields__value_error(self, buffer_size, offset):
+        buffer = bytearray(buffer_size)
+        with pytest.raises(ValueError):
+            Service._pack_message_fields(fields=[(8, [0x12, 0x34, 0x56])], total_length=24, buffer=buffer,
+                                         offset=offset)
+        assert buffer == bytearray(buffer_size)
 
     # validate_message_structure
 
@@ -1062,3 +1247,227 @@ class TestService:
                                data_records_values=data_records_values)
                 == self.mock_service.encode_negative_response.return_value)
         self.mock_service.encode_negative_response.assert_called_once_with(nrc=data_records_values["NRC"])
+
+    # encode_into
+
+    @pytest.mark.parametrize("sid, rsid, data_records_values", [
+        (None, None, {}),
+        (Mock(), Mock(), Mock()),
+    ])
+    def test_encode_into__value_error(self, sid, rsid, data_records_values):
+        with pytest.raises(ValueError):
+            Service.encode_into(self.mock_service, buffer=bytearray(10), sid=sid, rsid=rsid,
+                                data_records_values=data_records_values)
+
+    @pytest.mark.parametrize("buffer, offset", [
+        (bytearray(), 0),
+        (bytearray(10), 10),
+        (bytearray(10), -1),
+    ])
+    def test_encode_into__value_error__buffer(self, buffer, offset):
+        with pytest.raises(ValueError):
+            Service.encode_into(self.mock_service, buffer=buffer, sid=self.mock_service.request_sid,
+                                data_records_values={}, offset=offset)
+        self.mock_service._encode_message.assert_not_called()
+
+    @pytest.mark.parametrize("buffer, offset", [
+        (bytearray(10), 0),
+        (memoryview(bytearray(64)), 17),
+    ])
+    @pytest.mark.parametrize("data_records_values", [{}, {"a": 1, "b": [{"zyx a": 94}, 0xFF]}])
+    def test_encode_into__request(self, buffer, offset, data_records_values):
+        self.mock_service.request_sid = 0x22
+        self.mock_service._encode_message.return_value = memoryview(b"\x12\x34\x56")
+        assert Service.encode_into(self.mock_service, buffer=buffer, sid=self.mock_service.request_sid,
+                                   data_records_values=data_records_values, offset=offset) == 4
+        assert buffer[offset] == 0x22
+        self.mock_service._encode_message.assert_called_once_with(data_records_values=data_records_values,
+                                                                  message_structure=self.mock_service.request_structure,
+                                                                  buffer=buffer,
+                                                                  offset=offset + 1)
+
+    @pytest.mark.parametrize("buffer, offset", [
+        (bytearray(1), 0),
+        (memoryview(bytearray(64)), 63),
+    ])
+    @pytest.mark.parametrize("data_records_values", [{}, {"a": 1, "b": [{"zyx a": 94}, 0xFF]}])
+    def test_encode_into__positive_response(self, buffer, offset, data_records_values):
+        self.mock_service.response_sid = 0x62
+        self.mock_service._encode_message.return_value = memoryview(b"")
+        assert Service.encode_into(self.mock_service, buffer=buffer, rsid=self.mock_service.response_sid,
+                                   data_records_values=data_records_values, offset=offset) == 1
+        assert buffer[offset] == 0x62
+        self.mock_service._encode_message.assert_called_once_with(
+            data_records_values=data_records_values,
+            message_structure=self.mock_service.response_structure,
+            buffer=buffer,
+            offset=offset + 1)
+
+    @pytest.mark.parametrize("buffer, offset", [
+        (bytearray(2), 0),
+        (bytearray(10), 8),
+    ])
+    def test_encode_into__negative_response__value_error(self, buffer, offset):
+        self.mock_service.encode.return_value = bytearray(b"\x7F\x22\x31")
+        with pytest.raises(ValueError):
+            Service.encode_into(self.mock_service, buffer=buffer, rsid=ResponseSID.NegativeResponse,
+                                data_records_values={"NRC": 0x31}, offset=offset)
+
+    @pytest.mark.parametrize("buffer, offset", [
+        (bytearray(3), 0),
+        (memoryview(bytearray(10)), 7),
+    ])
+    def test_encode_into__negative_response(self, buffer, offset):
+        self.mock_service.encode.return_value = bytearray(b"\x7F\x22\x31")
+        assert Service.encode_into(self.mock_service, buffer=buffer, rsid=ResponseSID.NegativeResponse,
+                                   sid=self.mock_service.request_sid, data_records_values={"NRC": 0x31},
+                                   offset=offset) == 3
+        assert buffer[offset:offset + 3] == b"\x7F\x22\x31"
+        self.mock_service.encode.assert_called_once_with(data_records_values={"NRC": 0x31},
+                                                         sid=self.mock_service.request_sid,
+                                                         rsid=ResponseSID.NegativeResponse)
+
+
+@pytest.mark.integration
+class TestServiceIntegration:
+    """Integration tests for `Service` class."""
+
+    def setup_class(self):
+        self.vin = TextDataRecord(name="VIN",
+                                  encoding=TextEncoding.ASCII,
+                                  min_occurrences=17,
+                                  max_occurrences=17)
+        self.nibble = RawDataRecord(name="Nibble", length=4)
+        self.digits = TextDataRecord(name="Digits",
+                                     encoding=TextEncoding.BCD,
+                                     min_occurrences=1,
+                                     max_occurrences=None)
+
+    # _encode_message and _decode_payload
+
+    @pytest.mark.parametrize("data_records_values", [
+        {"VIN": "WVWZZZ1JZXW000001"},
+        {"VIN": list(b"1HGCM82633A004352")},
+    ])
+    def test_encode_decode__ascii(self, data_records_values):
+        message_structure = (self.vin,)
+        expected_payload = b"".join(bytes(value) if isinstance(value, list) else value.encode("ascii")
+                                    for value in data_records_values.values())
+        payload = Service._encode_message(data_records_values=deepcopy(data_records_values),
+                                          message_structure=message_structure)
+        assert payload == expected_payload
+        decoded_message = Service._decode_payload(payload=payload, message_structure=message_structure)
+        assert decoded_message[0]["raw_value"] == tuple(payload)
+        assert decoded_message[0]["physical_value"] == payload.decode("ascii")
+
+    @pytest.mark.parametrize("data_records_values, payload", [
+        ({"Nibble": 0xF, "Digits": "012"}, bytes.fromhex("F012")),
+        ({"Nibble": 0x0, "Digits": "123456789"}, bytes.fromhex("0123456789")),
+    ])
+    def test_encode_decode__bcd(self, data_records_values, payload):
+        message_structure = (self.nibble, self.digits)
+        assert Service._encode_message(data_records_values=deepcopy(data_records_values),
+                                       message_structure=message_structure) == payload
+        decoded_message = Service._decode_payload(payload=payload, message_structure=message_structure)
+        assert decoded_message[1]["raw_value"] == tuple(int(digit) for digit in data_records_values["Digits"])
+        assert decoded_message[1]["physical_value"] == data_records_values["Digits"]
+
+    @pytest.mark.parametrize("payload", [b"\x12\x34\x56\x78", b"\x00\x00\x09"])
+    def test_decode_payload__bcd_unaligned(self, payload):
+        message_structure = (self.nibble, self.digits)
+        payload_int = int.from_bytes(payload, "big")
+        raw_values = [(payload_int >> (4 * i)) & 0xF for i in range(2 * len(payload) - 2, -1, -1)]
+        decoded_message = Service._decode_payload(payload=payload, message_structure=message_structure)
+        assert decoded_message[1] == self.digits.get_occurrence_info(*raw_values)
+
+    @pytest.mark.parametrize("payload", [
+        bytes.fromhex("02FF"),
+        bytes.fromhex("02FF1234562F"),
+        bytes.fromhex("02FF") + bytes(range(256)),
+    ])
+    def test_decode_payload__dtc_and_status(self, payload):
+        message_structure = READ_DTC_INFORMATION.response_structure
+        with patch(f"{SCRIPT_LOCATION}.Service._decode_data_record_from_bytes", return_value=None):
+            expected_decoded_message = Service._decode_payload(payload=payload, message_structure=message_structure)
+        assert Service._decode_payload(payload=payload, message_structure=message_structure) \
+            == expected_decoded_message
+
+    @pytest.mark.parametrize("length", [8, 16, 24, 32, 40, 64])
+    @pytest.mark.parametrize("occurrences_number", [2, 3, 100])
+    def test_decode_payload__fixed_stride(self, length, occurrences_number):
+        data_record = RawDataRecord(name="Reoccurring", length=length, min_occurrences=1, max_occurrences=None)
+        payload = bytes((7 * i + 3) % 256 for i in range(1 + occurrences_number * length // 8))
+        payload_int = int.from_bytes(payload, "big")
+        raw_values = [(payload_int >> (length * i)) & ((1 << length) - 1)
+                      for i in range(occurrences_number - 1, -1, -1)]
+        decoded_message = Service._decode_payload(payload=payload, message_structure=(self.nibble, self.nibble,
+                                                                                       data_record))
+        assert decoded_message[2] == data_record.get_occurrence_info(*raw_values)
+
+    @pytest.mark.parametrize("lengths", [
+        (8, 16, 24, 32, 40, 64),
+        (4, 8, 4, 16, 12, 24, 4),
+        (1, 7, 3, 5, 9, 7),
+    ])
+    def test_encode_message__mixed_alignment(self, lengths):
+        message_structure = tuple(RawDataRecord(name=f"DR#{i}", length=length, min_occurrences=1, max_occurrences=None)
+                                  for i, length in enumerate(lengths))
+        data_records_values = {data_record.name: [(37 * i + 11) % (1 << data_record.length) for i in range(5)]
+                               for data_record in message_structure}
+        total_value = 0
+        total_length = 0
+        for data_record in message_structure:
+            for raw_value in data_records_values[data_record.name]:
+                total_value = (total_value << data_record.length) | raw_value
+                total_length += data_record.length
+        payload = Service._encode_message(data_records_values=data_records_values,
+                                          message_structure=message_structure)
+        assert payload == total_value.to_bytes(total_length // 8, "big")
+
+    @pytest.mark.parametrize("data_records_values", [
+        {"VIN": "WVWZZZ1JZXW000001"},
+        {"VIN": list(b"1HGCM82633A004352")},
+    ])
+    @pytest.mark.parametrize("offset", [0, 5])
+    def test_encode_message__buffer(self, data_records_values, offset):
+        message_structure = (self.vin,)
+        buffer = bytearray(32)
+        payload = Service._encode_message(data_records_values=deepcopy(data_records_values),
+                                          message_structure=message_structure)
+        assert Service._encode_message(data_records_values=deepcopy(data_records_values),
+                                       message_structure=message_structure,
+                                       buffer=buffer,
+                                       offset=offset) == payload
+        assert buffer[offset:offset + len(payload)] == payload
+
+
+@pytest.mark.performance
+class TestServicePerformance:
+    """Performance tests for `Service` class."""
+
+    PAYLOAD_SIZES = (384, 6144, 98304)
+    REPETITIONS = 3
+
+    @classmethod
+    def _measure_encode(cls, data_record, size):
+        values = [(7 * i) % (1 << data_record.length) for i in range(8 * size // data_record.length)]
+        execution_times = []
+        for _ in range(cls.REPETITIONS):
+            data_records_values = {data_record.name: list(values)}
+            timestamp_before = perf_counter()
+            payload = Service._encode_message(data_records_values=data_records_values,
+                                              message_structure=(data_record,))
+            execution_times.append(perf_counter() - timestamp_before)
+            assert len(payload) == size
+        return min(execution_times)
+
+    @pytest.mark.parametrize("length", [4, 8, 16, 24])
+    def test_encode_message__linear(self, length):
+        """Make sure that encoding time grows (approximately) linearly with payload size."""
+        data_record = RawDataRecord(name="Data", length=length, min_occurrences=1, max_occurrences=None)
+        execution_times = [self._measure_encode(data_record=data_record, size=size) for size in self.PAYLOAD_SIZES]
+        for (smaller_size, larger_size), (smaller_time, larger_time) in zip(zip(self.PAYLOAD_SIZES,
+                                                                                self.PAYLOAD_SIZES[1:]),
+                                                                            zip(execution_times,
+                                                                                execution_times[1:])):
+            assert larger_time / smaller_time < 3 * larger_size / smaller_size
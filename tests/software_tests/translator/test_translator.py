@@ -17,6 +17,7 @@ from uds.translator.data_record import (
 from uds.translator.translator import (
     Collection,
     InconsistencyError,
+    LazyTranslator,
     MappingProxyType,
     RequestSID,
     ResponseSID,
@@ -24,6 +25,7 @@ from uds.translator.translator import (
     Translator,
     UdsMessage,
     UdsMessageRecord,
+    _LazyServicesMapping,
 )
 
 SCRIPT_LOCATION = "uds.translator.translator"
@@ -178,8 +180,213 @@ class TestTranslator:
         assert Translator.decode(self.mock_translator, message) == mock_service.decode_negative_response.return_value
         mock_service.decode_negative_response.assert_called_once_with(message.payload)
 
+    # encode_into
+
+    @pytest.mark.parametrize("sid, rsid, services_mapping", [
+        (None, None, {}),
+        (0x10, 0x7F, {0x7F: Mock()}),
+        (0x10, 0x50, {0x10: Mock(), 0x50: Mock()}),
+        (None, 0x50, {0x4F: Mock(), 0x51: Mock()}),
+    ])
+    def test_encode_into__value_error(self, sid, rsid, services_mapping):
+        self.mock_translator.services_mapping = services_mapping
+        with pytest.raises(ValueError):
+            Translator.encode_into(self.mock_translator, buffer=bytearray(10), sid=sid, rsid=rsid,
+                                   data_records_values=MagicMock())
+
+    @pytest.mark.parametrize("sid, rsid, key", [
+        (0x22, None, 0x22),
+        (None, 0x62, 0x62),
+        (0x22, 0x7F, 0x22),
+    ])
+    @pytest.mark.parametrize("offset", [0, 7])
+    def test_encode_into(self, sid, rsid, key, offset):
+        mock_service = Mock()
+        mock_buffer = Mock()
+        mock_data_records_values = MagicMock()
+        self.mock_translator.services_mapping = {key: mock_service}
+        assert (Translator.encode_into(self.mock_translator, buffer=mock_buffer, sid=sid, rsid=rsid,
+                                       data_records_values=mock_data_records_values, offset=offset)
+                == mock_service.encode_into.return_value)
+        mock_service.encode_into.assert_called_once_with(buffer=mock_buffer,
+                                                         data_records_values=mock_data_records_values,
+                                                         sid=sid,
+                                                         rsid=rsid,
+                                                         offset=offset)
+
+    # decode_payload
+
+    @pytest.mark.parametrize("payload", [None, [0x10, 0x03], (0x10, 0x03), "1003"])
+    def test_decode_payload__type_error(self, payload):
+        with pytest.raises(TypeError):
+            Translator.decode_payload(self.mock_translator, payload)
+
+    @pytest.mark.parametrize("payload", [b"", bytearray(), memoryview(b""), b"\x10\x03", b"\x7F", b"\x7F\x10\x11"])
+    def test_decode_payload__value_error(self, payload):
+        self.mock_translator.services_mapping = {}
+        with pytest.raises(ValueError):
+            Translator.decode_payload(self.mock_translator, payload)
+
+    @pytest.mark.parametrize("payload, expected_payload", [
+        (b"\x10\x03", b"\x10\x03"),
+        (bytearray(b"\x62\xF1\x86\x01"), bytearray(b"\x62\xF1\x86\x01")),
+        (memoryview(b"\xFF\x62\xF1\x86\x01")[1:], b"\x62\xF1\x86\x01"),
+    ])
+    def test_decode_payload(self, payload, expected_payload):
+        mock_service = Mock()
+        self.mock_translator.services_mapping = {expected_payload[0]: mock_service}
+        assert Translator.decode_payload(self.mock_translator, payload) == mock_service.decode.return_value
+        mock_service.decode.assert_called_once_with(expected_payload)
+
+    @pytest.mark.parametrize("payload", [b"\x7F\x10\x11", memoryview(bytearray(b"\x7F\x3E\x12"))])
+    def test_decode_payload__negative_response(self, payload):
+        mock_service = Mock()
+        self.mock_translator.services_mapping = {payload[1]: mock_service}
+        assert (Translator.decode_payload(self.mock_translator, payload)
+                == mock_service.decode_negative_response.return_value)
+        mock_service.decode_negative_response.assert_called_once_with(bytes(payload))
+
 
 @pytest.mark.integration
+class TestLazyServicesMapping:
+    """Unit tests for `_LazyServicesMapping` class."""
+
+    def setup_method(self):
+        self.dsc_service = Mock(spec=Service,
+                                request_sid=RequestSID.DiagnosticSessionControl,
+                                response_sid=ResponseSID.DiagnosticSessionControl)
+        self.ecu_reset_service = Mock(spec=Service,
+                                      request_sid=RequestSID.ECUReset,
+                                      response_sid=ResponseSID.ECUReset)
+        self.mock_dsc_loader = Mock(return_value=self.dsc_service)
+        self.mock_ecu_reset_loader = Mock(return_value=self.ecu_reset_service)
+        self.services_mapping = _LazyServicesMapping({
+            RequestSID.DiagnosticSessionControl: self.mock_dsc_loader,
+            RequestSID.ECUReset: self.mock_ecu_reset_loader,
+        })
+
+    # __init__
+
+    def test_init(self):
+        assert len(self.services_mapping) == 4
+        assert self.services_mapping.loaded_services == frozenset()
+        self.mock_dsc_loader.assert_not_called()
+        self.mock_ecu_reset_loader.assert_not_called()
+
+    # __getitem__
+
+    @pytest.mark.parametrize("key", [RequestSID.DiagnosticSessionControl, ResponseSID.DiagnosticSessionControl,
+                                     0x10, 0x50])
+    def test_getitem(self, key):
+        assert self.services_mapping[key] is self.dsc_service
+        assert self.services_mapping[0x10] is self.services_mapping[0x50] is self.dsc_service
+        self.mock_dsc_loader.assert_called_once_with()
+        self.mock_ecu_reset_loader.assert_not_called()
+        assert self.services_mapping.loaded_services == frozenset({self.dsc_service})
+
+    @pytest.mark.parametrize("key", [RequestSID.ReadDataByIdentifier, 0x00, 0x7F])
+    def test_getitem__key_error(self, key):
+        with pytest.raises(KeyError):
+            self.services_mapping[key]
+
+    @pytest.mark.parametrize("service", [
+        Mock(),
+        Mock(spec=Service, request_sid=RequestSID.ECUReset, response_sid=ResponseSID.ECUReset),
+    ])
+    def test_getitem__inconsistency_error(self, service):
+        self.mock_dsc_loader.return_value = service
+        with pytest.raises(InconsistencyError):
+            self.services_mapping[RequestSID.DiagnosticSessionControl]
+        assert self.services_mapping.loaded_services == frozenset()
+
+    # __contains__
+
+    @pytest.mark.parametrize("key", [RequestSID.DiagnosticSessionControl, ResponseSID.ECUReset, 0x10, 0x51])
+    def test_contains__true(self, key):
+        assert key in self.services_mapping
+        self.mock_dsc_loader.assert_not_called()
+        self.mock_ecu_reset_loader.assert_not_called()
+
+    @pytest.mark.parametrize("key", [RequestSID.ReadDataByIdentifier, 0x7F, None, "DiagnosticSessionControl"])
+    def test_contains__false(self, key):
+        assert key not in self.services_mapping
+
+    # __iter__
+
+    def test_iter(self):
+        assert set(self.services_mapping) == {0x10, 0x50, 0x11, 0x51}
+        self.mock_dsc_loader.assert_not_called()
+        self.mock_ecu_reset_loader.assert_not_called()
+
+
+class TestLazyTranslator:
+    """Unit tests for `LazyTranslator` class."""
+
+    def setup_method(self):
+        self.dsc_service = Mock(spec=Service,
+                                request_sid=RequestSID.DiagnosticSessionControl,
+                                response_sid=ResponseSID.DiagnosticSessionControl)
+        self.ecu_reset_service = Mock(spec=Service,
+                                      request_sid=RequestSID.ECUReset,
+                                      response_sid=ResponseSID.ECUReset)
+        self.mock_dsc_loader = Mock(return_value=self.dsc_service)
+        self.mock_ecu_reset_loader = Mock(return_value=self.ecu_reset_service)
+        self.translator = LazyTranslator(services_loaders={
+            RequestSID.DiagnosticSessionControl: self.mock_dsc_loader,
+            RequestSID.ECUReset: self.mock_ecu_reset_loader,
+        })
+
+    # __init__
+
+    @pytest.mark.parametrize("services_loaders", [None, [Mock(), Mock()]])
+    def test_init__type_error(self, services_loaders):
+        with pytest.raises(TypeError):
+            LazyTranslator(services_loaders=services_loaders)
+
+    def test_init(self):
+        assert isinstance(self.translator, Translator)
+        assert self.translator.loaded_services == frozenset()
+        assert set(self.translator.services_mapping) == {0x10, 0x50, 0x11, 0x51}
+        self.mock_dsc_loader.assert_not_called()
+        self.mock_ecu_reset_loader.assert_not_called()
+
+    # services
+
+    def test_services__get(self):
+        assert self.translator.services == frozenset({self.dsc_service, self.ecu_reset_service})
+        assert self.translator.loaded_services == frozenset({self.dsc_service, self.ecu_reset_service})
+        self.mock_dsc_loader.assert_called_once_with()
+        self.mock_ecu_reset_loader.assert_called_once_with()
+
+    def test_services__set(self):
+        service = Mock(spec=Service, request_sid=RequestSID.TesterPresent, response_sid=ResponseSID.TesterPresent)
+        self.translator.services = [service]
+        assert set(self.translator.services_mapping) == {0x3E, 0x7E}
+        assert self.translator.services_mapping[0x7E] is service
+        assert self.translator.services == frozenset({service})
+        self.mock_dsc_loader.assert_not_called()
+        self.mock_ecu_reset_loader.assert_not_called()
+
+    @pytest.mark.parametrize("value, error_type", [
+        (None, TypeError),
+        ([Mock()], ValueError),
+        ([Mock(spec=Service, request_sid=RequestSID.TesterPresent, response_sid=ResponseSID.TesterPresent),
+          Mock(spec=Service, request_sid=RequestSID.TesterPresent, response_sid=ResponseSID.TesterPresent)],
+         InconsistencyError),
+    ])
+    def test_services__set__error(self, value, error_type):
+        with pytest.raises(error_type):
+            self.translator.services = value
+        assert set(self.translator.services_mapping) == {0x10, 0x50, 0x11, 0x51}
+
+    # loaded_services
+
+    def test_loaded_services(self):
+        assert self.translator.services_mapping[ResponseSID.ECUReset] is self.ecu_reset_service
+        assert self.translator.loaded_services == frozenset({self.ecu_reset_service})
+        self.mock_dsc_loader.assert_not_called()
+
+
 class TestTranslatorIntegration:
     """Integration tests for `Translator` class."""
 
@@ -429,6 +636,23 @@ class TestTranslatorIntegration:
                                       rsid=rsid,
                                       data_records_values=data_records_values) == payload
 
+    @pytest.mark.parametrize("sid, rsid, data_records_values", [
+        (0x10, None, {"subFunction": 0x03}),
+        (None, 0x50, {"subFunction": {"SPRMIB": 0, "diagnosticSessionType": 3},
+                      "sessionParameterRecord": {"P2Server_max": 0x1234, "P2*Server_max": 0x5678}}),
+        (0x10, 0x7F, {"NRC": NRC.SubFunctionNotSupported}),
+    ])
+    @pytest.mark.parametrize("offset", [0, 13])
+    def test_encode_into(self, sid, rsid, data_records_values, offset):
+        payload = self.translator.encode(sid=sid, rsid=rsid, data_records_values=data_records_values)
+        buffer = bytearray(b"\xFF" * 32)
+        assert self.translator.encode_into(buffer=memoryview(buffer),
+                                           sid=sid,
+                                           rsid=rsid,
+                                           data_records_values=data_records_values,
+                                           offset=offset) == len(payload)
+        assert buffer == b"\xFF" * offset + payload + b"\xFF" * (32 - offset - len(payload))
+
     @pytest.mark.parametrize("sid, rsid, data_records_values", [
         (
             None,
@@ -791,3 +1015,12 @@ class TestTranslatorIntegration:
     ])
     def test_decode(self, message, decoded_message):
         assert self.translator.decode(message=message) == decoded_message
+
+    @pytest.mark.parametrize("payload", [
+        b"\x10\x40",
+        bytearray(b"\x7F\x22\x31"),
+        memoryview(b"\x62\xF1\x86\x03"),
+    ])
+    def test_decode_payload(self, payload):
+        message = UdsMessage(payload=bytes(payload), addressing_type=AddressingType.PHYSICAL)
+        assert self.translator.decode_payload(payload) == self.translator.decode(message=message)
@@ -0,0 +1,304 @@
+import pickle
+
+import pytest
+from mock import MagicMock, Mock, call, mock_open, patch
+
+from uds.addressing import AddressingType
+from uds.message import RequestSID, UdsMessage
+from uds.translator import (
+    BASE_TRANSLATOR_2013,
+    BASE_TRANSLATOR_2020,
+    ConditionalMappingDataRecord,
+    CustomFormulaDataRecord,
+    LinearFormulaDataRecord,
+    MappingDataRecord,
+    RawDataRecord,
+)
+from uds.translator.translator_cache import (
+    _HEADER_LENGTH,
+    _MAGIC,
+    TRANSLATOR_CACHE_VERSION,
+    MappingProxyType,
+    Service,
+    Translator,
+    _get_content_digest,
+    _get_mapping_proxy,
+    _TranslatorPickler,
+    _TranslatorUnpickler,
+    deserialize_translator,
+    load_translator,
+    save_translator,
+    serialize_translator,
+)
+
+SCRIPT_LOCATION = "uds.translator.translator_cache"
+
+
+class TestFunctions:
+    """Unit tests for module functions."""
+
+    # _get_mapping_proxy
+
+    @pytest.mark.parametrize("mapping", [{}, {1: "a", 2: "b"}])
+    def test_get_mapping_proxy(self, mapping):
+        mapping_proxy = _get_mapping_proxy(mapping)
+        assert isinstance(mapping_proxy, MappingProxyType)
+        assert mapping_proxy == mapping
+
+    # _get_content_digest
+
+    @pytest.mark.parametrize("payload", [b"", b"\x00\x01\x02"])
+    @patch(f"{SCRIPT_LOCATION}.uds")
+    @patch(f"{SCRIPT_LOCATION}.sha256")
+    def test_get_content_digest(self, mock_sha256, mock_uds, payload):
+        mock_uds.__version__ = "1.2.3"
+        assert _get_content_digest(payload) == mock_sha256.return_value.digest.return_value
+        mock_sha256.assert_called_once_with(b"1.2.3" + payload)
+
+    # serialize_translator
+
+    @pytest.mark.parametrize("translator", [Mock(), {Mock(spec=Service)}])
+    def test_serialize_translator__type_error(self, translator):
+        with pytest.raises(TypeError):
+            serialize_translator(translator)
+
+    @pytest.mark.parametrize("exception", [pickle.PicklingError, TypeError, AttributeError])
+    @patch(f"{SCRIPT_LOCATION}._TranslatorPickler")
+    def test_serialize_translator__value_error(self, mock_pickler, exception):
+        mock_pickler.return_value.dump.side_effect = exception
+        with pytest.raises(ValueError):
+            serialize_translator(Mock(spec=Translator, services={Mock(), Mock()}))
+
+    @patch(f"{SCRIPT_LOCATION}._get_content_digest")
+    @patch(f"{SCRIPT_LOCATION}.BytesIO")
+    @patch(f"{SCRIPT_LOCATION}._TranslatorPickler")
+    def test_serialize_translator(self, mock_pickler, mock_bytes_io, mock_get_content_digest):
+        mock_translator = Mock(spec=Translator, services={Mock(), Mock()})
+        mock_bytes_io.return_value.getvalue.return_value = b"payload"
+        mock_get_content_digest.return_value = b"\xAB" * 32
+        assert (serialize_translator(mock_translator)
+                == _MAGIC + bytes([TRANSLATOR_CACHE_VERSION]) + b"\xAB" * 32 + b"payload")
+        mock_pickler.assert_called_once_with(mock_bytes_io.return_value)
+        mock_pickler.return_value.dump.assert_called_once_with(tuple(mock_translator.services))
+        mock_get_content_digest.assert_called_once_with(b"payload")
+
+    # deserialize_translator
+
+    @pytest.mark.parametrize("data", [
+        b"",
+        b"\x00" * 100,
+        _MAGIC + bytes([TRANSLATOR_CACHE_VERSION]) + b"\x00" * 32,
+        _MAGIC + bytes([TRANSLATOR_CACHE_VERSION + 1]) + b"\x00" * 40,
+    ])
+    def test_deserialize_translator__value_error(self, data):
+        with pytest.raises(ValueError):
+            deserialize_translator(data)
+
+    @patch(f"{SCRIPT_LOCATION}._get_content_digest")
+    def test_deserialize_translator__value_error__digest(self, mock_get_content_digest):
+        mock_get_content_digest.return_value = b"\x00" * 32
+        with pytest.raises(ValueError):
+            deserialize_translator(_MAGIC + bytes([TRANSLATOR_CACHE_VERSION]) + b"\xFF" * 32 + b"payload")
+        mock_get_content_digest.assert_called_once_with(b"payload")
+
+    @patch(f"{SCRIPT_LOCATION}.Translator")
+    @patch(f"{SCRIPT_LOCATION}._TranslatorUnpickler")
+    @patch(f"{SCRIPT_LOCATION}.BytesIO")
+    @patch(f"{SCRIPT_LOCATION}._get_content_digest")
+    def test_deserialize_translator(self, mock_get_content_digest, mock_bytes_io, mock_unpickler, mock_translator):
+        mock_get_content_digest.return_value = b"\xAB" * 32
+        assert (deserialize_translator(bytearray(_MAGIC + bytes([TRANSLATOR_CACHE_VERSION]) + b"\xAB" * 32
+                                                 + b"payload"))
+                == mock_translator.return_value)
+        mock_bytes_io.assert_called_once_with(b"payload")
+        mock_unpickler.assert_called_once_with(mock_bytes_io.return_value)
+        mock_translator.assert_called_once_with(services=mock_unpickler.return_value.load.return_value)
+
+    # save_translator
+
+    @pytest.mark.parametrize("file_path", ["translator.bin", Mock()])
+    @patch(f"{SCRIPT_LOCATION}.open", new_callable=mock_open)
+    @patch(f"{SCRIPT_LOCATION}.serialize_translator")
+    def test_save_translator(self, mock_serialize_translator, mock_open_file, file_path):
+        mock_translator = Mock()
+        mock_serialize_translator.return_value = _MAGIC + bytes([TRANSLATOR_CACHE_VERSION]) + b"\x12" * 32 + b"xyz"
+        assert save_translator(translator=mock_translator, file_path=file_path) == "12" * 32
+        mock_serialize_translator.assert_called_once_with(mock_translator)
+        mock_open_file.assert_called_once_with(file_path, "wb")
+        mock_open_file.return_value.write.assert_called_once_with(mock_serialize_translator.return_value)
+
+    # load_translator
+
+    @pytest.mark.parametrize("content_hash", ["00" * 32, "AB" * 31])
+    @patch(f"{SCRIPT_LOCATION}.open", new_callable=mock_open,
+           read_data=_MAGIC + bytes([TRANSLATOR_CACHE_VERSION]) + b"\xAB" * 32 + b"xyz")
+    @patch(f"{SCRIPT_LOCATION}.deserialize_translator")
+    def test_load_translator__value_error(self, mock_deserialize_translator, mock_open_file, content_hash):
+        with pytest.raises(ValueError):
+            load_translator(file_path="translator.bin", content_hash=content_hash)
+        mock_deserialize_translator.assert_not_called()
+
+    @pytest.mark.parametrize("content_hash", [None, "AB" * 32, "ab" * 32])
+    @patch(f"{SCRIPT_LOCATION}.open", new_callable=mock_open,
+           read_data=_MAGIC + bytes([TRANSLATOR_CACHE_VERSION]) + b"\xAB" * 32 + b"xyz")
+    @patch(f"{SCRIPT_LOCATION}.deserialize_translator")
+    def test_load_translator(self, mock_deserialize_translator, mock_open_file, content_hash):
+        assert (load_translator(file_path="translator.bin", content_hash=content_hash)
+                == mock_deserialize_translator.return_value)
+        mock_open_file.assert_called_once_with("translator.bin", "rb")
+        mock_deserialize_translator.assert_called_once_with(_MAGIC + bytes([TRANSLATOR_CACHE_VERSION])
+                                                            + b"\xAB" * 32 + b"xyz")
+
+
+class TestTranslatorPickler:
+    """Unit tests for `_TranslatorPickler` class."""
+
+    def setup_method(self):
+        self.mock_pickler = Mock(spec=_TranslatorPickler)
+
+    # persistent_id
+
+    @pytest.mark.parametrize("obj", [Mock(), 1, "abc"])
+    def test_persistent_id(self, obj):
+        mock_references = MagicMock()
+        self.mock_pickler._TranslatorPickler__references = mock_references
+        assert (_TranslatorPickler.persistent_id(self.mock_pickler, obj)
+                == mock_references.get.return_value)
+        mock_references.get.assert_called_once_with(id(obj), None)
+
+    # reducer_override
+
+    @pytest.mark.parametrize("obj", [{}, Mock(), (1, 2, 3)])
+    def test_reducer_override__not_implemented(self, obj):
+        assert _TranslatorPickler.reducer_override(self.mock_pickler, obj) is NotImplemented
+
+    @pytest.mark.parametrize("mapping", [{}, {1: "a", 2: "b"}])
+    def test_reducer_override__mapping_proxy(self, mapping):
+        assert (_TranslatorPickler.reducer_override(self.mock_pickler, MappingProxyType(mapping))
+                == (_get_mapping_proxy, (mapping,)))
+
+
+class TestTranslatorUnpickler:
+    """Unit tests for `_TranslatorUnpickler` class."""
+
+    def setup_method(self):
+        self.mock_unpickler = Mock(spec=_TranslatorUnpickler)
+        # patching
+        self._patcher_import_module = patch(f"{SCRIPT_LOCATION}.importlib.import_module")
+        self.mock_import_module = self._patcher_import_module.start()
+
+    def teardown_method(self):
+        self._patcher_import_module.stop()
+
+    # persistent_load
+
+    @pytest.mark.parametrize("pid", [
+        "uds.translator.service_definitions",
+        ("uds.translator.service_definitions",),
+        ("os", "system"),
+        (1, "name"),
+        ("uds.translator.service_definitions", "ECU_RESET", 0, 1),
+    ])
+    def test_persistent_load__unpickling_error(self, pid):
+        with pytest.raises(pickle.UnpicklingError):
+            _TranslatorUnpickler.persistent_load(self.mock_unpickler, pid)
+        self.mock_import_module.assert_not_called()
+
+    @pytest.mark.parametrize("pid", [
+        ("uds.translator.service_definitions", "ECU_RESET"),
+        ("uds.translator.data_record_definitions.other", "SID_2013"),
+    ])
+    def test_persistent_load__attribute(self, pid):
+        assert (_TranslatorUnpickler.persistent_load(self.mock_unpickler, pid)
+                == getattr(self.mock_import_module.return_value, pid[1]))
+        self.mock_import_module.assert_called_once_with(pid[0])
+
+    @pytest.mark.parametrize("pid", [
+        ("uds.translator.service_definitions.read_data_by_identifier", "DIDS_2020", 3),
+        ("uds.translator.data_record.conditional_data_record", "DEFAULT_DIAGNOSTIC_MESSAGE_CONTINUATION", 0),
+    ])
+    def test_persistent_load__element(self, pid):
+        mock_sequence = MagicMock()
+        setattr(self.mock_import_module.return_value, pid[1], mock_sequence)
+        assert (_TranslatorUnpickler.persistent_load(self.mock_unpickler, pid)
+                == mock_sequence.__getitem__.return_value)
+        self.mock_import_module.assert_called_once_with(pid[0])
+        mock_sequence.__getitem__.assert_has_calls([call(pid[2])])
+
+
+@pytest.mark.integration
+class TestTranslatorCacheIntegration:
+    """Integration tests for translators serialization."""
+
+    def setup_class(self):
+        did_mapping = {
+            did: [MappingDataRecord(name=f"Parameter 0x{did:04X}",
+                                    length=8,
+                                    values_mapping={value: f"Value {value}" for value in range(16)}),
+                  LinearFormulaDataRecord(name=f"Voltage 0x{did:04X}",
+                                          length=16,
+                                          factor=0.01,
+                                          offset=-10,
+                                          unit="V")]
+            for did in range(0x1000, 0x1100)
+        }
+        did = MappingDataRecord(name="DID",
+                                length=16,
+                                values_mapping={did: f"DID 0x{did:04X}" for did in did_mapping})
+        self.read_data_by_identifier = Service(request_sid=RequestSID.ReadDataByIdentifier,
+                                               request_structure=(did,),
+                                               response_structure=(did,
+                                                                   ConditionalMappingDataRecord(mapping=did_mapping)))
+        self.translator = Translator(
+            services={service for service in BASE_TRANSLATOR_2020.services
+                      if service.request_sid != RequestSID.ReadDataByIdentifier} | {self.read_data_by_identifier})
+
+    @pytest.mark.parametrize("payload", [
+        [0x22, 0x10, 0x00],
+        [0x62, 0x10, 0x0F, 0x0A, 0x12, 0x34],
+        [0x59, 0x02, 0xFF, 0x12, 0x34, 0x56, 0x09],
+        [0x7F, 0x22, 0x31],
+        [0x71, 0x01, 0xFF, 0x00, 0x01],
+    ])
+    def test_decode(self, payload):
+        message = UdsMessage(payload=payload, addressing_type=AddressingType.PHYSICAL)
+        restored_translator = deserialize_translator(serialize_translator(self.translator))
+        assert restored_translator.decode(message) == self.translator.decode(message)
+
+    @pytest.mark.parametrize("sid, data_records_values", [
+        (RequestSID.ReadDataByIdentifier, {"DID": 0x1005}),
+        (RequestSID.DiagnosticSessionControl, {"SubFunction": 0x03}),
+    ])
+    def test_encode(self, sid, data_records_values):
+        restored_translator = deserialize_translator(serialize_translator(self.translator))
+        assert (restored_translator.encode(sid=sid, data_records_values=dict(data_records_values))
+                == self.translator.encode(sid=sid, data_records_values=dict(data_records_values)))
+
+    @pytest.mark.parametrize("translator", [BASE_TRANSLATOR_2013, BASE_TRANSLATOR_2020])
+    def test_base_translators(self, translator):
+        restored_translator = deserialize_translator(serialize_translator(translator))
+        assert restored_translator.services == translator.services
+
+    def test_restored_data_records(self):
+        restored_translator = deserialize_translator(serialize_translator(self.translator))
+        restored_service = restored_translator.services_mapping[RequestSID.ReadDataByIdentifier]
+        assert restored_service is not self.read_data_by_identifier
+        assert restored_service.request_structure[0].values_mapping == \
+               self.read_data_by_identifier.request_structure[0].values_mapping
+        assert isinstance(restored_service.request_structure[0].values_mapping, MappingProxyType)
+
+    def test_serialize_translator__value_error(self):
+        service = Service(request_sid=RequestSID.TesterPresent,
+                          request_structure=(CustomFormulaDataRecord(name="SubFunction",
+                                                                     length=8,
+                                                                     encoding_formula=lambda value: value,
+                                                                     decoding_formula=lambda value: value),),
+                          response_structure=(RawDataRecord(name="SubFunction", length=8),))
+        with pytest.raises(ValueError):
+            serialize_translator(Translator(services={service}))
+
+    def test_deserialize_translator__corrupted(self):
+        data = bytearray(serialize_translator(self.translator))
+        data[_HEADER_LENGTH + 10] ^= 0xFF
+        with pytest.raises(ValueError):
+            deserialize_translator(data)
@@ -1,3 +1,6 @@
+import subprocess
+import sys
+
 import pytest
 
 import uds.translator.service_definitions
@@ -12,7 +15,7 @@ class TestTranslatorDefinitions:
     @staticmethod
     def _get_services_definitions_names():
         return (service_def_name
-                for service_def_name in vars(uds.translator.service_definitions).keys()
+                for service_def_name in dir(uds.translator.service_definitions)
                 if service_def_name.isupper() and not service_def_name.startswith("_"))
 
     def test_services_definition(self):
@@ -29,6 +32,13 @@ class TestTranslatorDefinitions:
     def test_default_translator(self):
         assert BASE_TRANSLATOR is BASE_TRANSLATOR_2020
 
+    @pytest.mark.parametrize("translator", [BASE_TRANSLATOR_2020, BASE_TRANSLATOR_2013])
+    def test_services_mapping(self, translator):
+        """Make sure that all services are available without loading them."""
+        assert set(translator.services_mapping) == {sid
+                                                    for service in translator.services
+                                                    for sid in (service.request_sid, service.response_sid)}
+
     @pytest.mark.parametrize("translator", [BASE_TRANSLATOR_2020, BASE_TRANSLATOR_2013])
     @pytest.mark.parametrize("sid, rsid, data_records_values, payload", [
         (
@@ -200,4 +210,40 @@ class TestTranslatorDefinitions:
         ),
     ])
     def test_decode(self, translator, message, decoded_message):
-        assert translator.decode(message=message) == decoded_message
\ No newline at end of file
+        assert translator.decode(message=message) == decoded_message
+
+
+@pytest.mark.performance
+class TestTranslatorDefinitionsPerformance:
+    """Performance tests for translator definitions."""
+
+    CREATION_TIME_SCRIPT = ("import importlib, time; "
+                            "import uds.translator.translator_definitions as definitions; "
+                            "start = time.perf_counter(); "
+                            "importlib.reload(definitions); "
+                            "lazy_time = time.perf_counter() - start; "
+                            "start = time.perf_counter(); "
+                            "definitions.BASE_TRANSLATOR_2013.services, definitions.BASE_TRANSLATOR_2020.services; "
+                            "print(lazy_time, time.perf_counter() - start)")
+    """Script that measures creation time of base translators and then time of building all their services."""
+
+    @classmethod
+    def _measure(cls, repetitions=5):
+        measurements = [subprocess.check_output([sys.executable, "-c", cls.CREATION_TIME_SCRIPT]).split()
+                        for _ in range(repetitions)]
+        return (min(float(lazy_time) for lazy_time, _ in measurements),
+                min(float(eager_time) for _, eager_time in measurements))
+
+    def test_import__no_services_definitions(self):
+        """Make sure that importing translators does not build any Service translator."""
+        output = subprocess.check_output([sys.executable, "-c",
+                                          "import sys, uds, uds.translator; "
+                                          "print(sorted(name for name in sys.modules "
+                                          "if name.startswith(('uds.translator.service_definitions.', "
+                                          "'uds.translator.data_record_definitions'))))"])
+        assert output.strip() == b"[]"
+
+    def test_creation_time(self):
+        """Make sure that creating translators costs a small fraction of building all Services translators."""
+        lazy_time, eager_time = self._measure()
+        assert lazy_time * 10 < eager_time
@@ -1,5 +1,9 @@
+from logging import DEBUG, Handler, LogRecord, getLogger
+from threading import current_thread
+from time import perf_counter, sleep
+
 import pytest
-from mock import AsyncMock, MagicMock, Mock, call, patch
+from mock import AsyncMock, MagicMock, Mock, PropertyMock, call, patch
 
 from uds.transport_interface.logger import (
     INFO,
@@ -7,6 +11,9 @@ from uds.transport_interface.logger import (
     AbstractTransportInterface,
     TransportLogger,
     UdsMessageRecord,
+    _DeferredQueueHandler,
+    _LazyLogMessage,
+    _LoggerHandler,
 )
 
 SCRIPT_LOCATION = "uds.transport_interface.logger"
@@ -39,7 +46,10 @@ class TestTransportLogger:
         assert self.mock_transport_logger.log_receiving is True
         assert self.mock_transport_logger.message_log_format == TransportLogger.DEFAULT_LOG_FORMAT
         assert self.mock_transport_logger.packet_log_format == TransportLogger.DEFAULT_LOG_FORMAT
+        assert self.mock_transport_logger._TransportLogger__queue_handler is None
+        assert self.mock_transport_logger._TransportLogger__queue_listener is None
         self.mock_get_logger.assert_called_once_with(None)
+        self.mock_transport_logger.start_queue_listener.assert_not_called()
 
     @pytest.mark.parametrize("logger_name, message_logging_level, packet_logging_level, log_sending, log_receiving, "
                              "message_log_format, packet_log_format", [
@@ -56,7 +66,8 @@ class TestTransportLogger:
                                         log_sending=log_sending,
                                         log_receiving=log_receiving,
                                         message_log_format=message_log_format,
-                                        packet_log_format=packet_log_format) is None
+                                        packet_log_format=packet_log_format,
+                                        use_queue=True) is None
         assert self.mock_transport_logger._TransportLogger__logger == self.mock_get_logger.return_value
         assert self.mock_transport_logger.message_logging_level == message_logging_level
         assert self.mock_transport_logger.packet_logging_level == packet_logging_level
@@ -65,6 +76,7 @@ class TestTransportLogger:
         assert self.mock_transport_logger.message_log_format == message_log_format
         assert self.mock_transport_logger.packet_log_format == packet_log_format
         self.mock_get_logger.assert_called_once_with(logger_name)
+        self.mock_transport_logger.start_queue_listener.assert_called_once_with()
 
     # __call__
 
@@ -359,6 +371,93 @@ class TestTransportLogger:
         method.assert_called_once_with(*args, **kwargs)
         self.mock_transport_logger.log_packet.assert_called_once_with(method.return_value)
 
+    # is_queue_listener_running
+
+    @pytest.mark.parametrize("queue_listener, expected_value", [
+        (None, False),
+        (Mock(), True),
+    ])
+    def test_is_queue_listener_running(self, queue_listener, expected_value):
+        self.mock_transport_logger._TransportLogger__queue_listener = queue_listener
+        assert TransportLogger.is_queue_listener_running.fget(self.mock_transport_logger) is expected_value
+
+    # start_queue_listener
+
+    @patch(f"{SCRIPT_LOCATION}.warn")
+    def test_start_queue_listener__already_running(self, mock_warn):
+        self.mock_transport_logger.is_queue_listener_running = True
+        assert TransportLogger.start_queue_listener(self.mock_transport_logger) is None
+        mock_warn.assert_called_once()
+
+    @patch(f"{SCRIPT_LOCATION}._LoggerHandler")
+    @patch(f"{SCRIPT_LOCATION}.QueueListener")
+    @patch(f"{SCRIPT_LOCATION}._DeferredQueueHandler")
+    @patch(f"{SCRIPT_LOCATION}.SimpleQueue")
+    def test_start_queue_listener(self, mock_simple_queue, mock_deferred_queue_handler, mock_queue_listener,
+                                  mock_logger_handler):
+        self.mock_transport_logger.is_queue_listener_running = False
+        assert TransportLogger.start_queue_listener(self.mock_transport_logger) is None
+        mock_deferred_queue_handler.assert_called_once_with(mock_simple_queue.return_value)
+        mock_logger_handler.assert_called_once_with(self.mock_transport_logger.logger)
+        mock_queue_listener.assert_called_once_with(mock_simple_queue.return_value, mock_logger_handler.return_value)
+        mock_queue_listener.return_value.start.assert_called_once_with()
+        assert self.mock_transport_logger._TransportLogger__queue_handler == mock_deferred_queue_handler.return_value
+        assert self.mock_transport_logger._TransportLogger__queue_listener == mock_queue_listener.return_value
+
+    # stop_queue_listener
+
+    @patch(f"{SCRIPT_LOCATION}.warn")
+    def test_stop_queue_listener__not_running(self, mock_warn):
+        self.mock_transport_logger._TransportLogger__queue_listener = None
+        assert TransportLogger.stop_queue_listener(self.mock_transport_logger) is None
+        mock_warn.assert_called_once()
+
+    def test_stop_queue_listener(self):
+        mock_queue_listener = Mock()
+        self.mock_transport_logger._TransportLogger__queue_listener = mock_queue_listener
+        assert TransportLogger.stop_queue_listener(self.mock_transport_logger) is None
+        mock_queue_listener.stop.assert_called_once_with()
+        assert self.mock_transport_logger._TransportLogger__queue_listener is None
+        assert self.mock_transport_logger._TransportLogger__queue_handler is None
+
+    # _log
+
+    @pytest.mark.parametrize("level, log_format, record", [
+        (INFO, "{record}", Mock()),
+        (DEBUG, Mock(), Mock()),
+    ])
+    @patch(f"{SCRIPT_LOCATION}._LazyLogMessage")
+    def test_log__direct(self, mock_lazy_log_message, level, log_format, record):
+        self.mock_transport_logger._TransportLogger__queue_handler = None
+        assert TransportLogger._log(self.mock_transport_logger, level=level, log_format=log_format,
+                                    record=record) is None
+        mock_lazy_log_message.assert_called_once_with(log_format=log_format, record=record)
+        self.mock_transport_logger.logger.log.assert_called_once_with(level=level,
+                                                                      msg=mock_lazy_log_message.return_value)
+
+    @pytest.mark.parametrize("level, log_format, record", [
+        (INFO, "{record}", Mock()),
+        (DEBUG, Mock(), Mock()),
+    ])
+    @patch(f"{SCRIPT_LOCATION}._LazyLogMessage")
+    def test_log__queue(self, mock_lazy_log_message, level, log_format, record):
+        mock_queue_handler = Mock()
+        self.mock_transport_logger._TransportLogger__queue_handler = mock_queue_handler
+        assert TransportLogger._log(self.mock_transport_logger, level=level, log_format=log_format,
+                                    record=record) is None
+        mock_lazy_log_message.assert_called_once_with(log_format=log_format, record=record)
+        self.mock_transport_logger.logger.log.assert_not_called()
+        self.mock_transport_logger.logger.makeRecord.assert_called_once_with(
+            name=self.mock_transport_logger.logger.name,
+            level=level,
+            fn="(unknown file)",
+            lno=0,
+            msg=mock_lazy_log_message.return_value,
+            args=(),
+            exc_info=None)
+        mock_queue_handler.handle.assert_called_once_with(
+            self.mock_transport_logger.logger.makeRecord.return_value)
+
     # log_message
 
     @pytest.mark.parametrize("level, record", [
@@ -367,34 +466,212 @@ class TestTransportLogger:
     ])
     def test_log_message__log(self, level, record):
         self.mock_transport_logger.message_logging_level = level
+        self.mock_transport_logger.logger.isEnabledFor.return_value = True
         assert TransportLogger.log_message(self.mock_transport_logger, record) is None
-        self.mock_transport_logger.logger.log.assert_called_once_with(
+        self.mock_transport_logger.logger.isEnabledFor.assert_called_once_with(level)
+        self.mock_transport_logger._log.assert_called_once_with(
             level=level,
-            msg=self.mock_transport_logger.message_log_format.format.return_value)
-        self.mock_transport_logger.message_log_format.format.assert_called_once_with(record=record)
+            log_format=self.mock_transport_logger.message_log_format,
+            record=record)
+        self.mock_transport_logger.message_log_format.format.assert_not_called()
 
     def test_log_message__no_log(self):
         self.mock_transport_logger.message_logging_level = None
         assert TransportLogger.log_message(self.mock_transport_logger, Mock(spec=UdsMessageRecord)) is None
-        self.mock_transport_logger.logger.log.assert_not_called()
+        self.mock_transport_logger._log.assert_not_called()
+        self.mock_transport_logger.message_log_format.format.assert_not_called()
+
+    def test_log_message__disabled(self):
+        self.mock_transport_logger.message_logging_level = INFO
+        self.mock_transport_logger.logger.isEnabledFor.return_value = False
+        assert TransportLogger.log_message(self.mock_transport_logger, Mock(spec=UdsMessageRecord)) is None
+        self.mock_transport_logger.logger.isEnabledFor.assert_called_once_with(INFO)
+        self.mock_transport_logger._log.assert_not_called()
         self.mock_transport_logger.message_log_format.format.assert_not_called()
 
     # log_packet
-    
+
     @pytest.mark.parametrize("level, record", [
         (0, Mock(spec=AbstractPacketRecord)),
         (INFO, Mock(spec=AbstractPacketRecord)),
     ])
     def test_log_packet__log(self, level, record):
         self.mock_transport_logger.packet_logging_level = level
+        self.mock_transport_logger.logger.isEnabledFor.return_value = True
         assert TransportLogger.log_packet(self.mock_transport_logger, record) is None
-        self.mock_transport_logger.logger.log.assert_called_once_with(
+        self.mock_transport_logger.logger.isEnabledFor.assert_called_once_with(level)
+        self.mock_transport_logger._log.assert_called_once_with(
             level=level,
-            msg=self.mock_transport_logger.packet_log_format.format.return_value)
-        self.mock_transport_logger.packet_log_format.format.assert_called_once_with(record=record)
+            log_format=self.mock_transport_logger.packet_log_format,
+            record=record)
+        self.mock_transport_logger.packet_log_format.format.assert_not_called()
 
     def test_log_packet__no_log(self):
         self.mock_transport_logger.packet_logging_level = None
         assert TransportLogger.log_packet(self.mock_transport_logger, Mock(spec=AbstractPacketRecord)) is None
-        self.mock_transport_logger.logger.log.assert_not_called()
-        self.mock_transport_logger.message_log_format.format.assert_not_called()
+        self.mock_transport_logger._log.assert_not_called()
+        self.mock_transport_logger.packet_log_format.format.assert_not_called()
+
+    def test_log_packet__disabled(self):
+        self.mock_transport_logger.packet_logging_level = DEBUG
+        self.mock_transport_logger.logger.isEnabledFor.return_value = False
+        assert TransportLogger.log_packet(self.mock_transport_logger, Mock(spec=AbstractPacketRecord)) is None
+        self.mock_transport_logger.logger.isEnabledFor.assert_called_once_with(DEBUG)
+        self.mock_transport_logger._log.assert_not_called()
+        self.mock_transport_logger.packet_log_format.format.assert_not_called()
+
+
+class TestLazyLogMessage:
+    """Unit tests for `_LazyLogMessage` class."""
+
+    def test_init(self):
+        mock_log_format = Mock()
+        mock_record = Mock()
+        message = _LazyLogMessage(log_format=mock_log_format, record=mock_record)
+        assert message.log_format == mock_log_format
+        assert message.record == mock_record
+        mock_log_format.format.assert_not_called()
+
+    def test_str(self):
+        mock_log_format = Mock(format=Mock(return_value="formatted"))
+        mock_record = Mock()
+        assert str(_LazyLogMessage(log_format=mock_log_format, record=mock_record)) == "formatted"
+        mock_log_format.format.assert_called_once_with(record=mock_record)
+
+
+class TestDeferredQueueHandler:
+    """Unit tests for `_DeferredQueueHandler` class."""
+
+    def test_prepare(self):
+        mock_record = Mock(spec=LogRecord)
+        assert _DeferredQueueHandler.prepare(Mock(spec=_DeferredQueueHandler), mock_record) is mock_record
+        mock_record.getMessage.assert_not_called()
+
+
+class TestLoggerHandler:
+    """Unit tests for `_LoggerHandler` class."""
+
+    def test_init(self):
+        mock_logger = Mock()
+        assert _LoggerHandler(mock_logger).logger == mock_logger
+
+    def test_emit(self):
+        mock_handler = Mock(spec=_LoggerHandler, logger=Mock())
+        mock_record = Mock(spec=LogRecord)
+        assert _LoggerHandler.emit(mock_handler, mock_record) is None
+        mock_handler.logger.handle.assert_called_once_with(mock_record)
+
+
+class _CollectingHandler(Handler):
+    """Handler that collects formatted messages (optionally simulating slow I/O)."""
+
+    def __init__(self, delay=0.):
+        super().__init__()
+        self.delay = delay
+        self.messages = []
+        self.threads = set()
+
+    def emit(self, record):
+        sleep(self.delay)
+        self.messages.append(self.format(record))
+        self.threads.add(current_thread())
+
+
+@pytest.mark.integration
+class TestTransportLoggerIntegration:
+    """Integration tests for `TransportLogger` class."""
+
+    def setup_method(self):
+        self.logger = getLogger(f"{SCRIPT_LOCATION}.integration")
+        self.logger.propagate = False
+        self.handler = _CollectingHandler()
+        self.logger.addHandler(self.handler)
+
+    def teardown_method(self):
+        self.logger.removeHandler(self.handler)
+
+    def test_disabled_level__no_formatting(self):
+        self.logger.setLevel(INFO)
+        mock_raw_frame_data = PropertyMock()
+        mock_record = MagicMock(spec=AbstractPacketRecord)
+        type(mock_record).raw_frame_data = mock_raw_frame_data
+        transport_logger = TransportLogger(logger_name=self.logger.name,
+                                           packet_logging_level=DEBUG,
+                                           packet_log_format="{record.raw_frame_data}")
+        transport_logger.log_packet(mock_record)
+        assert self.handler.messages == []
+        mock_raw_frame_data.assert_not_called()
+
+    def test_direct(self):
+        self.logger.setLevel(DEBUG)
+        records = [Mock(spec=UdsMessageRecord) for _ in range(5)]
+        transport_logger = TransportLogger(logger_name=self.logger.name, message_log_format="{record}")
+        for record in records:
+            transport_logger.log_message(record)
+        assert self.handler.messages == [str(record) for record in records]
+        assert self.handler.threads == {current_thread()}
+
+    def test_queue(self):
+        self.logger.setLevel(DEBUG)
+        records = [Mock(spec=AbstractPacketRecord) for _ in range(5)]
+        transport_logger = TransportLogger(logger_name=self.logger.name, packet_log_format="{record}",
+                                           use_queue=True)
+        assert transport_logger.is_queue_listener_running is True
+        for record in records:
+            transport_logger.log_packet(record)
+        transport_logger.stop_queue_listener()
+        assert transport_logger.is_queue_listener_running is False
+        assert self.handler.messages == [str(record) for record in records]
+        assert current_thread() not in self.handler.threads
+
+
+@pytest.mark.performance
+class TestTransportLoggerPerformance:
+    """Performance tests for `TransportLogger` class."""
+
+    def setup_method(self):
+        self.logger = getLogger(f"{SCRIPT_LOCATION}.performance")
+        self.logger.setLevel(DEBUG)
+        self.logger.propagate = False
+        # handler that simulates slow I/O (e.g. writing to a file on a busy disk)
+        self.handler = _CollectingHandler(delay=0.002)
+        self.logger.addHandler(self.handler)
+
+    def teardown_method(self):
+        self.logger.removeHandler(self.handler)
+
+    @staticmethod
+    def _measure_st_min_jitter(transport_logger, st_min, packets_number):
+        """Simulate sending Consecutive Frames with STmin gaps and return the mean deviation from STmin [s]."""
+        timestamps = []
+        for _ in range(packets_number):
+            timestamps.append(perf_counter())
+            transport_logger.log_packet(Mock(spec=AbstractPacketRecord))
+            # STmin is measured from the moment when the previous Consecutive Frame was transmitted (and logged)
+            next_timestamp = perf_counter() + st_min
+            while perf_counter() < next_timestamp:
+                pass
+        deviations = [later - earlier - st_min for earlier, later in zip(timestamps[:-1], timestamps[1:])]
+        return sum(deviations) / len(deviations)
+
+    @pytest.mark.parametrize("st_min, packets_number", [
+        (0.001, 100),
+    ])
+    def test_st_min_jitter(self, st_min, packets_number):
+        # handlers attached by pytest logging plugin would distort the measurement
+        for handler in self.logger.handlers[:]:
+            if handler is not self.handler:
+                self.logger.removeHandler(handler)
+        direct_transport_logger = TransportLogger(logger_name=self.logger.name, packet_log_format="{record}")
+        direct_jitter = self._measure_st_min_jitter(direct_transport_logger, st_min=st_min,
+                                                    packets_number=packets_number)
+        queue_transport_logger = TransportLogger(logger_name=self.logger.name, packet_log_format="{record}",
+                                                 use_queue=True)
+        try:
+            queue_jitter = self._measure_st_min_jitter(queue_transport_logger, st_min=st_min,
+                                                       packets_number=packets_number)
+        finally:
+            queue_transport_logger.stop_queue_listener()
+        print(f"STmin jitter: direct = {direct_jitter * 1000:.3f} ms, queue = {queue_jitter * 1000:.3f} ms")
+        assert len(self.handler.messages) == 2 * packets_number
+        assert queue_jitter < direct_jitter
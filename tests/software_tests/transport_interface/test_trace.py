@@ -0,0 +1,105 @@
+import pytest
+from mock import Mock, patch
+
+from uds.transport_interface.trace import AbstractTraceWriter, LogRecord, TraceEntryType, TraceHandler, _LazyLogMessage
+
+SCRIPT_LOCATION = "uds.transport_interface.trace"
+
+
+class TestTraceEntryType:
+    """Unit tests for `TraceEntryType` class."""
+
+    def test_members(self):
+        assert TraceEntryType.is_member(TraceEntryType.PACKET)
+        assert TraceEntryType.is_member(TraceEntryType.MESSAGE)
+
+
+class TestAbstractTraceWriter:
+    """Unit tests for `AbstractTraceWriter` class."""
+
+    def setup_method(self):
+        self.mock_trace_writer = Mock(spec=AbstractTraceWriter)
+
+    def test_enter(self):
+        assert AbstractTraceWriter.__enter__(self.mock_trace_writer) is self.mock_trace_writer
+
+    def test_exit(self):
+        assert AbstractTraceWriter.__exit__(self.mock_trace_writer, None, None, None) is None
+        self.mock_trace_writer.close.assert_called_once_with()
+
+
+class TestTraceHandler:
+    """Unit tests for `TraceHandler` class."""
+
+    def setup_method(self):
+        self.mock_trace_handler = Mock(spec=TraceHandler)
+
+    # __init__
+
+    @pytest.mark.parametrize("level", [0, 10])
+    def test_init(self, level):
+        mock_trace_writer = Mock(spec=AbstractTraceWriter)
+        trace_handler = TraceHandler(trace_writer=mock_trace_writer, level=level)
+        assert trace_handler.trace_writer == mock_trace_writer
+        assert trace_handler.level == level
+
+    # trace_writer
+
+    def test_trace_writer__get(self):
+        self.mock_trace_handler._TraceHandler__trace_writer = Mock()
+        assert (TraceHandler.trace_writer.fget(self.mock_trace_handler)
+                == self.mock_trace_handler._TraceHandler__trace_writer)
+
+    @pytest.mark.parametrize("value", [None, Mock()])
+    def test_trace_writer__set__type_error(self, value):
+        with pytest.raises(TypeError):
+            TraceHandler.trace_writer.fset(self.mock_trace_handler, value)
+
+    def test_trace_writer__set__valid(self):
+        mock_trace_writer = Mock(spec=AbstractTraceWriter)
+        assert TraceHandler.trace_writer.fset(self.mock_trace_handler, mock_trace_writer) is None
+        assert self.mock_trace_handler._TraceHandler__trace_writer == mock_trace_writer
+
+    # emit
+
+    def test_emit__other_message(self):
+        mock_log_record = Mock(spec=LogRecord, msg="Some log message")
+        assert TraceHandler.emit(self.mock_trace_handler, mock_log_record) is None
+        self.mock_trace_handler.trace_writer.write.assert_not_called()
+        self.mock_trace_handler.handleError.assert_not_called()
+
+    def test_emit__transport_logger_message(self):
+        mock_log_record = Mock(spec=LogRecord, msg=_LazyLogMessage(log_format=Mock(), record=Mock()))
+        assert TraceHandler.emit(self.mock_trace_handler, mock_log_record) is None
+        self.mock_trace_handler.trace_writer.write.assert_called_once_with(mock_log_record.msg.record)
+        self.mock_trace_handler.handleError.assert_not_called()
+
+    def test_emit__error(self):
+        mock_log_record = Mock(spec=LogRecord, msg=_LazyLogMessage(log_format=Mock(), record=Mock()))
+        self.mock_trace_handler.trace_writer.write.side_effect = ValueError
+        assert TraceHandler.emit(self.mock_trace_handler, mock_log_record) is None
+        self.mock_trace_handler.handleError.assert_called_once_with(mock_log_record)
+
+    # flush
+
+    @pytest.mark.parametrize("is_closed", [True, False])
+    def test_flush(self, is_closed):
+        self.mock_trace_handler.trace_writer.is_closed = is_closed
+        assert TraceHandler.flush(self.mock_trace_handler) is None
+        if is_closed:
+            self.mock_trace_handler.trace_writer.flush.assert_not_called()
+        else:
+            self.mock_trace_handler.trace_writer.flush.assert_called_once_with()
+
+    # close
+
+    @pytest.mark.parametrize("is_closed", [True, False])
+    @patch(f"{SCRIPT_LOCATION}.Handler.close")
+    def test_close(self, mock_handler_close, is_closed):
+        self.mock_trace_handler.trace_writer.is_closed = is_closed
+        assert TraceHandler.close(self.mock_trace_handler) is None
+        if is_closed:
+            self.mock_trace_handler.trace_writer.close.assert_not_called()
+        else:
+            self.mock_trace_handler.trace_writer.close.assert_called_once_with()
+        mock_handler_close.assert_called_once_with()
@@ -43,6 +43,14 @@ class TestFunctions:
     def test_validate_raw_bytes__valid(self, example_raw_bytes):
         assert validate_raw_bytes(value=example_raw_bytes) is None
 
+    @pytest.mark.parametrize("value_type", [bytes, bytearray])
+    def test_validate_raw_bytes__valid__bytes_like(self, value_type):
+        class NotIterable(value_type):
+            def __iter__(self):
+                raise AssertionError("Bytes-like objects must not be validated byte by byte.")
+
+        assert validate_raw_bytes(value=NotIterable(range(256))) is None
+
     @pytest.mark.parametrize("value", [tuple(), [], bytearray(), bytes()])
     def test_validate_raw_bytes__invalid_empty(self, value):
         with pytest.raises(ValueError):
@@ -1,3 +1,6 @@
+from gc import collect, disable, enable
+from time import perf_counter
+
 import pytest
 from aenum import IntEnum, StrEnum
 
@@ -129,6 +132,17 @@ class TestValidatedEnum:
         with pytest.raises(ValueError):
             enum_class.validate_member(not_member)
 
+    # unhashable values
+
+    @pytest.mark.parametrize("enum_class, value", [
+        (ExampleByteEnum1, ["x", "y"]),
+        (ExampleByteEnum2, {"1": 2}),
+    ])
+    def test_unhashable_value(self, enum_class, value):
+        assert enum_class.is_member(value) is False
+        with pytest.raises(ValueError):
+            enum_class.validate_member(value)
+
 
 class TestExtendableEnum:
     """Unit tests for 'ExtendableEnum' class."""
@@ -287,6 +301,55 @@ class TestMultipleEnums:
         assert member.value == value
         assert isinstance(member, enum_class)
 
+    @pytest.mark.parametrize("name, value", [
+        ("V4", 0x33),
+        ("V5", 0x44),
+    ])
+    def test_add_member__validation(self, name, value):
+        assert self.ExtendableValidatedByteEnum.is_member(value) is False
+        member = self.ExtendableValidatedByteEnum.add_member(name=name, value=value)
+        assert self.ExtendableValidatedByteEnum.is_member(value) is True
+        assert self.ExtendableValidatedByteEnum.is_member(member) is True
+        assert self.ExtendableValidatedByteEnum.validate_member(value) is member
+        assert self.ExtendableValidatedByteEnum.validate_member(member) is member
+
+
+@pytest.mark.performance
+class TestValidatedEnumPerformance:
+    """Performance tests for `ValidatedEnum` class."""
+
+    class ExampleByteEnum(ValidatedEnum, ByteEnum):
+        A = 0x10
+        B = 0x22
+        C = 0x3E
+
+    @pytest.mark.parametrize("lookups_number", [100_000])
+    @pytest.mark.parametrize("value", [0x22, 0x00])
+    def test_is_member(self, lookups_number, value):
+        """Make sure that validation is faster than creation of enum member (with aenum)."""
+        def is_member_aenum(enum_value):
+            try:
+                self.ExampleByteEnum(enum_value)
+            except ValueError:
+                return False
+            return True
+
+        is_member = self.ExampleByteEnum.is_member
+        collect()
+        disable()
+        try:
+            timestamp_start = perf_counter()
+            for _ in range(lookups_number):
+                is_member_aenum(value)
+            aenum_time = perf_counter() - timestamp_start
+            timestamp_start = perf_counter()
+            for _ in range(lookups_number):
+                is_member(value)
+            is_member_time = perf_counter() - timestamp_start
+        finally:
+            enable()
+        assert is_member_time < aenum_time
+
 
 class TestEndianness:
     """Unit tests for `Endianness` class."""
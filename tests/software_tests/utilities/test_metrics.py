@@ -0,0 +1,320 @@
+from random import Random
+
+import pytest
+from mock import Mock, patch
+
+from uds.utilities.metrics import (
+    Histogram,
+    MetricsRegistry,
+    _escape_label_value,
+    _render_labels,
+    _validate_significant_digits,
+    export_prometheus_text,
+)
+
+SCRIPT_LOCATION = "uds.utilities.metrics"
+
+
+class TestHistogram:
+    """Unit tests for `Histogram` class."""
+
+    def setup_method(self):
+        self._patcher_validate_significant_digits = patch(f"{SCRIPT_LOCATION}._validate_significant_digits")
+        self.mock_validate_significant_digits = self._patcher_validate_significant_digits.start()
+
+    def teardown_method(self):
+        self._patcher_validate_significant_digits.stop()
+
+    # __init__
+
+    @pytest.mark.parametrize("significant_digits", [1, 3])
+    def test_init(self, significant_digits):
+        histogram = Histogram(significant_digits)
+        self.mock_validate_significant_digits.assert_called_once_with(significant_digits)
+        assert histogram.significant_digits == significant_digits
+        assert histogram.count == 0
+        assert histogram.sum == 0
+        assert histogram.min is None
+        assert histogram.max is None
+        assert histogram.mean is None
+
+    def test_init__default(self):
+        assert Histogram().significant_digits == Histogram.DEFAULT_SIGNIFICANT_DIGITS
+
+    # record
+
+    @pytest.mark.parametrize("value", [None, "1", (1,)])
+    def test_record__type_error(self, value):
+        with pytest.raises(TypeError):
+            Histogram().record(value)
+
+    @pytest.mark.parametrize("value", [-1, -0.001])
+    def test_record__value_error(self, value):
+        with pytest.raises(ValueError):
+            Histogram().record(value)
+
+    @pytest.mark.parametrize("values", [
+        [0],
+        [1.5, 0.25, 1000, 3],
+    ])
+    def test_record(self, values):
+        histogram = Histogram()
+        for value in values:
+            histogram.record(value)
+        assert histogram.count == len(values)
+        assert histogram.sum == pytest.approx(sum(values))
+        assert histogram.min == min(values)
+        assert histogram.max == max(values)
+        assert histogram.mean == pytest.approx(sum(values) / len(values))
+
+    # percentile
+
+    @pytest.mark.parametrize("percent", [-0.1, 100.01])
+    def test_percentile__value_error(self, percent):
+        with pytest.raises(ValueError):
+            Histogram().percentile(percent)
+
+    def test_percentile__no_values(self):
+        assert Histogram().percentile(50) is None
+
+    @pytest.mark.parametrize("significant_digits", [1, 2, 3])
+    @pytest.mark.parametrize("percent", [1, 50, 90, 99, 100])
+    def test_percentile__relative_error(self, significant_digits, percent):
+        random = Random(significant_digits)
+        values = sorted(random.uniform(0.01, 5000.) for _ in range(5000))
+        histogram = Histogram(significant_digits)
+        for value in values:
+            histogram.record(value)
+        expected_value = values[max(0, -(-len(values) * percent // 100) - 1)]
+        assert histogram.percentile(percent) == pytest.approx(expected_value, rel=10 ** -significant_digits)
+
+    @pytest.mark.parametrize("percent", [0, 100])
+    def test_percentile__limits(self, percent):
+        histogram = Histogram()
+        for value in (2.5, 7.5):
+            histogram.record(value)
+        assert histogram.percentile(percent) == (2.5 if percent == 0 else 7.5)
+
+    # snapshot
+
+    def test_snapshot__no_values(self):
+        assert Histogram().snapshot() == {"count": 0, "sum": 0, "min": None, "max": None, "mean": None,
+                                          "p50": None, "p90": None, "p99": None}
+
+    def test_snapshot(self):
+        histogram = Histogram()
+        for value in range(1, 101):
+            histogram.record(value)
+        snapshot = histogram.snapshot()
+        assert snapshot["count"] == 100
+        assert snapshot["sum"] == 5050
+        assert snapshot["min"] == 1
+        assert snapshot["max"] == 100
+        assert snapshot["mean"] == 50.5
+        assert snapshot["p50"] == pytest.approx(50, rel=0.01)
+        assert snapshot["p90"] == pytest.approx(90, rel=0.01)
+        assert snapshot["p99"] == pytest.approx(99, rel=0.01)
+
+    # clear
+
+    def test_clear(self):
+        histogram = Histogram()
+        histogram.record(10)
+        assert histogram.clear() is None
+        assert histogram.snapshot() == Histogram().snapshot()
+
+
+class TestMetricsRegistry:
+    """Unit tests for `MetricsRegistry` class."""
+
+    # __init__
+
+    @patch(f"{SCRIPT_LOCATION}._validate_significant_digits")
+    def test_init(self, mock_validate_significant_digits):
+        registry = MetricsRegistry(significant_digits=3)
+        mock_validate_significant_digits.assert_called_once_with(3)
+        assert registry.snapshot() == {"histograms": {}, "counters": {}}
+
+    # _get_key
+
+    @pytest.mark.parametrize("name", [None, 1, ("p2_client",)])
+    def test_get_key__type_error(self, name):
+        with pytest.raises(TypeError):
+            MetricsRegistry._get_key(name=name, labels={})
+
+    @pytest.mark.parametrize("name, labels, expected_key", [
+        ("p2_client", {}, ("p2_client", ())),
+        ("p2_client", {"sid": "0x22", "ecu": 0x7E8}, ("p2_client", (("ecu", "2024"), ("sid", "0x22")))),
+        ("timeouts", {"sid": "0x10", "ecu": None}, ("timeouts", (("sid", "0x10"),))),
+    ])
+    def test_get_key(self, name, labels, expected_key):
+        assert MetricsRegistry._get_key(name=name, labels=labels) == expected_key
+
+    # record
+
+    def test_record(self):
+        registry = MetricsRegistry()
+        registry.record("p2_client", 10, sid="0x22", ecu="0x7E8")
+        registry.record("p2_client", 30, ecu="0x7E8", sid="0x22")
+        registry.record("p2_client", 20, sid="0x22")
+        histograms = registry.snapshot()["histograms"]
+        assert histograms.keys() == {("p2_client", (("ecu", "0x7E8"), ("sid", "0x22"))),
+                                     ("p2_client", (("sid", "0x22"),))}
+        assert histograms[("p2_client", (("ecu", "0x7E8"), ("sid", "0x22")))]["count"] == 2
+        assert histograms[("p2_client", (("sid", "0x22"),))]["sum"] == 20
+
+    @pytest.mark.parametrize("value", [None, -1])
+    def test_record__invalid_value(self, value):
+        with pytest.raises((TypeError, ValueError)):
+            MetricsRegistry().record("n_as", value)
+
+    # increment
+
+    @pytest.mark.parametrize("value", [None, 1.])
+    def test_increment__type_error(self, value):
+        with pytest.raises(TypeError):
+            MetricsRegistry().increment("timeouts", value)
+
+    def test_increment__value_error(self):
+        with pytest.raises(ValueError):
+            MetricsRegistry().increment("timeouts", -1)
+
+    def test_increment(self):
+        registry = MetricsRegistry()
+        registry.increment("negative_responses", sid="0x31", nrc="0x22")
+        registry.increment("negative_responses", 4, sid="0x31", nrc="0x22")
+        registry.increment("negative_responses", sid="0x31", nrc="0x78")
+        assert registry.snapshot()["counters"] == {
+            ("negative_responses", (("nrc", "0x22"), ("sid", "0x31"))): 5,
+            ("negative_responses", (("nrc", "0x78"), ("sid", "0x31"))): 1,
+        }
+
+    def test_increment__label_names(self):
+        registry = MetricsRegistry()
+        registry.increment("custom", 2, name="abc", value="xyz")
+        assert registry.snapshot()["counters"] == {("custom", (("name", "abc"), ("value", "xyz"))): 2}
+
+    # snapshot
+
+    def test_snapshot__copy(self):
+        registry = MetricsRegistry()
+        registry.record("n_cr", 1.5)
+        registry.increment("timeouts")
+        snapshot = registry.snapshot()
+        registry.record("n_cr", 2.5)
+        registry.increment("timeouts")
+        assert snapshot["histograms"][("n_cr", ())]["count"] == 1
+        assert snapshot["counters"][("timeouts", ())] == 1
+
+    # clear
+
+    def test_clear(self):
+        registry = MetricsRegistry()
+        registry.record("n_cr", 1.5)
+        registry.increment("timeouts")
+        assert registry.clear() is None
+        assert registry.snapshot() == {"histograms": {}, "counters": {}}
+
+
+class TestFunctions:
+    """Unit tests for module functions."""
+
+    # _validate_significant_digits
+
+    @pytest.mark.parametrize("value", [None, 2., "2"])
+    def test_validate_significant_digits__type_error(self, value):
+        with pytest.raises(TypeError):
+            _validate_significant_digits(value)
+
+    @pytest.mark.parametrize("value", [0, 6, -1])
+    def test_validate_significant_digits__value_error(self, value):
+        with pytest.raises(ValueError):
+            _validate_significant_digits(value)
+
+    @pytest.mark.parametrize("value", [1, 2, 5])
+    def test_validate_significant_digits__valid(self, value):
+        assert _validate_significant_digits(value) is None
+
+    # _escape_label_value
+
+    @pytest.mark.parametrize("value, expected_value", [
+        ("0x7E8", "0x7E8"),
+        ('a"b', 'a\\"b'),
+        ("a\\b\nc", "a\\\\b\\nc"),
+    ])
+    def test_escape_label_value(self, value, expected_value):
+        assert _escape_label_value(value) == expected_value
+
+    # _render_labels
+
+    @pytest.mark.parametrize("labels, extra_labels, expected_text", [
+        ((), {}, ""),
+        ((("sid", "0x22"),), {}, '{sid="0x22"}'),
+        ((("ecu", "0x7E8"), ("sid", "0x22")), {"quantile": "0.5"}, '{ecu="0x7E8",sid="0x22",quantile="0.5"}'),
+    ])
+    def test_render_labels(self, labels, extra_labels, expected_text):
+        assert _render_labels(labels, **extra_labels) == expected_text
+
+    # export_prometheus_text
+
+    def test_export_prometheus_text__empty(self):
+        assert export_prometheus_text(Mock(__getitem__=Mock(return_value={}))) == ""
+
+    def test_export_prometheus_text(self):
+        snapshot = {
+            "histograms": {
+                ("p2_client", (("sid", "0x22"),)): {"count": 2, "sum": 30., "min": 10., "max": 20., "mean": 15.,
+                                                    "p50": 10., "p90": 20., "p99": 20.},
+                ("n_as", ()): {"count": 0, "sum": 0, "min": None, "max": None, "mean": None,
+                               "p50": None, "p90": None, "p99": None},
+            },
+            "counters": {
+                ("timeouts", (("sid", "0x22"), ("stage", "initial_response"))): 3,
+            },
+        }
+        assert export_prometheus_text(snapshot, namespace="test").splitlines() == [
+            "# TYPE test_n_as_milliseconds summary",
+            'test_n_as_milliseconds{quantile="0.5"} NaN',
+            'test_n_as_milliseconds{quantile="0.9"} NaN',
+            'test_n_as_milliseconds{quantile="0.99"} NaN',
+            "test_n_as_milliseconds_sum 0.0",
+            "test_n_as_milliseconds_count 0",
+            "# TYPE test_p2_client_milliseconds summary",
+            'test_p2_client_milliseconds{sid="0x22",quantile="0.5"} 10.0',
+            'test_p2_client_milliseconds{sid="0x22",quantile="0.9"} 20.0',
+            'test_p2_client_milliseconds{sid="0x22",quantile="0.99"} 20.0',
+            'test_p2_client_milliseconds_sum{sid="0x22"} 30.0',
+            'test_p2_client_milliseconds_count{sid="0x22"} 2',
+            "# TYPE test_timeouts_total counter",
+            'test_timeouts_total{sid="0x22",stage="initial_response"} 3',
+        ]
+
+
+@pytest.mark.integration
+class TestMetricsIntegration:
+    """Integration tests for metrics."""
+
+    def test_registry_to_prometheus_text(self):
+        registry = MetricsRegistry()
+        for value in (12.5, 14., 95.):
+            registry.record("p2_client", value, sid="0x22", ecu="0x7E8")
+        registry.increment("negative_responses", sid="0x22", ecu="0x7E8", nrc="0x31")
+        text = export_prometheus_text(registry.snapshot())
+        assert text.endswith("\n")
+        assert 'uds_p2_client_milliseconds_count{ecu="0x7E8",sid="0x22"} 3\n' in text
+        assert 'uds_p2_client_milliseconds{ecu="0x7E8",sid="0x22",quantile="0.99"} 95.0\n' in text
+        assert 'uds_negative_responses_total{ecu="0x7E8",nrc="0x31",sid="0x22"} 1\n' in text
+
+
+@pytest.mark.performance
+class TestMetricsPerformance:
+    """Performance tests for metrics."""
+
+    @pytest.mark.parametrize("samples_number", [100_000])
+    def test_histogram_memory(self, samples_number):
+        random = Random(0)
+        histogram = Histogram()
+        for _ in range(samples_number):
+            histogram.record(random.expovariate(1 / 20.))
+        # number of buckets depends on range of values, not on number of samples
+        assert len(histogram._Histogram__buckets) < 2000
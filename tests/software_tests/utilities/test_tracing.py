@@ -0,0 +1,303 @@
+from asyncio import run
+from gc import collect, disable, enable
+from json import load
+from time import perf_counter
+
+import pytest
+from mock import MagicMock, Mock, call, mock_open, patch
+
+from uds.addressing import AddressingType
+from uds.can import CanAddressingFormat, CanAddressingInformation, CanSegmenter
+from uds.message import UdsMessage
+from uds.translator import BASE_TRANSLATOR
+from uds.utilities.tracing import TRACING_HOOKS, Span, SpansRecorder, TracingHooks, export_chrome_trace
+
+SCRIPT_LOCATION = "uds.utilities.tracing"
+
+
+class TestTracingHooks:
+    """Unit tests for `TracingHooks` class."""
+
+    def setup_method(self):
+        self.mock_tracing_hooks = MagicMock(spec=TracingHooks,
+                                            _TracingHooks__hooks=(),
+                                            _TracingHooks__lock=MagicMock())
+        # patching
+        self._patcher_perf_counter_ns = patch(f"{SCRIPT_LOCATION}.perf_counter_ns")
+        self.mock_perf_counter_ns = self._patcher_perf_counter_ns.start()
+        self._patcher_get_ident = patch(f"{SCRIPT_LOCATION}.get_ident")
+        self.mock_get_ident = self._patcher_get_ident.start()
+
+    def teardown_method(self):
+        self._patcher_perf_counter_ns.stop()
+        self._patcher_get_ident.stop()
+
+    # __init__
+
+    def test_init(self):
+        tracing_hooks = TracingHooks()
+        assert tracing_hooks.hooks == ()
+        assert tracing_hooks.enabled is False
+
+    # enabled
+
+    @pytest.mark.parametrize("hooks, enabled", [
+        ((), False),
+        ((Mock(),), True),
+        ((Mock(), Mock()), True),
+    ])
+    def test_enabled(self, hooks, enabled):
+        self.mock_tracing_hooks._TracingHooks__hooks = hooks
+        assert TracingHooks.enabled.fget(self.mock_tracing_hooks) is enabled
+
+    # add_hook
+
+    @pytest.mark.parametrize("hook", [None, "hook", 1])
+    def test_add_hook__type_error(self, hook):
+        with pytest.raises(TypeError):
+            TracingHooks.add_hook(self.mock_tracing_hooks, hook)
+
+    def test_add_hook__value_error(self):
+        hook = Mock()
+        self.mock_tracing_hooks._TracingHooks__hooks = (hook,)
+        with pytest.raises(ValueError):
+            TracingHooks.add_hook(self.mock_tracing_hooks, hook)
+
+    def test_add_hook(self):
+        hook_1 = Mock()
+        hook_2 = Mock()
+        self.mock_tracing_hooks._TracingHooks__hooks = (hook_1,)
+        assert TracingHooks.add_hook(self.mock_tracing_hooks, hook_2) is None
+        assert self.mock_tracing_hooks._TracingHooks__hooks == (hook_1, hook_2)
+
+    # remove_hook
+
+    def test_remove_hook__value_error(self):
+        self.mock_tracing_hooks._TracingHooks__hooks = (Mock(),)
+        with pytest.raises(ValueError):
+            TracingHooks.remove_hook(self.mock_tracing_hooks, Mock())
+
+    def test_remove_hook(self):
+        hook_1 = Mock()
+        hook_2 = Mock()
+        self.mock_tracing_hooks._TracingHooks__hooks = (hook_1, hook_2)
+        assert TracingHooks.remove_hook(self.mock_tracing_hooks, hook_1) is None
+        assert self.mock_tracing_hooks._TracingHooks__hooks == (hook_2,)
+
+    # clear
+
+    def test_clear(self):
+        self.mock_tracing_hooks._TracingHooks__hooks = (Mock(), Mock())
+        assert TracingHooks.clear(self.mock_tracing_hooks) is None
+        assert self.mock_tracing_hooks._TracingHooks__hooks == ()
+
+    # emit
+
+    def test_emit(self):
+        hooks = (Mock(), Mock())
+        self.mock_tracing_hooks._TracingHooks__hooks = hooks
+        mock_span = Mock()
+        assert TracingHooks.emit(self.mock_tracing_hooks, mock_span) is None
+        for hook in hooks:
+            hook.assert_called_once_with(mock_span)
+
+    # span
+
+    def test_span__disabled(self):
+        with TracingHooks.span(self.mock_tracing_hooks, name="name", category="category") as attributes:
+            assert attributes is None
+        self.mock_perf_counter_ns.assert_not_called()
+        self.mock_tracing_hooks.emit.assert_not_called()
+
+    @pytest.mark.parametrize("name, category, attributes", [
+        ("send_message", "transport", {}),
+        ("some name", "some category", {"size": 10, "sid": "0x22"}),
+    ])
+    def test_span(self, name, category, attributes):
+        tracing_hooks = TracingHooks()
+        tracing_hooks.add_hook(Mock())
+        self.mock_perf_counter_ns.side_effect = [1000, 2500]
+        with patch.object(tracing_hooks, "emit") as mock_emit:
+            with tracing_hooks.span(name=name, category=category, **attributes) as span_attributes:
+                assert span_attributes == attributes
+        mock_emit.assert_called_once_with(Span(name=name,
+                                               category=category,
+                                               start_ns=1000,
+                                               end_ns=2500,
+                                               thread_id=self.mock_get_ident.return_value,
+                                               attributes=attributes))
+
+    def test_span__exception(self):
+        tracing_hooks = TracingHooks()
+        tracing_hooks.add_hook(Mock())
+        self.mock_perf_counter_ns.side_effect = [1000, 2500]
+        with patch.object(tracing_hooks, "emit") as mock_emit:
+            with pytest.raises(TimeoutError):
+                with tracing_hooks.span(name="name", category="category"):
+                    raise TimeoutError
+        mock_emit.assert_called_once()
+        assert mock_emit.call_args[0][0]["attributes"] == {"exception": "TimeoutError"}
+
+    # traced
+
+    @pytest.mark.parametrize("args, kwargs", [
+        ((), {}),
+        ((1, 2), {"x": "y"}),
+    ])
+    def test_traced__disabled(self, args, kwargs):
+        mock_function = Mock(__qualname__="function")
+        traced_function = TracingHooks().traced(category="category")(mock_function)
+        assert traced_function(*args, **kwargs) == mock_function.return_value
+        mock_function.assert_called_once_with(*args, **kwargs)
+        self.mock_perf_counter_ns.assert_not_called()
+
+    @pytest.mark.parametrize("category, name", [
+        ("client", None),
+        ("transport", "some name"),
+    ])
+    def test_traced(self, category, name):
+        mock_function = Mock(__qualname__="Class.method")
+        mock_hook = Mock()
+        tracing_hooks = TracingHooks()
+        tracing_hooks.add_hook(mock_hook)
+        self.mock_perf_counter_ns.side_effect = [1000, 2500]
+        traced_function = tracing_hooks.traced(category=category, name=name)(mock_function)
+        assert traced_function(1, x=2) == mock_function.return_value
+        mock_function.assert_called_once_with(1, x=2)
+        mock_hook.assert_called_once_with(Span(name="Class.method" if name is None else name,
+                                               category=category,
+                                               start_ns=1000,
+                                               end_ns=2500,
+                                               thread_id=self.mock_get_ident.return_value,
+                                               attributes={}))
+
+    def test_traced__async(self):
+        mock_function = Mock()
+
+        async def function(*args, **kwargs):
+            return mock_function(*args, **kwargs)
+
+        mock_hook = Mock()
+        tracing_hooks = TracingHooks()
+        traced_function = tracing_hooks.traced(category="category")(function)
+        assert run(traced_function(1, x=2)) == mock_function.return_value
+        mock_hook.assert_not_called()
+        tracing_hooks.add_hook(mock_hook)
+        self.mock_perf_counter_ns.side_effect = [1000, 2500]
+        assert run(traced_function(3)) == mock_function.return_value
+        mock_function.assert_has_calls([call(1, x=2), call(3)])
+        mock_hook.assert_called_once_with(Span(name=function.__qualname__,
+                                               category="category",
+                                               start_ns=1000,
+                                               end_ns=2500,
+                                               thread_id=self.mock_get_ident.return_value,
+                                               attributes={"async": True}))
+
+
+class TestSpansRecorder:
+    """Unit tests for `SpansRecorder` class."""
+
+    def test_init(self):
+        assert SpansRecorder().spans == ()
+
+    def test_call_and_clear(self):
+        spans = [Mock(), Mock(), Mock()]
+        recorder = SpansRecorder()
+        for span in spans:
+            assert recorder(span) is None
+        assert recorder.spans == tuple(spans)
+        assert recorder.clear() is None
+        assert recorder.spans == ()
+
+
+class TestFunctions:
+    """Unit tests for module functions."""
+
+    @patch(f"{SCRIPT_LOCATION}.getpid")
+    @patch(f"{SCRIPT_LOCATION}.dump")
+    @patch(f"{SCRIPT_LOCATION}.open", new_callable=mock_open)
+    def test_export_chrome_trace(self, mock_open_file, mock_dump, mock_getpid):
+        spans = [Span(name="send_message", category="transport", start_ns=1_000_000, end_ns=3_500_000,
+                      thread_id=15, attributes={}),
+                 Span(name="decode", category="translator", start_ns=4_000_000, end_ns=4_001_500,
+                      thread_id=16, attributes={"async": True})]
+        assert export_chrome_trace(spans=spans, file_path="trace.json") is None
+        mock_open_file.assert_called_once_with("trace.json", "w", encoding="utf-8")
+        mock_dump.assert_called_once_with({
+            "traceEvents": [
+                {"name": "send_message", "cat": "transport", "ph": "X", "ts": 1000., "dur": 2500.,
+                 "pid": mock_getpid.return_value, "tid": 15, "args": {}},
+                {"name": "decode", "cat": "translator", "ph": "X", "ts": 4000., "dur": 1.5,
+                 "pid": mock_getpid.return_value, "tid": 16, "args": {"async": True}},
+            ],
+            "displayTimeUnit": "ms"},
+            mock_open_file.return_value, default=str)
+
+
+@pytest.mark.integration
+class TestTracingIntegration:
+    """Integration tests for tracing."""
+
+    def setup_method(self):
+        TRACING_HOOKS.clear()
+
+    def teardown_method(self):
+        TRACING_HOOKS.clear()
+
+    def test_segmentation_and_translation(self, tmp_path):
+        addressing_information = CanAddressingInformation(addressing_format=CanAddressingFormat.NORMAL_ADDRESSING,
+                                                          rx_physical_params={"can_id": 0x7E8},
+                                                          tx_physical_params={"can_id": 0x7E0},
+                                                          rx_functional_params={"can_id": 0x7E8},
+                                                          tx_functional_params={"can_id": 0x7DF})
+        segmenter = CanSegmenter(addressing_information=addressing_information)
+        message = UdsMessage(payload=[0x22, 0xF1, 0x86, 0xF1, 0x90], addressing_type=AddressingType.PHYSICAL)
+        recorder = SpansRecorder()
+        TRACING_HOOKS.add_hook(recorder)
+        segmenter.segmentation(message)
+        with TRACING_HOOKS.span("decoding", "user", sid="0x22") as attributes:
+            BASE_TRANSLATOR.decode(message)
+            attributes["decoded"] = True
+        TRACING_HOOKS.remove_hook(recorder)
+        segmenter.segmentation(message)
+        spans = recorder.spans
+        assert [(span["name"], span["category"]) for span in spans] == [
+            ("CanSegmenter.segmentation", "segmentation"),
+            ("Translator.decode", "translator"),
+            ("decoding", "user"),
+        ]
+        assert spans[2]["attributes"] == {"sid": "0x22", "decoded": True}
+        assert spans[2]["start_ns"] <= spans[1]["start_ns"] <= spans[1]["end_ns"] <= spans[2]["end_ns"]
+        file_path = str(tmp_path / "trace.json")
+        export_chrome_trace(spans=spans, file_path=file_path)
+        with open(file_path, encoding="utf-8") as file:
+            trace = load(file)
+        assert [event["name"] for event in trace["traceEvents"]] == [span["name"] for span in spans]
+        assert all(event["ph"] == "X" and event["dur"] >= 0 for event in trace["traceEvents"])
+
+
+@pytest.mark.performance
+class TestTracingPerformance:
+    """Performance tests for tracing."""
+
+    @pytest.mark.parametrize("calls_number", [100_000])
+    def test_traced__disabled_overhead(self, calls_number):
+        def function(value):
+            return value
+
+        traced_function = TracingHooks().traced(category="category")(function)
+        collect()
+        disable()
+        try:
+            timestamp_start = perf_counter()
+            for value in range(calls_number):
+                function(value)
+            plain_time = perf_counter() - timestamp_start
+            timestamp_start = perf_counter()
+            for value in range(calls_number):
+                traced_function(value)
+            traced_time = perf_counter() - timestamp_start
+        finally:
+            enable()
+        # less than 1 microsecond overhead per call
+        assert traced_time - plain_time < calls_number * 1e-6
@@ -21,10 +21,12 @@ __all__ = [
     "addressing",
     "can",
     "client",
+    "procedures",
     "translator",
     "message",
     "packet",
     "segmentation",
+    "server",
     "transport_interface",
     "utilities",
     "__version__",
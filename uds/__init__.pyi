@@ -11,6 +11,7 @@ import uds.client as client
 import uds.message as message
 import uds.packet as packet
 import uds.segmentation as segmentation
+import uds.server as server
 import uds.translator as translator
 import uds.transport_interface as transport_interface
 import uds.utilities as utilities
@@ -19,7 +19,17 @@ It provides tools for:
     - First Frame
     - Consecutive Frame
     - Flow Status
+
+- binary traces of CAN packets and UDS messages
+- replay of recorded CAN communication
+
+Features that depend on python-can (Transport Interface and replay) are imported on the first access,
+so python-can is not imported together with this sub-package.
 """
+
+import importlib
+from typing import TYPE_CHECKING, Any, Dict, Sequence
+
 from .addressing import CanAddressingFormat, CanAddressingInformation
 from .frame import DEFAULT_FILLER_BYTE, CanDlcHandler, CanIdHandler, CanVersion
 from .packet import (
@@ -32,4 +42,31 @@ from .packet import (
     DefaultFlowControlParametersGenerator,
 )
 from .segmenter import CanSegmenter
-from .transport_interface import PythonCanTransportInterface
+from .trace import CanTraceEntry, CanTraceReader, CanTraceWriter
+
+if TYPE_CHECKING:
+    from .replay import CanReplayEngine, CanReplayStatistics, CanReplayStream
+    from .transport_interface import PythonCanTransportInterface
+
+_LAZY_IMPORTS_MODULES: Dict[str, str] = {
+    "CanReplayEngine": "replay",
+    "CanReplayStatistics": "replay",
+    "CanReplayStream": "replay",
+    "PythonCanTransportInterface": "transport_interface",
+}
+"""Mapping from names that are imported on the first access to names of modules where they are defined."""
+
+
+def __getattr__(name: str) -> Any:  # noqa: vulture
+    """Lazy imports of features that depend on python-can."""
+    if name in _LAZY_IMPORTS_MODULES:
+        module = importlib.import_module(f"{__name__}.{_LAZY_IMPORTS_MODULES[name]}")
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> Sequence[str]:  # noqa: vulture
+    """All attributes including the ones that are imported on the first access."""
+    return sorted({*globals(), *_LAZY_IMPORTS_MODULES})
@@ -2,7 +2,7 @@
 
 from .abstract_container import AbstractCanPacketContainer, CanPacketsContainersSequence
 from .can_packet import CanPacket
-from .can_packet_record import CanPacketRecord
+from .can_packet_record import CanPacketRecord, is_python_can_frame
 from .can_packet_type import CanPacketType
 from .consecutive_frame import (
     CONSECUTIVE_FRAME_N_PCI,
@@ -93,7 +93,7 @@ class AbstractCanPacketContainer(AbstractPacketContainer, ABC):
     def packet_type(self) -> CanPacketType:
         """Type (N_PCI value) of this CAN packet."""
         ai_data_bytes_number = CanAddressingInformation.get_ai_data_bytes_number(self.addressing_format)
-        return CanPacketType(self.raw_frame_data[ai_data_bytes_number] >> 4)
+        return CanPacketType.validate_member(self.raw_frame_data[ai_data_bytes_number] >> 4)
 
     @property
     def data_length(self) -> Optional[int]:
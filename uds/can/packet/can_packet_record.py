@@ -1,11 +1,11 @@
 """CAN bus specific implementation of packets records."""
 
-__all__ = ["CanPacketRecord", "CanFrameAlias"]
+__all__ = ["CanPacketRecord", "CanFrameAlias", "is_python_can_frame"]
 
+import sys
 from datetime import datetime
-from typing import Any, Union
+from typing import TYPE_CHECKING, Any, TypeGuard, Union
 
-from can import Message as PythonCanFrame
 from uds.addressing import AddressingType, TransmissionDirection
 from uds.packet import AbstractPacketRecord
 from uds.utilities import ReassignmentError, bytes_to_hex
@@ -14,10 +14,28 @@ from ..addressing import CanAddressingFormat, CanAddressingInformation
 from .abstract_container import AbstractCanPacketContainer
 from .can_packet_type import CanPacketType
 
-CanFrameAlias = Union[PythonCanFrame]
+if TYPE_CHECKING:
+    from can import Message as PythonCanFrame
+
+CanFrameAlias = Union["PythonCanFrame"]
 """Alias of supported CAN frames objects."""
 
 
+def is_python_can_frame(value: Any) -> TypeGuard["PythonCanFrame"]:
+    """
+    Check whether provided value is python-can frame object.
+
+    python-can is not imported by this function. If python-can was not imported yet,
+    then no python-can frame could have been created.
+
+    :param value: Value to check.
+
+    :return: True if provided value is a python-can frame, False otherwise.
+    """
+    python_can_message_module = sys.modules.get("can.message")
+    return python_can_message_module is not None and isinstance(value, python_can_message_module.Message)
+
+
 class CanPacketRecord(AbstractCanPacketContainer, AbstractPacketRecord):
     """
     Definition of a CAN packet record.
@@ -69,7 +87,7 @@ class CanPacketRecord(AbstractCanPacketContainer, AbstractPacketRecord):
 
         :raise NotImplementedError: There is missing implementation for the stored CAN Frame object type.
         """
-        if isinstance(self.frame, PythonCanFrame):
+        if is_python_can_frame(self.frame):
             return self.frame.arbitration_id
         raise NotImplementedError("Missing implementation for the currently stored CAN frame type: "
                                   f"{type(self.frame)}.")
@@ -81,7 +99,7 @@ class CanPacketRecord(AbstractCanPacketContainer, AbstractPacketRecord):
 
         :raise NotImplementedError: There is missing implementation for the stored CAN Frame object type.
         """
-        if isinstance(self.frame, PythonCanFrame):
+        if is_python_can_frame(self.frame):
             return bytes(self.frame.data)
         raise NotImplementedError("Missing implementation for the currently stored CAN frame type: "
                                   f"{type(self.frame)}.")
@@ -129,7 +147,7 @@ class CanPacketRecord(AbstractCanPacketContainer, AbstractPacketRecord):
 
         :raise TypeError: Provided frame object has unsupported type.
         """
-        if isinstance(value, PythonCanFrame):
+        if is_python_can_frame(value):
             return None
         raise TypeError(f"Unsupported CAN Frame type was provided. Actual type: {type(value)}")
 
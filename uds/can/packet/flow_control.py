@@ -352,7 +352,7 @@ def extract_flow_status(addressing_format: CanAddressingFormat, raw_frame_data:
     :return: Flow Status value carried by the provided Flow Control data.
     """
     ai_data_bytes_number = CanAddressingInformation.get_ai_data_bytes_number(addressing_format)
-    return CanFlowStatus(raw_frame_data[ai_data_bytes_number] & 0xF)
+    return CanFlowStatus.validate_member(raw_frame_data[ai_data_bytes_number] & 0xF)
 
 
 def extract_block_size(addressing_format: CanAddressingFormat, raw_frame_data: RawBytesAlias) -> int:
@@ -0,0 +1,332 @@
+"""Replay of recorded CAN communication (e.g. for regression and load testing without real ECUs)."""
+
+__all__ = ["CanReplayStatistics", "CanReplayStream", "CanReplayEngine"]
+
+from heapq import merge
+from statistics import mean, pstdev
+from threading import Event, Lock
+from time import perf_counter
+from typing import Iterable, List, Optional, Sequence, Tuple, TypedDict, Union
+
+from can import BusABC
+from can import Message as PythonCanFrame
+from uds.addressing import TransmissionDirection
+from uds.message import UdsMessageRecord
+from uds.packet import AbstractPacketRecord
+from uds.transport_interface.trace import TraceEntryType
+from uds.utilities import TimeMillisecondsAlias
+
+from .packet import CanPacketRecord
+from .trace import CanTraceEntry
+
+ReplayRecordAlias = Union[CanPacketRecord, UdsMessageRecord, CanTraceEntry]
+"""Alias of records that could be replayed."""
+
+
+class CanReplayStatistics(TypedDict):
+    """Statistics of a replay - how closely the replay matched the (scaled) original timing."""
+
+    frames_number: int  # noqa: vulture
+    """Number of frames that were sent."""
+    original_duration: TimeMillisecondsAlias  # noqa: vulture
+    """Time between the first and the last frame in the recording."""
+    replay_duration: TimeMillisecondsAlias  # noqa: vulture
+    """Time between the first and the last frame transmission during the replay."""
+    min_error: Optional[TimeMillisecondsAlias]  # noqa: vulture
+    """The smallest difference between actual and planned transmission time (None if timing was not kept)."""
+    max_error: Optional[TimeMillisecondsAlias]  # noqa: vulture
+    """The largest difference between actual and planned transmission time (None if timing was not kept)."""
+    mean_error: Optional[TimeMillisecondsAlias]  # noqa: vulture
+    """Mean difference between actual and planned transmission time (None if timing was not kept)."""
+    stdev_error: Optional[TimeMillisecondsAlias]  # noqa: vulture
+    """Standard deviation of differences between actual and planned transmission time
+    (None if timing was not kept)."""
+
+
+def _get_statistics(frames: Sequence[Tuple[float, PythonCanFrame]],
+                    timestamps: Sequence[float],
+                    errors: Sequence[float]) -> CanReplayStatistics:
+    """
+    Calculate replay statistics.
+
+    :param frames: Replayed frames with their recorded timestamps.
+    :param timestamps: Times when the frames were sent.
+    :param errors: Differences between actual and planned transmission times [s].
+        Empty if timing was not kept.
+
+    :return: Replay statistics.
+    """
+    errors_ms = [1000. * error for error in errors]
+    return CanReplayStatistics(frames_number=len(timestamps),
+                               original_duration=1000. * (frames[-1][0] - frames[0][0]),
+                               replay_duration=1000. * (timestamps[-1] - timestamps[0]),
+                               min_error=min(errors_ms) if errors_ms else None,
+                               max_error=max(errors_ms) if errors_ms else None,
+                               mean_error=mean(errors_ms) if errors_ms else None,
+                               stdev_error=pstdev(errors_ms) if errors_ms else None)
+
+
+class CanReplayStream:
+    """Recorded CAN frames of a single node (e.g. an ECU) that are replayed onto a CAN bus."""
+
+    def __init__(self,
+                 bus: BusABC,
+                 records: Iterable[ReplayRecordAlias],
+                 direction: Optional[TransmissionDirection] = None) -> None:
+        """
+        Create replay stream.
+
+        :param bus: python-can bus to send the frames to.
+        :param records: Recorded CAN packets, UDS messages (their packets are replayed) or binary trace entries.
+        :param direction: Replay only frames that were transmitted in this direction.
+            None if all frames are to be replayed.
+
+        :raise TypeError: Provided bus is not python-can bus object.
+        """
+        if not isinstance(bus, BusABC):
+            raise TypeError(f"Provided value is not python-can bus object. Actual type: {type(bus)}.")
+        self.__bus = bus
+        self.__direction = None if direction is None else TransmissionDirection.validate_member(direction)
+        self.__frames = tuple(sorted(self._get_frames(records=records, direction=self.__direction),
+                                     key=lambda timestamp_and_frame: timestamp_and_frame[0]))
+        self.__errors: List[float] = []
+        self.__timestamps: List[float] = []
+
+    @property
+    def bus(self) -> BusABC:
+        """Get python-can bus that frames are sent to."""
+        return self.__bus
+
+    @property
+    def direction(self) -> Optional[TransmissionDirection]:
+        """Get direction of the recorded frames that are replayed (None if all frames are replayed)."""
+        return self.__direction
+
+    @property
+    def frames(self) -> Tuple[Tuple[float, PythonCanFrame], ...]:
+        """Get recorded timestamps (:func:`time.perf_counter` values) and frames that are replayed."""
+        return self.__frames
+
+    @property  # noqa: vulture
+    def statistics(self) -> Optional[CanReplayStatistics]:
+        """Get statistics of the last replay of this stream (None if no frame was replayed)."""
+        if not self.__timestamps:
+            return None
+        return _get_statistics(frames=self.__frames[:len(self.__timestamps)],
+                               timestamps=self.__timestamps,
+                               errors=self.__errors)
+
+    @staticmethod
+    def _get_frames(records: Iterable[Union[ReplayRecordAlias, AbstractPacketRecord]],
+                    direction: Optional[TransmissionDirection]) -> List[Tuple[float, PythonCanFrame]]:
+        """
+        Get frames to replay.
+
+        :param records: Recorded CAN packets, UDS messages or binary trace entries
+            (entries with UDS messages are skipped as their packets are stored separately).
+        :param direction: Direction of frames to get. None if all frames are to be returned.
+
+        :raise TypeError: At least one of records has unsupported type.
+
+        :return: List with recorded timestamps and frames.
+        """
+        frames: List[Tuple[float, PythonCanFrame]] = []
+        for record in records:
+            if isinstance(record, UdsMessageRecord):
+                # direction is checked for each packet, e.g. Flow Control packets of a transmitted message are received
+                frames.extend(CanReplayStream._get_frames(records=record.packets_records, direction=direction))
+            elif isinstance(record, CanPacketRecord):
+                if direction is None or record.direction == direction:
+                    frames.append((record.transmission_timestamp, record.frame))
+            elif isinstance(record, CanTraceEntry):
+                if record.entry_type == TraceEntryType.PACKET and (direction is None or record.direction == direction):
+                    frames.append((record.transmission_timestamp,
+                                   PythonCanFrame(arbitration_id=record.can_id,
+                                                  is_extended_id=record.is_extended_id,
+                                                  is_fd=record.is_fd,
+                                                  bitrate_switch=record.bitrate_switch,
+                                                  data=record.data)))
+            else:
+                raise TypeError(f"Unsupported record type was provided. Actual type: {type(record)}.")
+        return frames
+
+    def clear_results(self) -> None:
+        """Clear results of the previous replay (called by the engine when a replay starts)."""
+        self.__errors.clear()
+        self.__timestamps.clear()
+
+    def add_result(self, timestamp: float, error: Optional[float]) -> None:
+        """
+        Store result of a frame transmission (called by the engine after each frame is sent).
+
+        :param timestamp: Time (:func:`time.perf_counter` value) when the frame was sent.
+        :param error: Difference between actual and planned transmission time [s].
+            None if timing was not kept.
+        """
+        self.__timestamps.append(timestamp)
+        if error is not None:
+            self.__errors.append(error)
+
+
+class CanReplayEngine:
+    """
+    Engine that replays recorded CAN communication of one or many nodes.
+
+    Frames of all streams are merged (by recorded timestamps) and sent from a single thread that keeps
+    the original timing (optionally accelerated) - it sleeps until shortly before the planned transmission time
+    and spins for the rest of it. This way :class:`~uds.can.transport_interface.python_can.PythonCanTransportInterface`
+    and :class:`~uds.client.Client` could be tested offline (e.g. with python-can virtual bus).
+    """
+
+    SPIN_TIME: float = 0.002
+    """Time [s] before the planned transmission when the engine stops sleeping and starts spinning."""
+
+    def __init__(self, speed: Optional[float] = 1.) -> None:
+        """
+        Create replay engine.
+
+        :param speed: Replay speed (e.g. 1 for original timing, 10 for 10x faster replay).
+            None if frames are to be sent as fast as possible.
+        """
+        self.speed = speed
+        self.__streams: List[CanReplayStream] = []
+        self.__lock = Lock()
+        self.__stop_event = Event()
+        self.__is_running = False
+
+    @property
+    def speed(self) -> Optional[float]:
+        """Get replay speed or None if frames are sent as fast as possible."""
+        return self.__speed
+
+    @speed.setter
+    def speed(self, value: Optional[float]) -> None:
+        """
+        Set replay speed.
+
+        :param value: Replay speed to set. None if frames are to be sent as fast as possible.
+
+        :raise TypeError: Provided value is not None or a number.
+        :raise ValueError: Provided value is not a positive number.
+        """
+        if value is not None:
+            if not isinstance(value, (int, float)):
+                raise TypeError(f"Provided value is not None or a number. Actual type: {type(value)}.")
+            if value <= 0:
+                raise ValueError(f"Provided value is not a positive number. Actual value: {value}.")
+        self.__speed = value
+
+    @property
+    def streams(self) -> Tuple[CanReplayStream, ...]:
+        """Get streams that are replayed."""
+        return tuple(self.__streams)
+
+    @property  # noqa: vulture
+    def is_running(self) -> bool:
+        """Get flag whether replay is in progress."""
+        return self.__is_running
+
+    def add_stream(self,
+                   bus: BusABC,
+                   records: Iterable[ReplayRecordAlias],
+                   direction: Optional[TransmissionDirection] = None) -> CanReplayStream:
+        """
+        Add recorded frames of a node to replay.
+
+        :param bus: python-can bus to send the frames to.
+        :param records: Recorded CAN packets, UDS messages (their packets are replayed) or binary trace entries.
+        :param direction: Replay only frames that were transmitted in this direction.
+            None if all frames are to be replayed.
+
+        :raise RuntimeError: Replay is in progress.
+
+        :return: Stream that was added.
+        """
+        stream = CanReplayStream(bus=bus, records=records, direction=direction)
+        with self.__lock:
+            if self.__is_running:
+                raise RuntimeError("Streams cannot be added while replay is in progress.")
+            self.__streams.append(stream)
+        return stream
+
+    def clear_streams(self) -> None:
+        """
+        Remove all streams.
+
+        :raise RuntimeError: Replay is in progress.
+        """
+        with self.__lock:
+            if self.__is_running:
+                raise RuntimeError("Streams cannot be removed while replay is in progress.")
+            self.__streams.clear()
+
+    def stop(self) -> None:
+        """Stop replay that is in progress (it could be called from any thread)."""
+        self.__stop_event.set()
+
+    def _wait_until(self, timestamp: float) -> bool:
+        """
+        Wait precisely until provided time.
+
+        :param timestamp: Time (:func:`time.perf_counter` value) to wait for.
+
+        :return: True if the time was reached, False if replay was stopped in the meantime.
+        """
+        remaining_time = timestamp - perf_counter() - self.SPIN_TIME
+        if remaining_time > 0 and self.__stop_event.wait(remaining_time):
+            return False
+        while perf_counter() < timestamp:
+            pass
+        return not self.__stop_event.is_set()
+
+    def run(self) -> Optional[CanReplayStatistics]:
+        """
+        Replay all streams (this call blocks until all frames are sent or replay is stopped).
+
+        :raise RuntimeError: Replay is already in progress.
+
+        :return: Statistics of the replay (for all streams), None if no frame was sent.
+        """
+        with self.__lock:
+            if self.__is_running:
+                raise RuntimeError("Replay is already in progress.")
+            self.__is_running = True
+            self.__stop_event.clear()
+            streams = tuple(self.__streams)
+        try:
+            for stream in streams:
+                stream.clear_results()
+            frames = list(merge(*[[(timestamp, stream_index, frame_index, frame)
+                                   for frame_index, (timestamp, frame) in enumerate(stream.frames)]
+                                  for stream_index, stream in enumerate(streams)]))
+            if not frames:
+                return None
+            speed = self.speed
+            recording_start = frames[0][0]
+            replay_start = perf_counter()
+            sent_frames: List[Tuple[float, PythonCanFrame]] = []
+            timestamps: List[float] = []
+            errors: List[float] = []
+            for recorded_timestamp, stream_index, _, frame in frames:
+                if speed is None:
+                    if self.__stop_event.is_set():
+                        break
+                    planned_timestamp = None
+                else:
+                    planned_timestamp = replay_start + (recorded_timestamp - recording_start) / speed
+                    if not self._wait_until(planned_timestamp):
+                        break
+                streams[stream_index].bus.send(frame)
+                timestamp = perf_counter()
+                error = None if planned_timestamp is None else timestamp - planned_timestamp
+                streams[stream_index].add_result(timestamp=timestamp, error=error)
+                sent_frames.append((recorded_timestamp, frame))
+                timestamps.append(timestamp)
+                if error is not None:
+                    errors.append(error)
+            if not timestamps:
+                return None
+            return _get_statistics(frames=sent_frames, timestamps=timestamps, errors=errors)
+        finally:
+            with self.__lock:
+                self.__is_running = False
@@ -9,7 +9,7 @@ from uds.addressing import AbstractAddressingInformation, AddressingType
 from uds.message import UdsMessage, UdsMessageRecord
 from uds.packet import AbstractPacket, AbstractPacketRecord
 from uds.segmentation import AbstractSegmenter, SegmentationError
-from uds.utilities import ValueWarning, validate_raw_byte
+from uds.utilities import TRACING_HOOKS, ValueWarning, validate_raw_byte
 
 from .addressing import AbstractCanAddressingInformation, CanAddressingFormat
 from .frame import DEFAULT_FILLER_BYTE, CanDlcHandler
@@ -317,6 +317,7 @@ class CanSegmenter(AbstractSegmenter):
                          dlc=None if self.use_data_optimization else self.dlc,
                          **self.addressing_information.tx_physical_params)
 
+    @TRACING_HOOKS.traced(category="segmentation")
     def desegmentation(self, packets: CanPacketsContainersSequence) -> Union[UdsMessage, UdsMessageRecord]:
         """
         Perform desegmentation of CAN packets.
@@ -346,6 +347,7 @@ class CanSegmenter(AbstractSegmenter):
             raise SegmentationError("Unexpectedly, something went wrong...")
         raise NotImplementedError("Missing implementation for the provided CAN Packet type.")
 
+    @TRACING_HOOKS.traced(category="segmentation")
     def segmentation(self, message: UdsMessage) -> Tuple[CanPacket, ...]:
         """
         Perform segmentation of a diagnostic message.
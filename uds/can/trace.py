@@ -0,0 +1,481 @@
+"""
+Compact binary traces of CAN packets and UDS messages.
+
+Trace file layout:
+
+- file header - magic bytes, format version and index interval
+- entries - fixed size entry header followed by raw data (frame data of a packet or payload of a message)
+- index entries - written after every :attr:`~uds.can.trace.CanTraceWriter.index_interval` entries,
+  they point at the first entry of the preceding chunk and at the previous index entry
+- footer - offset of the last index entry (present only if the trace was closed properly)
+"""
+
+__all__ = ["CanTraceEntry", "CanTraceWriter", "CanTraceReader"]
+
+from datetime import datetime, timedelta
+from mmap import ACCESS_READ, mmap
+from os import PathLike
+from struct import Struct
+from threading import Lock
+from typing import BinaryIO, Iterator, List, NamedTuple, Optional, Tuple, Union
+
+from uds.addressing import AddressingType, TransmissionDirection
+from uds.message import UdsMessageRecord
+from uds.packet import AbstractPacketRecord
+from uds.transport_interface.trace import AbstractTraceWriter, TraceEntryType
+
+from .addressing import CanAddressingFormat
+from .packet import CanPacketRecord, is_python_can_frame
+
+_FILE_HEADER = Struct("<8sHI")
+"""File header: magic bytes, format version, index interval."""
+_ENTRY_HEADER = Struct("<BBBBBqqIBI")
+"""Entry header: entry kind, frame flags, direction, addressing type, addressing format,
+transmission time [ns], transmission timestamp [ns], CAN ID, DLC, data length."""
+_INDEX_DATA = Struct("<qQQI")
+"""Index entry data: transmission time [ns] of the first entry in the chunk, offset of the chunk,
+offset of the previous index entry (0 if there is none), number of entries in the chunk."""
+_FOOTER = Struct("<Q8s")
+"""Footer: offset of the last index entry, magic bytes."""
+
+_FILE_MAGIC = b"UDSTRACE"
+_FOOTER_MAGIC = b"UDSTRIDX"
+_FORMAT_VERSION = 1
+
+_INDEX_KIND = 0
+_PACKET_KIND = 1
+_MESSAGE_KIND = 2
+_ENTRY_TYPES = {_PACKET_KIND: TraceEntryType.PACKET,
+                _MESSAGE_KIND: TraceEntryType.MESSAGE}
+_DIRECTIONS: Tuple[TransmissionDirection, ...] = (TransmissionDirection.RECEIVED, TransmissionDirection.TRANSMITTED)
+_ADDRESSING_TYPES: Tuple[AddressingType, ...] = (AddressingType.PHYSICAL, AddressingType.FUNCTIONAL)
+_ADDRESSING_FORMATS: Tuple[CanAddressingFormat, ...] = (CanAddressingFormat.NORMAL_ADDRESSING,
+                                                        CanAddressingFormat.NORMAL_FIXED_ADDRESSING,
+                                                        CanAddressingFormat.EXTENDED_ADDRESSING,
+                                                        CanAddressingFormat.MIXED_11BIT_ADDRESSING,
+                                                        CanAddressingFormat.MIXED_29BIT_ADDRESSING)
+_UNKNOWN_CODE = 0xFF
+
+_EXTENDED_ID_FLAG = 0x01
+_FD_FLAG = 0x02
+_BITRATE_SWITCH_FLAG = 0x04
+
+_NS_IN_S = 1_000_000_000
+_NS_IN_US = 1_000
+
+
+def _time_to_ns(value: datetime) -> int:
+    """
+    Convert time into a number of nanoseconds since the epoch.
+
+    :param value: Time to convert.
+
+    :return: Number of nanoseconds since the epoch.
+    """
+    return round(value.timestamp() * 1_000_000) * _NS_IN_US
+
+
+def _ns_to_time(value: int) -> datetime:
+    """
+    Convert a number of nanoseconds since the epoch into time.
+
+    :param value: Number of nanoseconds since the epoch.
+
+    :return: Local time.
+    """
+    seconds, nanoseconds = divmod(value, _NS_IN_S)
+    return datetime.fromtimestamp(seconds) + timedelta(microseconds=nanoseconds // _NS_IN_US)
+
+
+class CanTraceEntry(NamedTuple):
+    """Packet or UDS message record read from a binary trace."""
+
+    entry_type: TraceEntryType  # noqa: vulture
+    """Type of the stored record."""
+    direction: TransmissionDirection
+    """Information whether the record was transmitted or received."""
+    addressing_type: AddressingType
+    """Addressing type of the record."""
+    addressing_format: Optional[CanAddressingFormat]
+    """CAN Addressing Format used (None if unknown)."""
+    transmission_time_ns: int
+    """Time when the record was transmitted (nanoseconds since the epoch).
+    For UDS messages, this is the time of the last packet."""
+    transmission_timestamp_ns: int
+    """Timestamp (:func:`time.perf_counter` in nanoseconds) when the record was transmitted."""
+    can_id: int
+    """CAN Identifier of the frame (for UDS messages: CAN ID of the first packet)."""
+    is_extended_id: bool
+    """Flag whether the frame used extended (29-bit) CAN Identifier."""
+    is_fd: bool
+    """Flag whether it was CAN FD frame."""
+    bitrate_switch: bool
+    """Flag whether CAN FD frame used bitrate switch."""
+    dlc: int
+    """DLC of the frame (0 for UDS messages)."""
+    data: bytes
+    """Raw data of the frame (for packets) or payload (for UDS messages)."""
+
+    @property
+    def transmission_time(self) -> datetime:
+        """Time when the record was transmitted."""
+        return _ns_to_time(self.transmission_time_ns)
+
+    @property
+    def transmission_timestamp(self) -> float:
+        """Timestamp (:func:`time.perf_counter` value) when the record was transmitted."""
+        return self.transmission_timestamp_ns / _NS_IN_S
+
+
+class CanTraceWriter(AbstractTraceWriter):
+    """
+    Streaming writer of compact, append-only binary traces with CAN packets and UDS messages.
+
+    Use it together with :class:`~uds.transport_interface.trace.TraceHandler` to store all records
+    logged by :class:`~uds.transport_interface.logger.TransportLogger`.
+    """
+
+    DEFAULT_INDEX_INTERVAL: int = 1024
+    """Default number of entries between index entries."""
+    BUFFER_SIZE: int = 64 * 1024
+    """Size of the write buffer [bytes]."""
+
+    def __init__(self,
+                 file: Union[str, "PathLike[str]", BinaryIO],
+                 index_interval: int = DEFAULT_INDEX_INTERVAL) -> None:
+        """
+        Create a new binary trace.
+
+        :param file: Path to the trace file (it would be overwritten) or a binary stream opened for writing.
+        :param index_interval: Number of entries between index entries.
+
+        :raise TypeError: Provided index interval value is not int type.
+        :raise ValueError: Provided index interval value is not a positive number.
+        """
+        if not isinstance(index_interval, int):
+            raise TypeError(f"Provided index interval value is not int type. Actual type: {type(index_interval)}.")
+        if index_interval <= 0:
+            raise ValueError(f"Provided index interval value is not a positive number. "
+                             f"Actual value: {index_interval}.")
+        self.__index_interval = index_interval
+        self.__lock = Lock()
+        self.__owns_stream = isinstance(file, (str, PathLike))
+        self.__stream: BinaryIO
+        if isinstance(file, (str, PathLike)):
+            # the stream stays open till the trace is closed, so 'with' statement cannot be used
+            self.__stream = open(file, "wb", buffering=self.BUFFER_SIZE)  # pylint: disable=consider-using-with
+        else:
+            self.__stream = file
+        self.__is_closed = False
+        self.__entries_number = 0
+        self.__chunk_entries_number = 0
+        self.__chunk_offset = _FILE_HEADER.size
+        self.__chunk_time_ns = 0
+        self.__last_index_offset = 0
+        self.__offset = 0
+        self.__write(_FILE_HEADER.pack(_FILE_MAGIC, _FORMAT_VERSION, index_interval))
+
+    @property
+    def index_interval(self) -> int:
+        """Get number of entries between index entries."""
+        return self.__index_interval
+
+    @property  # noqa: vulture
+    def entries_number(self) -> int:
+        """Get number of packet and UDS message entries written."""
+        return self.__entries_number
+
+    @property  # noqa: vulture
+    def is_closed(self) -> bool:
+        """Get flag whether the trace is already closed."""
+        return self.__is_closed
+
+    def __write(self, data: bytes) -> None:
+        """
+        Write data to the stream and update the offset.
+
+        :param data: Data to write.
+        """
+        self.__stream.write(data)
+        self.__offset += len(data)
+
+    def __write_index(self) -> None:
+        """Write index entry for the current chunk of entries."""
+        index_offset = self.__offset
+        self.__write(_ENTRY_HEADER.pack(_INDEX_KIND, 0, 0, 0, 0, self.__chunk_time_ns, 0, 0, 0, _INDEX_DATA.size)
+                     + _INDEX_DATA.pack(self.__chunk_time_ns, self.__chunk_offset, self.__last_index_offset,
+                                        self.__chunk_entries_number))
+        self.__last_index_offset = index_offset
+        self.__chunk_entries_number = 0
+        self.__chunk_offset = self.__offset
+
+    def __write_entry(self,
+                      kind: int,
+                      flags: int,
+                      direction: TransmissionDirection,
+                      addressing_type: AddressingType,
+                      addressing_format: Optional[CanAddressingFormat],
+                      time_ns: int,
+                      timestamp_ns: int,
+                      can_id: int,
+                      dlc: int,
+                      data: bytes) -> None:
+        """
+        Write a single entry.
+
+        :param kind: Entry kind code.
+        :param flags: Frame flags.
+        :param direction: Direction of the record.
+        :param addressing_type: Addressing type of the record.
+        :param addressing_format: CAN Addressing Format of the record.
+        :param time_ns: Transmission time in nanoseconds since the epoch.
+        :param timestamp_ns: Transmission timestamp in nanoseconds.
+        :param can_id: CAN Identifier.
+        :param dlc: DLC value.
+        :param data: Raw data to store.
+
+        :raise ValueError: The trace is already closed.
+        """
+        with self.__lock:
+            if self.__is_closed:
+                raise ValueError("Trace is already closed.")
+            if self.__chunk_entries_number == 0:
+                self.__chunk_time_ns = time_ns
+            self.__write(_ENTRY_HEADER.pack(kind,
+                                            flags,
+                                            _DIRECTIONS.index(direction),
+                                            _ADDRESSING_TYPES.index(addressing_type),
+                                            (_UNKNOWN_CODE if addressing_format is None
+                                             else _ADDRESSING_FORMATS.index(addressing_format)),
+                                            time_ns,
+                                            timestamp_ns,
+                                            can_id,
+                                            dlc,
+                                            len(data)) + data)
+            self.__entries_number += 1
+            self.__chunk_entries_number += 1
+            if self.__chunk_entries_number >= self.__index_interval:
+                self.__write_index()
+
+    @staticmethod
+    def __get_frame_flags(frame: object) -> int:
+        """
+        Get flags of CAN frame.
+
+        :param frame: CAN frame object.
+
+        :return: Value of frame flags.
+        """
+        if is_python_can_frame(frame):
+            return ((_EXTENDED_ID_FLAG if frame.is_extended_id else 0)
+                    | (_FD_FLAG if frame.is_fd else 0)
+                    | (_BITRATE_SWITCH_FLAG if frame.bitrate_switch else 0))
+        return 0
+
+    def write_packet_record(self, record: CanPacketRecord) -> None:
+        """
+        Append CAN packet record to the trace.
+
+        :param record: CAN packet record to store.
+        """
+        self.__write_entry(kind=_PACKET_KIND,
+                           flags=self.__get_frame_flags(record.frame),
+                           direction=record.direction,
+                           addressing_type=record.addressing_type,
+                           addressing_format=record.addressing_format,
+                           time_ns=_time_to_ns(record.transmission_time),
+                           timestamp_ns=round(record.transmission_timestamp * _NS_IN_S),
+                           can_id=record.can_id,
+                           dlc=record.dlc,
+                           data=record.raw_frame_data)
+
+    def write_message_record(self, record: UdsMessageRecord) -> None:
+        """
+        Append UDS message record to the trace.
+
+        :param record: UDS message record to store.
+        """
+        first_packet_record = record.packets_records[0]
+        if isinstance(first_packet_record, CanPacketRecord):
+            flags = self.__get_frame_flags(first_packet_record.frame)
+            addressing_format: Optional[CanAddressingFormat] = first_packet_record.addressing_format
+            can_id = first_packet_record.can_id
+        else:
+            flags, addressing_format, can_id = 0, None, 0
+        self.__write_entry(kind=_MESSAGE_KIND,
+                           flags=flags,
+                           direction=record.direction,
+                           addressing_type=record.addressing_type,
+                           addressing_format=addressing_format,
+                           time_ns=_time_to_ns(record.transmission_end_time),
+                           timestamp_ns=round(record.transmission_end_timestamp * _NS_IN_S),
+                           can_id=can_id,
+                           dlc=0,
+                           data=record.payload)
+
+    def write(self, record: Union[UdsMessageRecord, AbstractPacketRecord]) -> None:
+        """
+        Append a record to the trace.
+
+        :param record: CAN packet or UDS message record to store.
+
+        :raise TypeError: Provided value is neither CAN packet record nor UDS message record.
+        """
+        if isinstance(record, CanPacketRecord):
+            self.write_packet_record(record)
+        elif isinstance(record, UdsMessageRecord):
+            self.write_message_record(record)
+        else:
+            raise TypeError(f"Provided value is neither CAN packet record nor UDS message record. "
+                            f"Actual type: {type(record)}.")
+
+    def flush(self) -> None:
+        """Flush buffered entries to the trace."""
+        with self.__lock:
+            self.__stream.flush()
+
+    def close(self) -> None:
+        """Write the last index entry with the footer and close the trace."""
+        with self.__lock:
+            if self.__is_closed:
+                return
+            if self.__chunk_entries_number > 0:
+                self.__write_index()
+            if self.__last_index_offset != 0:
+                self.__write(_FOOTER.pack(self.__last_index_offset, _FOOTER_MAGIC))
+            self.__stream.flush()
+            if self.__owns_stream:
+                self.__stream.close()
+            self.__is_closed = True
+
+
+class CanTraceReader:
+    """Reader of binary traces created by :class:`~uds.can.trace.CanTraceWriter`."""
+
+    def __init__(self, file_path: Union[str, "PathLike[str]"]) -> None:
+        """
+        Open a binary trace for reading.
+
+        :param file_path: Path to the trace file.
+
+        :raise ValueError: Provided file is not a valid trace.
+        """
+        with open(file_path, "rb") as file:
+            try:
+                self.__mmap = mmap(file.fileno(), 0, access=ACCESS_READ)
+            except ValueError as exception:
+                raise ValueError("Provided file is not a valid trace (it is empty).") from exception
+        if len(self.__mmap) < _FILE_HEADER.size:
+            self.__mmap.close()
+            raise ValueError("Provided file is not a valid trace (it is too short).")
+        magic, version, index_interval = _FILE_HEADER.unpack_from(self.__mmap, 0)
+        if magic != _FILE_MAGIC or version != _FORMAT_VERSION:
+            self.__mmap.close()
+            raise ValueError(f"Provided file is not a valid trace. Magic: {magic!r}, version: {version}.")
+        self.__index_interval: int = index_interval
+        self.__end_offset = len(self.__mmap)
+        self.__last_index_offset = 0
+        if self.__end_offset >= _FILE_HEADER.size + _FOOTER.size:
+            last_index_offset, footer_magic = _FOOTER.unpack_from(self.__mmap, self.__end_offset - _FOOTER.size)
+            if footer_magic == _FOOTER_MAGIC:
+                self.__end_offset -= _FOOTER.size
+                self.__last_index_offset = last_index_offset
+        self.__chunks: Optional[List[Tuple[int, int]]] = None
+
+    def __enter__(self) -> "CanTraceReader":
+        """Enter the context manager."""
+        return self
+
+    def __exit__(self, *args: object) -> None:  # noqa: vulture
+        """Close the trace when leaving the context manager."""
+        self.close()
+
+    def __iter__(self) -> Iterator[CanTraceEntry]:
+        """Iterate over all entries in the trace."""
+        return self.iter_entries()
+
+    @property
+    def index_interval(self) -> int:
+        """Get number of entries between index entries."""
+        return self.__index_interval
+
+    @property  # noqa: vulture
+    def is_complete(self) -> bool:
+        """Get flag whether the trace was closed properly (it contains footer with the index)."""
+        return self.__last_index_offset != 0
+
+    @property
+    def chunks(self) -> List[Tuple[int, int]]:
+        """
+        Get index of the trace.
+
+        :return: List with transmission time [ns] of the first entry and offset of each chunk of entries.
+            The list is empty for traces that were not closed properly.
+        """
+        if self.__chunks is None:
+            chunks = []
+            index_offset = self.__last_index_offset
+            while index_offset != 0:
+                time_ns, chunk_offset, index_offset, _ = _INDEX_DATA.unpack_from(self.__mmap,
+                                                                                 index_offset + _ENTRY_HEADER.size)
+                chunks.append((time_ns, chunk_offset))
+            chunks.reverse()
+            self.__chunks = chunks
+        return self.__chunks
+
+    def close(self) -> None:
+        """Close the trace."""
+        self.__mmap.close()
+
+    def __find_offset(self, start_time_ns: int) -> int:
+        """
+        Find offset of the chunk which contains entries transmitted at the provided time.
+
+        :param start_time_ns: Transmission time [ns] to look for.
+
+        :return: Offset to start reading entries from.
+        """
+        offset = _FILE_HEADER.size
+        for chunk_time_ns, chunk_offset in self.chunks:
+            if chunk_time_ns > start_time_ns:
+                break
+            offset = chunk_offset
+        return offset
+
+    def iter_entries(self, start_time: Optional[datetime] = None) -> Iterator[CanTraceEntry]:
+        """
+        Iterate lazily over entries in the trace.
+
+        Incomplete entry at the end of the trace (e.g. if writing was interrupted) is ignored.
+
+        :param start_time: Skip entries that were transmitted before this time.
+            The index is used to skip the chunks of older entries.
+
+        :return: Generator of the trace entries.
+        """
+        start_time_ns = None if start_time is None else _time_to_ns(start_time)
+        offset = _FILE_HEADER.size if start_time_ns is None else self.__find_offset(start_time_ns)
+        buffer = self.__mmap
+        end_offset = self.__end_offset
+        while offset + _ENTRY_HEADER.size <= end_offset:
+            (kind, flags, direction, addressing_type, addressing_format, time_ns, timestamp_ns, can_id, dlc,
+             data_length) = _ENTRY_HEADER.unpack_from(buffer, offset)
+            data_offset = offset + _ENTRY_HEADER.size
+            offset = data_offset + data_length
+            if offset > end_offset:
+                return
+            if kind == _INDEX_KIND or (start_time_ns is not None and time_ns < start_time_ns):
+                continue
+            yield CanTraceEntry(entry_type=_ENTRY_TYPES[kind],
+                                direction=_DIRECTIONS[direction],
+                                addressing_type=_ADDRESSING_TYPES[addressing_type],
+                                addressing_format=(None if addressing_format == _UNKNOWN_CODE
+                                                   else _ADDRESSING_FORMATS[addressing_format]),
+                                transmission_time_ns=time_ns,
+                                transmission_timestamp_ns=timestamp_ns,
+                                can_id=can_id,
+                                is_extended_id=bool(flags & _EXTENDED_ID_FLAG),
+                                is_fd=bool(flags & _FD_FLAG),
+                                bitrate_switch=bool(flags & _BITRATE_SWITCH_FLAG),
+                                dlc=dlc,
+                                data=buffer[data_offset:offset])
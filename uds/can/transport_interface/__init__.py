@@ -1,4 +1,28 @@
-"""Transport Interfaces for CAN bus."""
+"""
+Transport Interfaces for CAN bus.
+
+:class:`~uds.can.transport_interface.python_can.PythonCanTransportInterface` is imported on the first access,
+so python-can is not imported until it is used.
+"""
+
+import importlib
+from typing import TYPE_CHECKING, Any, Sequence
 
 from .common import AbstractCanTransportInterface
-from .python_can import PythonCanTransportInterface
+
+if TYPE_CHECKING:
+    from .python_can import PythonCanTransportInterface
+
+
+def __getattr__(name: str) -> Any:  # noqa: vulture
+    """Lazy import of Transport Interfaces that depend on python-can."""
+    if name == "PythonCanTransportInterface":
+        value = importlib.import_module(f"{__name__}.python_can").PythonCanTransportInterface
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> Sequence[str]:  # noqa: vulture
+    """All attributes including the ones that are imported on the first access."""
+    return sorted({*globals(), "PythonCanTransportInterface"})
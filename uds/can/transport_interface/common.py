@@ -3,14 +3,13 @@
 __all__ = ["AbstractCanTransportInterface"]
 
 from abc import ABC, abstractmethod
-from asyncio import AbstractEventLoop
-from typing import Any, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Optional, Tuple
 from warnings import warn
 
 from uds.addressing import TransmissionDirection
 from uds.message import UdsMessageRecord
 from uds.transport_interface import AbstractTransportInterface
-from uds.utilities import TimeMillisecondsAlias, ValueWarning
+from uds.utilities import MetricsRegistry, TimeMillisecondsAlias, ValueWarning
 
 from ..addressing import AbstractCanAddressingInformation
 from ..frame import CanVersion
@@ -23,6 +22,9 @@ from ..packet import (
 )
 from ..segmenter import CanSegmenter
 
+if TYPE_CHECKING:
+    from asyncio import AbstractEventLoop
+
 
 class AbstractCanTransportInterface(AbstractTransportInterface, ABC):
     """
@@ -64,6 +66,7 @@ class AbstractCanTransportInterface(AbstractTransportInterface, ABC):
                  = DEFAULT_FLOW_CONTROL_PARAMETERS,
                  can_version: CanVersion = CanVersion.CLASSIC_CAN,
                  bitrate_switch: bool = False,
+                 metrics: Optional[MetricsRegistry] = None,
                  **segmenter_configuration: Any) -> None:
         """
         Create Transport Interface (an object for handling UDS Transport and Network layers).
@@ -80,6 +83,8 @@ class AbstractCanTransportInterface(AbstractTransportInterface, ABC):
         :param flow_control_parameters_generator: Generator with Flow Control parameters to use.
         :param can_version: Version of CAN protocol to be used for packets sending.
         :param bitrate_switch: Whether bitrate switch (BRS) shall be set in sent packets.
+        :param metrics: Registry where measured values of CAN communication parameters are collected.
+            Leave None to not collect metrics.
         :param segmenter_configuration: Configuration parameters for CAN Segmenter.
 
             - :parameter dlc: Base CAN DLC value to use for CAN packets.
@@ -104,6 +109,7 @@ class AbstractCanTransportInterface(AbstractTransportInterface, ABC):
         self.segmenter = CanSegmenter(addressing_information=addressing_information, **segmenter_configuration)
         self.can_version = can_version
         self.bitrate_switch = bitrate_switch
+        self.metrics = metrics
 
     # General
 
@@ -125,6 +131,24 @@ class AbstractCanTransportInterface(AbstractTransportInterface, ABC):
             raise TypeError(f"Provided value is not CAN Segmenter type. Actual type: {type(value)}.")
         self.__segmenter = value
 
+    @property
+    def metrics(self) -> Optional[MetricsRegistry]:
+        """Get registry where measured values of CAN communication parameters are collected."""
+        return self.__metrics
+
+    @metrics.setter
+    def metrics(self, value: Optional[MetricsRegistry]) -> None:
+        """
+        Set registry where measured values of CAN communication parameters are collected.
+
+        :param value: Metrics registry to use or None to stop collecting metrics.
+
+        :raise TypeError: Provided value is neither None nor an instance of MetricsRegistry class.
+        """
+        if value is not None and not isinstance(value, MetricsRegistry):
+            raise TypeError(f"Provided value is not an instance of MetricsRegistry class. Actual type: {type(value)}.")
+        self.__metrics = value
+
     # Communication parameters
 
     @property
@@ -514,6 +538,8 @@ class AbstractCanTransportInterface(AbstractTransportInterface, ABC):
             warn("Measured value of N_Ar was greater than N_Ar timeout.",
                  category=ValueWarning)
         self.__n_ar_measured = value
+        if self.metrics is not None:
+            self.metrics.record("n_ar", value)
 
     def _update_n_as_measured(self, value: TimeMillisecondsAlias) -> None:
         """
@@ -532,11 +558,16 @@ class AbstractCanTransportInterface(AbstractTransportInterface, ABC):
             warn("Measured value of N_As was greater than N_As timeout.",
                  category=ValueWarning)
         self.__n_as_measured = value
+        if self.metrics is not None:
+            self.metrics.record("n_as", value)
 
     def _update_n_bs_measured(self, message_record: UdsMessageRecord) -> None:
         """
         Update measured values of :ref:`N_Bs <knowledge-base-can-n-bs>` according to timestamps of CAN packet records.
 
+        If metrics are collected, then achieved separation times between transmitted Consecutive Frames
+        (compared with :ref:`STmin <knowledge-base-can-st-min>`) are recorded as well.
+
         :param message_record: Record of UDS message transmitted over CAN.
 
         :raise TypeError: Provided value is not UDS message record.
@@ -556,6 +587,16 @@ class AbstractCanTransportInterface(AbstractTransportInterface, ABC):
                             - message_record.packets_records[i].transmission_timestamp)
                     n_bs_measured.append(round(n_bs * 1000, 3))
             self.__n_bs_measured = tuple(n_bs_measured)
+            if self.metrics is not None:
+                for n_bs in n_bs_measured:
+                    self.metrics.record("n_bs", n_bs)
+                for previous_packet_record, packet_record in zip(message_record.packets_records,
+                                                                 message_record.packets_records[1:]):
+                    if (previous_packet_record.packet_type == packet_record.packet_type
+                            == CanPacketType.CONSECUTIVE_FRAME):
+                        self.metrics.record("st_min_achieved",
+                                            (packet_record.transmission_timestamp
+                                             - previous_packet_record.transmission_timestamp) * 1000.)
 
     def _update_n_cr_measured(self, message_record: UdsMessageRecord) -> None:
         """
@@ -580,6 +621,9 @@ class AbstractCanTransportInterface(AbstractTransportInterface, ABC):
                             - message_record.packets_records[i].transmission_timestamp)
                     n_cr_measured.append(round(n_cr * 1000, 3))
             self.__n_cr_measured = tuple(n_cr_measured)
+            if self.metrics is not None:
+                for n_cr in n_cr_measured:
+                    self.metrics.record("n_cr", n_cr)
 
     def clear_measurements(self) -> None:
         """Clear measured values of CAN communication parameters."""
@@ -603,7 +647,7 @@ class AbstractCanTransportInterface(AbstractTransportInterface, ABC):
     @abstractmethod
     async def async_send_packet(self,
                                 packet: CanPacket,  # type: ignore
-                                loop: Optional[AbstractEventLoop] = None) -> CanPacketRecord:
+                                loop: Optional["AbstractEventLoop"] = None) -> CanPacketRecord:
         """
         Transmit CAN packet asynchronously.
 
@@ -629,7 +673,7 @@ class AbstractCanTransportInterface(AbstractTransportInterface, ABC):
     @abstractmethod
     async def async_receive_packet(self,
                                    timeout: Optional[TimeMillisecondsAlias] = None,
-                                   loop: Optional[AbstractEventLoop] = None) -> CanPacketRecord:
+                                   loop: Optional["AbstractEventLoop"] = None) -> CanPacketRecord:
         """
         Receive CAN packet asynchronously.
 
@@ -17,6 +17,7 @@ from can import Notifier
 from uds.addressing import AddressingType, TransmissionDirection
 from uds.message import UdsMessage, UdsMessageRecord
 from uds.utilities import (
+    TRACING_HOOKS,
     MessageTransmissionNotStartedError,
     NewMessageReceptionWarning,
     TimeMillisecondsAlias,
@@ -87,6 +88,7 @@ class PythonCanTransportInterface(AbstractCanTransportInterface):
             - :parameter flow_control_parameters_generator: Generator with Flow Control parameters to use.
             - :parameter can_version: Version of CAN protocol to be used for packets sending.
             - :parameter bitrate_switch: Whether bitrate switch (BRS) shall be set in sent packets.
+            - :parameter metrics: Registry where measured values of CAN communication parameters are collected.
         """
         super().__init__(network_manager=network_manager,
                          addressing_information=addressing_information,
@@ -266,6 +268,7 @@ class PythonCanTransportInterface(AbstractCanTransportInterface):
             if value <= 0:
                 raise ValueError(f"Provided timeout value is less or equal to 0. Actual value: {value}")
 
+    @TRACING_HOOKS.traced(category="transport")
     def _send_cf_packets_block(self,
                                cf_packets_block: List[CanPacket],
                                delay: TimeMillisecondsAlias,
@@ -290,6 +293,7 @@ class PythonCanTransportInterface(AbstractCanTransportInterface):
             packet_records.append(cf_packet_record)
         return tuple(packet_records)
 
+    @TRACING_HOOKS.traced(category="transport")
     async def _async_send_cf_packets_block(self,
                                            cf_packets_block: List[CanPacket],
                                            delay: TimeMillisecondsAlias,
@@ -316,6 +320,7 @@ class PythonCanTransportInterface(AbstractCanTransportInterface):
             packet_records.append(cf_packet_record)
         return tuple(packet_records)
 
+    @TRACING_HOOKS.traced(category="transport")
     def _wait_for_flow_control(self, last_packet_transmission_timestamp: float) -> CanPacketRecord:
         """
         Wait till Flow Control CAN Packet is received.
@@ -333,6 +338,7 @@ class PythonCanTransportInterface(AbstractCanTransportInterface):
             packet_record = self._wait_for_rx_packet(buffer=self.__fc_frames_buffer, timeout=remaining_time_ms)
         return packet_record
 
+    @TRACING_HOOKS.traced(category="transport")
     async def _async_wait_for_flow_control(self, last_packet_transmission_timestamp: float) -> CanPacketRecord:
         """
         Wait till Flow Control CAN Packet is received.
@@ -429,6 +435,7 @@ class PythonCanTransportInterface(AbstractCanTransportInterface):
                                transmission_time=frame_datetime,
                                transmission_timestamp=frame_timestamp)
 
+    @TRACING_HOOKS.traced(category="transport")
     def _wait_for_tx_frame(self,
                            buffer: BufferedReader,
                            frame: PythonCanFrame,
@@ -463,6 +470,7 @@ class PythonCanTransportInterface(AbstractCanTransportInterface):
                 sent_frame = None  # clear as this is a record of another frame
         return sent_frame
 
+    @TRACING_HOOKS.traced(category="transport")
     async def _async_wait_for_tx_frame(self,
                                        buffer: AsyncBufferedReader,
                                        frame: PythonCanFrame,
@@ -498,6 +506,7 @@ class PythonCanTransportInterface(AbstractCanTransportInterface):
                 sent_frame = None  # clear as this is a record of another frame
         return sent_frame
 
+    @TRACING_HOOKS.traced(category="transport")
     def _receive_cf_packets_block(self,
                                   sequence_number: int,
                                   block_size: int,
@@ -556,6 +565,7 @@ class PythonCanTransportInterface(AbstractCanTransportInterface):
                 sequence_number = (received_packet.sequence_number + 1) & 0xF
         return tuple(received_cf)
 
+    @TRACING_HOOKS.traced(category="transport")
     async def _async_receive_cf_packets_block(self,
                                               sequence_number: int,
                                               block_size: int,
@@ -973,6 +983,7 @@ class PythonCanTransportInterface(AbstractCanTransportInterface):
         self.__setup_async_listening(loop=loop)
         return await self._async_wait_for_rx_packet(buffer=self.__async_rx_frames_buffer, timeout=timeout)
 
+    @TRACING_HOOKS.traced(category="transport")
     def send_message(self, message: UdsMessage) -> UdsMessageRecord:
         """
         Transmit UDS message over CAN.
@@ -1016,6 +1027,7 @@ class PythonCanTransportInterface(AbstractCanTransportInterface):
         self._update_n_bs_measured(message_records)
         return message_records
 
+    @TRACING_HOOKS.traced(category="transport")
     async def async_send_message(self,
                                  message: UdsMessage,
                                  loop: Optional[AbstractEventLoop] = None) -> UdsMessageRecord:
@@ -1062,6 +1074,7 @@ class PythonCanTransportInterface(AbstractCanTransportInterface):
         self._update_n_bs_measured(message_records)
         return message_records
 
+    @TRACING_HOOKS.traced(category="transport")
     def receive_message(self,
                         start_timeout: Optional[TimeMillisecondsAlias] = None,
                         end_timeout: Optional[TimeMillisecondsAlias] = None) -> UdsMessageRecord:
@@ -1107,11 +1120,14 @@ class PythonCanTransportInterface(AbstractCanTransportInterface):
                     from exception
             # handle received packet
             if CanPacketType.is_initial_packet_type(received_packet.packet_type):
-                return self._message_receive_start(initial_packet=received_packet,
-                                                   timestamp_end=timestamp_end_timeout)
+                message_record = self._message_receive_start(initial_packet=received_packet,
+                                                             timestamp_end=timestamp_end_timeout)
+                self._update_n_cr_measured(message_record)
+                return message_record
             warn(message="A CAN packet that does not start UDS message transmission was received.",
                  category=UnexpectedPacketReceptionWarning)
 
+    @TRACING_HOOKS.traced(category="transport")
     async def async_receive_message(self,
                                     start_timeout: Optional[TimeMillisecondsAlias] = None,
                                     end_timeout: Optional[TimeMillisecondsAlias] = None,
@@ -1160,8 +1176,10 @@ class PythonCanTransportInterface(AbstractCanTransportInterface):
                     from exception
             # handle received packet
             if CanPacketType.is_initial_packet_type(received_packet.packet_type):
-                return await self._async_message_receive_start(initial_packet=received_packet,
-                                                               timestamp_end=timestamp_end_timeout,
-                                                               loop=loop)
+                message_record = await self._async_message_receive_start(initial_packet=received_packet,
+                                                                         timestamp_end=timestamp_end_timeout,
+                                                                         loop=loop)
+                self._update_n_cr_measured(message_record)
+                return message_record
             warn(message="A CAN packet that does not start UDS message transmission was received.",
                  category=UnexpectedPacketReceptionWarning)
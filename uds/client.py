@@ -1,11 +1,15 @@
 """Implementation for :ref:`UDS Client <knowledge-base-client>` Simulation."""
 
-__all__ = ["Client"]
+__all__ = ["Client", "TesterPresentScheduler", "TesterPresentJitterStatistics"]
 
+from collections import deque
+from heapq import heappop, heappush
+from itertools import count
 from queue import Empty, Queue
-from threading import Event, Lock, Thread
+from statistics import fmean, pstdev
+from threading import Condition, Event, Lock, Thread
 from time import perf_counter, sleep
-from typing import List, Optional, Sequence, Tuple, Union
+from typing import Deque, Dict, Hashable, List, Optional, Sequence, Tuple, TypedDict, Union
 from warnings import warn
 
 from uds.addressing import AddressingType
@@ -14,15 +18,31 @@ from uds.translator import TESTER_PRESENT
 from uds.transport_interface import AbstractTransportInterface
 from uds.utilities import (
     SPRMIB_MASK,
+    TRACING_HOOKS,
     InconsistencyError,
     MessageTransmissionNotStartedError,
+    MetricsRegistry,
     ReassignmentError,
     TimeMillisecondsAlias,
     ValueWarning,
 )
 
 
-class Client:
+class _ResponseMatcher:  # pylint: disable=too-few-public-methods
+    """Expected responses to a request message that is sent while background receiving is active."""
+
+    def __init__(self, request: UdsMessage) -> None:
+        """
+        Create matcher of responses to a request message.
+
+        :param request: Request message which responses are expected.
+            It is replaced with the request record once the request is sent.
+        """
+        self.request: Union[UdsMessage, UdsMessageRecord] = request
+        self.responses: Deque[UdsMessageRecord] = deque()
+
+
+class Client:  # pylint: disable=too-many-instance-attributes
     """Simulation for UDS Client entity."""
 
     DEFAULT_P2_CLIENT_TIMEOUT: TimeMillisecondsAlias = 100  # P2Client_max > P2Server_max (default: 50 ms)
@@ -51,7 +71,8 @@ class Client:
                  p3_client_functional: TimeMillisecondsAlias = DEFAULT_P3_CLIENT,
                  p6_client_timeout: TimeMillisecondsAlias = DEFAULT_P6_CLIENT_TIMEOUT,
                  p6_ext_client_timeout: TimeMillisecondsAlias = DEFAULT_P6_EXT_CLIENT_TIMEOUT,
-                 s3_client: TimeMillisecondsAlias = DEFAULT_S3_CLIENT) -> None:
+                 s3_client: TimeMillisecondsAlias = DEFAULT_S3_CLIENT,
+                 metrics: Optional[MetricsRegistry] = None) -> None:
         """
         Configure Client for UDS communication.
 
@@ -63,6 +84,8 @@ class Client:
         :param p6_client_timeout: Timeout value for P6Client parameter.
         :param p6_ext_client_timeout: Timeout value for P6*Client parameter.
         :param s3_client: Value of S3Client time parameter.
+        :param metrics: Registry where timing parameters, negative responses and timeouts are collected.
+            Leave None to not collect metrics.
         """
         # TIMING PARAMETERS
         self.__p2_client_measured: Optional[TimeMillisecondsAlias] = None
@@ -86,25 +109,26 @@ class Client:
         self.p6_client_timeout = p6_client_timeout
         self.p6_ext_client_timeout = p6_ext_client_timeout
         self.s3_client = s3_client
+        self.metrics = metrics
         # tasks and threads
         self.__tester_present_task_event: Event = Event()
         self.__tester_present_task_event.clear()
         self.__tester_present_thread: Optional[Thread] = None
+        self.__tester_present_scheduler: Optional[TesterPresentScheduler] = None
         self.__background_receiving_task_event: Event = Event()
         self.__background_receiving_task_event.clear()
-        self.__break_in_background_receiving_event: Event = Event()
-        self.__break_in_background_receiving_event.clear()
         self.__background_receiving_thread: Optional[Thread] = None
-        self.__send_and_receive_not_in_progress_event: Event = Event()
-        self.__send_and_receive_not_in_progress_event.set()
-        self.__receiving_not_in_progress_event: Event = Event()
-        self.__receiving_not_in_progress_event.set()
         self.__transmission_not_in_progress_event: Event = Event()
         self.__transmission_not_in_progress_event.set()
-        self.__receiving_lock: Lock = Lock()
         self.__transmission_lock: Lock = Lock()
         self.__physical_transmission_lock: Lock = Lock()
         self.__functional_transmission_lock: Lock = Lock()
+        # receiving state (guarded by the condition)
+        self.__receiving_condition: Condition = Condition()
+        self.__requests_in_progress_number = 0
+        self.__is_receiving_directly = False
+        self.__receiving_attempt_timestamp: Optional[float] = None
+        self.__response_matchers: List[_ResponseMatcher] = []
         # other
         self.__response_queue: Queue[UdsMessageRecord] = Queue()
         self.__last_physical_request: Optional[UdsMessageRecord] = None
@@ -142,6 +166,24 @@ class Client:
             raise ReassignmentError("Value of 'transport_interface' attribute cannot be changed once assigned.")
         self.__transport_interface = value
 
+    @property
+    def metrics(self) -> Optional[MetricsRegistry]:
+        """Get registry where metrics of the communication are collected."""
+        return self.__metrics
+
+    @metrics.setter
+    def metrics(self, value: Optional[MetricsRegistry]) -> None:
+        """
+        Set registry where metrics of the communication are collected.
+
+        :param value: Metrics registry to use or None to stop collecting metrics.
+
+        :raise TypeError: Provided value is neither None nor an instance of MetricsRegistry class.
+        """
+        if value is not None and not isinstance(value, MetricsRegistry):
+            raise TypeError(f"Provided value is not an instance of MetricsRegistry class. Actual type: {type(value)}.")
+        self.__metrics = value
+
     @property
     def p2_client_timeout(self) -> TimeMillisecondsAlias:
         """Get timeout value for :ref:`P2Client <knowledge-base-p2-client>` parameter."""
@@ -432,7 +474,7 @@ class Client:
             was either received or timed-out (P2, P3 or P6), False otherwise.
         """
         return (self.__transmission_not_in_progress_event.is_set()
-                and self.__receiving_not_in_progress_event.is_set()
+                and not self.__is_receiving_directly
                 and (self.__last_physical_request is None
                      or self.__last_physical_response is not None
                      or perf_counter() > self.__last_physical_request.transmission_end_timestamp
@@ -529,23 +571,48 @@ class Client:
 
     def __receiving_task(self, cycle: TimeMillisecondsAlias) -> None:
         """
-        Schedule reception of a UDS message for a cyclic response collecting.
+        Receive all UDS messages while background receiving is active (the only receiver of the transport interface).
+
+        Responses to requests that are currently handled are delivered to their matchers,
+        other messages are put into the response queue.
+        The start time of each receiving attempt is published, so requests waiting for responses know whether
+        a reception is in progress (an attempt lasts longer than the cycle only if a message reception started).
 
-        :param cycle: Time (in milliseconds) used for this task cycle.
+        :param cycle: Maximal time (in milliseconds) to wait for a message before checking whether the task
+            is still active.
         """
         while self.is_background_receiving:
-            sleep(cycle / 1000.)
-            if not self.__send_and_receive_not_in_progress_event.is_set():
-                self.__break_in_background_receiving_event.set()
-                self.__send_and_receive_not_in_progress_event.wait()
-                self.__break_in_background_receiving_event.clear()
+            with self.__receiving_condition:
+                if self.__is_receiving_directly:
+                    # a request that was sent before background receiving started is still being received
+                    self.__receiving_condition.wait(timeout=cycle / 1000.)
+                    continue
+                self.__receiving_attempt_timestamp = perf_counter()
             try:
-                response_record = self._receive_response(start_timeout=cycle,
-                                                         end_timeout=self.p6_ext_client_timeout)
+                response_record = self.transport_interface.receive_message(start_timeout=cycle,
+                                                                           end_timeout=self.p6_ext_client_timeout)
             except TimeoutError:
                 pass
             else:
-                self.__response_queue.put_nowait(response_record)
+                self._update_last_response(response_record)
+                self._dispatch_response(response_record)
+            finally:
+                with self.__receiving_condition:
+                    self.__receiving_attempt_timestamp = None
+                    self.__receiving_condition.notify_all()
+
+    def _dispatch_response(self, response_record: UdsMessageRecord) -> None:
+        """
+        Deliver response message received by the background receiving task.
+
+        :param response_record: Record of the received response message.
+        """
+        for response_matcher in tuple(self.__response_matchers):
+            if self.is_response_to_request(response_message=response_record,
+                                           request_message=response_matcher.request):
+                response_matcher.responses.append(response_record)
+                return
+        self.__response_queue.put_nowait(response_record)
 
     def __send_tester_present_task(self, tester_present_request: UdsMessage) -> None:
         """
@@ -557,19 +624,30 @@ class Client:
         next_call = perf_counter() + period_s
         sleep(period_s)
         while self.is_tester_present_sent:
-            if (self.__send_and_receive_not_in_progress_event.is_set()
-                    or (self.last_sent_request is not None
-                        and self.last_sent_request.addressing_type != tester_present_request.addressing_type)):
-                # avoid collision of message with the same addressing type
-                tp_record = self._send_request(tester_present_request)
-                self.__last_tester_present_requests.insert(0, tp_record)
-                self.__last_tester_present_requests \
-                    = self.__last_tester_present_requests[:self.tester_present_storage_size]
+            self._send_tester_present(tester_present_request)
             next_call += period_s
             remaining_wait_s = next_call - perf_counter()
             if remaining_wait_s > 0:
                 sleep(remaining_wait_s)
 
+    def _send_tester_present(self, tester_present_request: UdsMessage) -> Optional[UdsMessageRecord]:
+        """
+        Send Tester Present message unless it would collide with a request that is currently handled.
+
+        :param tester_present_request: Tester Present request message to send.
+
+        :return: Record of Tester Present message that was sent, None if the transmission was skipped.
+        """
+        if (self.__requests_in_progress_number == 0
+                or (self.last_sent_request is not None
+                    and self.last_sent_request.addressing_type != tester_present_request.addressing_type)):
+            # avoid collision of message with the same addressing type
+            tp_record = self._send_request(tester_present_request)
+            self.__last_tester_present_requests.insert(0, tp_record)
+            self.__last_tester_present_requests = self.__last_tester_present_requests[:self.tester_present_storage_size]
+            return tp_record
+        return None
+
     def _update_last_response(self, response_record: UdsMessageRecord) -> None:
         """
         Update the last response messages received by the Client.
@@ -577,14 +655,14 @@ class Client:
         :param response_record: Recently received response record.
         """
         if self.__last_physical_request is not None and self.__last_physical_response is None:
-            sid = RequestSID(self.__last_physical_request.payload[0])
+            sid = RequestSID.validate_member(self.__last_physical_request.payload[0])
             if (self.is_response_to_request(response_message=response_record,
                                             request_message=self.__last_physical_request)
                     and not self.is_response_pending_message(response_message=response_record,
                                                              request_sid=sid)):
                 self.__last_physical_response = response_record
         if self.__last_functional_request is not None and self.__last_functional_response is None:
-            sid = RequestSID(self.__last_functional_request.payload[0])
+            sid = RequestSID.validate_member(self.__last_functional_request.payload[0])
             if (self.is_response_to_request(response_message=response_record,
                                             request_message=self.__last_functional_request)
                     and not self.is_response_pending_message(response_message=response_record,
@@ -616,6 +694,65 @@ class Client:
             p6_measured = response_records[-1].transmission_end_timestamp - request_record.transmission_end_timestamp
             self.__update_p6_client_measured(round(p6_measured * 1000., 3))
 
+    def _update_metrics(self,
+                        request_record: UdsMessageRecord,
+                        response_records: Sequence[UdsMessageRecord]) -> None:
+        """
+        Collect timing parameters and negative responses of a request message in metrics registry.
+
+        Metrics are labeled with SID of the request and identifier of the server that responded
+        (according to :meth:`~uds.client.Client.get_response_source`). Negative time values are skipped.
+
+        :param request_record: Record of the transmitted request message.
+        :param response_records: Records of received responses to provided message (sent by a single server).
+        """
+        if self.metrics is None or len(response_records) == 0:
+            return
+        source = self.get_response_source(response_records[0])
+        labels = {"sid": f"0x{request_record.payload[0]:02X}",
+                  "ecu": f"0x{source:X}" if isinstance(source, int) else source}
+        samples = [("p2_client", response_records[0].transmission_start_timestamp
+                    - request_record.transmission_end_timestamp)]
+        for previous_response_record, response_record in zip(response_records, response_records[1:]):
+            samples.append(("p2_ext_client", response_record.transmission_end_timestamp
+                            - previous_response_record.transmission_end_timestamp))
+        samples.append(("p6_client" if len(response_records) == 1 else "p6_ext_client",
+                        response_records[-1].transmission_end_timestamp - request_record.transmission_end_timestamp))
+        for name, value in samples:
+            # negative values (e.g. a response that started before the request ended) are not valid samples
+            if value >= 0:
+                self.metrics.record(name, value * 1000., **labels)
+        for response_record in response_records:
+            if len(response_record.payload) == 3 and response_record.payload[0] == ResponseSID.NegativeResponse:
+                self.metrics.increment("negative_responses", nrc=f"0x{response_record.payload[2]:02X}", **labels)
+
+    def __register_response_matcher(self, request: UdsMessage) -> Optional[_ResponseMatcher]:
+        """
+        Register request that is about to be handled and matcher of its responses if background receiving is active.
+
+        :param request: Request message that is about to be sent.
+
+        :return: Registered response matcher, None if responses are to be received directly.
+        """
+        with self.__receiving_condition:
+            self.__requests_in_progress_number += 1
+            if not self.is_background_receiving:
+                return None
+            response_matcher = _ResponseMatcher(request)
+            self.__response_matchers.append(response_matcher)
+            return response_matcher
+
+    def __unregister_response_matcher(self, response_matcher: Optional[_ResponseMatcher]) -> None:
+        """
+        Unregister request that was handled and matcher of its responses.
+
+        :param response_matcher: Response matcher to unregister.
+        """
+        with self.__receiving_condition:
+            self.__requests_in_progress_number -= 1
+            if response_matcher is not None:
+                self.__response_matchers.remove(response_matcher)
+
     def _send_request(self, request: UdsMessage) -> UdsMessageRecord:
         """
         Send UDS Request Message in a threadsafe way.
@@ -651,40 +788,98 @@ class Client:
 
     def _receive_response(self,
                           start_timeout: TimeMillisecondsAlias,
-                          end_timeout: TimeMillisecondsAlias) -> UdsMessageRecord:
+                          end_timeout: TimeMillisecondsAlias,
+                          response_matcher: Optional[_ResponseMatcher] = None) -> UdsMessageRecord:
         """
         Receive UDS response message to previously sent request.
 
         :param start_timeout: Maximal time (in milliseconds) to wait for the start of the message reception.
         :param end_timeout: Maximal time (in milliseconds) to wait for the end of the message reception.
+        :param response_matcher: Matcher to which the background receiving task delivers responses.
+            Leave None to receive the message directly from the transport interface.
+
+        :raise MessageTransmissionNotStartedError: Reception of the message was not started before the start timeout.
 
         :return: Record with response message received to the last UDS request message sent.
         """
         remaining_start_timeout_ms = start_timeout  # either P2Client or P2*Client
         remaining_end_timeout_ms = end_timeout  # either P6Client or P6*Client
-        with self.__receiving_lock:
-            self.__receiving_not_in_progress_event.clear()
-            try:
-                response_record = self.transport_interface.receive_message(
-                    start_timeout=min(remaining_start_timeout_ms, remaining_end_timeout_ms),
-                    end_timeout=remaining_end_timeout_ms)
-            finally:
-                self.__receiving_not_in_progress_event.set()
+        if response_matcher is not None:
+            return self._receive_matched_response(start_timeout=min(remaining_start_timeout_ms,
+                                                                    remaining_end_timeout_ms),
+                                                  end_timeout=remaining_end_timeout_ms,
+                                                  response_matcher=response_matcher)
+        with self.__receiving_condition:
+            while self.__is_receiving_directly or self.__receiving_attempt_timestamp is not None:
+                self.__receiving_condition.wait()
+            self.__is_receiving_directly = True
+        try:
+            response_record = self.transport_interface.receive_message(
+                start_timeout=min(remaining_start_timeout_ms, remaining_end_timeout_ms),
+                end_timeout=remaining_end_timeout_ms)
             self._update_last_response(response_record)
+        finally:
+            with self.__receiving_condition:
+                self.__is_receiving_directly = False
+                self.__receiving_condition.notify_all()
         return response_record
 
-    def _receive_initial_response(self, request_record: UdsMessageRecord) -> Optional[UdsMessageRecord]:
+    def _receive_matched_response(self,
+                                  start_timeout: TimeMillisecondsAlias,
+                                  end_timeout: TimeMillisecondsAlias,
+                                  response_matcher: _ResponseMatcher) -> UdsMessageRecord:
+        """
+        Wait for UDS response message delivered by the background receiving task.
+
+        Responses are delivered once their reception is over, so after the start timeout only the reception
+        that started before it is awaited (till the end timeout at the latest).
+
+        :param start_timeout: Maximal time (in milliseconds) to wait for the start of the message reception.
+        :param end_timeout: Maximal time (in milliseconds) to wait for the end of the message reception.
+        :param response_matcher: Matcher to which the background receiving task delivers responses.
+
+        :raise MessageTransmissionNotStartedError: Reception of the message was not started before the start timeout.
+        :raise TimeoutError: Reception of the message was not finished before the end timeout.
+
+        :return: Record with response message received to the request message of the matcher.
+        """
+        timestamp_now = perf_counter()
+        timestamp_start_timeout = timestamp_now + start_timeout / 1000.
+        timestamp_end_timeout = timestamp_now + end_timeout / 1000.
+        with self.__receiving_condition:
+            while not response_matcher.responses:
+                timestamp_now = perf_counter()
+                if timestamp_now < timestamp_start_timeout:
+                    self.__receiving_condition.wait(timeout=timestamp_start_timeout - timestamp_now)
+                    continue
+                timestamp_attempt = self.__receiving_attempt_timestamp
+                if timestamp_attempt is None or timestamp_attempt >= timestamp_start_timeout:
+                    raise MessageTransmissionNotStartedError("Timeout was reached before a UDS message was received.")
+                if timestamp_now >= timestamp_end_timeout:
+                    raise TimeoutError("Timeout was reached before a UDS message reception was finished.")
+                self.__receiving_condition.wait(timeout=timestamp_end_timeout - timestamp_now)
+            response_record = response_matcher.responses.popleft()
+        if response_record.transmission_start_timestamp > timestamp_start_timeout:
+            self.__response_queue.put_nowait(response_record)
+            raise MessageTransmissionNotStartedError("Timeout was reached before a UDS message was received.")
+        return response_record
+
+    def _receive_initial_response(self,
+                                  request_record: UdsMessageRecord,
+                                  response_matcher: Optional[_ResponseMatcher] = None) -> Optional[UdsMessageRecord]:
         """
         Receive the first UDS response to a request message.
 
         :param request_record: Request message to which response is collected.
+        :param response_matcher: Matcher to which the background receiving task delivers responses.
+            Leave None to receive responses directly from the transport interface.
 
         :raise TimeoutError: Either P2Client or P6Client timeout was exceeded.
 
         :return: Received UDS Response Message.
             None if legitimately (either Functionally addressed request or with SPRMIB set) no response was received.
         """
-        sid = RequestSID(request_record.payload[0])
+        sid = RequestSID.validate_member(request_record.payload[0])
         timestamp_start_timeout = request_record.transmission_end_timestamp + self.p2_client_timeout / 1000.
         timestamp_end_timeout = request_record.transmission_end_timestamp + self.p6_client_timeout / 1000.
         timestamp_now = perf_counter()
@@ -693,7 +888,8 @@ class Client:
             end_timeout_ms = (timestamp_end_timeout - timestamp_now) * 1000.
             try:
                 response_record = self._receive_response(start_timeout=start_timeout_ms,
-                                                         end_timeout=end_timeout_ms)
+                                                         end_timeout=end_timeout_ms,
+                                                         response_matcher=response_matcher)
             except MessageTransmissionNotStartedError as exception:
                 if request_record.addressing_type == AddressingType.FUNCTIONAL:
                     return None
@@ -719,12 +915,15 @@ class Client:
 
     def _receive_following_response(self,
                                     request_record: UdsMessageRecord,
-                                    previous_response_record: UdsMessageRecord) -> UdsMessageRecord:
+                                    previous_response_record: UdsMessageRecord,
+                                    response_matcher: Optional[_ResponseMatcher] = None) -> UdsMessageRecord:
         """
         Receive the following (not the first one) UDS response to a request message.
 
         :param request_record: Request message to which response is collected.
         :param previous_response_record: Record of the proceeding UDS response.
+        :param response_matcher: Matcher to which the background receiving task delivers responses.
+            Leave None to receive responses directly from the transport interface.
 
         :raise TimeoutError: Either P2*Client or P6*Client timeout was exceeded.
 
@@ -739,7 +938,8 @@ class Client:
             end_timeout_ms = (timestamp_end_timeout - timestamp_now) * 1000.
             try:
                 response_record = self._receive_response(start_timeout=start_timeout_ms,
-                                                         end_timeout=end_timeout_ms)
+                                                         end_timeout=end_timeout_ms,
+                                                         response_matcher=response_matcher)
             except TimeoutError as exception:
                 if timestamp_end_timeout <= timestamp_start_timeout:
                     raise TimeoutError("P6*Client timeout exceeded.") from exception
@@ -750,6 +950,97 @@ class Client:
             self.__response_queue.put_nowait(response_record)
         raise TimeoutError("P6*Client timeout exceeded.")
 
+    @staticmethod
+    def get_response_source(response_record: UdsMessageRecord) -> Hashable:
+        """
+        Get identifier of the server (ECU) that sent a response message.
+
+        .. note:: The source address of the first packet is used if it is defined, otherwise
+            the network identifier (e.g. CAN ID) of the packet is used.
+            Override this method if servers have to be distinguished in a different way.
+
+        :param response_record: Record of a received response message.
+
+        :return: Identifier of the server that sent the response message.
+        """
+        first_packet_record = response_record.packets_records[0]
+        source_address: Hashable = getattr(first_packet_record, "source_address", None)
+        if source_address is not None:
+            return source_address
+        network_identifier: Hashable = getattr(first_packet_record, "can_id", None)
+        return network_identifier
+
+    def _receive_responses_from_servers(
+            self,
+            request_record: UdsMessageRecord,
+            response_matcher: Optional[_ResponseMatcher] = None) -> Dict[Hashable, List[UdsMessageRecord]]:
+        """
+        Receive responses from all the servers (ECUs) that respond to a request message.
+
+        A single receiving loop is used for all the servers. Each server has its own response window
+        (P2Client at first, then P2*Client after each Response Pending message), so Response Pending
+        extensions of one server do not delay nor cut responses of other servers.
+        The loop ends when there is no server with an open response window.
+
+        :param request_record: Request message to which responses are collected.
+        :param response_matcher: Matcher to which the background receiving task delivers responses.
+            Leave None to receive responses directly from the transport interface.
+
+        :return: Dictionary with identifiers of the servers and records of responses that they sent.
+        """
+        sid = RequestSID.validate_member(request_record.payload[0])
+        timestamp_request = request_record.transmission_end_timestamp
+        timestamp_p2_timeout = timestamp_request + self.p2_client_timeout / 1000.
+        timestamp_p6_ext_timeout = timestamp_request + self.p6_ext_client_timeout / 1000.
+        responses: Dict[Hashable, List[UdsMessageRecord]] = {}
+        pending_timeouts: Dict[Hashable, float] = {}
+        timestamp_now = perf_counter()
+        while True:
+            timestamp_timeout = max(pending_timeouts.values(), default=timestamp_p2_timeout)
+            if timestamp_now < timestamp_p2_timeout:
+                timestamp_timeout = max(timestamp_timeout, timestamp_p2_timeout)
+            if timestamp_now >= timestamp_timeout:
+                break
+            try:
+                response_record = self._receive_response(
+                    start_timeout=(timestamp_timeout - timestamp_now) * 1000.,
+                    end_timeout=(timestamp_p6_ext_timeout - timestamp_now) * 1000.,
+                    response_matcher=response_matcher)
+            except MessageTransmissionNotStartedError:
+                break
+            except TimeoutError:
+                warn(message="Reception of a response message was not finished before P6*Client timeout.",
+                     category=RuntimeWarning)
+                break
+            timestamp_now = perf_counter()
+            if not self.is_response_to_request(response_message=response_record, request_message=request_record):
+                self.__response_queue.put_nowait(response_record)
+                continue
+            source = self.get_response_source(response_record)
+            if source in pending_timeouts:
+                on_time = response_record.transmission_start_timestamp < pending_timeouts[source]
+            else:
+                on_time = (source not in responses
+                           and response_record.transmission_start_timestamp < timestamp_p2_timeout)
+            if not on_time:
+                warn(message=f"Response message from {source!r} was received outside its response window. "
+                             "It was put into response_queue.",
+                     category=RuntimeWarning)
+                self.__response_queue.put_nowait(response_record)
+                continue
+            responses.setdefault(source, []).append(response_record)
+            if self.is_response_pending_message(response_message=response_record, request_sid=sid):
+                pending_timeouts[source] = min(response_record.transmission_end_timestamp
+                                               + self.p2_ext_client_timeout / 1000.,
+                                               timestamp_p6_ext_timeout)
+            else:
+                pending_timeouts.pop(source, None)
+        if pending_timeouts:
+            warn(message=f"Servers {tuple(pending_timeouts)!r} did not finish their responses "
+                         "(P2*Client timeout exceeded).",
+                 category=RuntimeWarning)
+        return responses
+
     @staticmethod
     def is_response_pending_message(response_message: Union[UdsMessage, UdsMessageRecord],
                                     request_sid: RequestSID) -> bool:
@@ -807,7 +1098,7 @@ class Client:
                 return False
         request_sid = RequestSID.validate_member(request_message.payload[0])
         if ResponseSID.is_member(response_message.payload[0]):
-            response_sid = ResponseSID(response_message.payload[0])
+            response_sid = ResponseSID.validate_member(response_message.payload[0])
         else:
             warn(message=f"Response with undefined RSID value (0x{response_message.payload[0]:02X}) was provided.",
                  category=RuntimeWarning)
@@ -822,7 +1113,9 @@ class Client:
         """Wait till the client is ready to transmit physically addressed request message."""
         while not self.is_ready_for_physical_transmission:
             self.__transmission_not_in_progress_event.wait()
-            self.__receiving_not_in_progress_event.wait()
+            with self.__receiving_condition:
+                while self.__is_receiving_directly:
+                    self.__receiving_condition.wait()
             if self.__last_physical_request is not None and self.__last_physical_response is None:
                 timestamp_now = perf_counter()
                 timestamp_p3_timeout = (self.__last_physical_request.transmission_end_timestamp
@@ -908,16 +1201,23 @@ class Client:
 
     def start_tester_present(self,
                              addressing_type: AddressingType = AddressingType.FUNCTIONAL,
-                             sprmib: bool = True) -> None:
+                             sprmib: bool = True,
+                             scheduler: Optional["TesterPresentScheduler"] = None) -> None:
         """
         Start sending Tester Present cyclically.
 
         :param addressing_type: Addressing Type to use for cyclical messages.
         :param sprmib: Whether to use Suppress Positive Response Message Indication Bit.
+        :param scheduler: Scheduler that sends Tester Present messages of many clients from a single thread.
+            Leave None to start a thread dedicated to this Client.
         """
         if self.is_tester_present_sent:
             warn("Tester Present is already transmitted cyclically.",
                  category=UserWarning)
+        elif scheduler is not None:
+            scheduler.register(client=self, addressing_type=addressing_type, sprmib=sprmib)
+            self.__tester_present_scheduler = scheduler
+            self.__tester_present_task_event.set()
         else:
             self.__tester_present_task_event.set()
             payload = TESTER_PRESENT.encode_request({
@@ -936,6 +1236,9 @@ class Client:
         """Stop sending Tester Present cyclically."""
         if self.is_tester_present_sent:
             self.__tester_present_task_event.clear()
+            if self.__tester_present_scheduler is not None:
+                self.__tester_present_scheduler.unregister(self)
+                self.__tester_present_scheduler = None
             if self.__tester_present_thread is not None:
                 self.__tester_present_thread.join(timeout=self.s3_client / 1000.)
             self.__tester_present_thread = None
@@ -972,6 +1275,7 @@ class Client:
             warn("Receiving is already stopped.",
                  category=UserWarning)
 
+    @TRACING_HOOKS.traced(category="client")
     def send_request_receive_responses(self,
                                        request: UdsMessage) -> Tuple[UdsMessageRecord, Tuple[UdsMessageRecord, ...]]:
         """
@@ -990,23 +1294,362 @@ class Client:
         if not isinstance(request, UdsMessage):
             raise TypeError(f"Provided request value is not an instance of UdsMessage class. "
                             f"Actual type: {type(request)}.")
-        sid = RequestSID(request.payload[0])
+        sid = RequestSID.validate_member(request.payload[0])
         response_records: List[UdsMessageRecord] = []
-        self.__send_and_receive_not_in_progress_event.clear()
-        if self.is_background_receiving:
-            self.__receiving_not_in_progress_event.wait(timeout=self.p6_ext_client_timeout)
-            self.__break_in_background_receiving_event.wait(timeout=self.p6_ext_client_timeout)
-        request_record = self._send_request(request)
+        response_matcher = self.__register_response_matcher(request)
         try:
-            initial_response = self._receive_initial_response(request_record)
-            if initial_response is None:
-                return request_record, tuple()
-            response_records.append(initial_response)
-            while self.is_response_pending_message(response_message=response_records[-1], request_sid=sid):
-                following_response = self._receive_following_response(request_record=request_record,
-                                                                      previous_response_record=response_records[-1])
-                response_records.append(following_response)
+            request_record = self._send_request(request)
+            if response_matcher is not None:
+                response_matcher.request = request_record
+            try:
+                initial_response = self._receive_initial_response(request_record=request_record,
+                                                                  response_matcher=response_matcher)
+                if initial_response is None:
+                    return request_record, tuple()
+                response_records.append(initial_response)
+                while self.is_response_pending_message(response_message=response_records[-1], request_sid=sid):
+                    following_response = self._receive_following_response(
+                        request_record=request_record,
+                        previous_response_record=response_records[-1],
+                        response_matcher=response_matcher)
+                    response_records.append(following_response)
+            except TimeoutError:
+                if self.metrics is not None:
+                    self.metrics.increment("timeouts",
+                                           sid=f"0x{sid:02X}",
+                                           stage="following_response" if response_records else "initial_response")
+                raise
             self._update_measured_client_values(request_record=request_record, response_records=response_records)
+            self._update_metrics(request_record=request_record, response_records=response_records)
         finally:
-            self.__send_and_receive_not_in_progress_event.set()
+            self.__unregister_response_matcher(response_matcher)
         return request_record, tuple(response_records)
+
+    @TRACING_HOOKS.traced(category="client")
+    def send_request_receive_responses_from_servers(
+            self,
+            request: UdsMessage) -> Tuple[UdsMessageRecord, Dict[Hashable, Tuple[UdsMessageRecord, ...]]]:
+        """
+        Send diagnostic request once and collect responses of all the servers (ECUs) that answered.
+
+        .. note:: This method is meant for functionally addressed requests (e.g. Tester Present, DTC sweeps)
+            that are responded by many servers. Servers are distinguished using
+            :meth:`~uds.client.Client.get_response_source` method.
+
+        :param request: Request message to send.
+
+        :raise TypeError: Provided value is not an instance of UdsMessage class.
+
+        :return: Tuple with two elements:
+
+            - record of diagnostic request message that was sent
+            - dictionary with identifiers of the servers (e.g. source addresses) and tuples with diagnostic
+              response messages that each server sent (Response Pending messages followed by the final response)
+        """
+        if not isinstance(request, UdsMessage):
+            raise TypeError(f"Provided request value is not an instance of UdsMessage class. "
+                            f"Actual type: {type(request)}.")
+        response_matcher = self.__register_response_matcher(request)
+        try:
+            request_record = self._send_request(request)
+            if response_matcher is not None:
+                response_matcher.request = request_record
+            responses = self._receive_responses_from_servers(request_record=request_record,
+                                                             response_matcher=response_matcher)
+            for response_records in responses.values():
+                self._update_measured_client_values(request_record=request_record, response_records=response_records)
+                self._update_metrics(request_record=request_record, response_records=response_records)
+        finally:
+            self.__unregister_response_matcher(response_matcher)
+        return request_record, {source: tuple(response_records) for source, response_records in responses.items()}
+
+
+class TesterPresentJitterStatistics(TypedDict):
+    """Statistics of the delays (in milliseconds) between planned and actual Tester Present transmissions."""
+
+    samples_number: int  # noqa: vulture
+    min: TimeMillisecondsAlias
+    max: TimeMillisecondsAlias
+    mean: TimeMillisecondsAlias  # noqa: vulture
+    stdev: TimeMillisecondsAlias  # noqa: vulture
+
+
+class _TesterPresentTask:
+    """Periodic Tester Present transmission on behalf of one or more clients."""
+
+    def __init__(self, tester_present_request: UdsMessage, timestamp_due: float) -> None:
+        """
+        Create Tester Present task.
+
+        :param tester_present_request: Tester Present request message to send.
+        :param timestamp_due: Time (perf_counter value) of the first transmission.
+        """
+        self.tester_present_request = tester_present_request
+        self.timestamp_due = timestamp_due
+        self.version = 0
+        self.clients: List[Client] = []
+
+    @property
+    def period(self) -> float:
+        """Get transmission period in seconds (the shortest S3Client of the clients)."""
+        return min(client.s3_client for client in self.clients) / 1000.
+
+
+class TesterPresentScheduler:
+    """
+    Scheduler that sends Tester Present messages of many clients from a single thread.
+
+    Transmissions are kept in a heap (ordered by the time of the next transmission), so a single thread
+    wakes up only when the next Tester Present message is due. The thread is started when the first client is
+    registered and it finishes when the last client is unregistered.
+
+    When coalescing is enabled, clients that use Tester Present with Suppress Positive Response Message Indication
+    Bit and share both the network and the functional address (e.g. many servers on the same CAN bus)
+    are kept alive by a single functionally addressed Tester Present message.
+    """
+
+    JITTER_SAMPLES_NUMBER: int = 1000
+    """Number of the most recent transmissions that are used for the jitter statistics."""
+
+    def __init__(self, coalesce: bool = True) -> None:
+        """
+        Create Tester Present scheduler.
+
+        :param coalesce: Whether to send one functionally addressed Tester Present message (with SPRMIB)
+            on behalf of the clients that share the network and the functional address.
+        """
+        self.coalesce = coalesce
+        self.__condition = Condition()
+        self.__heap: List[Tuple[float, int, int, _TesterPresentTask]] = []
+        self.__sequence = count()
+        self.__tasks: Dict[Hashable, _TesterPresentTask] = {}
+        self.__clients_tasks: Dict[int, Hashable] = {}
+        self.__thread: Optional[Thread] = None
+        self.__jitters: Deque[TimeMillisecondsAlias] = deque(maxlen=self.JITTER_SAMPLES_NUMBER)
+        self.__skipped_transmissions_number = 0
+        self.__failed_transmissions_number = 0
+
+    @property
+    def coalesce(self) -> bool:
+        """Get flag whether Tester Present messages of the clients are coalesced."""
+        return self.__coalesce
+
+    @coalesce.setter
+    def coalesce(self, value: bool) -> None:
+        """
+        Set whether Tester Present messages of the clients are to be coalesced.
+
+        :param value: Value to set.
+
+        :raise TypeError: Provided value is not bool type.
+        """
+        if not isinstance(value, bool):
+            raise TypeError(f"Provided value is not bool type. Actual type: {type(value)}.")
+        self.__coalesce = value
+
+    @property  # noqa: vulture
+    def is_running(self) -> bool:
+        """Get flag whether the scheduler thread is running."""
+        return self.__thread is not None
+
+    @property  # noqa: vulture
+    def clients_number(self) -> int:
+        """Get number of registered clients."""
+        return len(self.__clients_tasks)
+
+    @property  # noqa: vulture
+    def tasks_number(self) -> int:
+        """Get number of periodic Tester Present transmissions (after coalescing)."""
+        return len(self.__tasks)
+
+    @property  # noqa: vulture
+    def skipped_transmissions_number(self) -> int:
+        """Get number of transmissions skipped, because every client was busy with other request."""
+        return self.__skipped_transmissions_number
+
+    @property  # noqa: vulture
+    def failed_transmissions_number(self) -> int:
+        """Get number of Tester Present transmissions that failed (e.g. due to an error of the transport interface)."""
+        return self.__failed_transmissions_number
+
+    @property  # noqa: vulture
+    def jitter_statistics(self) -> Optional[TesterPresentJitterStatistics]:
+        """Get statistics of the delays between planned and actual transmissions, None if nothing was sent yet."""
+        jitters = tuple(self.__jitters)
+        if len(jitters) == 0:
+            return None
+        return TesterPresentJitterStatistics(samples_number=len(jitters),
+                                             min=min(jitters),
+                                             max=max(jitters),
+                                             mean=fmean(jitters),
+                                             stdev=pstdev(jitters))
+
+    @staticmethod
+    def _get_tester_present_request(addressing_type: AddressingType, sprmib: bool) -> UdsMessage:
+        """
+        Create Tester Present request message.
+
+        :param addressing_type: Addressing Type to use.
+        :param sprmib: Whether to use Suppress Positive Response Message Indication Bit.
+
+        :return: Tester Present request message.
+        """
+        payload = TESTER_PRESENT.encode_request({
+            "SubFunction": {
+                "suppressPosRspMsgIndicationBit": sprmib,
+                "zeroSubFunction": 0x00}
+        })
+        return UdsMessage(payload=payload, addressing_type=addressing_type)
+
+    def _get_task_key(self, client: Client, addressing_type: AddressingType, sprmib: bool) -> Hashable:
+        """
+        Get key of the task that would send Tester Present on behalf of the client.
+
+        :param client: Client to keep alive.
+        :param addressing_type: Addressing Type requested by the client.
+        :param sprmib: Whether Suppress Positive Response Message Indication Bit is requested by the client.
+
+        :return: Key shared by clients that can be kept alive with the same functionally addressed message.
+        """
+        if self.coalesce and sprmib:
+            transport_interface = client.transport_interface
+            tx_functional_params = transport_interface.addressing_information.tx_functional_params
+            return (id(transport_interface.network_manager),
+                    tuple(sorted(tx_functional_params.items(), key=lambda item: item[0])))
+        return id(client), addressing_type, sprmib
+
+    def register(self,
+                 client: Client,
+                 addressing_type: AddressingType = AddressingType.FUNCTIONAL,
+                 sprmib: bool = True) -> None:
+        """
+        Start sending Tester Present cyclically on behalf of the client.
+
+        :param client: Client to keep alive.
+        :param addressing_type: Addressing Type to use for cyclical messages.
+            Functional addressing is used if the message is coalesced.
+        :param sprmib: Whether to use Suppress Positive Response Message Indication Bit.
+
+        :raise TypeError: Provided client is not an instance of Client class.
+        :raise ValueError: Provided client is already registered.
+        """
+        if not isinstance(client, Client):
+            raise TypeError(f"Provided value is not an instance of Client class. Actual type: {type(client)}.")
+        addressing_type = AddressingType.validate_member(addressing_type)
+        key = self._get_task_key(client=client, addressing_type=addressing_type, sprmib=sprmib)
+        with self.__condition:
+            if id(client) in self.__clients_tasks:
+                raise ValueError("Provided client is already registered.")
+            task = self.__tasks.get(key, None)
+            if task is None:
+                if self.coalesce and sprmib:
+                    addressing_type = AddressingType.FUNCTIONAL
+                task = _TesterPresentTask(
+                    tester_present_request=self._get_tester_present_request(addressing_type=addressing_type,
+                                                                            sprmib=sprmib),
+                    timestamp_due=perf_counter() + client.s3_client / 1000.)
+                self.__tasks[key] = task
+            task.clients.append(client)
+            task.timestamp_due = min(task.timestamp_due, perf_counter() + task.period)
+            self.__clients_tasks[id(client)] = key
+            self.__schedule(task)
+            if self.__thread is None:
+                self.__thread = Thread(target=self.__scheduling_task, daemon=True)
+                self.__thread.start()
+
+    def unregister(self, client: Client) -> None:
+        """
+        Stop sending Tester Present cyclically on behalf of the client.
+
+        :param client: Client that is no longer kept alive.
+
+        :raise ValueError: Provided client is not registered.
+        """
+        with self.__condition:
+            key = self.__clients_tasks.pop(id(client), None)
+            if key is None:
+                raise ValueError("Provided client is not registered.")
+            task = self.__tasks[key]
+            task.clients.remove(client)
+            if task.clients:
+                self.__schedule(task)
+            else:
+                del self.__tasks[key]
+                task.version += 1
+                self.__condition.notify()
+
+    def __schedule(self, task: _TesterPresentTask) -> None:
+        """
+        Put the task into the heap with its current due time (previous entries of the task become obsolete).
+
+        .. note:: The condition lock must be acquired.
+
+        :param task: Task to schedule.
+        """
+        task.version += 1
+        heappush(self.__heap, (task.timestamp_due, next(self.__sequence), task.version, task))
+        self.__condition.notify()
+
+    def __get_due_task(self) -> Optional[_TesterPresentTask]:
+        """
+        Wait for the task which transmission is due.
+
+        :return: Task to execute, None if there are no tasks left (the scheduler thread shall finish).
+        """
+        with self.__condition:
+            while self.__heap:
+                timestamp_due, _, version, task = self.__heap[0]
+                if version != task.version or not task.clients:
+                    heappop(self.__heap)
+                    continue
+                remaining_wait_s = timestamp_due - perf_counter()
+                if remaining_wait_s > 0:
+                    self.__condition.wait(timeout=remaining_wait_s)
+                    continue
+                heappop(self.__heap)
+                return task
+            self.__thread = None
+            return None
+
+    def __scheduling_task(self) -> None:
+        """Send Tester Present messages when they are due (the scheduler thread)."""
+        while True:
+            task = self.__get_due_task()
+            if task is None:
+                return
+            timestamp_send = perf_counter()
+            try:
+                self.__send_tester_present(task=task, timestamp_send=timestamp_send)
+            finally:
+                with self.__condition:
+                    if task.clients:
+                        period = task.period
+                        while task.timestamp_due <= timestamp_send:
+                            task.timestamp_due += period
+                        self.__schedule(task)
+
+    def __send_tester_present(self, task: _TesterPresentTask, timestamp_send: float) -> None:
+        """
+        Send Tester Present message of the task using the first client that is able to transmit it.
+
+        A failure of one client is reported with a warning and the next client of the task is used,
+        so one broken client never stops the scheduler thread that keeps the other clients alive.
+
+        :param task: Task which Tester Present message is due.
+        :param timestamp_send: Time when the transmission was started.
+        """
+        failed = False
+        for client in tuple(task.clients):
+            try:
+                tp_record = client._send_tester_present(task.tester_present_request)  # pylint: disable=protected-access
+            except Exception as exception:  # pylint: disable=broad-exception-caught
+                failed = True
+                self.__failed_transmissions_number += 1
+                warn(f"Tester Present message could not be sent. Client: {client!r}. Exception: {exception!r}.",
+                     category=RuntimeWarning)
+                continue
+            if tp_record is not None:
+                self.__jitters.append(round((timestamp_send - task.timestamp_due) * 1000., 3))
+                return
+        if not failed:
+            self.__skipped_transmissions_number += 1
@@ -6,17 +6,52 @@ It provides tools for:
  - storing historic information about diagnostic message that were either received or transmitted
  - Service Identifiers (SID) definition
  - Negative Response Codes (NRC) definition
+
+Service Identifiers and Negative Response Codes enums are built on the first access.
 """
 
-from .nrc import NRC
-from .service_identifiers import (
-    ALL_REQUEST_SIDS,
-    ALL_RESPONSE_SIDS,
-    RESPONSE_REQUEST_SID_DIFF,
-    SERVICES_WITH_SUBFUNCTION,
-    RequestSID,
-    ResponseSID,
-    UnrecognizedSIDWarning,
-    define_service,
-)
+import importlib
+from typing import TYPE_CHECKING, Any, Dict, Sequence
+
 from .uds_message import NEGATIVE_RESPONSE_MESSAGE_LENGTH, AbstractUdsMessageContainer, UdsMessage, UdsMessageRecord
+
+if TYPE_CHECKING:
+    from .nrc import NRC
+    from .service_identifiers import (
+        ALL_REQUEST_SIDS,
+        ALL_RESPONSE_SIDS,
+        RESPONSE_REQUEST_SID_DIFF,
+        SERVICES_WITH_SUBFUNCTION,
+        RequestSID,
+        ResponseSID,
+        UnrecognizedSIDWarning,
+        define_service,
+    )
+
+_LAZY_IMPORTS_MODULES: Dict[str, str] = {
+    "NRC": "nrc",
+    "ALL_REQUEST_SIDS": "service_identifiers",
+    "ALL_RESPONSE_SIDS": "service_identifiers",
+    "RESPONSE_REQUEST_SID_DIFF": "service_identifiers",
+    "SERVICES_WITH_SUBFUNCTION": "service_identifiers",
+    "RequestSID": "service_identifiers",
+    "ResponseSID": "service_identifiers",
+    "UnrecognizedSIDWarning": "service_identifiers",
+    "define_service": "service_identifiers",
+}
+"""Mapping from names that are imported on the first access to names of modules where they are defined."""
+
+
+def __getattr__(name: str) -> Any:  # noqa: vulture
+    """Lazy imports of enums."""
+    if name in _LAZY_IMPORTS_MODULES:
+        module = importlib.import_module(f"{__name__}.{_LAZY_IMPORTS_MODULES[name]}")
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> Sequence[str]:  # noqa: vulture
+    """All attributes including the ones that are imported on the first access."""
+    return sorted({*globals(), *_LAZY_IMPORTS_MODULES})
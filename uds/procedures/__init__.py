@@ -0,0 +1,12 @@
+"""
+A sub-package with diagnostic procedures built on top of :ref:`Client <knowledge-base-client>`.
+
+Procedures combine multiple request messages to achieve a single goal, e.g.
+ - reading many :ref:`Data Identifiers <knowledge-base-did>` with the minimal number of requests
+ - downloading (flashing) memory images
+ - uploading memory (e.g. into a memory-mapped file)
+"""
+
+from .memory_image import MemorySegment, read_binary_file, read_intel_hex_file, read_s_record_file
+from .read_data_by_identifiers import DataIdentifiersReader, DataIdentifiersReadResult
+from .transfer import AbstractDataTransfer, DataDownloader, DataUploader, TransferStatistics
@@ -0,0 +1,202 @@
+"""
+Memory images that are transferred to/from the server (ECU).
+
+Binary files are memory-mapped, so their content is never loaded into memory as a whole.
+Files in `Intel HEX <https://en.wikipedia.org/wiki/Intel_HEX>`_ and
+`S-record <https://en.wikipedia.org/wiki/SREC_(file_format)>`_ formats are decoded into contiguous memory segments.
+"""
+
+__all__ = ["MemorySegment", "read_binary_file", "read_intel_hex_file", "read_s_record_file"]
+
+from mmap import ACCESS_READ, mmap
+from os import PathLike
+from typing import Iterable, List, Tuple, Union
+
+from uds.utilities import InconsistencyError
+
+FilePathAlias = Union[str, PathLike[str]]
+"""Alias of a file path."""
+
+_INTEL_HEX_DATA_RECORD: int = 0x00
+"""Intel HEX record type with data."""
+_INTEL_HEX_END_OF_FILE_RECORD: int = 0x01
+"""Intel HEX record type with end of file."""
+_INTEL_HEX_EXTENDED_SEGMENT_ADDRESS_RECORD: int = 0x02
+"""Intel HEX record type with extended segment address."""
+_INTEL_HEX_EXTENDED_LINEAR_ADDRESS_RECORD: int = 0x04
+"""Intel HEX record type with extended linear address."""
+_S_RECORD_ADDRESS_LENGTHS = {"1": 2, "2": 3, "3": 4}
+"""S-record data records types with the number of bytes used by their addresses."""
+
+
+class MemorySegment:
+    """Contiguous block of memory data."""
+
+    def __init__(self, address: int, data: Union[bytes, bytearray, memoryview, mmap]) -> None:
+        """
+        Create memory segment.
+
+        :param address: Memory address of the first byte of the segment.
+        :param data: Data of the segment. Provided object is not copied.
+
+        :raise TypeError: Provided address is not int type or data does not support buffer protocol.
+        :raise ValueError: Provided address is a negative number or data is empty.
+        """
+        if not isinstance(address, int):
+            raise TypeError(f"Provided address is not int type. Actual type: {type(address)}.")
+        if address < 0:
+            raise ValueError(f"Provided address is a negative number. Actual value: {address}.")
+        if not isinstance(data, (bytes, bytearray, memoryview, mmap)):
+            raise TypeError(f"Provided data does not support buffer protocol. Actual type: {type(data)}.")
+        data = memoryview(data).cast("B")
+        if len(data) == 0:
+            raise ValueError("Provided data is empty.")
+        self.__address = address
+        self.__data = data
+
+    def __repr__(self) -> str:
+        """Get string representation of the memory segment."""
+        return f"{self.__class__.__name__}(address=0x{self.address:X}, size={self.size})"
+
+    def __len__(self) -> int:
+        """Get number of bytes in the segment."""
+        return len(self.__data)
+
+    @property
+    def address(self) -> int:
+        """Get memory address of the first byte of the segment."""
+        return self.__address
+
+    @property
+    def data(self) -> memoryview:
+        """Get view on the segment data."""
+        return self.__data
+
+    @property
+    def size(self) -> int:
+        """Get number of bytes in the segment."""
+        return len(self.__data)
+
+    @property  # noqa: vulture
+    def end_address(self) -> int:
+        """Get memory address that directly follows the segment."""
+        return self.__address + len(self.__data)
+
+
+def _merge_data_records(data_records: Iterable[Tuple[int, bytes]]) -> Tuple[MemorySegment, ...]:
+    """
+    Merge data records into contiguous memory segments.
+
+    :param data_records: Memory addresses and data of records.
+
+    :raise InconsistencyError: Data records overlap.
+
+    :return: Memory segments sorted by their addresses.
+    """
+    segments: List[Tuple[int, bytearray]] = []
+    for address, data in data_records:
+        if len(data) == 0:
+            continue
+        if segments and segments[-1][0] + len(segments[-1][1]) == address:
+            segments[-1][1].extend(data)
+        else:
+            segments.append((address, bytearray(data)))
+    segments.sort(key=lambda segment: segment[0])
+    for (previous_address, previous_data), (address, _) in zip(segments, segments[1:]):
+        if previous_address + len(previous_data) > address:
+            raise InconsistencyError(f"Data stored at address 0x{address:X} is defined more than once.")
+    return tuple(MemorySegment(address=address, data=data) for address, data in segments)
+
+
+def read_binary_file(file_path: FilePathAlias, address: int = 0) -> MemorySegment:
+    """
+    Memory-map a binary file.
+
+    :param file_path: Path to the binary file.
+    :param address: Memory address where the file content is located.
+
+    :raise ValueError: The file is empty.
+
+    :return: Memory segment with read-only view on the file content.
+    """
+    with open(file_path, "rb") as file:
+        try:
+            mapped_file = mmap(file.fileno(), 0, access=ACCESS_READ)
+        except ValueError as exception:
+            raise ValueError(f"Provided file is empty: {file_path!r}.") from exception
+    return MemorySegment(address=address, data=mapped_file)
+
+
+def read_intel_hex_file(file_path: FilePathAlias) -> Tuple[MemorySegment, ...]:
+    """
+    Read a file in Intel HEX format.
+
+    :param file_path: Path to the Intel HEX file.
+
+    :raise ValueError: The file content is not in Intel HEX format or its checksum is incorrect.
+
+    :return: Memory segments with the file content.
+    """
+    data_records = []
+    base_address = 0
+    with open(file_path, "r", encoding="ascii") as file:
+        for line_number, line in enumerate(file, start=1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                if line[0] != ":":
+                    raise ValueError("Record does not start with a colon.")
+                record = bytes.fromhex(line[1:])
+                if len(record) < 5 or len(record) != record[0] + 5:
+                    raise ValueError("Incorrect record length.")
+                if sum(record) & 0xFF != 0:
+                    raise ValueError("Incorrect checksum.")
+            except ValueError as exception:
+                raise ValueError(f"Incorrect Intel HEX record in line {line_number}: {line!r}.") from exception
+            record_type = record[3]
+            data = record[4:-1]
+            if record_type == _INTEL_HEX_DATA_RECORD:
+                data_records.append((base_address + int.from_bytes(record[1:3], "big"), data))
+            elif record_type == _INTEL_HEX_END_OF_FILE_RECORD:
+                break
+            elif record_type == _INTEL_HEX_EXTENDED_SEGMENT_ADDRESS_RECORD:
+                base_address = int.from_bytes(data, "big") << 4
+            elif record_type == _INTEL_HEX_EXTENDED_LINEAR_ADDRESS_RECORD:
+                base_address = int.from_bytes(data, "big") << 16
+    return _merge_data_records(data_records)
+
+
+def read_s_record_file(file_path: FilePathAlias) -> Tuple[MemorySegment, ...]:
+    """
+    Read a file in Motorola S-record format.
+
+    :param file_path: Path to the S-record file.
+
+    :raise ValueError: The file content is not in S-record format or its checksum is incorrect.
+
+    :return: Memory segments with the file content.
+    """
+    data_records = []
+    with open(file_path, "r", encoding="ascii") as file:
+        for line_number, line in enumerate(file, start=1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                if line[0] != "S" or len(line) < 2:
+                    raise ValueError("Record does not start with S character.")
+                record = bytes.fromhex(line[2:])
+                if len(record) < 3 or len(record) != record[0] + 1:
+                    raise ValueError("Incorrect record length.")
+                if sum(record) & 0xFF != 0xFF:
+                    raise ValueError("Incorrect checksum.")
+                address_length = _S_RECORD_ADDRESS_LENGTHS.get(line[1], None)
+                if address_length is not None and len(record) < address_length + 2:
+                    raise ValueError("Record is too short to contain address.")
+            except ValueError as exception:
+                raise ValueError(f"Incorrect S-record in line {line_number}: {line!r}.") from exception
+            if address_length is not None:
+                data_records.append((int.from_bytes(record[1:1 + address_length], "big"),
+                                     record[1 + address_length:-1]))
+    return _merge_data_records(data_records)
@@ -0,0 +1,465 @@
+"""
+Reading many Data Identifiers with ReadDataByIdentifier service.
+
+:ref:`ReadDataByIdentifier (SID 0x22) <knowledge-base-service-read-data-by-identifier>` request might contain
+multiple :ref:`DIDs <knowledge-base-did>`, so they can be read using fewer requests.
+The number of DIDs in a single request is limited by the server (ECU):
+ - the maximal number of DIDs in a request (exceeding it causes
+   :ref:`NRC <knowledge-base-nrc>` IncorrectMessageLengthOrInvalidFormat)
+ - the maximal length of a response message (exceeding it causes :ref:`NRC <knowledge-base-nrc>` ResponseTooLong)
+"""
+
+__all__ = ["DataIdentifiersReader", "DataIdentifiersReadResult"]
+
+from collections import deque
+from types import MappingProxyType
+from typing import Deque, Dict, List, Mapping, Optional, Sequence, Tuple, Union
+
+from uds.addressing import AddressingType
+from uds.client import Client
+from uds.message import NEGATIVE_RESPONSE_MESSAGE_LENGTH, NRC, RequestSID, ResponseSID, UdsMessage, UdsMessageRecord
+from uds.translator import BASE_TRANSLATOR, DecodedMessageAlias, Translator
+from uds.translator.data_record import AbstractConditionalDataRecord, AbstractDataRecord, MappingDataRecord
+from uds.utilities import DID_BIT_LENGTH, InconsistencyError
+
+_DID_LENGTH: int = DID_BIT_LENGTH // 8
+"""Number of bytes used by a single DID."""
+_MAX_DID_VALUE: int = (1 << DID_BIT_LENGTH) - 1
+"""Maximal value of DID."""
+
+ExchangeRecordAlias = Tuple[UdsMessageRecord, Tuple[UdsMessageRecord, ...]]
+"""Alias of a single request with all its responses records."""
+
+
+def _get_did_data_lengths(translator: Translator) -> Dict[int, int]:
+    """
+    Get data lengths of DIDs which data structure (with fixed length) is known by the translator.
+
+    :param translator: Translator with ReadDataByIdentifier service that defines DIDs data structures.
+
+    :return: Mapping of DIDs to the number of bytes with their data.
+    """
+    if RequestSID.ReadDataByIdentifier not in translator.services_mapping:
+        return {}
+    response_structure = translator.services_mapping[RequestSID.ReadDataByIdentifier].response_structure
+    if (len(response_structure) < 2
+            or not isinstance(response_structure[0], MappingDataRecord)
+            or not isinstance(response_structure[1], AbstractConditionalDataRecord)):
+        return {}
+    did_data_lengths = {}
+    for did in response_structure[0].values_mapping:
+        try:
+            data_records = response_structure[1][did]
+        except (KeyError, ValueError):
+            continue
+        bit_length = 0
+        for data_record in data_records:
+            if not isinstance(data_record, AbstractDataRecord) or not data_record.fixed_total_length:
+                break
+            bit_length += data_record.min_occurrences * data_record.length
+        else:
+            if bit_length > 0 and bit_length % 8 == 0:
+                did_data_lengths[did] = bit_length // 8
+    return did_data_lengths
+
+
+class DataIdentifiersReadResult:
+    """Result of reading multiple DIDs."""
+
+    def __init__(self,
+                 data: Mapping[int, bytes],
+                 errors: Mapping[int, Union[NRC, int]],
+                 records: Sequence[ExchangeRecordAlias],
+                 translator: Translator) -> None:
+        """
+        Store result of reading multiple DIDs.
+
+        :param data: Mapping of DIDs to their data (bytes) that were read.
+        :param errors: Mapping of DIDs to the NRC values received in response to their reading.
+        :param records: Records of all requests that were sent with their responses.
+        :param translator: Translator to use for decoding DIDs data.
+        """
+        self.__data = MappingProxyType(dict(data))
+        self.__errors = MappingProxyType(dict(errors))
+        self.__records = tuple(records)
+        self.__translator = translator
+
+    @property
+    def data(self) -> Mapping[int, bytes]:
+        """Get mapping of DIDs to their data that were read."""
+        return self.__data
+
+    @property
+    def errors(self) -> Mapping[int, Union[NRC, int]]:
+        """
+        Get mapping of DIDs (that could not be read) to the NRC values.
+
+        .. note:: DIDs that were not contained by positive response message (as they are not supported by the server)
+            are reported with RequestOutOfRange NRC.
+        """
+        return self.__errors
+
+    @property
+    def records(self) -> Tuple[ExchangeRecordAlias, ...]:
+        """Get records of all requests that were sent with their responses."""
+        return self.__records
+
+    @property  # noqa: vulture
+    def requests_number(self) -> int:
+        """Get number of ReadDataByIdentifier requests that were sent."""
+        return len(self.__records)
+
+    def decode(self, did: int) -> DecodedMessageAlias:
+        """
+        Decode data of a DID.
+
+        :param did: DID which data to decode.
+
+        :raise KeyError: Data of provided DID were not read.
+
+        :return: Decoded positive response message with the data of the DID.
+        """
+        payload = bytes([ResponseSID.ReadDataByIdentifier]) + did.to_bytes(_DID_LENGTH, "big") + self.__data[did]
+        return self.__translator.decode_payload(payload)
+
+
+class DataIdentifiersReader:
+    """
+    Reader of multiple DIDs.
+
+    Features:
+     - DIDs are packed into the minimal number of ReadDataByIdentifier requests that do not exceed the server limits
+     - requests are sent back to back and responses are split per DID
+     - the limits are reduced (for the rest of the reading) when a request is rejected with either
+       IncorrectMessageLengthOrInvalidFormat or ResponseTooLong NRC, and rejected DIDs are read again
+       with smaller requests
+    """
+
+    DEFAULT_MAX_RESPONSE_LENGTH: int = 4095
+    """Default value of the maximal response message length (the maximal message length for CAN with classic
+    :ref:`First Frame <knowledge-base-can-first-frame>`)."""
+
+    def __init__(self,
+                 client: Client,
+                 translator: Translator = BASE_TRANSLATOR,
+                 did_data_lengths: Optional[Mapping[int, int]] = None,
+                 max_response_length: int = DEFAULT_MAX_RESPONSE_LENGTH,
+                 max_dids_per_request: Optional[int] = None) -> None:
+        """
+        Configure reader of multiple DIDs.
+
+        :param client: Client to use for communication with the server.
+        :param translator: Translator to use for decoding DIDs data.
+        :param did_data_lengths: Mapping of DIDs to the number of bytes with their data.
+            These values supplement (and overwrite) lengths known from the DIDs definitions of the translator.
+            DIDs with unknown data length are always read with a separate request.
+        :param max_response_length: The maximal length of a response message that the server is able to send.
+        :param max_dids_per_request: The maximal number of DIDs in a single request that the server accepts.
+            Leave None if there is no limit.
+        """
+        self.__custom_did_data_lengths: Mapping[int, int] = {}
+        self.client = client
+        self.translator = translator
+        self.did_data_lengths = did_data_lengths or {}
+        self.max_response_length = max_response_length
+        self.max_dids_per_request = max_dids_per_request
+
+    @property
+    def client(self) -> Client:
+        """Get Client used for communication with the server."""
+        return self.__client
+
+    @client.setter
+    def client(self, value: Client) -> None:
+        """
+        Set Client for communication with the server.
+
+        :param value: Value to set.
+
+        :raise TypeError: Provided value is not an instance of Client class.
+        """
+        if not isinstance(value, Client):
+            raise TypeError(f"Provided value is not an instance of Client class. Actual type: {type(value)}.")
+        self.__client = value
+
+    @property
+    def translator(self) -> Translator:
+        """Get Translator used for decoding DIDs data."""
+        return self.__translator
+
+    @translator.setter
+    def translator(self, value: Translator) -> None:
+        """
+        Set Translator for decoding DIDs data.
+
+        .. note:: Data lengths of DIDs are updated according to DIDs definitions of the new translator.
+
+        :param value: Value to set.
+
+        :raise TypeError: Provided value is not an instance of Translator class.
+        """
+        if not isinstance(value, Translator):
+            raise TypeError(f"Provided value is not an instance of Translator class. Actual type: {type(value)}.")
+        self.__translator = value
+        self.__translator_did_data_lengths = _get_did_data_lengths(value)
+        self.__did_data_lengths = MappingProxyType({**self.__translator_did_data_lengths,
+                                                    **self.__custom_did_data_lengths})
+
+    @property
+    def did_data_lengths(self) -> Mapping[int, int]:
+        """Get mapping of DIDs to the number of bytes with their data."""
+        return self.__did_data_lengths
+
+    @did_data_lengths.setter
+    def did_data_lengths(self, value: Mapping[int, int]) -> None:
+        """
+        Set data lengths of DIDs.
+
+        :param value: Mapping of DIDs to the number of bytes with their data.
+            These values supplement (and overwrite) lengths known from the DIDs definitions of the translator.
+
+        :raise TypeError: Provided value is not a mapping.
+        :raise ValueError: At least one of provided DIDs or data lengths is not a positive integer value
+            in the expected range.
+        """
+        if not isinstance(value, Mapping):
+            raise TypeError(f"Provided value is not a mapping. Actual type: {type(value)}.")
+        for did, data_length in value.items():
+            if not isinstance(did, int) or not 0 <= did <= _MAX_DID_VALUE:
+                raise ValueError(f"Provided DID value is out of range (0x0000-0x{_MAX_DID_VALUE:04X}). "
+                                 f"Actual value: {did!r}.")
+            if not isinstance(data_length, int) or data_length <= 0:
+                raise ValueError(f"Provided data length of DID 0x{did:04X} is not a positive integer. "
+                                 f"Actual value: {data_length!r}.")
+        self.__custom_did_data_lengths = dict(value)
+        self.__did_data_lengths = MappingProxyType({**self.__translator_did_data_lengths,
+                                                    **self.__custom_did_data_lengths})
+
+    @property
+    def max_response_length(self) -> int:
+        """Get the maximal length of a response message that the server is able to send."""
+        return self.__max_response_length
+
+    @max_response_length.setter
+    def max_response_length(self, value: int) -> None:
+        """
+        Set the maximal length of a response message that the server is able to send.
+
+        :param value: Value to set.
+
+        :raise TypeError: Provided value is not int type.
+        :raise ValueError: Provided value is too small to contain a response with any DID data.
+        """
+        if not isinstance(value, int):
+            raise TypeError(f"Provided value is not int type. Actual type: {type(value)}.")
+        if value <= 1 + _DID_LENGTH:
+            raise ValueError(f"Provided value must be greater than {1 + _DID_LENGTH}. Actual value: {value}.")
+        self.__max_response_length = value
+
+    @property
+    def max_dids_per_request(self) -> Optional[int]:
+        """Get the maximal number of DIDs in a single request that the server accepts."""
+        return self.__max_dids_per_request
+
+    @max_dids_per_request.setter
+    def max_dids_per_request(self, value: Optional[int]) -> None:
+        """
+        Set the maximal number of DIDs in a single request that the server accepts.
+
+        :param value: Value to set. Leave None if there is no limit.
+
+        :raise TypeError: Provided value is neither None nor int type.
+        :raise ValueError: Provided value is not a positive number.
+        """
+        if value is not None:
+            if not isinstance(value, int):
+                raise TypeError(f"Provided value is neither None nor int type. Actual type: {type(value)}.")
+            if value <= 0:
+                raise ValueError(f"Provided value is not a positive number. Actual value: {value}.")
+        self.__max_dids_per_request = value
+
+    def get_response_length(self, dids: Sequence[int]) -> Optional[int]:
+        """
+        Get expected length of a positive response message to ReadDataByIdentifier request.
+
+        :param dids: DIDs in the request.
+
+        :return: The number of bytes in the response or None if data length of any DID is unknown.
+        """
+        response_length = 1
+        for did in dids:
+            data_length = self.__did_data_lengths.get(did, None)
+            if data_length is None:
+                return None
+            response_length += _DID_LENGTH + data_length
+        return response_length
+
+    def plan(self, dids: Sequence[int]) -> Tuple[Tuple[int, ...], ...]:
+        """
+        Pack DIDs into ReadDataByIdentifier requests.
+
+        DIDs with known data length are packed (the longest first) into the first request that still fits within
+        the configured limits. Each DID with unknown data length is read using a separate request.
+
+        :param dids: DIDs to read. Repeated values are read only once.
+
+        :raise TypeError: Provided value is not a sequence.
+        :raise ValueError: At least one of provided DIDs is out of range.
+
+        :return: DIDs to put into following requests.
+        """
+        if not isinstance(dids, Sequence):
+            raise TypeError(f"Provided value is not a sequence. Actual type: {type(dids)}.")
+        unique_dids = tuple(dict.fromkeys(dids))
+        for did in unique_dids:
+            if not isinstance(did, int) or not 0 <= did <= _MAX_DID_VALUE:
+                raise ValueError(f"Provided DID value is out of range (0x0000-0x{_MAX_DID_VALUE:04X}). "
+                                 f"Actual value: {did!r}.")
+        return self._pack(dids=unique_dids,
+                          max_response_length=self.max_response_length,
+                          max_dids_per_request=self.max_dids_per_request)
+
+    def _pack(self,
+              dids: Sequence[int],
+              max_response_length: int,
+              max_dids_per_request: Optional[int]) -> Tuple[Tuple[int, ...], ...]:
+        """
+        Pack unique DIDs into ReadDataByIdentifier requests that do not exceed provided limits.
+
+        :param dids: DIDs to read. Each value must be unique.
+        :param max_response_length: The maximal length of a response message.
+        :param max_dids_per_request: The maximal number of DIDs in a single request. None if there is no limit.
+
+        :return: DIDs to put into following requests.
+        """
+        max_dids = max_dids_per_request or len(dids)
+        known_dids = sorted((did for did in dids if did in self.__did_data_lengths),
+                            key=lambda did: self.__did_data_lengths[did],
+                            reverse=True)
+        groups: List[List[int]] = []
+        groups_lengths: List[int] = []
+        for did in known_dids:
+            entry_length = _DID_LENGTH + self.__did_data_lengths[did]
+            for group_index, group in enumerate(groups):
+                if len(group) < max_dids and groups_lengths[group_index] + entry_length <= max_response_length:
+                    group.append(did)
+                    groups_lengths[group_index] += entry_length
+                    break
+            else:
+                groups.append([did])
+                groups_lengths.append(1 + entry_length)
+        groups.extend([did] for did in dids if did not in self.__did_data_lengths)
+        return tuple(tuple(group) for group in groups)
+
+    def _split_response(self, dids: Sequence[int], payload: bytes) -> Optional[Dict[int, bytes]]:
+        """
+        Split positive response message payload per DID.
+
+        :param dids: DIDs in the request.
+        :param payload: Payload of positive response message.
+
+        :return: Mapping of DIDs to their data or None if the payload does not match expected DIDs data lengths.
+        """
+        if len(dids) == 1:
+            if payload[1:1 + _DID_LENGTH] != dids[0].to_bytes(_DID_LENGTH, "big") or len(payload) <= 1 + _DID_LENGTH:
+                return None
+            return {dids[0]: payload[1 + _DID_LENGTH:]}
+        requested_dids = set(dids)
+        data = {}
+        offset = 1
+        while offset < len(payload):
+            did = int.from_bytes(payload[offset:offset + _DID_LENGTH], "big")
+            if did not in requested_dids or did in data:
+                return None
+            offset += _DID_LENGTH
+            data_length = self.__did_data_lengths[did]
+            if offset + data_length > len(payload):
+                return None
+            data[did] = payload[offset:offset + data_length]
+            offset += data_length
+        return data
+
+    def _reduce_limits(self,
+                       dids: Sequence[int],
+                       nrc: int,
+                       max_response_length: int,
+                       max_dids_per_request: Optional[int]) -> Tuple[int, Optional[int]]:
+        """
+        Reduce the limits after a request was rejected, so the rejected DIDs would be split between two requests.
+
+        :param dids: DIDs in the rejected request.
+        :param nrc: NRC value received.
+        :param max_response_length: The maximal length of a response message used for the rejected request.
+        :param max_dids_per_request: The maximal number of DIDs in a single request used for the rejected request.
+
+        :return: Reduced values of the maximal response length and the maximal number of DIDs in a request.
+        """
+        if nrc == NRC.IncorrectMessageLengthOrInvalidFormat:
+            return max_response_length, (len(dids) + 1) // 2
+        response_length = self.get_response_length(dids)
+        if response_length is None:
+            return max_response_length, max_dids_per_request
+        longest_entry = max(_DID_LENGTH + self.__did_data_lengths[did] for did in dids)
+        return max(1 + longest_entry, 1 + (response_length - 1) // 2), max_dids_per_request
+
+    def read(self, dids: Sequence[int]) -> DataIdentifiersReadResult:
+        """
+        Read DIDs using the minimal number of ReadDataByIdentifier requests.
+
+        .. note:: Limits reduced after rejected requests are used only until the end of this reading.
+
+        :param dids: DIDs to read.
+
+        :raise InconsistencyError: Either response to ReadDataByIdentifier request was not received, negative response
+            was too short or positive response does not contain data of the requested DID.
+
+        :return: Data of DIDs that were read and NRC values of DIDs that could not be read.
+        """
+        max_response_length, max_dids_per_request = self.max_response_length, self.max_dids_per_request
+        pending: Deque[Tuple[int, ...]] = deque(self.plan(dids))
+        data: Dict[int, bytes] = {}
+        errors: Dict[int, Union[NRC, int]] = {}
+        records: List[ExchangeRecordAlias] = []
+        while pending:
+            group = pending.popleft()
+            payload = bytearray([RequestSID.ReadDataByIdentifier])
+            for did in group:
+                payload += did.to_bytes(_DID_LENGTH, "big")
+            request = UdsMessage(payload=payload, addressing_type=AddressingType.PHYSICAL)
+            request_record, response_records = self.client.send_request_receive_responses(request)
+            records.append((request_record, response_records))
+            if len(response_records) == 0:
+                raise InconsistencyError("No response was received to ReadDataByIdentifier request.")
+            response_payload = bytes(response_records[-1].payload)
+            if response_payload[0] == ResponseSID.NegativeResponse:
+                if len(response_payload) < NEGATIVE_RESPONSE_MESSAGE_LENGTH:
+                    raise InconsistencyError("Too short negative response to ReadDataByIdentifier request was "
+                                             f"received. Actual payload: {response_payload.hex()}.")
+                nrc = response_payload[2]
+                if len(group) > 1 and nrc in {NRC.IncorrectMessageLengthOrInvalidFormat, NRC.ResponseTooLong}:
+                    max_response_length, max_dids_per_request = self._reduce_limits(
+                        dids=group,
+                        nrc=nrc,
+                        max_response_length=max_response_length,
+                        max_dids_per_request=max_dids_per_request)
+                    pending_dids = [did for pending_group in (group, *pending) for did in pending_group]
+                    pending = deque(self._pack(dids=pending_dids,
+                                               max_response_length=max_response_length,
+                                               max_dids_per_request=max_dids_per_request))
+                    continue
+                for did in group:
+                    errors[did] = NRC(nrc) if NRC.is_member(nrc) else nrc
+                continue
+            group_data = self._split_response(dids=group, payload=response_payload)
+            if group_data is None:
+                if len(group) == 1:
+                    raise InconsistencyError("Positive response to ReadDataByIdentifier request does not contain "
+                                             f"data of the requested DID. Actual payload: {response_payload.hex()}.")
+                # data length of some DID is incorrect - read each DID separately
+                pending.extendleft((did,) for did in reversed(group))
+                continue
+            data.update(group_data)
+            for did in group:
+                if did not in group_data:
+                    errors[did] = NRC.RequestOutOfRange
+        return DataIdentifiersReadResult(data=data, errors=errors, records=records, translator=self.translator)
@@ -0,0 +1,664 @@
+"""
+Data transfer between the client and the server (ECU).
+
+Download (e.g. flashing) is executed using the sequence of:
+ - :ref:`RequestDownload (SID 0x34) <knowledge-base-service-request-download>`
+ - :ref:`TransferData (SID 0x36) <knowledge-base-service-transfer-data>`
+ - :ref:`RequestTransferExit (SID 0x37) <knowledge-base-service-request-transfer-exit>`
+
+Upload (e.g. memory dump) is executed using either the sequence of:
+ - :ref:`RequestUpload (SID 0x35) <knowledge-base-service-request-upload>`
+ - :ref:`TransferData (SID 0x36) <knowledge-base-service-transfer-data>`
+ - :ref:`RequestTransferExit (SID 0x37) <knowledge-base-service-request-transfer-exit>`
+
+or multiple :ref:`ReadMemoryByAddress (SID 0x23) <knowledge-base-service-read-memory-by-address>` requests.
+"""
+
+__all__ = ["TransferStatistics", "AbstractDataTransfer", "DataDownloader", "DataUploader"]
+
+from mmap import mmap
+from os import PathLike
+from time import perf_counter
+from typing import Optional, Sequence, Tuple, Union
+from zlib import crc32
+
+from uds.addressing import AddressingType
+from uds.client import Client
+from uds.message import NEGATIVE_RESPONSE_MESSAGE_LENGTH, NRC, RequestSID, ResponseSID, UdsMessage, UdsMessageRecord
+from uds.utilities import InconsistencyError, NegativeResponseError, TimeMillisecondsAlias, validate_raw_byte
+
+from .memory_image import MemorySegment
+
+BLOCK_SEQUENCE_COUNTER_START: int = 0x01
+"""The first value of blockSequenceCounter used in TransferData requests."""
+_TRANSFER_DATA_HEADER_LENGTH: int = 2
+"""Number of bytes (SID and block sequence counter) that precede data in TransferData request and response."""
+
+WritableBufferAlias = Union[bytearray, memoryview, mmap]
+"""Alias of a writable buffer where uploaded data is stored."""
+
+
+class TransferStatistics:
+    """Statistics of data transfer."""
+
+    def __init__(self) -> None:
+        """Create statistics of data transfer that has not started yet."""
+        self.__start_timestamp = perf_counter()
+        self.__end_timestamp: Optional[float] = None
+        self.__bytes_number = 0
+        self.__blocks_number = 0
+        self.__response_pending_number = 0
+        self.__total_block_latency: TimeMillisecondsAlias = 0.
+        self.__min_block_latency: Optional[TimeMillisecondsAlias] = None
+        self.__max_block_latency: Optional[TimeMillisecondsAlias] = None
+
+    def __repr__(self) -> str:
+        """Get string representation of the statistics."""
+        return (f"{self.__class__.__name__}("
+                f"bytes_number={self.bytes_number}, "
+                f"blocks_number={self.blocks_number}, "
+                f"duration={self.duration:.3f} ms, "
+                f"throughput={self.throughput:.1f} B/s)")
+
+    @property
+    def bytes_number(self) -> int:
+        """Get number of data bytes transferred."""
+        return self.__bytes_number
+
+    @property
+    def blocks_number(self) -> int:
+        """Get number of data blocks transferred."""
+        return self.__blocks_number
+
+    @property  # noqa: vulture
+    def response_pending_number(self) -> int:
+        """Get number of Negative Response Messages with Response Pending NRC received."""
+        return self.__response_pending_number
+
+    @property
+    def duration(self) -> TimeMillisecondsAlias:
+        """Get time (in milliseconds) of the transfer."""
+        end_timestamp = perf_counter() if self.__end_timestamp is None else self.__end_timestamp
+        return (end_timestamp - self.__start_timestamp) * 1000.
+
+    @property
+    def throughput(self) -> float:
+        """Get average number of data bytes transferred per second."""
+        duration = self.duration
+        return 0. if duration == 0 else self.__bytes_number * 1000. / duration
+
+    @property  # noqa: vulture
+    def min_block_latency(self) -> Optional[TimeMillisecondsAlias]:
+        """Get the shortest time (in milliseconds) between a block request and its final response."""
+        return self.__min_block_latency
+
+    @property  # noqa: vulture
+    def max_block_latency(self) -> Optional[TimeMillisecondsAlias]:
+        """Get the longest time (in milliseconds) between a block request and its final response."""
+        return self.__max_block_latency
+
+    @property  # noqa: vulture
+    def average_block_latency(self) -> Optional[TimeMillisecondsAlias]:
+        """Get average time (in milliseconds) between a block request and its final response."""
+        if self.__blocks_number == 0:
+            return None
+        return self.__total_block_latency / self.__blocks_number
+
+    def add_block(self,
+                  bytes_number: int,
+                  request_record: UdsMessageRecord,
+                  response_records: Sequence[UdsMessageRecord]) -> None:
+        """
+        Update statistics with a transferred data block.
+
+        :param bytes_number: Number of data bytes in the block.
+        :param request_record: Record of the request message that was sent.
+        :param response_records: Records of all response messages that were received.
+        """
+        latency = (response_records[-1].transmission_end_timestamp - request_record.transmission_end_timestamp) * 1000.
+        self.__bytes_number += bytes_number
+        self.__blocks_number += 1
+        self.__response_pending_number += len(response_records) - 1
+        self.__total_block_latency += latency
+        if self.__min_block_latency is None or latency < self.__min_block_latency:
+            self.__min_block_latency = latency
+        if self.__max_block_latency is None or latency > self.__max_block_latency:
+            self.__max_block_latency = latency
+
+    def finish(self) -> None:
+        """Mark the end of the transfer."""
+        self.__end_timestamp = perf_counter()
+
+
+class AbstractDataTransfer:
+    """Common implementation for data transfer engines."""
+
+    def __init__(self,
+                 client: Client,
+                 data_format_identifier: int = 0x00,
+                 memory_address_length: int = 4,
+                 memory_size_length: int = 4,
+                 max_block_length: Optional[int] = None) -> None:
+        """
+        Configure data transfer engine.
+
+        :param client: Client to use for communication with the server.
+        :param data_format_identifier: Value of dataFormatIdentifier (compression and encryption methods).
+        :param memory_address_length: Number of bytes used by memoryAddress parameter.
+        :param memory_size_length: Number of bytes used by memorySize parameter.
+        :param max_block_length: The maximal length of messages that carry transferred data, i.e.
+            TransferData request messages (additional limit to the maxNumberOfBlockLength reported by the server)
+            when downloading and ReadMemoryByAddress response messages when uploading.
+            Leave None if there is no additional limit.
+        """
+        self.client = client
+        self.data_format_identifier = data_format_identifier
+        self.memory_address_length = memory_address_length
+        self.memory_size_length = memory_size_length
+        self.max_block_length = max_block_length
+
+    @property
+    def client(self) -> Client:
+        """Get Client used for communication with the server."""
+        return self.__client
+
+    @client.setter
+    def client(self, value: Client) -> None:
+        """
+        Set Client for communication with the server.
+
+        :param value: Value to set.
+
+        :raise TypeError: Provided value is not an instance of Client class.
+        """
+        if not isinstance(value, Client):
+            raise TypeError(f"Provided value is not an instance of Client class. Actual type: {type(value)}.")
+        self.__client = value
+
+    @property
+    def data_format_identifier(self) -> int:
+        """Get value of dataFormatIdentifier."""
+        return self.__data_format_identifier
+
+    @data_format_identifier.setter
+    def data_format_identifier(self, value: int) -> None:
+        """
+        Set value of dataFormatIdentifier.
+
+        :param value: Value to set.
+        """
+        validate_raw_byte(value)
+        self.__data_format_identifier = value
+
+    @property
+    def memory_address_length(self) -> int:
+        """Get number of bytes used by memoryAddress parameter."""
+        return self.__memory_address_length
+
+    @memory_address_length.setter
+    def memory_address_length(self, value: int) -> None:
+        """
+        Set number of bytes used by memoryAddress parameter.
+
+        :param value: Value to set.
+
+        :raise TypeError: Provided value is not int type.
+        :raise ValueError: Provided value is out of range (1-15).
+        """
+        if not isinstance(value, int):
+            raise TypeError(f"Provided value is not int type. Actual type: {type(value)}.")
+        if not 1 <= value <= 0xF:
+            raise ValueError(f"Provided value is out of range (1-15). Actual value: {value}.")
+        self.__memory_address_length = value
+
+    @property
+    def memory_size_length(self) -> int:
+        """Get number of bytes used by memorySize parameter."""
+        return self.__memory_size_length
+
+    @memory_size_length.setter
+    def memory_size_length(self, value: int) -> None:
+        """
+        Set number of bytes used by memorySize parameter.
+
+        :param value: Value to set.
+
+        :raise TypeError: Provided value is not int type.
+        :raise ValueError: Provided value is out of range (1-15).
+        """
+        if not isinstance(value, int):
+            raise TypeError(f"Provided value is not int type. Actual type: {type(value)}.")
+        if not 1 <= value <= 0xF:
+            raise ValueError(f"Provided value is out of range (1-15). Actual value: {value}.")
+        self.__memory_size_length = value
+
+    @property
+    def max_block_length(self) -> Optional[int]:
+        """Get the maximal length of messages that carry transferred data."""
+        return self.__max_block_length
+
+    @max_block_length.setter
+    def max_block_length(self, value: Optional[int]) -> None:
+        """
+        Set the maximal length of messages that carry transferred data.
+
+        :param value: Value to set. Leave None if there is no additional limit.
+
+        :raise TypeError: Provided value is neither None nor int type.
+        :raise ValueError: Provided value is too small to contain any data.
+        """
+        if value is not None:
+            if not isinstance(value, int):
+                raise TypeError(f"Provided value is neither None nor int type. Actual type: {type(value)}.")
+            if value <= _TRANSFER_DATA_HEADER_LENGTH:
+                raise ValueError(f"Provided value must be greater than {_TRANSFER_DATA_HEADER_LENGTH}. "
+                                 f"Actual value: {value}.")
+        self.__max_block_length = value
+
+    def _exchange(self, payload: Union[bytes, bytearray]) -> Tuple[UdsMessageRecord, Tuple[UdsMessageRecord, ...]]:
+        """
+        Send request message and receive its final positive response.
+
+        :param payload: Payload of the request message.
+
+        :raise InconsistencyError: Response message was not received or negative response message was too short.
+        :raise NegativeResponseError: Negative response message was received.
+
+        :return: Record of the request message that was sent and records of all responses messages received.
+        """
+        request = UdsMessage(payload=payload, addressing_type=AddressingType.PHYSICAL)
+        request_record, response_records = self.client.send_request_receive_responses(request)
+        if len(response_records) == 0:
+            raise InconsistencyError(f"No response was received to {RequestSID(payload[0]).name} request.")
+        response_payload = response_records[-1].payload
+        if response_payload[0] == ResponseSID.NegativeResponse:
+            if len(response_payload) < NEGATIVE_RESPONSE_MESSAGE_LENGTH:
+                raise InconsistencyError(f"Too short negative response to {RequestSID(payload[0]).name} request was "
+                                         f"received. Actual payload: {bytes(response_payload).hex()}.")
+            nrc = response_payload[2]
+            raise NegativeResponseError(f"{RequestSID(payload[0]).name} request was rejected with NRC "
+                                        f"{NRC(nrc).name if NRC.is_member(nrc) else f'0x{nrc:02X}'}.")
+        return request_record, response_records
+
+    def _get_address_and_size(self, address: int, size: int) -> bytes:
+        """
+        Get addressAndLengthFormatIdentifier, memoryAddress and memorySize parameters.
+
+        :param address: Value of memory address.
+        :param size: Value of memory size.
+
+        :raise ValueError: Provided address or size cannot be stored with configured number of bytes.
+
+        :return: Bytes with the parameters.
+        """
+        try:
+            address_bytes = address.to_bytes(self.memory_address_length, "big")
+            size_bytes = size.to_bytes(self.memory_size_length, "big")
+        except OverflowError as exception:
+            raise ValueError(f"Memory address (0x{address:X}) or size ({size}) cannot be stored using configured "
+                             "number of bytes.") from exception
+        return bytes([(self.memory_size_length << 4) | self.memory_address_length]) + address_bytes + size_bytes
+
+    def _request_transfer(self, request_sid: RequestSID, address: int, size: int) -> int:
+        """
+        Request either download or upload of a memory block.
+
+        :param request_sid: Either RequestDownload or RequestUpload SID.
+        :param address: Memory address of the transferred data.
+        :param size: Number of bytes to transfer.
+
+        :raise InconsistencyError: Response message does not contain valid maxNumberOfBlockLength.
+
+        :return: The maximal length of TransferData message reported by the server.
+        """
+        payload = bytes([request_sid, self.data_format_identifier]) + self._get_address_and_size(address, size)
+        _, response_records = self._exchange(payload)
+        response_payload = response_records[-1].payload
+        block_length_length = response_payload[1] >> 4 if len(response_payload) > 1 else 0
+        if block_length_length == 0 or len(response_payload) != 2 + block_length_length:
+            raise InconsistencyError(f"{request_sid.name} positive response does not contain valid "
+                                     f"maxNumberOfBlockLength. Actual payload: {bytes(response_payload).hex()}.")
+        max_number_of_block_length = int.from_bytes(response_payload[2:], "big")
+        if max_number_of_block_length <= _TRANSFER_DATA_HEADER_LENGTH:
+            raise InconsistencyError(f"maxNumberOfBlockLength is too small to transfer any data. "
+                                     f"Actual value: {max_number_of_block_length}.")
+        return max_number_of_block_length
+
+    def request_transfer_exit(self, transfer_request_parameter: Union[bytes, bytearray] = b"") -> bytes:
+        """
+        Finish data transfer.
+
+        :param transfer_request_parameter: Value of transferRequestParameterRecord to send.
+
+        :return: Value of transferResponseParameterRecord received.
+        """
+        _, response_records = self._exchange(bytes([RequestSID.RequestTransferExit]) + transfer_request_parameter)
+        return bytes(response_records[-1].payload[1:])
+
+
+class DataDownloader(AbstractDataTransfer):
+    """
+    Download (e.g. flashing) engine.
+
+    Features:
+     - data is sliced into blocks without copying the whole image (memory-mapped files might be used)
+     - block length is configured according to maxNumberOfBlockLength reported by the server
+     - block sequence counter wraps around (from 0xFF to 0x00)
+    """
+
+    def request_download(self, address: int, size: int) -> int:
+        """
+        Request download of a memory block.
+
+        :param address: Memory address where the data is to be downloaded.
+        :param size: Number of bytes to download.
+
+        :return: The maximal length of TransferData request message to use.
+        """
+        max_number_of_block_length = self._request_transfer(request_sid=RequestSID.RequestDownload,
+                                                            address=address,
+                                                            size=size)
+        if self.max_block_length is not None:
+            return min(max_number_of_block_length, self.max_block_length)
+        return max_number_of_block_length
+
+    def transfer_data(self,
+                      data: Union[bytes, bytearray, memoryview],
+                      max_number_of_block_length: int,
+                      statistics: Optional[TransferStatistics] = None,
+                      block_sequence_counter: int = BLOCK_SEQUENCE_COUNTER_START) -> int:
+        """
+        Transfer data in blocks.
+
+        :param data: Data to transfer.
+        :param max_number_of_block_length: The maximal length of TransferData request message.
+        :param statistics: Statistics to update with every transferred block.
+        :param block_sequence_counter: Value of block sequence counter to use in the first block.
+
+        :raise InconsistencyError: Block sequence counter in a response message does not match the request.
+
+        :return: Value of block sequence counter to use in the following block.
+        """
+        view = memoryview(data).cast("B")
+        block_data_length = max_number_of_block_length - _TRANSFER_DATA_HEADER_LENGTH
+        payload = bytearray(max_number_of_block_length)
+        payload[0] = RequestSID.TransferData
+        for offset in range(0, len(view), block_data_length):
+            block = view[offset:offset + block_data_length]
+            payload[1] = block_sequence_counter
+            payload[_TRANSFER_DATA_HEADER_LENGTH:] = block
+            request_record, response_records = self._exchange(payload)
+            response_payload = response_records[-1].payload
+            if len(response_payload) < 2 or response_payload[1] != block_sequence_counter:
+                raise InconsistencyError("TransferData positive response contains incorrect block sequence counter. "
+                                         f"Expected value: 0x{block_sequence_counter:02X}. "
+                                         f"Actual payload: {bytes(response_payload).hex()}.")
+            if statistics is not None:
+                statistics.add_block(bytes_number=len(block),
+                                     request_record=request_record,
+                                     response_records=response_records)
+            block_sequence_counter = (block_sequence_counter + 1) & 0xFF
+        return block_sequence_counter
+
+    def download(self, segments: Union[MemorySegment, Sequence[MemorySegment]]) -> TransferStatistics:
+        """
+        Download memory segments to the server.
+
+        :param segments: Memory segment(s) to download.
+
+        :raise TypeError: Provided value is neither a memory segment nor a sequence of memory segments.
+
+        :return: Statistics of the download.
+        """
+        if isinstance(segments, MemorySegment):
+            segments = (segments,)
+        if not all(isinstance(segment, MemorySegment) for segment in segments):
+            raise TypeError("Provided value is neither a memory segment nor a sequence of memory segments.")
+        statistics = TransferStatistics()
+        for segment in segments:
+            max_number_of_block_length = self.request_download(address=segment.address, size=segment.size)
+            self.transfer_data(data=segment.data,
+                               max_number_of_block_length=max_number_of_block_length,
+                               statistics=statistics)
+            self.request_transfer_exit()
+        statistics.finish()
+        return statistics
+
+
+class DataUploader(AbstractDataTransfer):
+    """
+    Upload (e.g. memory dump) engine.
+
+    Features:
+     - each received block is written straight into the sink (e.g. memory-mapped file) at its offset,
+       so memory usage does not depend on the upload size
+     - upload might be resumed from any offset
+     - CRC-32 checksum is calculated on the fly and verified at the end of the upload
+    """
+
+    DEFAULT_READ_MEMORY_BLOCK_LENGTH: int = 4095
+    """Default length of ReadMemoryByAddress response message (used when
+    :attr:`~uds.procedures.transfer.AbstractDataTransfer.max_block_length` is not set)."""
+
+    def request_upload(self, address: int, size: int) -> int:
+        """
+        Request upload of a memory block.
+
+        :param address: Memory address of the data to upload.
+        :param size: Number of bytes to upload.
+
+        :return: The maximal length of TransferData response message that the server would send.
+        """
+        return self._request_transfer(request_sid=RequestSID.RequestUpload, address=address, size=size)
+
+    @staticmethod
+    def _get_sink_view(sink: WritableBufferAlias, size: int, offset: int) -> memoryview:
+        """
+        Get view on the sink where uploaded data is to be written.
+
+        :param sink: Writable buffer for the uploaded data.
+        :param size: Number of bytes to upload.
+        :param offset: Number of bytes that were already uploaded (the offset to resume the upload from).
+
+        :raise TypeError: Provided sink is not a writable buffer.
+        :raise ValueError: Provided sink is too small or offset is out of range.
+
+        :return: Writable view on the sink.
+        """
+        if not isinstance(sink, (bytearray, memoryview, mmap)):
+            raise TypeError(f"Provided sink is not a writable buffer. Actual type: {type(sink)}.")
+        view = memoryview(sink).cast("B")
+        if view.readonly:
+            raise TypeError("Provided sink is read-only.")
+        if len(view) < size:
+            raise ValueError(f"Provided sink is too small. Expected size: {size}. Actual size: {len(view)}.")
+        if not isinstance(offset, int) or not 0 <= offset <= size:
+            raise ValueError(f"Provided offset is out of range (0-{size}). Actual value: {offset!r}.")
+        return view[:size]
+
+    def transfer_data(self,
+                      sink: memoryview,
+                      offset: int,
+                      max_number_of_block_length: int,
+                      statistics: Optional[TransferStatistics] = None,
+                      checksum: int = 0,
+                      block_sequence_counter: int = BLOCK_SEQUENCE_COUNTER_START) -> int:
+        """
+        Receive data in blocks.
+
+        :param sink: View on the buffer where the whole uploaded data is to be stored.
+        :param offset: Position in the sink where the first received block is to be written.
+        :param max_number_of_block_length: The maximal length of TransferData response message.
+        :param statistics: Statistics to update with every transferred block.
+        :param checksum: CRC-32 value of the data that precedes the offset.
+        :param block_sequence_counter: Value of block sequence counter to use in the first block.
+
+        :raise InconsistencyError: Response message contains either incorrect block sequence counter or
+            incorrect number of data bytes.
+
+        :return: CRC-32 value of the data stored in the sink.
+        """
+        block_data_length = max_number_of_block_length - _TRANSFER_DATA_HEADER_LENGTH
+        payload = bytearray([RequestSID.TransferData, 0x00])
+        while offset < len(sink):
+            payload[1] = block_sequence_counter
+            request_record, response_records = self._exchange(payload)
+            response_payload = response_records[-1].payload
+            if len(response_payload) < 2 or response_payload[1] != block_sequence_counter:
+                raise InconsistencyError("TransferData positive response contains incorrect block sequence counter. "
+                                         f"Expected value: 0x{block_sequence_counter:02X}. "
+                                         f"Actual payload: {bytes(response_payload[:2]).hex()}.")
+            bytes_number = len(response_payload) - _TRANSFER_DATA_HEADER_LENGTH
+            if not 0 < bytes_number <= min(block_data_length, len(sink) - offset):
+                raise InconsistencyError("TransferData positive response contains incorrect number of data bytes. "
+                                         f"Actual value: {bytes_number}.")
+            with sink[offset:offset + bytes_number] as block:
+                block[:] = memoryview(response_payload)[_TRANSFER_DATA_HEADER_LENGTH:]
+                checksum = crc32(block, checksum)
+            offset += bytes_number
+            if statistics is not None:
+                statistics.add_block(bytes_number=bytes_number,
+                                     request_record=request_record,
+                                     response_records=response_records)
+            block_sequence_counter = (block_sequence_counter + 1) & 0xFF
+        return checksum
+
+    def read_memory(self,
+                    sink: memoryview,
+                    address: int,
+                    offset: int,
+                    statistics: Optional[TransferStatistics] = None,
+                    checksum: int = 0) -> int:
+        """
+        Read memory in blocks using ReadMemoryByAddress service.
+
+        :param sink: View on the buffer where the whole uploaded data is to be stored.
+        :param address: Memory address of the first byte of the sink.
+        :param offset: Position in the sink where the first received block is to be written.
+        :param statistics: Statistics to update with every transferred block.
+        :param checksum: CRC-32 value of the data that precedes the offset.
+
+        :raise InconsistencyError: Response message contains incorrect number of data bytes.
+
+        :return: CRC-32 value of the data stored in the sink.
+        """
+        block_data_length = (self.max_block_length or self.DEFAULT_READ_MEMORY_BLOCK_LENGTH) - 1
+        while offset < len(sink):
+            bytes_number = min(block_data_length, len(sink) - offset)
+            payload = bytes([RequestSID.ReadMemoryByAddress]) + self._get_address_and_size(address + offset,
+                                                                                           bytes_number)
+            request_record, response_records = self._exchange(payload)
+            response_payload = response_records[-1].payload
+            if len(response_payload) != bytes_number + 1:
+                raise InconsistencyError("ReadMemoryByAddress positive response contains incorrect number of data "
+                                         f"bytes. Expected value: {bytes_number}. "
+                                         f"Actual value: {len(response_payload) - 1}.")
+            with sink[offset:offset + bytes_number] as block:
+                block[:] = memoryview(response_payload)[1:]
+                checksum = crc32(block, checksum)
+            offset += bytes_number
+            if statistics is not None:
+                statistics.add_block(bytes_number=bytes_number,
+                                     request_record=request_record,
+                                     response_records=response_records)
+        return checksum
+
+    def upload(self,
+               address: int,
+               size: int,
+               sink: WritableBufferAlias,
+               offset: int = 0,
+               expected_crc32: Optional[int] = None,
+               use_read_memory_by_address: bool = False,
+               statistics: Optional[TransferStatistics] = None) -> TransferStatistics:
+        """
+        Upload memory block from the server.
+
+        :param address: Memory address of the data to upload.
+        :param size: Number of bytes to upload.
+        :param sink: Writable buffer (e.g. bytearray or memory-mapped file) where the uploaded data is to be stored.
+            Data from the memory address is stored at the beginning of the sink.
+        :param offset: Number of bytes that were already uploaded (the offset to resume the upload from).
+            Data that is already stored in the sink (before the offset) is not uploaded again.
+        :param expected_crc32: Expected CRC-32 value of the whole uploaded data.
+            Leave None to skip the verification.
+        :param use_read_memory_by_address: True if ReadMemoryByAddress service is to be used,
+            False if RequestUpload, TransferData and RequestTransferExit services are to be used.
+        :param statistics: Statistics to update with every transferred block.
+            If the upload is interrupted, its bytes_number attribute contains the number of bytes that were stored
+            in the sink (which shall be added to the offset to resume the upload).
+            Leave None to create new statistics.
+
+        :raise InconsistencyError: CRC-32 value of the uploaded data does not match the expected value.
+
+        :return: Statistics of the upload.
+        """
+        if statistics is None:
+            statistics = TransferStatistics()
+        # view is released explicitly, so a memory-mapped sink can be closed even if the upload fails
+        with self._get_sink_view(sink=sink, size=size, offset=offset) as view:
+            checksum = crc32(view[:offset])
+            if offset < size:
+                if use_read_memory_by_address:
+                    checksum = self.read_memory(sink=view,
+                                                address=address,
+                                                offset=offset,
+                                                statistics=statistics,
+                                                checksum=checksum)
+                else:
+                    max_number_of_block_length = self.request_upload(address=address + offset, size=size - offset)
+                    checksum = self.transfer_data(sink=view,
+                                                  offset=offset,
+                                                  max_number_of_block_length=max_number_of_block_length,
+                                                  statistics=statistics,
+                                                  checksum=checksum)
+                    self.request_transfer_exit()
+        statistics.finish()
+        if expected_crc32 is not None and checksum != expected_crc32:
+            raise InconsistencyError(f"CRC-32 of the uploaded data (0x{checksum:08X}) does not match the expected "
+                                     f"value (0x{expected_crc32:08X}).")
+        return statistics
+
+    def upload_to_file(self,
+                       file_path: Union[str, "PathLike[str]"],
+                       address: int,
+                       size: int,
+                       offset: int = 0,
+                       expected_crc32: Optional[int] = None,
+                       use_read_memory_by_address: bool = False,
+                       statistics: Optional[TransferStatistics] = None) -> TransferStatistics:
+        """
+        Upload memory block from the server into a (memory-mapped) file.
+
+        :param file_path: Path to the file where the uploaded data is to be stored.
+            The file is created (or resized) to the upload size.
+        :param address: Memory address of the data to upload.
+        :param size: Number of bytes to upload.
+        :param offset: Number of bytes that were already uploaded to the file (the offset to resume the upload from).
+            The file is overwritten if the offset equals 0.
+        :param expected_crc32: Expected CRC-32 value of the whole uploaded data.
+            Leave None to skip the verification.
+        :param use_read_memory_by_address: True if ReadMemoryByAddress service is to be used,
+            False if RequestUpload, TransferData and RequestTransferExit services are to be used.
+        :param statistics: Statistics to update with every transferred block.
+            Leave None to create new statistics.
+
+        :raise ValueError: Provided size is not a positive number.
+
+        :return: Statistics of the upload.
+        """
+        if not isinstance(size, int) or size <= 0:
+            raise ValueError(f"Provided size is not a positive number. Actual value: {size!r}.")
+        with open(file_path, "r+b" if offset > 0 else "w+b") as file:
+            file.truncate(size)
+            with mmap(file.fileno(), size) as mapped_file:
+                try:
+                    return self.upload(address=address,
+                                       size=size,
+                                       sink=mapped_file,
+                                       offset=offset,
+                                       expected_crc32=expected_crc32,
+                                       use_read_memory_by_address=use_read_memory_by_address,
+                                       statistics=statistics)
+                finally:
+                    mapped_file.flush()
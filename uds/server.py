@@ -0,0 +1,480 @@
+"""Implementation for :ref:`UDS Server <knowledge-base-server>` Simulation (e.g. ECU emulator for load testing)."""
+
+__all__ = ["Server", "ServerResponse", "ResponseHandlerAlias"]
+
+from threading import Event, Lock, Thread
+from time import sleep
+from types import MappingProxyType
+from typing import Callable, Dict, FrozenSet, List, Mapping, Optional, Tuple
+from warnings import warn
+
+from uds.addressing import AddressingType
+from uds.message import (
+    NRC,
+    RESPONSE_REQUEST_SID_DIFF,
+    SERVICES_WITH_SUBFUNCTION,
+    ResponseSID,
+    UdsMessage,
+    UdsMessageRecord,
+)
+from uds.translator import DecodedMessageAlias, Translator
+from uds.transport_interface import AbstractTransportInterface
+from uds.utilities import SPRMIB_MASK, RawBytesAlias, ReassignmentError, TimeMillisecondsAlias, validate_raw_bytes
+
+
+class ServerResponse:
+    """Configuration of a response (with its timing) that simulated server sends to a request message."""
+
+    DEFAULT_RESPONSE_PENDING_PERIOD: TimeMillisecondsAlias = 10
+    """Default time between consecutive Response Pending messages."""
+
+    def __init__(self,
+                 payload: Optional[RawBytesAlias] = None,
+                 data_records_values: Optional[Mapping[str, object]] = None,
+                 nrc: Optional[NRC] = None,
+                 delay: TimeMillisecondsAlias = 0,
+                 response_pending_number: int = 0,
+                 response_pending_period: TimeMillisecondsAlias = DEFAULT_RESPONSE_PENDING_PERIOD) -> None:
+        """
+        Configure response of a simulated server.
+
+        Exactly one of `payload`, `data_records_values` and `nrc` parameters has to be provided.
+
+        :param payload: Raw payload of the response message.
+        :param data_records_values: Data Records values of the positive response message.
+            They are encoded using Translator of the server.
+        :param nrc: NRC value of the negative response message.
+        :param delay: Time (in milliseconds) to wait before the first (either Response Pending or the final)
+            response message is sent.
+        :param response_pending_number: Number of Negative Response messages with Response Pending NRC (0x78)
+            to send before the final response.
+        :param response_pending_period: Time (in milliseconds) between consecutive Response Pending messages
+            and between the last of them and the final response.
+
+        :raise TypeError: Provided value has incorrect type.
+        :raise ValueError: Provided value is out of range or not exactly one response content was provided.
+        """
+        if (payload is None) + (data_records_values is None) + (nrc is None) != 2:
+            raise ValueError("Exactly one of `payload`, `data_records_values` and `nrc` parameters must be provided.")
+        if payload is not None:
+            validate_raw_bytes(payload)
+            payload = bytes(payload)
+        if data_records_values is not None:
+            if not isinstance(data_records_values, Mapping):
+                raise TypeError(f"Provided Data Records values are not a mapping. "
+                                f"Actual type: {type(data_records_values)}.")
+            data_records_values = MappingProxyType(dict(data_records_values))
+        if nrc is not None:
+            nrc = NRC.validate_member(nrc)
+        for name, value in (("delay", delay), ("response_pending_period", response_pending_period)):
+            if not isinstance(value, (int, float)):
+                raise TypeError(f"Provided `{name}` value is not int or float type. Actual type: {type(value)}.")
+            if value < 0:
+                raise ValueError(f"Provided `{name}` value is a negative number. Actual value: {value}.")
+        if not isinstance(response_pending_number, int):
+            raise TypeError("Provided Response Pending messages number is not int type. "
+                            f"Actual type: {type(response_pending_number)}.")
+        if response_pending_number < 0:
+            raise ValueError("Provided Response Pending messages number is a negative number. "
+                             f"Actual value: {response_pending_number}.")
+        self.__payload = payload
+        self.__data_records_values = data_records_values
+        self.__nrc = nrc
+        self.__delay = delay
+        self.__response_pending_number = response_pending_number
+        self.__response_pending_period = response_pending_period
+
+    def __repr__(self) -> str:
+        """Get string representation of the response configuration."""
+        return (f"{self.__class__.__name__}(payload={self.payload!r}, "
+                f"data_records_values={None if self.data_records_values is None else dict(self.data_records_values)}, "
+                f"nrc={self.nrc!r}, "
+                f"delay={self.delay}, "
+                f"response_pending_number={self.response_pending_number}, "
+                f"response_pending_period={self.response_pending_period})")
+
+    @property
+    def payload(self) -> Optional[bytes]:
+        """Get raw payload of the response message."""
+        return self.__payload
+
+    @property
+    def data_records_values(self) -> Optional[Mapping[str, object]]:
+        """Get Data Records values of the positive response message."""
+        return self.__data_records_values
+
+    @property
+    def nrc(self) -> Optional[NRC]:
+        """Get NRC value of the negative response message."""
+        return self.__nrc
+
+    @property
+    def delay(self) -> TimeMillisecondsAlias:
+        """Get time (in milliseconds) to wait before the first response message is sent."""
+        return self.__delay
+
+    @property
+    def response_pending_number(self) -> int:
+        """Get number of Response Pending messages to send before the final response."""
+        return self.__response_pending_number
+
+    @property
+    def response_pending_period(self) -> TimeMillisecondsAlias:
+        """Get time (in milliseconds) between consecutive Response Pending messages."""
+        return self.__response_pending_period
+
+
+ResponseHandlerAlias = Callable[[UdsMessageRecord], Optional[ServerResponse]]
+"""Alias of a callable that determines response to a request message (None if no response is to be sent)."""
+
+
+class Server:
+    """
+    Simulation for UDS Server entity.
+
+    The server answers request messages using (in this order):
+
+    - table with responses to specific request payloads
+    - handlers of specific services (by SID value)
+    - default response (Negative Response with ServiceNotSupported NRC unless configured otherwise)
+
+    Flow Control parameters (Block Size and Separation Time minimum) that the server uses while receiving
+    segmented requests are configured on the transport interface (e.g. using
+    :class:`~uds.can.packet.flow_control.DefaultFlowControlParametersGenerator` for CAN).
+    Many servers could be simulated on a single bus, each with its own transport interface (with its own
+    addressing information).
+    """
+
+    DEFAULT_RECEIVING_TASK_CYCLE: TimeMillisecondsAlias = 10
+    """Default value of serving task cycle."""
+    SUPPRESSED_FUNCTIONAL_NRCS: FrozenSet[NRC] = frozenset({NRC.ServiceNotSupported,
+                                                            NRC.SubFunctionNotSupported,
+                                                            NRC.RequestOutOfRange,
+                                                            NRC.SubFunctionNotSupportedInActiveSession,
+                                                            NRC.ServiceNotSupportedInActiveSession})
+    """NRC values of Negative Responses that are not sent to functionally addressed requests."""
+    DEFAULT_RESPONSE: ServerResponse = ServerResponse(nrc=NRC.ServiceNotSupported)
+    """Default response to requests that are neither in responses table nor handled by handlers."""
+
+    def __init__(self,
+                 transport_interface: AbstractTransportInterface,
+                 responses: Optional[Mapping[bytes, ServerResponse]] = None,
+                 handlers: Optional[Mapping[int, ResponseHandlerAlias]] = None,
+                 translator: Optional[Translator] = None,
+                 default_response: Optional[ServerResponse] = DEFAULT_RESPONSE) -> None:
+        """
+        Configure Server for UDS communication.
+
+        :param transport_interface: Transport Interface object for managing UDS communication.
+        :param responses: Table with responses to request messages.
+            Mapping keys are payloads of request messages.
+        :param handlers: Handlers of diagnostic services.
+            Mapping keys are SID values.
+        :param translator: Translator used for encoding responses configured with Data Records values
+            and available to handlers.
+        :param default_response: Response to requests that are not configured otherwise.
+            Leave None to ignore such requests.
+        """
+        self.transport_interface = transport_interface
+        self.responses = responses or {}
+        self.handlers = handlers or {}
+        self.translator = translator
+        self.default_response = default_response
+        self.__received_requests_number = 0
+        self.__sent_responses_number = 0
+        self.__counters_lock: Lock = Lock()
+        self.__serving_task_event: Event = Event()
+        self.__serving_thread: Optional[Thread] = None
+
+    def __del__(self) -> None:
+        """Safely finish all tasks."""
+        if self.is_running:
+            self.stop()
+
+    @property
+    def transport_interface(self) -> AbstractTransportInterface:
+        """Get Transport Interface used."""
+        return self.__transport_interface
+
+    @transport_interface.setter
+    def transport_interface(self, value: AbstractTransportInterface) -> None:
+        """
+        Set Transport Interface for UDS communication.
+
+        :param value: Value to set.
+
+        :raise TypeError: Provided value is not an instance of AbstractTransportInterface class.
+        :raise ReassignmentError: An attempt to change the value after object creation.
+        """
+        if not isinstance(value, AbstractTransportInterface):
+            raise TypeError("Provided value is not an instance of AbstractTransportInterface class. "
+                            f"Actual type: {type(value)}.")
+        if hasattr(self, "_Server__transport_interface"):
+            raise ReassignmentError("Value of 'transport_interface' attribute cannot be changed once assigned.")
+        self.__transport_interface = value
+
+    @property
+    def responses(self) -> Mapping[bytes, ServerResponse]:
+        """Get table with responses to request messages (keys are payloads of request messages)."""
+        return MappingProxyType(self.__responses)
+
+    @responses.setter
+    def responses(self, value: Mapping[bytes, ServerResponse]) -> None:
+        """
+        Set table with responses to request messages.
+
+        :param value: Mapping with payloads of request messages (keys) and responses to them (values).
+
+        :raise TypeError: Provided value is not a mapping or at least one of its items has incorrect type.
+        """
+        if not isinstance(value, Mapping):
+            raise TypeError(f"Provided value is not a mapping. Actual type: {type(value)}.")
+        responses: Dict[bytes, ServerResponse] = {}
+        for request_payload, response in value.items():
+            validate_raw_bytes(request_payload)
+            if not isinstance(response, ServerResponse):
+                raise TypeError("At least one of provided responses is not an instance of ServerResponse class. "
+                                f"Actual type: {type(response)}.")
+            responses[bytes(request_payload)] = response
+        self.__responses = responses
+
+    @property
+    def handlers(self) -> Mapping[int, ResponseHandlerAlias]:
+        """Get handlers of diagnostic services (keys are SID values)."""
+        return MappingProxyType(self.__handlers)
+
+    @handlers.setter
+    def handlers(self, value: Mapping[int, ResponseHandlerAlias]) -> None:
+        """
+        Set handlers of diagnostic services.
+
+        :param value: Mapping with SID values (keys) and handlers of these services (values).
+
+        :raise TypeError: Provided value is not a mapping or at least one of its items has incorrect type.
+        :raise ValueError: At least one of provided keys is not a byte value.
+        """
+        if not isinstance(value, Mapping):
+            raise TypeError(f"Provided value is not a mapping. Actual type: {type(value)}.")
+        for sid, handler in value.items():
+            if not isinstance(sid, int):
+                raise TypeError(f"At least one of provided SID values is not int type. Actual type: {type(sid)}.")
+            if not 0 <= sid <= 0xFF:
+                raise ValueError(f"At least one of provided SID values is not a byte value. Actual value: {sid}.")
+            if not callable(handler):
+                raise TypeError(f"At least one of provided handlers is not callable. Actual value: {handler!r}.")
+        self.__handlers = {int(sid): handler for sid, handler in value.items()}
+
+    @property
+    def translator(self) -> Optional[Translator]:
+        """Get Translator used for encoding responses."""
+        return self.__translator
+
+    @translator.setter
+    def translator(self, value: Optional[Translator]) -> None:
+        """
+        Set Translator used for encoding responses.
+
+        :param value: Translator to use or None if responses are configured with raw payloads only.
+
+        :raise TypeError: Provided value is neither None nor an instance of Translator class.
+        """
+        if value is not None and not isinstance(value, Translator):
+            raise TypeError(f"Provided value is not an instance of Translator class. Actual type: {type(value)}.")
+        self.__translator = value
+
+    @property
+    def default_response(self) -> Optional[ServerResponse]:
+        """Get response to requests that are not configured otherwise (None if they are ignored)."""
+        return self.__default_response
+
+    @default_response.setter
+    def default_response(self, value: Optional[ServerResponse]) -> None:
+        """
+        Set response to requests that are not configured otherwise.
+
+        :param value: Response to use or None to ignore such requests.
+
+        :raise TypeError: Provided value is neither None nor an instance of ServerResponse class.
+        """
+        if value is not None and not isinstance(value, ServerResponse):
+            raise TypeError(f"Provided value is not an instance of ServerResponse class. Actual type: {type(value)}.")
+        self.__default_response = value
+
+    @property
+    def is_running(self) -> bool:
+        """Get flag whether serving task is active."""
+        return self.__serving_task_event.is_set()
+
+    @property  # noqa: vulture
+    def received_requests_number(self) -> int:
+        """Get number of request messages that this server processed."""
+        return self.__received_requests_number
+
+    @property  # noqa: vulture
+    def sent_responses_number(self) -> int:
+        """Get number of response messages (including Response Pending messages) that this server sent."""
+        return self.__sent_responses_number
+
+    def __serving_task(self, cycle: TimeMillisecondsAlias) -> None:
+        """
+        Receive and answer request messages while serving task is active.
+
+        Failures of answering a request (e.g. an exception raised by a handler) are reported as warnings
+        and the task keeps serving. Any other failure (e.g. of the transport interface) ends the task.
+
+        :param cycle: Maximal time (in milliseconds) to wait for a message before checking whether the task
+            is still active.
+        """
+        try:
+            while self.is_running:
+                try:
+                    request_record = self.transport_interface.receive_message(start_timeout=cycle)
+                except TimeoutError:
+                    continue
+                try:
+                    self.process_request(request_record)
+                except Exception as exception:  # pylint: disable=broad-exception-caught
+                    warn(f"Request message could not be answered. Request: {request_record}. "
+                         f"Exception: {exception!r}.",
+                         category=RuntimeWarning)
+        finally:
+            self.__serving_task_event.clear()
+
+    def _send_response(self, payload: RawBytesAlias) -> UdsMessageRecord:
+        """
+        Send response message.
+
+        :param payload: Payload of the response message.
+
+        :return: Record of the response message that was sent.
+        """
+        response_record = self.transport_interface.send_message(UdsMessage(payload=payload,
+                                                                           addressing_type=AddressingType.PHYSICAL))
+        with self.__counters_lock:
+            self.__sent_responses_number += 1
+        return response_record
+
+    def encode_response(self, request_sid: int, response: ServerResponse) -> bytes:
+        """
+        Get payload of the final response message.
+
+        :param request_sid: SID value of the request message.
+        :param response: Configuration of the response.
+
+        :raise ValueError: Data Records values cannot be encoded, because Translator is not set or the service
+            is unknown.
+
+        :return: Payload of the response message.
+        """
+        if response.payload is not None:
+            return response.payload
+        if response.nrc is not None:
+            return bytes([ResponseSID.NegativeResponse, request_sid, response.nrc])
+        if self.translator is None:
+            raise ValueError("Translator is required to encode response from Data Records values.")
+        response_sid = request_sid + RESPONSE_REQUEST_SID_DIFF
+        if not ResponseSID.is_member(response_sid):
+            raise ValueError(f"Response SID for provided request SID is not defined. Actual value: {request_sid}.")
+        return bytes(self.translator.encode(data_records_values=response.data_records_values,  # type: ignore
+                                            rsid=ResponseSID(response_sid)))
+
+    def decode_request(self, request: UdsMessageRecord) -> DecodedMessageAlias:
+        """
+        Decode request message using Translator of the server (useful in handlers).
+
+        :param request: Request message to decode.
+
+        :raise ValueError: Translator is not set.
+
+        :return: Decoded Data Records values from the request message.
+        """
+        if self.translator is None:
+            raise ValueError("Translator is required to decode request message.")
+        return self.translator.decode(request)
+
+    def get_response(self, request: UdsMessageRecord) -> Optional[ServerResponse]:
+        """
+        Get response to a request message.
+
+        :param request: Record of the request message.
+
+        :return: Configuration of the response or None if no response is to be sent.
+        """
+        response = self.__responses.get(bytes(request.payload))
+        if response is not None:
+            return response
+        handler = self.__handlers.get(request.payload[0])
+        if handler is not None:
+            return handler(request)
+        return self.default_response
+
+    def process_request(self, request: UdsMessageRecord) -> Tuple[UdsMessageRecord, ...]:
+        """
+        Answer request message.
+
+        Positive responses to requests with suppressPosRspMsgIndicationBit set and negative responses
+        (with NRC listed in :attr:`~uds.server.Server.SUPPRESSED_FUNCTIONAL_NRCS`) to functionally addressed
+        requests are not sent, unless Response Pending message was sent before.
+
+        :param request: Record of the request message.
+
+        :raise TypeError: Provided value is not an instance of UdsMessageRecord class.
+
+        :return: Records of all response messages that were sent.
+        """
+        if not isinstance(request, UdsMessageRecord):
+            raise TypeError(f"Provided value is not an instance of UdsMessageRecord class. "
+                            f"Actual type: {type(request)}.")
+        with self.__counters_lock:
+            self.__received_requests_number += 1
+        response = self.get_response(request)
+        if response is None:
+            return ()
+        request_sid = request.payload[0]
+        payload = self.encode_response(request_sid=request_sid, response=response)
+        responses_records: List[UdsMessageRecord] = []
+        if response.delay > 0:
+            sleep(response.delay / 1000.)
+        for _ in range(response.response_pending_number):
+            responses_records.append(self._send_response([ResponseSID.NegativeResponse,
+                                                          request_sid,
+                                                          NRC.RequestCorrectlyReceived_ResponsePending]))
+            sleep(response.response_pending_period / 1000.)
+        if response.response_pending_number == 0:
+            if payload[0] == ResponseSID.NegativeResponse:
+                if (request.addressing_type == AddressingType.FUNCTIONAL and len(payload) == 3
+                        and payload[2] in self.SUPPRESSED_FUNCTIONAL_NRCS):
+                    return ()
+            elif (request_sid in SERVICES_WITH_SUBFUNCTION and len(request.payload) > 1
+                  and request.payload[1] & SPRMIB_MASK):
+                return ()
+        responses_records.append(self._send_response(payload))
+        return tuple(responses_records)
+
+    def start(self, cycle: TimeMillisecondsAlias = DEFAULT_RECEIVING_TASK_CYCLE) -> None:
+        """
+        Start serving task (receiving and answering request messages in a background thread).
+
+        :param cycle: Maximal time (in milliseconds) to wait for a message before checking whether the task
+            is still active.
+        """
+        if self.is_running:
+            warn("Server is already running.",
+                 category=UserWarning)
+        else:
+            self.__serving_task_event.set()
+            self.__serving_thread = Thread(target=self.__serving_task,
+                                           kwargs={"cycle": cycle},
+                                           daemon=True)
+            self.__serving_thread.start()
+
+    def stop(self) -> None:
+        """Stop serving task."""
+        if self.is_running:
+            self.__serving_task_event.clear()
+            if self.__serving_thread is not None:
+                self.__serving_thread.join()
+            self.__serving_thread = None
+        else:
+            warn("Server is already stopped.",
+                 category=UserWarning)
@@ -4,6 +4,9 @@ Implementation for diagnostic messages databases.
 Tools for decoding and encoding information from/to diagnostic messages.
 """
 
+from typing import TYPE_CHECKING, Any
+
+from . import service_definitions
 from .data_record import (
     AbstractDataRecord,
     ConditionalFormulaDataRecord,
@@ -16,13 +19,39 @@ from .data_record import (
     TextDataRecord,
     TextEncoding,
 )
+from .dtc_and_status_records import DTCAndStatusRecords
 from .service import DecodedMessageAlias, Service
-from .service_definitions import (
-    CLEAR_DIAGNOSTIC_INFORMATION,
-    DIAGNOSTIC_SESSION_CONTROL,
-    ECU_RESET,
-    READ_DTC_INFORMATION,
-    TESTER_PRESENT,
+from .translator import LazyTranslator, Translator
+from .translator_cache import (
+    TRANSLATOR_CACHE_VERSION,
+    deserialize_translator,
+    load_translator,
+    save_translator,
+    serialize_translator,
 )
-from .translator import Translator
 from .translator_definitions import BASE_TRANSLATOR, BASE_TRANSLATOR_2013, BASE_TRANSLATOR_2020
+
+if TYPE_CHECKING:
+    from .service_definitions import (
+        CLEAR_DIAGNOSTIC_INFORMATION,
+        DIAGNOSTIC_SESSION_CONTROL,
+        ECU_RESET,
+        READ_DTC_INFORMATION,
+        TESTER_PRESENT,
+    )
+
+_LAZY_SERVICES_DEFINITIONS = frozenset({
+    "CLEAR_DIAGNOSTIC_INFORMATION",
+    "DIAGNOSTIC_SESSION_CONTROL",
+    "ECU_RESET",
+    "READ_DTC_INFORMATION",
+    "TESTER_PRESENT",
+})
+"""Names of Services translators that are imported (and built) on the first access."""
+
+
+def __getattr__(name: str) -> Any:  # noqa: vulture
+    """Lazy imports of Services translators."""
+    if name in _LAZY_SERVICES_DEFINITIONS:
+        return getattr(service_definitions, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -7,7 +7,7 @@ __all__ = ["AbstractDataRecord",
 
 from abc import ABC, abstractmethod
 from collections import OrderedDict
-from typing import List, Mapping, Optional, Sequence, Tuple, TypedDict, Union
+from typing import Dict, Mapping, Optional, Sequence, Tuple, TypedDict, Union
 
 from uds.utilities import InconsistencyError, ReassignmentError
 
@@ -219,6 +219,13 @@ class AbstractDataRecord(ABC):
         if len(children_names) != len(value):
             raise InconsistencyError("Each child has to have unique name.")
         self.__children = tuple(value)
+        children_layout = []
+        offset = children_length
+        for child in self.__children:
+            offset -= child.length
+            children_layout.append((child.name, offset, (1 << child.length) - 1, child))
+        self.__children_layout: Tuple[Tuple[str, int, int, AbstractDataRecord], ...] = tuple(children_layout)
+        self.__children_indexes: Dict[str, int] = {child.name: i for i, child in enumerate(self.__children)}
 
     @property
     def min_occurrences(self) -> int:
@@ -360,14 +367,8 @@ class AbstractDataRecord(ABC):
         :return: Children names and their values for this occurrence.
         """
         self._validate_raw_value(raw_value)
-        children_values = OrderedDict()
-        offset = self.length
-        for child in self.children:
-            offset -= child.length
-            mask = (1 << child.length) - 1
-            child_value = (raw_value >> offset) & mask
-            children_values[child.name] = child_value
-        return children_values
+        return OrderedDict([(name, (raw_value >> offset) & mask)
+                            for name, offset, mask, _ in self.__children_layout])
 
     def get_children_occurrence_info(self, raw_value: int) -> Tuple[SingleOccurrenceInfo, ...]:
         """
@@ -377,10 +378,9 @@ class AbstractDataRecord(ABC):
 
         :return: Children occurrence information.
         """
-        children_values = self.get_children_values(raw_value)
-        children_occurrence_info: List[SingleOccurrenceInfo] \
-            = [child.get_occurrence_info(children_values[child.name]) for child in self.children]  # type: ignore
-        return tuple(children_occurrence_info)
+        self._validate_raw_value(raw_value)
+        return tuple(child.get_occurrence_info((raw_value >> offset) & mask)  # type: ignore
+                     for _, offset, mask, child in self.__children_layout)
 
     def get_occurrence_info(self, *raw_values: int) -> DataRecordInfoAlias:
         """
@@ -471,16 +471,13 @@ class AbstractDataRecord(ABC):
             raise RuntimeError("This Data Record has no children.")
         if not isinstance(children_values, Mapping):
             raise TypeError(f"Provided value is not a mapping. Actual type: {type(children_values)}.")
-        children_names = set(child.name for child in self.children)
-        provided_names = set(children_values.keys())
-        if provided_names != children_names:
+        if children_values.keys() != self.__children_indexes.keys():
             raise ValueError("Values for all and only children have to be provided. "
-                             f"Names of all children: {children_names}. Provided names: {provided_names}.")
-        offset = self.length
+                             f"Names of all children: {set(self.__children_indexes)}. "
+                             f"Provided names: {set(children_values.keys())}.")
         raw_value = 0
-        for child in self.children:
-            offset -= child.length
-            child_value = children_values[child.name]
+        for name, offset, _, child in self.__children_layout:
+            child_value = children_values[name]
             if isinstance(child_value, int):
                 child_raw_value = child_value
             elif isinstance(child_value, Mapping):
@@ -2,11 +2,11 @@
 
 __all__ = ["TextDataRecord", "TextEncoding"]
 
-from typing import Callable, Dict, Optional, TypedDict
+from typing import Callable, Dict, Optional, Sequence, Tuple, TypedDict, Union
 
-from uds.utilities import MAX_DTC_VALUE, ValidatedEnum, int_to_obd_dtc, obd_dtc_to_int
+from uds.utilities import MAX_DTC_VALUE, RawBytesAlias, ValidatedEnum, int_to_obd_dtc, obd_dtc_to_int
 
-from .abstract_data_record import AbstractDataRecord
+from .abstract_data_record import AbstractDataRecord, DataRecordInfoAlias, MultipleOccurrencesInfo, SingleOccurrenceInfo
 
 
 class TextEncoding(ValidatedEnum):
@@ -30,6 +30,10 @@ class TextEncoding(ValidatedEnum):
     """:ref:`OBD DTC format <knowledge-base-dtc-obd-format>` encoding."""
 
 
+_DIGIT_TO_NIBBLE_TABLE: bytes = bytes.maketrans(b"0123456789", bytes(range(10)))
+"""Translation table (for :meth:`bytes.translate`) from ASCII digit characters to BCD nibble values."""
+
+
 def decode_ascii(character: str) -> int:
     """
     Decode ASCII character into byte value.
@@ -148,6 +152,92 @@ class TextDataRecord(AbstractDataRecord):
             return MAX_DTC_VALUE
         raise NotImplementedError(f"Missing implementation for {self.encoding!r}.")
 
+    @property
+    def is_bulk_convertible(self) -> bool:
+        """
+        Whether multiple occurrences of this Data Record can be converted in one step.
+
+        Values meaning:
+
+        - True - text encoding (ASCII or BCD) allows conversion of a whole bytes slice at once
+        - False - each occurrence has to be converted separately (e.g. DTC in OBD format)
+        """
+        return self.encoding in {TextEncoding.ASCII, TextEncoding.BCD}
+
+    def _decode_bytes(self,
+                      payload: RawBytesAlias,
+                      offset: int,
+                      occurrences_number: int) -> Tuple[Tuple[int, ...], str]:
+        """
+        Extract raw values and text of following occurrences directly from payload bytes.
+
+        :param payload: Payload bytes that contain occurrences of this Data Record.
+        :param offset: Bit position of the first occurrence (counted from the most significant bit of the first byte).
+        :param occurrences_number: Number of occurrences to extract.
+
+        :raise ValueError: At least one of the occurrences carries a value that is not a valid character.
+
+        :return: Tuple with raw values of following occurrences and the decoded text.
+        """
+        if self.encoding == TextEncoding.ASCII:
+            start_byte = offset // 8
+            raw_bytes = bytes(payload[start_byte:start_byte + occurrences_number])
+            try:
+                text = raw_bytes.decode("ascii")
+            except UnicodeDecodeError as exception:
+                raise ValueError(f"Provided value is out of range. Actual value: {raw_bytes!r}") from exception
+            return tuple(raw_bytes), text
+        start_nibble = offset // 4
+        raw_bytes = bytes(payload[start_nibble // 2:(start_nibble + occurrences_number + 1) // 2])
+        text = raw_bytes.hex()[start_nibble % 2:start_nibble % 2 + occurrences_number]
+        if not text.isdigit():
+            raise ValueError(f"Provided value is out of range. Actual value: {raw_bytes!r}")
+        return tuple(text.encode("ascii").translate(_DIGIT_TO_NIBBLE_TABLE)), text
+
+    def get_occurrence_info_from_bytes(self,
+                                       payload: RawBytesAlias,
+                                       offset: int,
+                                       occurrences_number: int) -> DataRecordInfoAlias:
+        """
+        Extract comprehensive occurrence information directly from payload bytes.
+
+        It is a faster equivalent of
+        :meth:`~uds.translator.data_record.abstract_data_record.AbstractDataRecord.get_occurrence_info`
+        which converts a whole slice of bytes in one step instead of handling each character separately.
+
+        :param payload: Payload bytes that contain occurrences of this Data Record.
+        :param offset: Bit position of the first occurrence (counted from the most significant bit of the first byte).
+        :param occurrences_number: Number of occurrences to extract.
+
+        :raise RuntimeError: The encoding does not support bulk conversion or the provided offset is not aligned with
+            characters boundaries.
+        :raise ValueError: Incorrect number of occurrences was provided.
+
+        :return: Data Record Information about a Single Occurrence or Multiple Occurrences.
+        """
+        if not self.is_bulk_convertible:
+            raise RuntimeError(f"Bulk conversion is not supported for {self.encoding!r} encoding.")
+        if offset % self.length != 0:
+            raise RuntimeError(f"Provided offset is not aligned with characters boundaries. Actual value: {offset}")
+        if not max(self.min_occurrences, 1) <= occurrences_number <= (self.max_occurrences or float("inf")):
+            raise ValueError(f"This Data Record requires from {self.min_occurrences} to "
+                             f"{self.max_occurrences or 'Infinite'} number of occurrences. "
+                             f"Provided {occurrences_number} occurrences.")
+        raw_values, text = self._decode_bytes(payload=payload, offset=offset, occurrences_number=occurrences_number)
+        if self.is_reoccurring:
+            return MultipleOccurrencesInfo(name=self.name,
+                                           length=self.length,
+                                           raw_value=raw_values,
+                                           physical_value=text,
+                                           children=((),) * occurrences_number,
+                                           unit=self.unit)
+        return SingleOccurrenceInfo(name=self.name,
+                                    length=self.length,
+                                    raw_value=raw_values[0],
+                                    physical_value=text,
+                                    children=(),
+                                    unit=self.unit)
+
     def get_physical_values(self, *raw_values: int) -> str:
         """
         Get physical values representing provided raw values.
@@ -186,3 +276,34 @@ class TextDataRecord(AbstractDataRecord):
         if not isinstance(physical_value, str):
             raise TypeError(f"Provided value is not str type. Actual type: {type(physical_value)}.")
         return self.__ENCODINGS[self.encoding]["decode"](physical_value)
+
+    def get_raw_values(self, physical_values: Union[str, Sequence[str]]) -> Tuple[int, ...]:
+        """
+        Get raw values that represent provided text.
+
+        .. note:: Text in ASCII and BCD encoding is converted in one step.
+            For other encodings (e.g. DTC in OBD format), each element (occurrence) is converted separately.
+
+        :param physical_values: Either text or sequence with physical value of each occurrence.
+
+        :raise TypeError: Provided value is not str neither sequence type.
+        :raise ValueError: Provided text contains characters which are not supported by the encoding.
+
+        :return: Raw values for following occurrences.
+        """
+        if isinstance(physical_values, str):
+            if self.encoding == TextEncoding.ASCII:
+                try:
+                    return tuple(physical_values.encode("ascii"))
+                except UnicodeEncodeError as exception:
+                    raise ValueError("Provided value contains non-ASCII characters. "
+                                     f"Actual value: {physical_values!r}") from exception
+            if self.encoding == TextEncoding.BCD:
+                if not physical_values.isascii() or not physical_values.isdigit():
+                    raise ValueError("Provided value contains non-BCD characters. "
+                                     f"Actual value: {physical_values!r}")
+                return tuple(physical_values.encode("ascii").translate(_DIGIT_TO_NIBBLE_TABLE))
+            return (self.get_raw_value(physical_values),)
+        if not isinstance(physical_values, Sequence):
+            raise TypeError(f"Provided value is not str neither sequence type. Actual type: {type(physical_values)}.")
+        return tuple(self.get_raw_value(physical_value) for physical_value in physical_values)
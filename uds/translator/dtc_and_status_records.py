@@ -0,0 +1,223 @@
+"""
+Compact representation of `DTC and DTCStatus` records arrays.
+
+Many :ref:`ReadDTCInformation <knowledge-base-service-read-dtc-information>` responses (e.g. reportDTCByStatusMask)
+carry a list of fixed-stride records, each containing 3 bytes of :ref:`DTC <knowledge-base-dtc>` and 1 byte of
+:ref:`DTCStatus <knowledge-base-dtc-status>`. This module decodes such lists in one pass.
+"""
+
+__all__ = ["DTCAndStatusRecords"]
+
+from array import array
+from sys import byteorder
+from types import MappingProxyType
+from typing import Dict, Mapping, Optional, Sequence, Tuple, Union, overload
+from weakref import WeakKeyDictionary
+
+from uds.utilities import RawBytesAlias
+
+from .data_record import (
+    AbstractDataRecord,
+    DataRecordInfoAlias,
+    MultipleOccurrencesInfo,
+    RawDataRecord,
+    SingleOccurrenceInfo,
+    TextDataRecord,
+    TextEncoding,
+)
+
+_UINT32_TYPECODE: str = next(typecode for typecode in "IL" if array(typecode).itemsize == 4)
+"""Type code of :class:`array.array` with 4 bytes unsigned integers."""
+
+
+class DTCAndStatusRecords(Sequence[Tuple[int, int]]):
+    """
+    Array of `DTC and DTCStatus` records.
+
+    Features:
+     - all DTCs and statuses are extracted from the payload in one pass (using bytes slicing)
+     - DTC Status bits are expanded lazily (only for the records that are accessed)
+     - the same Data Record information as produced by
+       :meth:`~uds.translator.data_record.abstract_data_record.AbstractDataRecord.get_occurrence_info` is available
+       on request
+    """
+
+    RECORD_LENGTH: int = 4
+    """Number of bytes used by a single `DTC and DTCStatus` record."""
+
+    _status_info_cache: "WeakKeyDictionary[AbstractDataRecord, Dict[int, SingleOccurrenceInfo]]" \
+        = WeakKeyDictionary()
+    """Occurrence information of DTC Status values (for each DTC Status Data Record).
+    Data Records are immutable, so this information never changes."""
+
+    def __init__(self, data_record: RawDataRecord, payload: RawBytesAlias) -> None:
+        """
+        Decode `DTC and DTCStatus` records.
+
+        :param data_record: Data Record that defines a single `DTC and DTCStatus` record.
+        :param payload: Bytes with records to decode.
+
+        :raise ValueError: Provided Data Record is not `DTC and DTCStatus` Data Record, provided payload cannot be
+            split into `DTC and DTCStatus` records or the number of records is not allowed for the Data Record.
+        """
+        if not self.is_dtc_and_status_record(data_record):
+            raise ValueError("Provided Data Record does not define `DTC and DTCStatus` record. "
+                             f"Actual value: {data_record!r}.")
+        payload = bytes(payload)
+        if len(payload) % self.RECORD_LENGTH != 0:
+            raise ValueError(f"Payload length must be a multiple of {self.RECORD_LENGTH}. "
+                             f"Actual value: {len(payload)}.")
+        records_number = len(payload) // self.RECORD_LENGTH
+        if not data_record.min_occurrences <= records_number <= (data_record.max_occurrences or float("inf")):
+            raise ValueError(f"Data Record {data_record.name!r} requires from {data_record.min_occurrences} to "
+                             f"{data_record.max_occurrences or 'Infinite'} number of occurrences. "
+                             f"Provided {records_number} occurrences.")
+        self.__data_record = data_record
+        dtcs_bytes = bytearray(payload)
+        dtcs_bytes[3::4] = dtcs_bytes[2::4]
+        dtcs_bytes[2::4] = dtcs_bytes[1::4]
+        dtcs_bytes[1::4] = dtcs_bytes[0::4]
+        dtcs_bytes[0::4] = bytes(records_number)
+        dtcs = array(_UINT32_TYPECODE, dtcs_bytes)
+        if byteorder == "little":
+            dtcs.byteswap()
+        self.__dtcs: Tuple[int, ...] = tuple(dtcs)
+        self.__statuses: bytes = payload[3::4]
+        self.__status_bits: Dict[int, Mapping[str, int]] = {}
+        self.__status_info = self._status_info_cache.setdefault(data_record.children[1], {})
+
+    def __len__(self) -> int:
+        """Get number of records."""
+        return len(self.__dtcs)
+
+    @overload
+    def __getitem__(self, index: int) -> Tuple[int, int]:  # noqa: D105
+        ...
+
+    @overload
+    def __getitem__(self, index: slice) -> Tuple[Tuple[int, int], ...]:  # noqa: D105
+        ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Tuple[int, int], Tuple[Tuple[int, int], ...]]:
+        """
+        Get DTC and DTC Status values.
+
+        :param index: Index (or slice) of records.
+
+        :return: Tuple with DTC and DTC Status value (or tuple with these tuples if slice was provided).
+        """
+        if isinstance(index, slice):
+            return tuple(zip(self.__dtcs[index], self.__statuses[index]))
+        return self.__dtcs[index], self.__statuses[index]
+
+    @property
+    def data_record(self) -> RawDataRecord:
+        """Get Data Record that defines a single `DTC and DTCStatus` record."""
+        return self.__data_record
+
+    @property
+    def dtcs(self) -> Tuple[int, ...]:
+        """Get DTC values of all records."""
+        return self.__dtcs
+
+    @property  # noqa: vulture
+    def statuses(self) -> bytes:
+        """Get DTC Status values of all records."""
+        return self.__statuses
+
+    @property
+    def raw_values(self) -> Tuple[int, ...]:
+        """Get raw values of all records (as they would be extracted by the Data Record)."""
+        return tuple((dtc << 8) | status for dtc, status in zip(self.__dtcs, self.__statuses))
+
+    @staticmethod
+    def is_dtc_and_status_record(data_record: AbstractDataRecord) -> bool:
+        """
+        Check whether Data Record defines `DTC and DTCStatus` record that can be handled.
+
+        :param data_record: Data Record to check.
+
+        :return: True if Data Record consists of DTC (3 bytes in OBD format) and DTC Status (1 byte), False otherwise.
+        """
+        if not isinstance(data_record, RawDataRecord) or data_record.length != 32 or len(data_record.children) != 2:
+            return False
+        dtc_record, status_record = data_record.children
+        return (isinstance(dtc_record, TextDataRecord)
+                and dtc_record.encoding == TextEncoding.DTC_OBD_FORMAT
+                and status_record.length == 8)
+
+    def get_status_bits(self, index: int) -> Mapping[str, int]:
+        """
+        Get values of DTC Status bits.
+
+        :param index: Index of the record.
+
+        :return: Mapping with DTC Status bits names and their values.
+        """
+        status = self.__statuses[index]
+        if status not in self.__status_bits:
+            status_record = self.__data_record.children[1]
+            self.__status_bits[status] = MappingProxyType(status_record.get_children_values(status))
+        return self.__status_bits[status]
+
+    def get_dtcs_with_status(self, status_mask: int) -> Tuple[int, ...]:
+        """
+        Get DTCs which status matches provided mask.
+
+        :param status_mask: DTC Status Mask value.
+            DTC is matching if at least one bit from the mask is set in its status.
+
+        :return: DTC values that match the mask.
+        """
+        return tuple(dtc for dtc, status in zip(self.__dtcs, self.__statuses) if status & status_mask)
+
+    def __get_status_info(self, status: int) -> SingleOccurrenceInfo:
+        """
+        Get occurrence information for DTC Status value.
+
+        :param status: DTC Status value.
+
+        :return: A fresh copy of DTC Status occurrence information.
+        """
+        if status not in self.__status_info:
+            self.__status_info[status] = self.__data_record.children[1].get_occurrence_info(status)  # type: ignore
+        status_info = self.__status_info[status]
+        return SingleOccurrenceInfo(name=status_info["name"],
+                                    length=status_info["length"],
+                                    raw_value=status_info["raw_value"],
+                                    physical_value=status_info["physical_value"],
+                                    children=tuple(SingleOccurrenceInfo(**child_info)
+                                                   for child_info in status_info["children"]),
+                                    unit=status_info["unit"])
+
+    def get_occurrence_info(self, index: Optional[int] = None) -> DataRecordInfoAlias:
+        """
+        Get comprehensive Data Record occurrence information.
+
+        :param index: Index of a single record to get information for.
+            Leave None to get information about all the records.
+
+        :return: The same information as provided by
+            :meth:`~uds.translator.data_record.abstract_data_record.AbstractDataRecord.get_occurrence_info`.
+        """
+        dtc_record = self.__data_record.children[0]
+        if index is not None:
+            dtc, status = self[index]
+            return SingleOccurrenceInfo(name=self.__data_record.name,
+                                        length=self.__data_record.length,
+                                        raw_value=(dtc << 8) | status,
+                                        physical_value=(dtc << 8) | status,
+                                        children=(dtc_record.get_occurrence_info(dtc),  # type: ignore
+                                                  self.__get_status_info(status)),
+                                        unit=self.__data_record.unit)
+        if not self.__data_record.is_reoccurring:
+            return self.get_occurrence_info(0)
+        raw_values = self.raw_values
+        return MultipleOccurrencesInfo(name=self.__data_record.name,
+                                       length=self.__data_record.length,
+                                       raw_value=raw_values,
+                                       physical_value=raw_values,
+                                       children=tuple((dtc_record.get_occurrence_info(dtc),  # type: ignore
+                                                       self.__get_status_info(status))
+                                                      for dtc, status in zip(self.__dtcs, self.__statuses)),
+                                       unit=self.__data_record.unit)
@@ -4,6 +4,7 @@ __all__ = ["Service", "DecodedMessageAlias", "DataRecordsValuesAlias",
            "DataRecordValueAlias", "MultipleDataRecordValueAlias", "SingleDataRecordValueAlias"]
 
 from copy import deepcopy
+from struct import pack_into, unpack
 from typing import Collection, Dict, List, Mapping, Optional, Sequence, Set, Tuple, Union
 from warnings import warn
 
@@ -17,7 +18,9 @@ from .data_record import (
     ChildrenValuesAlias,
     DataRecordInfoAlias,
     SingleOccurrenceInfo,
+    TextDataRecord,
 )
+from .dtc_and_status_records import DTCAndStatusRecords
 
 SingleDataRecordValueAlias = Optional[Union[int, ChildrenValuesAlias]]
 """Alias for a single occurrence Data Record. Either:
@@ -35,6 +38,9 @@ Mapping keys are Data Records names.
 Mapping values are corresponding Data Records values.
 """
 
+_STRUCT_FORMAT_CHARACTERS: Dict[int, str] = {16: "H", 32: "I", 64: "Q"}
+"""Format characters of :mod:`struct` module for unsigned integers (keys are values lengths in bits)."""
+
 DecodedMessageAlias = Tuple[DataRecordInfoAlias, ...]
 """Alias for decoded information about a Diagnostic Message."""
 
@@ -234,6 +240,7 @@ class Service:
 
         :param data_record: Data Record object.
         :param value: Sequence with Data Record values (either int or mapping type).
+            Text (str type) is also accepted for Text Data Records.
 
         :raise TypeError: Provided value has incorrect type that cannot be handled for the provided Data Record.
         :raise ValueError: Provided value is incorrect.
@@ -243,6 +250,16 @@ class Service:
         if not isinstance(value, Sequence):
             raise TypeError("A sequence of values has to be provided for a reoccurring Data Record. "
                             f"Data Record name = {data_record.name!r}.")
+        if isinstance(value, str) and isinstance(data_record, TextDataRecord):
+            text_raw_values = list(data_record.get_raw_values(value))
+            if (len(text_raw_values) < data_record.min_occurrences
+                    or len(text_raw_values) > (data_record.max_occurrences or float("inf"))):
+                raise ValueError("Provided text has to contain proper number of Data Record occurrences. "
+                                 f"Data Record name = {data_record.name!r}. "
+                                 f"Data Record min occurrences number = {data_record.min_occurrences}. "
+                                 f"Data Record max occurrences number = {data_record.max_occurrences}. "
+                                 f"Provided text = {value!r}.")
+            return text_raw_values
         if len(value) < data_record.min_occurrences or len(value) > (data_record.max_occurrences or float("inf")):
             raise ValueError("A sequence of values has to contain proper number of Data Record occurrences."
                              f"Data Record name = {data_record.name!r}. "
@@ -305,6 +322,91 @@ class Service:
                 raise TypeError("Minimal length can only be assessed for instances of `AbstractDataRecord` class.")
         return min_length
 
+    @staticmethod
+    def _get_fixed_stride_raw_values(payload: RawBytesAlias,
+                                     offset: int,
+                                     length: int,
+                                     occurrences_number: int) -> Tuple[int, ...]:
+        """
+        Extract raw values of byte aligned occurrences that are stored one after another.
+
+        :param payload: Payload of a diagnostic message.
+        :param offset: Bit offset (from the beginning of the payload) of the first occurrence.
+            It must be a multiple of 8.
+        :param length: Number of bits used by a single occurrence. It must be a multiple of 8.
+        :param occurrences_number: Number of occurrences to extract.
+
+        :return: Raw values of the occurrences.
+        """
+        start = offset // 8
+        stride = length // 8
+        occurrences_bytes = bytes(payload[start:start + stride * occurrences_number])
+        if length == 8:
+            return tuple(occurrences_bytes)
+        if length in _STRUCT_FORMAT_CHARACTERS:
+            return unpack(f">{occurrences_number}{_STRUCT_FORMAT_CHARACTERS[length]}", occurrences_bytes)
+        return tuple(int.from_bytes(occurrences_bytes[i:i + stride], "big")
+                     for i in range(0, len(occurrences_bytes), stride))
+
+    @classmethod
+    def _get_raw_values(cls,
+                        payload: RawBytesAlias,
+                        payload_int: int,
+                        remaining_length: int,
+                        length: int,
+                        occurrences_number: int) -> List[int]:
+        """
+        Extract raw values of occurrences that are stored one after another.
+
+        :param payload: Payload of a diagnostic message.
+        :param payload_int: The same payload in form of an integer.
+        :param remaining_length: Number of payload bits (counting from the end) where the first occurrence starts.
+        :param length: Number of bits used by a single occurrence.
+        :param occurrences_number: Number of occurrences to extract.
+
+        :return: Raw values of the occurrences.
+        """
+        if occurrences_number > 1 and remaining_length % 8 == 0 and length % 8 == 0:
+            return list(cls._get_fixed_stride_raw_values(payload=payload,
+                                                         offset=8 * len(payload) - remaining_length,
+                                                         length=length,
+                                                         occurrences_number=occurrences_number))
+        mask = (1 << length) - 1
+        return [(payload_int >> (remaining_length - (i + 1) * length)) & mask for i in range(occurrences_number)]
+
+    @staticmethod
+    def _decode_data_record_from_bytes(data_record: AbstractDataRecord,
+                                       payload: RawBytesAlias,
+                                       offset: int,
+                                       occurrences_number: int) -> Optional[DataRecordInfoAlias]:
+        """
+        Decode occurrences of a Data Record directly from payload bytes (without bit by bit extraction).
+
+        :param data_record: Data Record to decode.
+        :param payload: Payload of a diagnostic message.
+        :param offset: Bit offset (from the beginning of the payload) of the first occurrence.
+        :param occurrences_number: Number of occurrences to decode.
+
+        :return: Information about decoded Data Record occurrences or None if the Data Record cannot be decoded
+            this way (either type of the Data Record or the offset do not allow it).
+        """
+        if occurrences_number == 0:
+            return None
+        if (isinstance(data_record, TextDataRecord)
+                and data_record.is_bulk_convertible
+                and offset % data_record.length == 0):
+            return data_record.get_occurrence_info_from_bytes(payload=payload,
+                                                              offset=offset,
+                                                              occurrences_number=occurrences_number)
+        if offset % 8 == 0 and DTCAndStatusRecords.is_dtc_and_status_record(data_record):
+            start = offset // 8
+            end = start + occurrences_number * DTCAndStatusRecords.RECORD_LENGTH
+            # decoded message must be the same as produced bit by bit, so status bits of all records are expanded
+            # (each distinct DTC Status value only once) - lazy expansion is offered by DTCAndStatusRecords API only
+            return DTCAndStatusRecords(data_record=data_record,  # type: ignore
+                                       payload=payload[start:end]).get_occurrence_info()
+        return None
+
     @classmethod
     def _decode_payload(cls,  # pylint: disable=too-many-branches
                         payload: RawBytesAlias,
@@ -341,12 +443,22 @@ class Service:
                 occurrences_number = int(min(max_occurrences_number, data_record.max_occurrences or float("inf")))
                 if occurrences_number < data_record.min_occurrences:
                     raise ValueError("Too short payload was provided.")
-                raw_values = []
-                for _ in range(occurrences_number):
-                    remaining_length -= data_record.length
-                    mask = (1 << data_record.length) - 1
-                    occurrence_value = (payload_int >> remaining_length) & mask
-                    raw_values.append(occurrence_value)
+                data_record_info = cls._decode_data_record_from_bytes(data_record=data_record,
+                                                                      payload=payload,
+                                                                      offset=8 * len(payload) - remaining_length,
+                                                                      occurrences_number=occurrences_number)
+                if data_record_info is not None:
+                    remaining_length -= occurrences_number * data_record.length
+                    raw_values = [data_record_info["raw_value"]] if isinstance(data_record_info["raw_value"], int) \
+                        else list(data_record_info["raw_value"])
+                    decoded_message_continuation.append(data_record_info)
+                    continue
+                raw_values = cls._get_raw_values(payload=payload,
+                                                 payload_int=payload_int,
+                                                 remaining_length=remaining_length,
+                                                 length=data_record.length,
+                                                 occurrences_number=occurrences_number)
+                remaining_length -= occurrences_number * data_record.length
                 if data_record.min_occurrences == 0 and not raw_values:
                     if remaining_length == 0:
                         break
@@ -379,29 +491,29 @@ class Service:
         return tuple(decoded_message_continuation)
 
     @classmethod
-    def _encode_message(cls,  # pylint: disable=too-many-branches
-                        data_records_values: Dict[str, DataRecordValueAlias],
-                        message_structure: AliasMessageStructure,
-                        check_unused_data_record_values: bool = True) -> bytearray:
+    def _collect_message_fields(cls,  # pylint: disable=too-many-branches
+                                data_records_values: Dict[str, DataRecordValueAlias],
+                                message_structure: AliasMessageStructure,
+                                fields: List[Tuple[int, List[int]]]) -> int:
         """
-        Encode payload of a diagnostic message.
+        Collect raw values of Data Records that form payload of a diagnostic message.
 
         :param data_records_values: Mapping with Data Records values that are part of the message.
-            Mapping keys are Data Records names.
-            Mapping values are either a single occurrence or multiple occurrences values. Each occurrence can be
-            a raw value or a mapping with children names and its corresponding values.
+            Used values are removed from the mapping.
         :param message_structure: Data Records that form the remaining structure of the diagnostic message.
-        :param check_unused_data_record_values: Whether to raise an exception when unused Data Record value found.
+        :param fields: List to append collected fields to. Each field is a tuple with Data Record length and
+            raw values of all its occurrences.
 
+        :raise InconsistencyError: Value of a mandatory Data Record was not provided or a Conditional Data Record
+            was reached before any value of a preceding Data Record was collected.
         :raise RuntimeError: An error occurred which was caused by incorrect message structure.
-        :raise ValueError: Value for at least one Data Record that is no part of the message, was provided.
         :raise NotImplementedError: There is missing implementation for at least one Data Record in the provided
             message structure.
 
-        :return: Payload of a diagnostic message created from provided data records values.
+        :return: Number of bits used by collected fields.
         """
-        total_raw_value = 0
         total_length = 0
+        raw_value: Optional[int] = None
         for data_record in message_structure:
             if isinstance(data_record, AbstractDataRecord):
                 if data_record.name in data_records_values:
@@ -414,33 +526,120 @@ class Service:
                     raise InconsistencyError(f"Value for Data Record {data_record.name!r} was not provided.")
                 if len(occurrences) == 0 and not data_records_values:
                     break
-                for raw_value in occurrences:
-                    total_raw_value = (total_raw_value << data_record.length) + raw_value
-                    total_length += data_record.length
+                if occurrences:
+                    fields.append((data_record.length, occurrences))
+                    total_length += data_record.length * len(occurrences)
+                    raw_value = occurrences[-1]
             elif isinstance(data_record, AbstractConditionalDataRecord):
+                if raw_value is None:
+                    raise InconsistencyError("Conditional Data Record was reached before any value of a preceding "
+                                             "Data Record was collected.")
                 message_continuation = data_record.get_message_continuation(raw_value=raw_value)
                 if message_continuation:
-                    payload_continuation = cls._encode_message(data_records_values=data_records_values,
-                                                               message_structure=message_continuation,
-                                                               check_unused_data_record_values=False)
-                    _length = 8 * len(payload_continuation)
-                    total_length += _length
-                    continuation_raw_value = bytes_to_int(payload_continuation, endianness=Endianness.BIG_ENDIAN)
-                    total_raw_value = (total_raw_value << _length) + continuation_raw_value
-                    # calculate raw_value of the last Data Record (in the message_continuation)
+                    total_length += cls._collect_message_fields(data_records_values=data_records_values,
+                                                                message_structure=message_continuation,
+                                                                fields=fields)
+                    # raw_value of the last Data Record (in the message_continuation)
                     # in case it is followed by another ConditionalDataRecord
-                    if isinstance(message_continuation[-1], AbstractDataRecord):
-                        last_data_record_mask = (1 << message_continuation[-1].length) - 1
-                        raw_value = continuation_raw_value & last_data_record_mask
+                    if isinstance(message_continuation[-1], AbstractDataRecord) and fields:
+                        raw_value = fields[-1][1][-1]
             else:
                 raise NotImplementedError("Unexpected Data Record type found in the structure.")
         if total_length % 8 != 0:
             raise RuntimeError("Incorrect message structure was provided.")
+        return total_length
+
+    @staticmethod
+    def _pack_message_fields(fields: Sequence[Tuple[int, Sequence[int]]],
+                             total_length: int,
+                             buffer: Optional[Union[bytearray, memoryview]] = None,
+                             offset: int = 0) -> Union[bytearray, memoryview]:
+        """
+        Write raw values of Data Records into payload of a diagnostic message.
+
+        Byte aligned values are written directly into the payload buffer, bits are accumulated only for values
+        which do not start or end at a byte boundary.
+
+        :param fields: Fields to write. Each field is a tuple with Data Record length and raw values of all
+            its occurrences.
+        :param total_length: Number of bits used by all the fields. It must be a multiple of 8.
+        :param buffer: Writable buffer to write the payload into.
+            Leave None to create a new buffer.
+        :param offset: Index of the buffer byte where the payload starts.
+
+        :raise ValueError: Provided buffer is too small to store the payload.
+
+        :return: Payload of a diagnostic message.
+            If a buffer was provided, then it is a view on the part of the buffer with the payload.
+        """
+        payload_length = total_length // 8
+        if buffer is None:
+            payload: Union[bytearray, memoryview] = bytearray(payload_length)
+        else:
+            if not 0 <= offset <= len(buffer) - payload_length:
+                raise ValueError(f"Provided buffer is too small to store {payload_length} bytes of payload "
+                                 f"at offset {offset}. Buffer size: {len(buffer)}.")
+            payload = memoryview(buffer)[offset:offset + payload_length]
+        position = 0
+        bits_value = 0
+        bits_length = 0
+        for length, raw_values in fields:
+            if bits_length == 0 and length % 8 == 0:
+                size = length // 8
+                end = position + size * len(raw_values)
+                if length == 8:
+                    payload[position:end] = bytes(raw_values)
+                elif length in _STRUCT_FORMAT_CHARACTERS:
+                    pack_into(f">{len(raw_values)}{_STRUCT_FORMAT_CHARACTERS[length]}", payload, position,
+                              *raw_values)
+                else:
+                    for i, raw_value in enumerate(raw_values):
+                        payload[position + i * size:position + (i + 1) * size] = raw_value.to_bytes(size, "big")
+                position = end
+                continue
+            for raw_value in raw_values:
+                bits_value = (bits_value << length) | raw_value
+                bits_length += length
+                if bits_length >= 8:
+                    size = bits_length // 8
+                    bits_length %= 8
+                    payload[position:position + size] = (bits_value >> bits_length).to_bytes(size, "big")
+                    bits_value &= (1 << bits_length) - 1
+                    position += size
+        return payload
+
+    @classmethod
+    def _encode_message(cls,
+                        data_records_values: Dict[str, DataRecordValueAlias],
+                        message_structure: AliasMessageStructure,
+                        check_unused_data_record_values: bool = True,
+                        buffer: Optional[Union[bytearray, memoryview]] = None,
+                        offset: int = 0) -> Union[bytearray, memoryview]:
+        """
+        Encode payload of a diagnostic message.
+
+        :param data_records_values: Mapping with Data Records values that are part of the message.
+            Mapping keys are Data Records names.
+            Mapping values are either a single occurrence or multiple occurrences values. Each occurrence can be
+            a raw value or a mapping with children names and its corresponding values.
+        :param message_structure: Data Records that form the remaining structure of the diagnostic message.
+        :param check_unused_data_record_values: Whether to raise an exception when unused Data Record value found.
+        :param buffer: Writable buffer to encode the payload into.
+            Leave None to create a new buffer.
+        :param offset: Index of the buffer byte where the payload starts.
+
+        :raise ValueError: Value for at least one Data Record that is no part of the message, was provided.
+
+        :return: Payload of a diagnostic message created from provided data records values.
+            If a buffer was provided, then it is a view on the part of the buffer with the payload.
+        """
+        fields: List[Tuple[int, List[int]]] = []
+        total_length = cls._collect_message_fields(data_records_values=data_records_values,
+                                                   message_structure=message_structure,
+                                                   fields=fields)
         if check_unused_data_record_values and data_records_values:
             raise ValueError(f"Unused Data Record values were provided: {data_records_values}.")
-        return bytearray(int_to_bytes(int_value=total_raw_value,
-                                      size=total_length // 8,
-                                      endianness=Endianness.BIG_ENDIAN))
+        return cls._pack_message_fields(fields=fields, total_length=total_length, buffer=buffer, offset=offset)
 
     @staticmethod
     def validate_message_structure(value: AliasMessageStructure) -> None:
@@ -605,3 +804,52 @@ class Service:
             return self.encode_request(data_records_values=data_records_values)
         raise ValueError("Either SID or RSID value is missing or incorrect. Provided values: "
                          f"SID = {sid}. RSID = {rsid}.")
+
+    def encode_into(self,
+                    buffer: Union[bytearray, memoryview],
+                    data_records_values: DataRecordsValuesAlias,
+                    sid: Optional[RequestSID] = None,
+                    rsid: Optional[ResponseSID] = None,
+                    offset: int = 0) -> int:
+        """
+        Encode diagnostic message payload for this service directly into a preallocated buffer.
+
+        :param buffer: Writable buffer to encode the payload into.
+        :param data_records_values: Mapping with Data Records values that are part of the message.
+            Mapping keys are Data Records names.
+            Mapping values are either a single occurrence or multiple occurrences values. Each occurrence can be
+            a raw value or a mapping with children names and its corresponding values.
+        :param sid: Request SID value.
+            Used by request message (first byte) and negative response message (second byte).
+        :param rsid: Response SID value.
+            Used by response messages only (first byte).
+        :param offset: Index of the buffer byte where the payload is to start.
+
+        :raise ValueError: Missing or provided SID/RSID value cannot be handled by this service or
+            provided buffer is too small to store the payload.
+
+        :return: Number of payload bytes written into the buffer.
+        """
+        if rsid == ResponseSID.NegativeResponse and sid in {None, self.request_sid}:
+            payload = self.encode(data_records_values=data_records_values, sid=sid, rsid=rsid)
+            if not 0 <= offset <= len(buffer) - len(payload):
+                raise ValueError(f"Provided buffer is too small to store {len(payload)} bytes of payload "
+                                 f"at offset {offset}. Buffer size: {len(buffer)}.")
+            buffer[offset:offset + len(payload)] = payload
+            return len(payload)
+        if rsid == self.response_sid and sid is None:
+            first_byte, message_structure = self.response_sid, self.response_structure
+        elif sid == self.request_sid and rsid is None:
+            first_byte, message_structure = self.request_sid, self.request_structure
+        else:
+            raise ValueError("Either SID or RSID value is missing or incorrect. Provided values: "
+                             f"SID = {sid}. RSID = {rsid}.")
+        if not 0 <= offset < len(buffer):
+            raise ValueError(f"Provided buffer is too small to store payload at offset {offset}. "
+                             f"Buffer size: {len(buffer)}.")
+        payload_continuation = self._encode_message(data_records_values=deepcopy(dict(data_records_values)),
+                                                    message_structure=message_structure,
+                                                    buffer=buffer,
+                                                    offset=offset + 1)
+        buffer[offset] = first_byte
+        return len(payload_continuation) + 1
@@ -1,53 +1,134 @@
-"""Translators for :ref:`diagnostic services <knowledge-base-service>`."""
-
-from .access_timing_parameter import ACCESS_TIMING_PARAMETER_2013
-from .authentication import AUTHENTICATION
-from .clear_diagnostic_information import (
-    CLEAR_DIAGNOSTIC_INFORMATION,
-    CLEAR_DIAGNOSTIC_INFORMATION_2013,
-    CLEAR_DIAGNOSTIC_INFORMATION_2020,
-)
-from .communication_control import COMMUNICATION_CONTROL
-from .control_dtc_setting import CONTROL_DTC_SETTING
-from .diagnostic_session_control import DIAGNOSTIC_SESSION_CONTROL
-from .dynamically_define_data_identifier import (
-    DYNAMICALLY_DEFINE_DATA_IDENTIFIER,
-    DYNAMICALLY_DEFINE_DATA_IDENTIFIER_2013,
-    DYNAMICALLY_DEFINE_DATA_IDENTIFIER_2020,
-)
-from .ecu_reset import ECU_RESET
-from .input_output_control_by_identifier import (
-    INPUT_OUTPUT_CONTROL_BY_IDENTIFIER,
-    INPUT_OUTPUT_CONTROL_BY_IDENTIFIER_2013,
-    INPUT_OUTPUT_CONTROL_BY_IDENTIFIER_2020,
-)
-from .link_control import LINK_CONTROL
-from .read_data_by_identifier import READ_DATA_BY_IDENTIFIER, READ_DATA_BY_IDENTIFIER_2013, READ_DATA_BY_IDENTIFIER_2020
-from .read_data_by_periodic_identifier import READ_DATA_BY_PERIODIC_IDENTIFIER
-from .read_dtc_information import READ_DTC_INFORMATION, READ_DTC_INFORMATION_2013, READ_DTC_INFORMATION_2020
-from .read_memory_by_address import READ_MEMORY_BY_ADDRESS
-from .read_scaling_data_by_identifier import (
-    READ_SCALING_DATA_BY_IDENTIFIER,
-    READ_SCALING_DATA_BY_IDENTIFIER_2013,
-    READ_SCALING_DATA_BY_IDENTIFIER_2020,
-)
-from .request_download import REQUEST_DOWNLOAD
-from .request_file_transfer import REQUEST_FILE_TRANSFER, REQUEST_FILE_TRANSFER_2013, REQUEST_FILE_TRANSFER_2020
-from .request_transfer_exit import REQUEST_TRANSFER_EXIT
-from .request_upload import REQUEST_UPLOAD
-from .response_on_event import RESPONSE_ON_EVENT, RESPONSE_ON_EVENT_2013, RESPONSE_ON_EVENT_2020
-from .routine_control import ROUTINE_CONTROL
-from .secured_data_transmission import (
-    SECURED_DATA_TRANSMISSION,
-    SECURED_DATA_TRANSMISSION_2013,
-    SECURED_DATA_TRANSMISSION_2020,
-)
-from .security_access import SECURITY_ACCESS
-from .tester_present import TESTER_PRESENT
-from .transfer_data import TRANSFER_DATA
-from .write_data_by_identifier import (
-    WRITE_DATA_BY_IDENTIFIER,
-    WRITE_DATA_BY_IDENTIFIER_2013,
-    WRITE_DATA_BY_IDENTIFIER_2020,
-)
-from .write_memory_by_address import WRITE_MEMORY_BY_ADDRESS
+"""
+Translators for :ref:`diagnostic services <knowledge-base-service>`.
+
+Services translators are imported on the first access, so only the definitions that are actually used
+are ever built.
+"""
+
+import importlib
+from typing import TYPE_CHECKING, Any, Dict, Sequence
+
+if TYPE_CHECKING:
+    from .access_timing_parameter import ACCESS_TIMING_PARAMETER_2013
+    from .authentication import AUTHENTICATION
+    from .clear_diagnostic_information import (
+        CLEAR_DIAGNOSTIC_INFORMATION,
+        CLEAR_DIAGNOSTIC_INFORMATION_2013,
+        CLEAR_DIAGNOSTIC_INFORMATION_2020,
+    )
+    from .communication_control import COMMUNICATION_CONTROL
+    from .control_dtc_setting import CONTROL_DTC_SETTING
+    from .diagnostic_session_control import DIAGNOSTIC_SESSION_CONTROL
+    from .dynamically_define_data_identifier import (
+        DYNAMICALLY_DEFINE_DATA_IDENTIFIER,
+        DYNAMICALLY_DEFINE_DATA_IDENTIFIER_2013,
+        DYNAMICALLY_DEFINE_DATA_IDENTIFIER_2020,
+    )
+    from .ecu_reset import ECU_RESET
+    from .input_output_control_by_identifier import (
+        INPUT_OUTPUT_CONTROL_BY_IDENTIFIER,
+        INPUT_OUTPUT_CONTROL_BY_IDENTIFIER_2013,
+        INPUT_OUTPUT_CONTROL_BY_IDENTIFIER_2020,
+    )
+    from .link_control import LINK_CONTROL
+    from .read_data_by_identifier import (
+        READ_DATA_BY_IDENTIFIER,
+        READ_DATA_BY_IDENTIFIER_2013,
+        READ_DATA_BY_IDENTIFIER_2020,
+    )
+    from .read_data_by_periodic_identifier import READ_DATA_BY_PERIODIC_IDENTIFIER
+    from .read_dtc_information import READ_DTC_INFORMATION, READ_DTC_INFORMATION_2013, READ_DTC_INFORMATION_2020
+    from .read_memory_by_address import READ_MEMORY_BY_ADDRESS
+    from .read_scaling_data_by_identifier import (
+        READ_SCALING_DATA_BY_IDENTIFIER,
+        READ_SCALING_DATA_BY_IDENTIFIER_2013,
+        READ_SCALING_DATA_BY_IDENTIFIER_2020,
+    )
+    from .request_download import REQUEST_DOWNLOAD
+    from .request_file_transfer import REQUEST_FILE_TRANSFER, REQUEST_FILE_TRANSFER_2013, REQUEST_FILE_TRANSFER_2020
+    from .request_transfer_exit import REQUEST_TRANSFER_EXIT
+    from .request_upload import REQUEST_UPLOAD
+    from .response_on_event import RESPONSE_ON_EVENT, RESPONSE_ON_EVENT_2013, RESPONSE_ON_EVENT_2020
+    from .routine_control import ROUTINE_CONTROL
+    from .secured_data_transmission import (
+        SECURED_DATA_TRANSMISSION,
+        SECURED_DATA_TRANSMISSION_2013,
+        SECURED_DATA_TRANSMISSION_2020,
+    )
+    from .security_access import SECURITY_ACCESS
+    from .tester_present import TESTER_PRESENT
+    from .transfer_data import TRANSFER_DATA
+    from .write_data_by_identifier import (
+        WRITE_DATA_BY_IDENTIFIER,
+        WRITE_DATA_BY_IDENTIFIER_2013,
+        WRITE_DATA_BY_IDENTIFIER_2020,
+    )
+    from .write_memory_by_address import WRITE_MEMORY_BY_ADDRESS
+
+_SERVICES_DEFINITIONS_MODULES: Dict[str, str] = {
+    "ACCESS_TIMING_PARAMETER_2013": "access_timing_parameter",
+    "AUTHENTICATION": "authentication",
+    "CLEAR_DIAGNOSTIC_INFORMATION": "clear_diagnostic_information",
+    "CLEAR_DIAGNOSTIC_INFORMATION_2013": "clear_diagnostic_information",
+    "CLEAR_DIAGNOSTIC_INFORMATION_2020": "clear_diagnostic_information",
+    "COMMUNICATION_CONTROL": "communication_control",
+    "CONTROL_DTC_SETTING": "control_dtc_setting",
+    "DIAGNOSTIC_SESSION_CONTROL": "diagnostic_session_control",
+    "DYNAMICALLY_DEFINE_DATA_IDENTIFIER": "dynamically_define_data_identifier",
+    "DYNAMICALLY_DEFINE_DATA_IDENTIFIER_2013": "dynamically_define_data_identifier",
+    "DYNAMICALLY_DEFINE_DATA_IDENTIFIER_2020": "dynamically_define_data_identifier",
+    "ECU_RESET": "ecu_reset",
+    "INPUT_OUTPUT_CONTROL_BY_IDENTIFIER": "input_output_control_by_identifier",
+    "INPUT_OUTPUT_CONTROL_BY_IDENTIFIER_2013": "input_output_control_by_identifier",
+    "INPUT_OUTPUT_CONTROL_BY_IDENTIFIER_2020": "input_output_control_by_identifier",
+    "LINK_CONTROL": "link_control",
+    "READ_DATA_BY_IDENTIFIER": "read_data_by_identifier",
+    "READ_DATA_BY_IDENTIFIER_2013": "read_data_by_identifier",
+    "READ_DATA_BY_IDENTIFIER_2020": "read_data_by_identifier",
+    "READ_DATA_BY_PERIODIC_IDENTIFIER": "read_data_by_periodic_identifier",
+    "READ_DTC_INFORMATION": "read_dtc_information",
+    "READ_DTC_INFORMATION_2013": "read_dtc_information",
+    "READ_DTC_INFORMATION_2020": "read_dtc_information",
+    "READ_MEMORY_BY_ADDRESS": "read_memory_by_address",
+    "READ_SCALING_DATA_BY_IDENTIFIER": "read_scaling_data_by_identifier",
+    "READ_SCALING_DATA_BY_IDENTIFIER_2013": "read_scaling_data_by_identifier",
+    "READ_SCALING_DATA_BY_IDENTIFIER_2020": "read_scaling_data_by_identifier",
+    "REQUEST_DOWNLOAD": "request_download",
+    "REQUEST_FILE_TRANSFER": "request_file_transfer",
+    "REQUEST_FILE_TRANSFER_2013": "request_file_transfer",
+    "REQUEST_FILE_TRANSFER_2020": "request_file_transfer",
+    "REQUEST_TRANSFER_EXIT": "request_transfer_exit",
+    "REQUEST_UPLOAD": "request_upload",
+    "RESPONSE_ON_EVENT": "response_on_event",
+    "RESPONSE_ON_EVENT_2013": "response_on_event",
+    "RESPONSE_ON_EVENT_2020": "response_on_event",
+    "ROUTINE_CONTROL": "routine_control",
+    "SECURED_DATA_TRANSMISSION": "secured_data_transmission",
+    "SECURED_DATA_TRANSMISSION_2013": "secured_data_transmission",
+    "SECURED_DATA_TRANSMISSION_2020": "secured_data_transmission",
+    "SECURITY_ACCESS": "security_access",
+    "TESTER_PRESENT": "tester_present",
+    "TRANSFER_DATA": "transfer_data",
+    "WRITE_DATA_BY_IDENTIFIER": "write_data_by_identifier",
+    "WRITE_DATA_BY_IDENTIFIER_2013": "write_data_by_identifier",
+    "WRITE_DATA_BY_IDENTIFIER_2020": "write_data_by_identifier",
+    "WRITE_MEMORY_BY_ADDRESS": "write_memory_by_address",
+}
+"""Mapping from Services translators names to names of modules where they are defined."""
+
+__all__ = list(_SERVICES_DEFINITIONS_MODULES)
+
+
+def __getattr__(name: str) -> Any:  # noqa: vulture
+    """Lazy imports of Services translators."""
+    if name in _SERVICES_DEFINITIONS_MODULES:
+        module = importlib.import_module(f"{__name__}.{_SERVICES_DEFINITIONS_MODULES[name]}")
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> Sequence[str]:  # noqa: vulture
+    """All Services translators."""
+    return sorted(__all__)
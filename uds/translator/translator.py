@@ -1,12 +1,13 @@
 """Implementation of UDS messages translator for data encoding and decoding."""
 
-__all__ = ["Translator"]
+__all__ = ["Translator", "LazyTranslator", "ServiceLoaderAlias"]
 
+from functools import partial
 from types import MappingProxyType
-from typing import Collection, Dict, FrozenSet, Mapping, Optional, Union
+from typing import Callable, Collection, Dict, FrozenSet, Iterator, Mapping, Optional, Union
 
-from uds.message import RequestSID, ResponseSID, UdsMessage, UdsMessageRecord
-from uds.utilities import InconsistencyError
+from uds.message import RESPONSE_REQUEST_SID_DIFF, RequestSID, ResponseSID, UdsMessage, UdsMessageRecord
+from uds.utilities import TRACING_HOOKS, InconsistencyError
 
 from .service import DataRecordsValuesAlias, DecodedMessageAlias, Service
 
@@ -92,6 +93,7 @@ class Translator:
         raise ValueError("Either SID or RSID value is missing or incorrect. "
                          f"Provided values: SID = {sid}. RSID = {rsid}.")
 
+    @TRACING_HOOKS.traced(category="translator")
     def decode(self, message: Union[UdsMessage, UdsMessageRecord]) -> DecodedMessageAlias:
         """
         Decode physical values carried in payload of a diagnostic message.
@@ -109,3 +111,194 @@ class Translator:
         if sid not in self.services_mapping:
             raise ValueError("Database has no decoding defined for SID/RSID value of the provided message.")
         return self.services_mapping[sid].decode(message.payload)
+
+    def encode_into(self,
+                    buffer: Union[bytearray, memoryview],
+                    data_records_values: DataRecordsValuesAlias,
+                    sid: Optional[RequestSID] = None,
+                    rsid: Optional[ResponseSID] = None,
+                    offset: int = 0) -> int:
+        """
+        Encode diagnostic message payload directly into a preallocated buffer.
+
+        :param buffer: Writable buffer to encode the payload into.
+        :param data_records_values: Mapping with Data Records values that are part of the message.
+            Mapping keys are Data Records names.
+            Mapping values are either a single occurrence or multiple occurrences values. Each occurrence can be
+            a raw value or a mapping with children names and its corresponding values.
+        :param sid: Request SID value.
+            Used by request message (first byte) and negative response message (second byte).
+        :param rsid: Response SID value.
+            Used by response messages only (first byte).
+        :param offset: Index of the buffer byte where the payload is to start.
+
+        :raise ValueError: Either SID or RSID value is missing or incorrect.
+
+        :return: Number of payload bytes written into the buffer.
+        """
+        if rsid == ResponseSID.NegativeResponse and sid in self.services_mapping:
+            service = self.services_mapping[sid]  # type: ignore
+        elif rsid in self.services_mapping and sid is None:
+            service = self.services_mapping[rsid]  # type: ignore
+        elif sid in self.services_mapping and rsid is None:
+            service = self.services_mapping[sid]  # type: ignore
+        else:
+            raise ValueError("Either SID or RSID value is missing or incorrect. "
+                             f"Provided values: SID = {sid}. RSID = {rsid}.")
+        return service.encode_into(buffer=buffer,
+                                   data_records_values=data_records_values,
+                                   sid=sid,
+                                   rsid=rsid,
+                                   offset=offset)
+
+    def decode_payload(self, payload: Union[bytes, bytearray, memoryview]) -> DecodedMessageAlias:
+        """
+        Decode physical values carried in payload of a diagnostic message.
+
+        This is a faster alternative to :meth:`~uds.translator.translator.Translator.decode` for payloads
+        that are already available as bytes (e.g. read from a database or a file), as no diagnostic
+        message object has to be created.
+
+        :param payload: Payload of a diagnostic message.
+
+        :raise TypeError: Provided value is not a bytes-like object.
+        :raise ValueError: Provided payload is empty or this translator has no service implementation for
+            provided diagnostic message SID.
+
+        :return: Decoded Data Records values from provided payload.
+        """
+        if isinstance(payload, memoryview):
+            payload = payload.tobytes()
+        elif not isinstance(payload, (bytes, bytearray)):
+            raise TypeError(f"Provided value is not a bytes-like object. Actual type: {type(payload)}.")
+        if not payload:
+            raise ValueError("Provided payload is empty.")
+        if payload[0] == ResponseSID.NegativeResponse:
+            if len(payload) < 2 or payload[1] not in self.services_mapping:
+                raise ValueError("Database has no decoding defined for SID value of the provided payload.")
+            return self.services_mapping[payload[1]].decode_negative_response(payload)
+        if payload[0] not in self.services_mapping:
+            raise ValueError("Database has no decoding defined for SID/RSID value of the provided payload.")
+        return self.services_mapping[payload[0]].decode(payload)
+
+
+ServiceLoaderAlias = Callable[[], Service]
+"""Alias of a callable that builds (or imports) Service translator."""
+
+
+def _return_service(service: Service) -> Service:
+    """
+    Loader of Service translator that is already built.
+
+    :param service: Service translator to return.
+
+    :return: The provided Service translator.
+    """
+    return service
+
+
+class _LazyServicesMapping(Mapping[Union[int, RequestSID, ResponseSID], Service]):
+    """Mapping from SID/RSID values to Services translators that are loaded on the first access."""
+
+    def __init__(self, services_loaders: Mapping[RequestSID, ServiceLoaderAlias]) -> None:
+        """
+        Configure lazy mapping.
+
+        :param services_loaders: Mapping from Request SID values to callables that provide Service translators.
+        """
+        self.__loaders: Dict[int, ServiceLoaderAlias] = {}
+        self.__request_sids: Dict[int, RequestSID] = {}
+        for request_sid, loader in services_loaders.items():
+            request_sid = RequestSID.validate_member(request_sid)
+            response_sid = ResponseSID.validate_member(request_sid + RESPONSE_REQUEST_SID_DIFF)
+            self.__loaders[request_sid] = self.__loaders[response_sid] = loader
+            self.__request_sids[request_sid] = self.__request_sids[response_sid] = request_sid
+        self.__services: Dict[int, Service] = {}
+
+    def __getitem__(self, key: Union[int, RequestSID, ResponseSID]) -> Service:
+        """
+        Get Service translator for provided SID/RSID value and load it if this is the first access.
+
+        :param key: SID or RSID value.
+
+        :raise InconsistencyError: Loaded Service translator is defined for other SID value.
+
+        :return: Service translator.
+        """
+        if key in self.__services:
+            return self.__services[key]
+        service = self.__loaders[key]()
+        if not isinstance(service, Service) or service.request_sid != self.__request_sids[key]:
+            raise InconsistencyError(f"Loader for SID = {self.__request_sids[key]} did not provide Service "
+                                     f"translator for this SID. Actual value: {service!r}.")
+        self.__services[service.request_sid] = self.__services[service.response_sid] = service
+        return service
+
+    def __contains__(self, key: object) -> bool:
+        """Check whether Service translator is defined for provided SID/RSID value (without loading it)."""
+        return key in self.__loaders
+
+    def __iter__(self) -> Iterator[Union[int, RequestSID, ResponseSID]]:
+        """Iterate over SID/RSID values (without loading Services translators)."""
+        return iter(self.__loaders)
+
+    def __len__(self) -> int:
+        """Get number of SID/RSID values."""
+        return len(self.__loaders)
+
+    @property
+    def loaded_services(self) -> FrozenSet[Service]:
+        """Get Services translators that were already loaded."""
+        return frozenset(self.__services.values())
+
+
+class LazyTranslator(Translator):
+    """
+    Translator for UDS messages which loads Services translators on demand.
+
+    Each Service translator is built (imported) when its SID/RSID value is looked up for the first time.
+    It makes Translator creation cheap, which is useful when only a few services are ever used.
+    """
+
+    def __init__(self,  # pylint: disable=super-init-not-called
+                 services_loaders: Mapping[RequestSID, ServiceLoaderAlias]) -> None:
+        """
+        Configure Lazy Translator.
+
+        :param services_loaders: Mapping from Request SID values to callables that provide Service translators.
+
+        :raise TypeError: Provided value is not a mapping.
+        """
+        if not isinstance(services_loaders, Mapping):
+            raise TypeError(f"Provided value is not a mapping. Actual type: {type(services_loaders)}.")
+        self.__lazy_services_mapping = _LazyServicesMapping(services_loaders)
+
+    @property
+    def services(self) -> FrozenSet[Service]:
+        """Get diagnostic services translators (all of them are loaded)."""
+        return frozenset(self.__lazy_services_mapping[sid] for sid in self.__lazy_services_mapping)
+
+    @services.setter
+    def services(self, value: Collection[Service]) -> None:
+        """
+        Set diagnostic services translators (they replace all Services loaders).
+
+        :param value: Diagnostic services translators to set.
+
+        :raise TypeError: Provided value is not a collection.
+        :raise ValueError: Provided value does not contain collection of Service instances only.
+        :raise InconsistencyError: Multiple translators were provided for at least one Service.
+        """
+        services = Translator(services=value).services
+        self.__lazy_services_mapping = _LazyServicesMapping({service.request_sid: partial(_return_service, service)
+                                                             for service in services})
+
+    @property
+    def loaded_services(self) -> FrozenSet[Service]:
+        """Get diagnostic services translators that were already loaded."""
+        return self.__lazy_services_mapping.loaded_services
+
+    @property
+    def services_mapping(self) -> Mapping[Union[int, RequestSID, ResponseSID], Service]:
+        """Get mapping from SID/RSID values to corresponding Service Translators."""
+        return self.__lazy_services_mapping
@@ -0,0 +1,220 @@
+"""
+Serialization of configured translators.
+
+Building a translator with many Data Records executes validation of every single Data Record attribute.
+Serialized translator can be restored without repeating this work, so processes that use the same translator
+start faster.
+
+.. warning:: Serialized translators use :mod:`pickle` module under the hood.
+    Never deserialize data that comes from untrusted sources.
+"""
+
+__all__ = ["TRANSLATOR_CACHE_VERSION", "serialize_translator", "deserialize_translator",
+           "save_translator", "load_translator"]
+
+import importlib
+import pickle  # nosec B403
+import sys
+from hashlib import sha256
+from io import BytesIO
+from os import PathLike
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional, Tuple, Union
+
+import uds
+
+from .data_record import AbstractConditionalDataRecord, AbstractDataRecord
+from .service import Service
+from .translator import Translator
+
+TRANSLATOR_CACHE_VERSION: int = 2
+"""Version of serialized translator format."""
+
+_MAGIC: bytes = b"UDSTC"
+"""Magic bytes at the beginning of serialized translator."""
+_DIGEST_LENGTH: int = sha256().digest_size
+"""Number of bytes used by content hash."""
+_HEADER_LENGTH: int = len(_MAGIC) + 1 + _DIGEST_LENGTH
+"""Number of bytes used by serialized translator header."""
+_REFERENCED_MODULES_PREFIX: str = "uds.translator."
+"""Prefix of modules which definitions are serialized as references."""
+
+_PersistentIdAlias = Union[Tuple[str, str], Tuple[str, str, int]]
+"""Alias of reference to an object defined (directly or within a tuple) by a module."""
+
+
+def _get_mapping_proxy(mapping: Mapping[Any, Any]) -> MappingProxyType[Any, Any]:
+    """
+    Create read-only mapping.
+
+    :param mapping: Mapping to wrap.
+
+    :return: Read-only view of provided mapping.
+    """
+    return MappingProxyType(mapping)
+
+
+def _get_content_digest(payload: bytes) -> bytes:
+    """
+    Get content hash of serialized translator.
+
+    :param payload: Serialized translator payload.
+
+    :return: SHA-256 digest of the payload and the package version.
+    """
+    return sha256(uds.__version__.encode() + payload).digest()
+
+
+class _TranslatorPickler(pickle.Pickler):
+    """Pickler that stores Data Records and Services defined by this package as references."""
+
+    def __init__(self, file: BytesIO) -> None:
+        """
+        Configure pickler and collect objects that are defined by this package.
+
+        :param file: Buffer to write serialized data to.
+        """
+        super().__init__(file, protocol=5)
+        self.__references: Dict[int, _PersistentIdAlias] = {}
+        for module_name, module in list(sys.modules.items()):
+            if not module_name.startswith(_REFERENCED_MODULES_PREFIX):
+                continue
+            for name, value in list(vars(module).items()):
+                if name.startswith("__"):
+                    continue
+                if isinstance(value, (AbstractDataRecord, AbstractConditionalDataRecord, Service)):
+                    self.__references.setdefault(id(value), (module_name, name))
+                elif isinstance(value, tuple):
+                    for index, element in enumerate(value):
+                        if isinstance(element, (AbstractDataRecord, AbstractConditionalDataRecord, Service)):
+                            self.__references.setdefault(id(element), (module_name, name, index))
+
+    def persistent_id(self, obj: Any) -> Optional[_PersistentIdAlias]:  # noqa: vulture
+        """
+        Get reference for objects that are defined by this package.
+
+        :param obj: Object to be serialized.
+
+        :return: Reference to the object or None if the object has to be serialized.
+        """
+        return self.__references.get(id(obj), None)
+
+    def reducer_override(self, obj: Any) -> Any:  # noqa: vulture
+        """
+        Serialize read-only mappings which are not supported by pickle.
+
+        :param obj: Object to be serialized.
+
+        :return: Reduce value for read-only mappings, NotImplemented for other objects.
+        """
+        if isinstance(obj, MappingProxyType):
+            return _get_mapping_proxy, (dict(obj),)
+        return NotImplemented
+
+
+class _TranslatorUnpickler(pickle.Unpickler):  # nosec B301
+    """Unpickler that resolves references to Data Records and Services defined by this package."""
+
+    def persistent_load(self, pid: Any) -> Any:  # noqa: vulture
+        """
+        Get object that is defined by this package.
+
+        :param pid: Reference to the object.
+
+        :raise pickle.UnpicklingError: Provided reference is incorrect.
+
+        :return: Referenced object.
+        """
+        if (not isinstance(pid, tuple) or len(pid) not in {2, 3}
+                or not isinstance(pid[0], str) or not pid[0].startswith(_REFERENCED_MODULES_PREFIX)):
+            raise pickle.UnpicklingError(f"Incorrect reference found: {pid!r}.")
+        value = getattr(importlib.import_module(pid[0]), pid[1])
+        return value if len(pid) == 2 else value[pid[2]]
+
+
+def serialize_translator(translator: Translator) -> bytes:
+    """
+    Serialize translator into compact binary form.
+
+    Data Records and Services defined by this package are stored as references, all the others
+    (e.g. OEM specific) are stored with their complete configuration.
+
+    :param translator: Translator to serialize.
+
+    :raise TypeError: Provided value is not Translator instance.
+    :raise ValueError: Translator contains objects that cannot be serialized,
+        e.g. formulas (lambdas or nested functions) that are not defined on a module level.
+
+    :return: Serialized translator.
+    """
+    if not isinstance(translator, Translator):
+        raise TypeError(f"Provided value is not Translator instance. Actual type: {type(translator)}.")
+    services = tuple(translator.services)  # all services must be loaded before references are collected
+    buffer = BytesIO()
+    try:
+        _TranslatorPickler(buffer).dump(services)
+    except (pickle.PicklingError, TypeError, AttributeError) as exception:
+        raise ValueError("Provided translator contains objects that cannot be serialized.") from exception
+    payload = buffer.getvalue()
+    return _MAGIC + bytes([TRANSLATOR_CACHE_VERSION]) + _get_content_digest(payload) + payload
+
+
+def deserialize_translator(data: bytes) -> Translator:
+    """
+    Restore translator from its serialized form.
+
+    .. note:: Data Records are restored without validation of their attributes.
+
+    :param data: Serialized translator.
+
+    :raise ValueError: Provided data is not a serialized translator, it uses other format version,
+        it was created by other version of the package or its content is corrupted.
+
+    :return: Restored translator.
+    """
+    data = bytes(data)
+    if data[:len(_MAGIC)] != _MAGIC or len(data) <= _HEADER_LENGTH:
+        raise ValueError("Provided data is not a serialized translator.")
+    if data[len(_MAGIC)] != TRANSLATOR_CACHE_VERSION:
+        raise ValueError("Provided serialized translator uses unsupported format version. "
+                         f"Actual version: {data[len(_MAGIC)]}. Expected version: {TRANSLATOR_CACHE_VERSION}.")
+    digest = data[len(_MAGIC) + 1:_HEADER_LENGTH]
+    payload = data[_HEADER_LENGTH:]
+    if digest != _get_content_digest(payload):
+        raise ValueError("Provided serialized translator is either corrupted or created by other package version.")
+    return Translator(services=_TranslatorUnpickler(BytesIO(payload)).load())  # nosec B301
+
+
+def save_translator(translator: Translator, file_path: Union[str, "PathLike[str]"]) -> str:
+    """
+    Serialize translator into a file.
+
+    :param translator: Translator to serialize.
+    :param file_path: Path to the file where serialized translator is to be saved.
+
+    :return: Content hash (hex string) of the serialized translator.
+    """
+    data = serialize_translator(translator)
+    with open(file_path, "wb") as file:
+        file.write(data)
+    return data[len(_MAGIC) + 1:_HEADER_LENGTH].hex()
+
+
+def load_translator(file_path: Union[str, "PathLike[str]"], content_hash: Optional[str] = None) -> Translator:
+    """
+    Restore translator from a file.
+
+    :param file_path: Path to the file with serialized translator.
+    :param content_hash: Expected content hash (returned by :func:`save_translator`).
+        Leave None to accept any content.
+
+    :raise ValueError: The file content is not the expected serialized translator.
+
+    :return: Restored translator.
+    """
+    with open(file_path, "rb") as file:
+        data = file.read()
+    if content_hash is not None and data[len(_MAGIC) + 1:_HEADER_LENGTH].hex() != content_hash.lower():
+        raise ValueError("Content hash of the serialized translator does not match. "
+                         f"Actual value: {data[len(_MAGIC) + 1:_HEADER_LENGTH].hex()}. Expected value: {content_hash}.")
+    return deserialize_translator(data)
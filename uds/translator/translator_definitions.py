@@ -1,118 +1,101 @@
-"""Definition of UDS translators."""
+"""
+Definition of UDS translators.
+
+Base translators load Services translators on demand, so a service definition (together with its Data Records)
+is built the first time its SID/RSID is looked up.
+"""
 
 __all__ = ["BASE_TRANSLATOR", "BASE_TRANSLATOR_2020", "BASE_TRANSLATOR_2013"]
 
-from .service_definitions import (
-    ACCESS_TIMING_PARAMETER_2013,
-    AUTHENTICATION,
-    CLEAR_DIAGNOSTIC_INFORMATION_2013,
-    CLEAR_DIAGNOSTIC_INFORMATION_2020,
-    COMMUNICATION_CONTROL,
-    CONTROL_DTC_SETTING,
-    DIAGNOSTIC_SESSION_CONTROL,
-    DYNAMICALLY_DEFINE_DATA_IDENTIFIER_2013,
-    DYNAMICALLY_DEFINE_DATA_IDENTIFIER_2020,
-    ECU_RESET,
-    INPUT_OUTPUT_CONTROL_BY_IDENTIFIER_2013,
-    INPUT_OUTPUT_CONTROL_BY_IDENTIFIER_2020,
-    LINK_CONTROL,
-    READ_DATA_BY_IDENTIFIER_2013,
-    READ_DATA_BY_IDENTIFIER_2020,
-    READ_DATA_BY_PERIODIC_IDENTIFIER,
-    READ_DTC_INFORMATION_2013,
-    READ_DTC_INFORMATION_2020,
-    READ_MEMORY_BY_ADDRESS,
-    READ_SCALING_DATA_BY_IDENTIFIER_2013,
-    READ_SCALING_DATA_BY_IDENTIFIER_2020,
-    REQUEST_DOWNLOAD,
-    REQUEST_FILE_TRANSFER_2013,
-    REQUEST_FILE_TRANSFER_2020,
-    REQUEST_TRANSFER_EXIT,
-    REQUEST_UPLOAD,
-    RESPONSE_ON_EVENT_2013,
-    RESPONSE_ON_EVENT_2020,
-    ROUTINE_CONTROL,
-    SECURED_DATA_TRANSMISSION_2013,
-    SECURED_DATA_TRANSMISSION_2020,
-    SECURITY_ACCESS,
-    TESTER_PRESENT,
-    TRANSFER_DATA,
-    WRITE_DATA_BY_IDENTIFIER_2013,
-    WRITE_DATA_BY_IDENTIFIER_2020,
-    WRITE_MEMORY_BY_ADDRESS,
-)
-from .translator import Translator
+from functools import partial
+
+from uds.message import RequestSID
+
+from . import service_definitions
+from .translator import LazyTranslator, ServiceLoaderAlias
+
+
+def _service_loader(name: str) -> ServiceLoaderAlias:
+    """
+    Get loader of a Service translator defined in :mod:`uds.translator.service_definitions`.
+
+    :param name: Name of the Service translator.
+
+    :return: Callable that imports and returns the Service translator.
+    """
+    return partial(getattr, service_definitions, name)
+
 
-BASE_TRANSLATOR_2013 = Translator(services={
+BASE_TRANSLATOR_2013 = LazyTranslator(services_loaders={
     # Diagnostic and Communication Management functional unit
-    DIAGNOSTIC_SESSION_CONTROL,
-    ECU_RESET,
-    SECURITY_ACCESS,
-    COMMUNICATION_CONTROL,
-    TESTER_PRESENT,
-    ACCESS_TIMING_PARAMETER_2013,
-    SECURED_DATA_TRANSMISSION_2013,
-    CONTROL_DTC_SETTING,
-    RESPONSE_ON_EVENT_2013,
-    LINK_CONTROL,
+    RequestSID.DiagnosticSessionControl: _service_loader("DIAGNOSTIC_SESSION_CONTROL"),
+    RequestSID.ECUReset: _service_loader("ECU_RESET"),
+    RequestSID.SecurityAccess: _service_loader("SECURITY_ACCESS"),
+    RequestSID.CommunicationControl: _service_loader("COMMUNICATION_CONTROL"),
+    RequestSID.TesterPresent: _service_loader("TESTER_PRESENT"),
+    RequestSID.AccessTimingParameter: _service_loader("ACCESS_TIMING_PARAMETER_2013"),
+    RequestSID.SecuredDataTransmission: _service_loader("SECURED_DATA_TRANSMISSION_2013"),
+    RequestSID.ControlDTCSetting: _service_loader("CONTROL_DTC_SETTING"),
+    RequestSID.ResponseOnEvent: _service_loader("RESPONSE_ON_EVENT_2013"),
+    RequestSID.LinkControl: _service_loader("LINK_CONTROL"),
     # Data Transmission functional unit
-    READ_DATA_BY_IDENTIFIER_2013,
-    READ_MEMORY_BY_ADDRESS,
-    READ_SCALING_DATA_BY_IDENTIFIER_2013,
-    READ_DATA_BY_PERIODIC_IDENTIFIER,
-    DYNAMICALLY_DEFINE_DATA_IDENTIFIER_2013,
-    WRITE_DATA_BY_IDENTIFIER_2013,
-    WRITE_MEMORY_BY_ADDRESS,
+    RequestSID.ReadDataByIdentifier: _service_loader("READ_DATA_BY_IDENTIFIER_2013"),
+    RequestSID.ReadMemoryByAddress: _service_loader("READ_MEMORY_BY_ADDRESS"),
+    RequestSID.ReadScalingDataByIdentifier: _service_loader("READ_SCALING_DATA_BY_IDENTIFIER_2013"),
+    RequestSID.ReadDataByPeriodicIdentifier: _service_loader("READ_DATA_BY_PERIODIC_IDENTIFIER"),
+    RequestSID.DynamicallyDefineDataIdentifier: _service_loader("DYNAMICALLY_DEFINE_DATA_IDENTIFIER_2013"),
+    RequestSID.WriteDataByIdentifier: _service_loader("WRITE_DATA_BY_IDENTIFIER_2013"),
+    RequestSID.WriteMemoryByAddress: _service_loader("WRITE_MEMORY_BY_ADDRESS"),
     # Stored Data Transmission functional unit
-    CLEAR_DIAGNOSTIC_INFORMATION_2013,
-    READ_DTC_INFORMATION_2013,
+    RequestSID.ClearDiagnosticInformation: _service_loader("CLEAR_DIAGNOSTIC_INFORMATION_2013"),
+    RequestSID.ReadDTCInformation: _service_loader("READ_DTC_INFORMATION_2013"),
     # InputOutput Control functional unit
-    INPUT_OUTPUT_CONTROL_BY_IDENTIFIER_2013,
+    RequestSID.InputOutputControlByIdentifier: _service_loader("INPUT_OUTPUT_CONTROL_BY_IDENTIFIER_2013"),
     # Routine functional unit
-    ROUTINE_CONTROL,
+    RequestSID.RoutineControl: _service_loader("ROUTINE_CONTROL"),
     # Upload Download functional unit
-    REQUEST_DOWNLOAD,
-    REQUEST_UPLOAD,
-    TRANSFER_DATA,
-    REQUEST_TRANSFER_EXIT,
-    REQUEST_FILE_TRANSFER_2013,
+    RequestSID.RequestDownload: _service_loader("REQUEST_DOWNLOAD"),
+    RequestSID.RequestUpload: _service_loader("REQUEST_UPLOAD"),
+    RequestSID.TransferData: _service_loader("TRANSFER_DATA"),
+    RequestSID.RequestTransferExit: _service_loader("REQUEST_TRANSFER_EXIT"),
+    RequestSID.RequestFileTransfer: _service_loader("REQUEST_FILE_TRANSFER_2013"),
 })
 """Base translator for messages compatible with ISO 14229-1:2013."""
 
-BASE_TRANSLATOR_2020 = Translator(services={
+BASE_TRANSLATOR_2020 = LazyTranslator(services_loaders={
     # Diagnostic and communication management functional unit
-    DIAGNOSTIC_SESSION_CONTROL,
-    ECU_RESET,
-    SECURITY_ACCESS,
-    COMMUNICATION_CONTROL,
-    AUTHENTICATION,
-    TESTER_PRESENT,
-    CONTROL_DTC_SETTING,
-    RESPONSE_ON_EVENT_2020,
-    LINK_CONTROL,
+    RequestSID.DiagnosticSessionControl: _service_loader("DIAGNOSTIC_SESSION_CONTROL"),
+    RequestSID.ECUReset: _service_loader("ECU_RESET"),
+    RequestSID.SecurityAccess: _service_loader("SECURITY_ACCESS"),
+    RequestSID.CommunicationControl: _service_loader("COMMUNICATION_CONTROL"),
+    RequestSID.Authentication: _service_loader("AUTHENTICATION"),
+    RequestSID.TesterPresent: _service_loader("TESTER_PRESENT"),
+    RequestSID.ControlDTCSetting: _service_loader("CONTROL_DTC_SETTING"),
+    RequestSID.ResponseOnEvent: _service_loader("RESPONSE_ON_EVENT_2020"),
+    RequestSID.LinkControl: _service_loader("LINK_CONTROL"),
     # Data transmission functional unit
-    READ_DATA_BY_IDENTIFIER_2020,
-    READ_MEMORY_BY_ADDRESS,
-    READ_SCALING_DATA_BY_IDENTIFIER_2020,
-    READ_DATA_BY_PERIODIC_IDENTIFIER,
-    DYNAMICALLY_DEFINE_DATA_IDENTIFIER_2020,
-    WRITE_DATA_BY_IDENTIFIER_2020,
-    WRITE_MEMORY_BY_ADDRESS,
+    RequestSID.ReadDataByIdentifier: _service_loader("READ_DATA_BY_IDENTIFIER_2020"),
+    RequestSID.ReadMemoryByAddress: _service_loader("READ_MEMORY_BY_ADDRESS"),
+    RequestSID.ReadScalingDataByIdentifier: _service_loader("READ_SCALING_DATA_BY_IDENTIFIER_2020"),
+    RequestSID.ReadDataByPeriodicIdentifier: _service_loader("READ_DATA_BY_PERIODIC_IDENTIFIER"),
+    RequestSID.DynamicallyDefineDataIdentifier: _service_loader("DYNAMICALLY_DEFINE_DATA_IDENTIFIER_2020"),
+    RequestSID.WriteDataByIdentifier: _service_loader("WRITE_DATA_BY_IDENTIFIER_2020"),
+    RequestSID.WriteMemoryByAddress: _service_loader("WRITE_MEMORY_BY_ADDRESS"),
     # Stored data transmission functional unit
-    CLEAR_DIAGNOSTIC_INFORMATION_2020,
-    READ_DTC_INFORMATION_2020,
+    RequestSID.ClearDiagnosticInformation: _service_loader("CLEAR_DIAGNOSTIC_INFORMATION_2020"),
+    RequestSID.ReadDTCInformation: _service_loader("READ_DTC_INFORMATION_2020"),
     # InputOutput control functional unit
-    INPUT_OUTPUT_CONTROL_BY_IDENTIFIER_2020,
+    RequestSID.InputOutputControlByIdentifier: _service_loader("INPUT_OUTPUT_CONTROL_BY_IDENTIFIER_2020"),
     # Routine functional unit
-    ROUTINE_CONTROL,
+    RequestSID.RoutineControl: _service_loader("ROUTINE_CONTROL"),
     # Upload download functional unit
-    REQUEST_DOWNLOAD,
-    REQUEST_UPLOAD,
-    TRANSFER_DATA,
-    REQUEST_TRANSFER_EXIT,
-    REQUEST_FILE_TRANSFER_2020,
+    RequestSID.RequestDownload: _service_loader("REQUEST_DOWNLOAD"),
+    RequestSID.RequestUpload: _service_loader("REQUEST_UPLOAD"),
+    RequestSID.TransferData: _service_loader("TRANSFER_DATA"),
+    RequestSID.RequestTransferExit: _service_loader("REQUEST_TRANSFER_EXIT"),
+    RequestSID.RequestFileTransfer: _service_loader("REQUEST_FILE_TRANSFER_2020"),
     # Security sub-layer definition
-    SECURED_DATA_TRANSMISSION_2020,
+    RequestSID.SecuredDataTransmission: _service_loader("SECURED_DATA_TRANSMISSION_2020"),
 })
 """Base translator for messages compatible with ISO 14229-1:2020."""
 
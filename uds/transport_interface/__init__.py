@@ -7,7 +7,9 @@ It provides tools and base for configurable Transport Interfaces. Transport Inte
  - storing historic information about transmitted and received packets
  - storing historic information about transmitted and received UDS messages
  - managing Transport and Network layer errors
+ - storing transmitted and received packets and UDS messages in binary traces
 """
 
 from .abstract_transport_interface import AbstractTransportInterface
 from .logger import TransportLogger
+from .trace import AbstractTraceWriter, TraceEntryType, TraceHandler
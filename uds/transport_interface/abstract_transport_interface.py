@@ -3,8 +3,7 @@
 __all__ = ["AbstractTransportInterface"]
 
 from abc import ABC, abstractmethod
-from asyncio import AbstractEventLoop
-from typing import Any, Optional
+from typing import TYPE_CHECKING, Any, Optional
 
 from uds.addressing import AbstractAddressingInformation
 from uds.message import UdsMessage, UdsMessageRecord
@@ -12,6 +11,9 @@ from uds.packet import AbstractPacket, AbstractPacketRecord
 from uds.segmentation import AbstractSegmenter
 from uds.utilities import ReassignmentError, TimeMillisecondsAlias, TimeSync
 
+if TYPE_CHECKING:
+    from asyncio import AbstractEventLoop
+
 
 class AbstractTransportInterface(ABC):
     """
@@ -108,7 +110,7 @@ class AbstractTransportInterface(ABC):
     @abstractmethod
     async def async_send_packet(self,
                                 packet: AbstractPacket,
-                                loop: Optional[AbstractEventLoop] = None) -> AbstractPacketRecord:
+                                loop: Optional["AbstractEventLoop"] = None) -> AbstractPacketRecord:
         """
         Transmit packet asynchronously.
 
@@ -134,7 +136,7 @@ class AbstractTransportInterface(ABC):
     @abstractmethod
     async def async_receive_packet(self,
                                    timeout: Optional[TimeMillisecondsAlias] = None,
-                                   loop: Optional[AbstractEventLoop] = None) -> AbstractPacketRecord:
+                                   loop: Optional["AbstractEventLoop"] = None) -> AbstractPacketRecord:
         """
         Receive packet asynchronously.
 
@@ -161,7 +163,7 @@ class AbstractTransportInterface(ABC):
     @abstractmethod
     async def async_send_message(self,
                                  message: UdsMessage,
-                                 loop: Optional[AbstractEventLoop] = None) -> UdsMessageRecord:
+                                 loop: Optional["AbstractEventLoop"] = None) -> UdsMessageRecord:
         """
         Transmit asynchronously UDS message.
 
@@ -195,7 +197,7 @@ class AbstractTransportInterface(ABC):
     async def async_receive_message(self,
                                     start_timeout: Optional[TimeMillisecondsAlias] = None,
                                     end_timeout: Optional[TimeMillisecondsAlias] = None,
-                                    loop: Optional[AbstractEventLoop] = None) -> UdsMessageRecord:
+                                    loop: Optional["AbstractEventLoop"] = None) -> UdsMessageRecord:
         """
         Receive asynchronously UDS message.
 
@@ -5,8 +5,11 @@ __all__ = ["TransportLogger"]
 from copy import copy
 from functools import wraps
 from inspect import iscoroutinefunction
-from logging import INFO, Logger, getLogger
+from logging import INFO, Handler, Logger, LogRecord, getLogger
+from logging.handlers import QueueHandler, QueueListener
+from queue import SimpleQueue
 from typing import Any, Callable, Optional, Type, Union
+from warnings import warn
 
 from uds.message import UdsMessageRecord
 from uds.packet import AbstractPacketRecord
@@ -14,8 +17,70 @@ from uds.packet import AbstractPacketRecord
 from .abstract_transport_interface import AbstractTransportInterface
 
 
+class _LazyLogMessage:
+    """Log message that is formatted only when it is emitted by a handler."""
+
+    __slots__ = ("log_format", "record")
+
+    def __init__(self, log_format: str, record: Union[UdsMessageRecord, AbstractPacketRecord]) -> None:
+        """
+        Create log message.
+
+        :param log_format: Format of the log message.
+            It has to be defined as a str on which format method would be called with record parameter.
+        :param record: Record to log.
+        """
+        self.log_format = log_format
+        self.record = record
+
+    def __str__(self) -> str:
+        """Format the log message."""
+        return self.log_format.format(record=self.record)
+
+
+class _DeferredQueueHandler(QueueHandler):
+    """Queue handler that leaves formatting of log records to the queue listener."""
+
+    def prepare(self, record: LogRecord) -> LogRecord:
+        """
+        Prepare log record for enqueuing.
+
+        :param record: Log record to enqueue.
+
+        :return: The same log record (with message that is not formatted yet).
+        """
+        return record
+
+
+class _LoggerHandler(Handler):
+    """Handler that passes log records to a logger (and therefore to all its handlers)."""
+
+    def __init__(self, logger: Logger) -> None:
+        """
+        Create handler.
+
+        :param logger: Logger to which log records are passed.
+        """
+        super().__init__()
+        self.logger = logger
+
+    def emit(self, record: LogRecord) -> None:
+        """
+        Pass log record to the logger.
+
+        :param record: Log record to pass.
+        """
+        self.logger.handle(record)
+
+
 class TransportLogger:
-    """Configurable logger for Transport Interface objects."""
+    """
+    Configurable logger for Transport Interface objects.
+
+    Log messages are formatted only if they are emitted by a handler. Use queue listener
+    (:meth:`~uds.transport_interface.logger.TransportLogger.start_queue_listener`) to move formatting
+    and handlers I/O out of the thread that transmits and receives packets.
+    """
 
     TransportInterfaceAlias = Union[AbstractTransportInterface, Type[AbstractTransportInterface]]
     """Alias of Transport Interface (either class or instance)."""
@@ -34,7 +99,8 @@ class TransportLogger:
                  log_sending: bool = True,
                  log_receiving: bool = True,
                  message_log_format: str = DEFAULT_LOG_FORMAT,
-                 packet_log_format: str = DEFAULT_LOG_FORMAT) -> None:
+                 packet_log_format: str = DEFAULT_LOG_FORMAT,
+                 use_queue: bool = False) -> None:
         """
         Configure transport logging.
 
@@ -45,14 +111,20 @@ class TransportLogger:
             It has to be defined as a str on which format method would be called with record parameter.
         :param packet_log_format: Log messages format for Packets.
             It has to be defined as a str on which format method would be called with record parameter.
+        :param use_queue: Whether to start queue listener, so log messages are formatted and handled
+            in a separate thread.
         """
         self.__logger = getLogger(logger_name)
+        self.__queue_handler: Optional[QueueHandler] = None
+        self.__queue_listener: Optional[QueueListener] = None
         self.message_logging_level = message_logging_level
         self.packet_logging_level = packet_logging_level
         self.log_sending = log_sending
         self.log_receiving = log_receiving
         self.message_log_format = message_log_format
         self.packet_log_format = packet_log_format
+        if use_queue:
+            self.start_queue_listener()
 
     def __call__(self, transport_interface: TransportInterfaceAlias) -> TransportInterfaceAlias:
         """Decorate Transport Interface."""
@@ -68,6 +140,11 @@ class TransportLogger:
         """Get configured Logger (from logging package)."""
         return self.__logger
 
+    @property
+    def is_queue_listener_running(self) -> bool:
+        """Get flag whether log messages are formatted and handled by queue listener thread."""
+        return self.__queue_listener is not None
+
     @property
     def message_logging_level(self) -> Optional[int]:
         """Get logging level to use for UDS Messages logging."""
@@ -251,14 +328,61 @@ class TransportLogger:
                 return packet_record
         return decorated_method
 
+    def start_queue_listener(self) -> None:
+        """
+        Start handling log messages in a separate thread.
+
+        Log records are created (with timestamps) in the thread that transmits or receives,
+        but they are formatted and passed to the logger handlers by the queue listener thread.
+        """
+        if self.is_queue_listener_running:
+            warn("Queue listener is already running.",
+                 category=UserWarning)
+            return
+        queue: SimpleQueue[LogRecord] = SimpleQueue()
+        self.__queue_handler = _DeferredQueueHandler(queue)
+        self.__queue_listener = QueueListener(queue, _LoggerHandler(self.logger))
+        self.__queue_listener.start()
+
+    def stop_queue_listener(self) -> None:
+        """Handle all log messages that are already queued and stop the queue listener thread."""
+        if self.__queue_listener is None:
+            warn("Queue listener is not running.",
+                 category=UserWarning)
+            return
+        self.__queue_listener.stop()
+        self.__queue_listener = None
+        self.__queue_handler = None
+
+    def _log(self, level: int, log_format: str, record: Union[UdsMessageRecord, AbstractPacketRecord]) -> None:
+        """
+        Log a record without formatting it.
+
+        :param level: Logging level to use.
+        :param log_format: Format of the log message.
+        :param record: Record to log.
+        """
+        msg = _LazyLogMessage(log_format=log_format, record=record)
+        queue_handler = self.__queue_handler
+        if queue_handler is None:
+            self.logger.log(level=level, msg=msg)
+        else:
+            queue_handler.handle(self.logger.makeRecord(name=self.logger.name,
+                                                        level=level,
+                                                        fn="(unknown file)",
+                                                        lno=0,
+                                                        msg=msg,
+                                                        args=(),
+                                                        exc_info=None))
+
     def log_message(self, record: UdsMessageRecord) -> None:
         """Log a message after receiving/transmitting UDS Message."""
-        if self.message_logging_level is not None:
-            self.logger.log(level=self.message_logging_level,
-                            msg=self.message_log_format.format(record=record))
+        level = self.message_logging_level
+        if level is not None and self.logger.isEnabledFor(level):
+            self._log(level=level, log_format=self.message_log_format, record=record)
 
     def log_packet(self, record: AbstractPacketRecord) -> None:
         """Log a message after receiving/transmitting Packet."""
-        if self.packet_logging_level is not None:
-            self.logger.log(level=self.packet_logging_level,
-                            msg=self.packet_log_format.format(record=record))
+        level = self.packet_logging_level
+        if level is not None and self.logger.isEnabledFor(level):
+            self._log(level=level, log_format=self.packet_log_format, record=record)
@@ -0,0 +1,121 @@
+"""Binary tracing of transmitted and received packets and UDS messages."""
+
+__all__ = ["TraceEntryType", "AbstractTraceWriter", "TraceHandler"]
+
+from abc import ABC, abstractmethod
+from logging import NOTSET, Handler, LogRecord
+from typing import Union
+
+from aenum import StrEnum as AStrEnum
+from aenum import unique
+
+from uds.message import UdsMessageRecord
+from uds.packet import AbstractPacketRecord
+from uds.utilities import ValidatedEnum
+
+from .logger import _LazyLogMessage
+
+
+@unique
+class TraceEntryType(ValidatedEnum, AStrEnum):  # type: ignore
+    """Types of records that are stored in binary traces."""
+
+    PACKET: "TraceEntryType" = "Packet"  # type: ignore
+    """Entry with a :ref:`packet <knowledge-base-packet>` record."""
+    MESSAGE: "TraceEntryType" = "Message"  # type: ignore
+    """Entry with a :ref:`UDS message <knowledge-base-diagnostic-message>` record."""
+
+
+class AbstractTraceWriter(ABC):
+    """Abstract definition of a writer that streams records into a binary trace."""
+
+    @property
+    @abstractmethod
+    def is_closed(self) -> bool:
+        """Get flag whether the trace is already closed."""
+
+    @abstractmethod
+    def write(self, record: Union[UdsMessageRecord, AbstractPacketRecord]) -> None:
+        """
+        Append a record to the trace.
+
+        :param record: Packet or UDS message record to store.
+        """
+
+    @abstractmethod
+    def flush(self) -> None:
+        """Flush buffered entries to the trace."""
+
+    @abstractmethod
+    def close(self) -> None:
+        """Finalize and close the trace."""
+
+    def __enter__(self) -> "AbstractTraceWriter":
+        """Enter the context manager."""
+        return self
+
+    def __exit__(self, *args: object) -> None:  # noqa: vulture
+        """Close the trace when leaving the context manager."""
+        self.close()
+
+
+class TraceHandler(Handler):
+    """
+    Logging handler that stores records logged by :class:`~uds.transport_interface.logger.TransportLogger`.
+
+    Records are passed to a trace writer as they are, so no log message is formatted.
+    """
+
+    def __init__(self, trace_writer: AbstractTraceWriter, level: int = NOTSET) -> None:
+        """
+        Create handler for binary tracing.
+
+        :param trace_writer: Trace writer to use for storing records.
+        :param level: Logging level of the handler.
+        """
+        super().__init__(level=level)
+        self.trace_writer = trace_writer
+
+    @property
+    def trace_writer(self) -> AbstractTraceWriter:
+        """Get trace writer used for storing records."""
+        return self.__trace_writer
+
+    @trace_writer.setter
+    def trace_writer(self, value: AbstractTraceWriter) -> None:
+        """
+        Set trace writer to use for storing records.
+
+        :param value: Trace writer to set.
+
+        :raise TypeError: Provided value is not an instance of AbstractTraceWriter class.
+        """
+        if not isinstance(value, AbstractTraceWriter):
+            raise TypeError(f"Provided value is not an instance of AbstractTraceWriter class. "
+                            f"Actual type: {type(value)}.")
+        self.__trace_writer = value
+
+    def emit(self, record: LogRecord) -> None:
+        """
+        Store packet or UDS message record that was logged.
+
+        Log records that were not created by a Transport Logger are ignored.
+
+        :param record: Log record to handle.
+        """
+        if isinstance(record.msg, _LazyLogMessage):
+            try:
+                self.trace_writer.write(record.msg.record)
+            except Exception:  # pylint: disable=broad-exception-caught
+                self.handleError(record)
+
+    def flush(self) -> None:
+        """Flush the trace writer."""
+        if not self.trace_writer.is_closed:
+            self.trace_writer.flush()
+
+    def close(self) -> None:
+        """Close the trace writer and the handler."""
+        if not self.trace_writer.is_closed:
+            self.trace_writer.close()
+        super().close()
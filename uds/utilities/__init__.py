@@ -89,6 +89,7 @@ from .custom_exceptions import (
     AmbiguityError,
     InconsistencyError,
     MessageTransmissionNotStartedError,
+    NegativeResponseError,
     ReassignmentError,
     UnusedArgumentError,
 )
@@ -99,3 +100,5 @@ from .custom_warnings import (
     ValueWarning,
 )
 from .enums import ByteEnum, Endianness, ExtendableEnum, NibbleEnum, ValidatedEnum
+from .metrics import Histogram, HistogramSnapshot, MetricsRegistry, MetricsSnapshot, export_prometheus_text
+from .tracing import TRACING_HOOKS, Span, SpanHookAlias, SpansRecorder, TracingHooks, export_chrome_trace
@@ -65,6 +65,8 @@ def validate_raw_bytes(value: RawBytesAlias, allow_empty: bool = False) -> None:
                         f"Actual type: {type(value)}")
     if not allow_empty and not value:
         raise ValueError("Provided values is an empty sequence.")
+    if isinstance(value, (bytearray, bytes)):
+        return  # bytes-like objects cannot contain anything but raw bytes
     if not all(isinstance(raw_byte, int) and 0x00 <= raw_byte <= 0xFF for raw_byte in value):
         raise ValueError("Provided value does not contain raw bytes (int value between 0x00 and 0xFF) only. "
                          f"Actual value: {value!r}")
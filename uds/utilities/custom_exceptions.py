@@ -53,3 +53,13 @@ class MessageTransmissionNotStartedError(TimeoutError):
         Timeout defined by `start_timeout` argument was reached by
         :meth:`~uds.transport_interface.abstract_transport_interface.AbstractTransportInterface.receive_message`
     """
+
+
+class NegativeResponseError(RuntimeError):
+    """
+    Server responded with :ref:`Negative Response Message <knowledge-base-negative-response-message>`.
+
+    Example:
+        A procedure (that consists of multiple requests) cannot be continued, because the server rejected
+        one of the requests.
+    """
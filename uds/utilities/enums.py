@@ -8,7 +8,7 @@ named values. This module provides extension to `aenum <https://pypi.org/project
 __all__ = ["ExtendableEnum", "ValidatedEnum", "ByteEnum", "NibbleEnum",
            "Endianness"]
 
-from typing import Any
+from typing import Any, Dict, Type, TypeVar
 
 from aenum import Enum as AEnum
 from aenum import IntEnum as AIntEnum
@@ -17,9 +17,35 @@ from aenum import extend_enum
 
 from .common_types import validate_nibble, validate_raw_byte
 
+_MEMBERS_LOOKUP: Dict[type, Dict[Any, Any]] = {}
+"""Cache with mappings from values and members to members of each validated enum (built on the first use)."""
+_ValidatedEnumTypeVar = TypeVar("_ValidatedEnumTypeVar", bound="ValidatedEnum")
+
+
+def _get_members_lookup(enum_class: type) -> Dict[Any, Any]:
+    """
+    Get mapping from values and members to members of an enum.
+
+    :param enum_class: Enum class.
+
+    :return: Dictionary with values and members of the enum (as keys) and its members (as values).
+    """
+    members_lookup = _MEMBERS_LOOKUP.get(enum_class)
+    if members_lookup is None:
+        members = tuple(enum_class.__members__.values())
+        members_lookup = {member.value: member for member in members}
+        members_lookup.update({member: member for member in members})
+        _MEMBERS_LOOKUP[enum_class] = members_lookup
+    return members_lookup
+
 
 class ExtendableEnum(AEnum):  # type: ignore
-    """Enum that supports new members adding."""
+    """
+    Enum that supports new members adding.
+
+    .. note:: New members must be added with :meth:`~uds.utilities.enums.ExtendableEnum.add_member` method,
+        so members validation (:class:`~uds.utilities.enums.ValidatedEnum`) is aware of them.
+    """
 
     @classmethod
     def add_member(cls, name: str, value: Any) -> "ExtendableEnum":
@@ -39,6 +65,7 @@ class ExtendableEnum(AEnum):  # type: ignore
             if member.value == value:
                 raise ValueError(f"Value '{value}' is already in use.")
         extend_enum(cls, name, value)
+        _MEMBERS_LOOKUP.pop(cls, None)
         return cls[name]    # type: ignore
 
 
@@ -55,25 +82,36 @@ class ValidatedEnum(AEnum):  # type: ignore
         :return: True if given argument is a member or a value of this Enum, else False.
         """
         try:
-            cls.validate_member(value)
-        except ValueError:
-            return False
-        return True
+            return value in _get_members_lookup(cls)
+        except TypeError:  # unhashable values are handled by aenum
+            try:
+                cls(value)
+            except ValueError:
+                return False
+            return True
 
     @classmethod
-    def validate_member(cls, value: Any) -> "ValidatedEnum":
+    def validate_member(cls: Type[_ValidatedEnumTypeVar], value: Any) -> _ValidatedEnumTypeVar:
         """
         Validate whether given argument is a member or a value stored by this Enum.
 
         :param value: Value to validate.
 
         :raise ValueError: Provided value is not a member neither a value of this Enum.
+
+        :return: Member of this Enum.
         """
         try:
-            return cls(value)
-        except ValueError:
-            # pylint: disable=raise-missing-from
-            raise ValueError(f"Provided value is not a member of this Enum. Actual value: {value}")
+            member: _ValidatedEnumTypeVar = _get_members_lookup(cls)[value]
+            return member
+        except KeyError:
+            pass
+        except TypeError:  # unhashable values are handled by aenum
+            try:
+                return cls(value)
+            except ValueError:
+                pass
+        raise ValueError(f"Provided value is not a member of this Enum. Actual value: {value}")
 
 
 class ByteEnum(AIntEnum):  # type: ignore
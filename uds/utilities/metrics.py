@@ -0,0 +1,359 @@
+"""
+Opt-in metrics of UDS communication (e.g. measured timing parameters, negative responses, timeouts).
+
+Values are collected into streaming histograms with logarithmic buckets (similar to
+`HDR Histogram <https://hdrhistogram.github.io/HdrHistogram/>`_), so memory usage does not grow with
+the number of samples and percentiles are estimated with a bounded relative error.
+"""
+
+__all__ = ["Histogram", "HistogramSnapshot", "MetricsRegistry", "MetricsSnapshot", "export_prometheus_text"]
+
+from math import ceil, log
+from threading import Lock
+from typing import Dict, Hashable, List, Optional, Tuple, TypedDict
+
+LabelsAlias = Tuple[Tuple[str, str], ...]
+"""Alias of metric labels (sorted pairs of label name and value)."""
+MetricKeyAlias = Tuple[str, LabelsAlias]
+"""Alias of metric key (metric name and labels)."""
+
+
+def _validate_significant_digits(value: int) -> None:
+    """
+    Validate number of significant decimal digits preserved by histogram buckets.
+
+    :param value: Value to check.
+
+    :raise TypeError: Provided value is not int type.
+    :raise ValueError: Provided value is out of range.
+    """
+    if not isinstance(value, int):
+        raise TypeError(f"Provided value is not int type. Actual type: {type(value)}.")
+    if not 1 <= value <= 5:
+        raise ValueError(f"Number of significant digits must be in range 1-5. Actual value: {value}.")
+
+
+class HistogramSnapshot(TypedDict):
+    """Summary of values recorded by a histogram."""
+
+    count: int
+    sum: float  # noqa: vulture
+    min: Optional[float]
+    max: Optional[float]
+    mean: Optional[float]
+    p50: Optional[float]  # noqa: vulture
+    p90: Optional[float]  # noqa: vulture
+    p99: Optional[float]  # noqa: vulture
+
+
+class MetricsSnapshot(TypedDict):
+    """Copy of all metrics collected by a registry."""
+
+    histograms: Dict[MetricKeyAlias, HistogramSnapshot]  # noqa: vulture
+    counters: Dict[MetricKeyAlias, int]  # noqa: vulture
+
+
+class Histogram:
+    """Streaming histogram of non-negative values with logarithmic buckets."""
+
+    DEFAULT_SIGNIFICANT_DIGITS: int = 2
+    """Default number of significant decimal digits that are preserved by buckets."""
+    LOWEST_DISCERNIBLE_VALUE: float = 0.001
+    """The greatest value stored in the first bucket (1 microsecond for values in milliseconds)."""
+
+    def __init__(self, significant_digits: int = DEFAULT_SIGNIFICANT_DIGITS) -> None:
+        """
+        Create empty histogram.
+
+        :param significant_digits: Number of significant decimal digits preserved by buckets
+            (relative error of estimated values is not greater than 10^(-significant_digits)).
+
+        :raise TypeError: Provided value is not int type.
+        :raise ValueError: Provided value is out of range.
+        """
+        _validate_significant_digits(significant_digits)
+        self.__significant_digits = significant_digits
+        self.__bucket_base = 1 + 10 ** -significant_digits
+        self.__log_bucket_base = log(self.__bucket_base)
+        self.__buckets: Dict[int, int] = {}
+        self.__count = 0
+        self.__sum = 0.
+        self.__min: Optional[float] = None
+        self.__max: Optional[float] = None
+
+    @property
+    def significant_digits(self) -> int:
+        """Get number of significant decimal digits preserved by buckets."""
+        return self.__significant_digits
+
+    @property
+    def count(self) -> int:
+        """Get number of recorded values."""
+        return self.__count
+
+    @property  # noqa: vulture
+    def sum(self) -> float:
+        """Get sum of recorded values."""
+        return self.__sum
+
+    @property
+    def min(self) -> Optional[float]:
+        """Get the smallest recorded value."""
+        return self.__min
+
+    @property
+    def max(self) -> Optional[float]:
+        """Get the greatest recorded value."""
+        return self.__max
+
+    @property
+    def mean(self) -> Optional[float]:
+        """Get mean of recorded values."""
+        if self.__count == 0:
+            return None
+        return self.__sum / self.__count
+
+    def _get_bucket_index(self, value: float) -> int:
+        """
+        Get index of the bucket for a value.
+
+        :param value: Non-negative value.
+
+        :return: Index of the bucket which upper bound is the smallest one that is not less than the value.
+            Index 0 is used for values that are not greater than the lowest discernible value.
+        """
+        if value <= self.LOWEST_DISCERNIBLE_VALUE:
+            return 0
+        return ceil(log(value / self.LOWEST_DISCERNIBLE_VALUE) / self.__log_bucket_base)
+
+    def _get_bucket_upper_bound(self, index: int) -> float:
+        """
+        Get upper bound of a bucket.
+
+        :param index: Index of the bucket.
+
+        :return: The greatest value that is stored in the bucket.
+        """
+        upper_bound: float = self.LOWEST_DISCERNIBLE_VALUE * self.__bucket_base ** index
+        return upper_bound
+
+    def record(self, value: float) -> None:
+        """
+        Record a value.
+
+        :param value: Value to record.
+
+        :raise TypeError: Provided value is not int or float type.
+        :raise ValueError: Provided value is a negative number.
+        """
+        if not isinstance(value, (int, float)):
+            raise TypeError(f"Provided value is not int or float type. Actual type: {type(value)}.")
+        if value < 0:
+            raise ValueError(f"Provided value is a negative number. Actual value: {value}.")
+        index = self._get_bucket_index(value)
+        self.__buckets[index] = self.__buckets.get(index, 0) + 1
+        self.__count += 1
+        self.__sum += value
+        if self.__min is None or value < self.__min:
+            self.__min = value
+        if self.__max is None or value > self.__max:
+            self.__max = value
+
+    def percentile(self, percent: float) -> Optional[float]:
+        """
+        Estimate percentile of recorded values.
+
+        :param percent: Percent of recorded values that are not greater than the percentile.
+
+        :raise ValueError: Provided value is out of range.
+
+        :return: Estimated value of the percentile or None if no values were recorded.
+        """
+        if not 0 <= percent <= 100:
+            raise ValueError(f"Provided percent is out of range 0-100. Actual value: {percent}.")
+        if self.__min is None or self.__max is None:
+            return None
+        rank = max(1, ceil(self.__count * percent / 100.))
+        if rank == 1:
+            return self.__min
+        if rank == self.__count:
+            return self.__max
+        cumulative_count = 0
+        for index in sorted(self.__buckets):
+            cumulative_count += self.__buckets[index]
+            if cumulative_count >= rank:
+                return min(max(self._get_bucket_upper_bound(index), self.__min), self.__max)
+        return self.__max
+
+    def snapshot(self) -> HistogramSnapshot:
+        """Get summary of recorded values."""
+        return HistogramSnapshot(count=self.__count,
+                                 sum=self.__sum,
+                                 min=self.__min,
+                                 max=self.__max,
+                                 mean=self.mean,
+                                 p50=self.percentile(50),
+                                 p90=self.percentile(90),
+                                 p99=self.percentile(99))
+
+    def clear(self) -> None:
+        """Remove all recorded values."""
+        self.__buckets.clear()
+        self.__count = 0
+        self.__sum = 0.
+        self.__min = None
+        self.__max = None
+
+
+class MetricsRegistry:
+    """
+    Thread-safe storage of histograms and counters.
+
+    Metrics are identified by their name and labels (e.g. SID or ECU), so one registry can be shared by many
+    :class:`~uds.client.Client` and Transport Interface objects.
+    """
+
+    def __init__(self, significant_digits: int = Histogram.DEFAULT_SIGNIFICANT_DIGITS) -> None:
+        """
+        Create empty registry.
+
+        :param significant_digits: Number of significant decimal digits preserved by histograms.
+
+        :raise TypeError: Provided value is not int type.
+        :raise ValueError: Provided value is out of range.
+        """
+        _validate_significant_digits(significant_digits)
+        self.__significant_digits = significant_digits
+        self.__histograms: Dict[MetricKeyAlias, Histogram] = {}
+        self.__counters: Dict[MetricKeyAlias, int] = {}
+        self.__lock = Lock()
+
+    @staticmethod
+    def _get_key(name: str, labels: Dict[str, Optional[Hashable]]) -> MetricKeyAlias:
+        """
+        Get key of a metric.
+
+        :param name: Name of the metric.
+        :param labels: Labels of the metric. Labels with None values are skipped.
+
+        :raise TypeError: Provided name is not str type.
+
+        :return: Key that identifies the metric.
+        """
+        if not isinstance(name, str):
+            raise TypeError(f"Provided metric name is not str type. Actual type: {type(name)}.")
+        return name, tuple(sorted((label_name, str(label_value)) for label_name, label_value in labels.items()
+                                  if label_value is not None))
+
+    def record(self, name: str, value: float, /, **labels: Optional[Hashable]) -> None:
+        """
+        Record a value in a histogram.
+
+        :param name: Name of the histogram (e.g. `p2_client`).
+        :param value: Value to record.
+        :param labels: Labels of the histogram (e.g. `sid="0x22"`).
+            Name and value are positional-only parameters, so they do not collide with labels.
+        """
+        key = self._get_key(name=name, labels=labels)
+        with self.__lock:
+            histogram = self.__histograms.get(key, None)
+            if histogram is None:
+                histogram = self.__histograms[key] = Histogram(self.__significant_digits)
+            histogram.record(value)
+
+    def increment(self, name: str, value: int = 1, /, **labels: Optional[Hashable]) -> None:
+        """
+        Increase value of a counter.
+
+        :param name: Name of the counter (e.g. `negative_responses`).
+        :param value: Value to add.
+        :param labels: Labels of the counter (e.g. `nrc="0x31"`).
+            Name and value are positional-only parameters, so they do not collide with labels.
+
+        :raise TypeError: Provided value is not int type.
+        :raise ValueError: Provided value is a negative number.
+        """
+        if not isinstance(value, int):
+            raise TypeError(f"Provided value is not int type. Actual type: {type(value)}.")
+        if value < 0:
+            raise ValueError(f"Counters cannot be decreased. Actual value: {value}.")
+        key = self._get_key(name=name, labels=labels)
+        with self.__lock:
+            self.__counters[key] = self.__counters.get(key, 0) + value
+
+    def snapshot(self) -> MetricsSnapshot:
+        """Get copy of all collected metrics."""
+        with self.__lock:
+            return MetricsSnapshot(histograms={key: histogram.snapshot()
+                                               for key, histogram in self.__histograms.items()},
+                                   counters=dict(self.__counters))
+
+    def clear(self) -> None:
+        """Remove all collected metrics."""
+        with self.__lock:
+            self.__histograms.clear()
+            self.__counters.clear()
+
+
+def _escape_label_value(value: str) -> str:
+    """
+    Escape label value according to Prometheus text format.
+
+    :param value: Label value to escape.
+
+    :return: Label value with escaped backslashes, double quotes and line feeds.
+    """
+    return value.replace("\\", "\\\\").replace("\"", "\\\"").replace("\n", "\\n")
+
+
+def _render_labels(labels: LabelsAlias, **extra_labels: str) -> str:
+    """
+    Render labels of a metric sample in Prometheus text format.
+
+    :param labels: Labels of the metric.
+    :param extra_labels: Additional labels of the sample (e.g. quantile).
+
+    :return: Labels inside curly brackets or empty string if there are no labels.
+    """
+    all_labels = labels + tuple(extra_labels.items())
+    if not all_labels:
+        return ""
+    rendered_labels = ",".join(f'{name}="{_escape_label_value(value)}"' for name, value in all_labels)
+    return f"{{{rendered_labels}}}"
+
+
+def export_prometheus_text(snapshot: MetricsSnapshot, namespace: str = "uds") -> str:
+    """
+    Render metrics in `Prometheus text format <https://prometheus.io/docs/instrumenting/exposition_formats/>`_.
+
+    Histograms are rendered as summaries (0.5, 0.9 and 0.99 quantiles with sum and count).
+
+    :param snapshot: Metrics to render (e.g. result of :meth:`~uds.utilities.metrics.MetricsRegistry.snapshot`).
+    :param namespace: Prefix of all metric names.
+
+    :return: Metrics in Prometheus text format.
+    """
+    lines: List[str] = []
+    histograms_by_name: Dict[str, List[Tuple[LabelsAlias, HistogramSnapshot]]] = {}
+    for (name, labels), histogram_snapshot in snapshot["histograms"].items():
+        histograms_by_name.setdefault(name, []).append((labels, histogram_snapshot))
+    for name in sorted(histograms_by_name):
+        metric_name = f"{namespace}_{name}_milliseconds"
+        lines.append(f"# TYPE {metric_name} summary")
+        for labels, histogram_snapshot in sorted(histograms_by_name[name]):
+            for quantile, value in (("0.5", histogram_snapshot["p50"]),
+                                    ("0.9", histogram_snapshot["p90"]),
+                                    ("0.99", histogram_snapshot["p99"])):
+                rendered_value = "NaN" if value is None else repr(float(value))
+                lines.append(f"{metric_name}{_render_labels(labels, quantile=quantile)} {rendered_value}")
+            lines.append(f"{metric_name}_sum{_render_labels(labels)} {float(histogram_snapshot['sum'])!r}")
+            lines.append(f"{metric_name}_count{_render_labels(labels)} {histogram_snapshot['count']}")
+    counters_by_name: Dict[str, List[Tuple[LabelsAlias, int]]] = {}
+    for (name, labels), counter_value in snapshot["counters"].items():
+        counters_by_name.setdefault(name, []).append((labels, counter_value))
+    for name in sorted(counters_by_name):
+        metric_name = f"{namespace}_{name}_total"
+        lines.append(f"# TYPE {metric_name} counter")
+        for labels, counter_value in sorted(counters_by_name[name]):
+            lines.append(f"{metric_name}{_render_labels(labels)} {counter_value}")
+    return "".join(f"{line}\n" for line in lines)
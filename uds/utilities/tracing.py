@@ -0,0 +1,227 @@
+"""
+Opt-in profiling of UDS communication with spans (timed sections of code execution).
+
+Spans are emitted to hooks (callbacks) registered in :data:`~uds.utilities.tracing.TRACING_HOOKS`.
+When no hook is registered, traced functions are called directly, so tracing costs (almost) nothing.
+"""
+
+__all__ = ["Span", "SpanHookAlias", "TracingHooks", "TRACING_HOOKS", "SpansRecorder", "export_chrome_trace"]
+
+from contextlib import contextmanager, nullcontext
+from functools import wraps
+from inspect import iscoroutinefunction
+from json import dump
+from os import getpid
+from threading import Lock, get_ident
+from time import perf_counter_ns
+from typing import Any, Callable, ContextManager, Dict, Iterable, Iterator, List, Optional, Tuple, TypedDict, TypeVar
+
+_FunctionTypeVar = TypeVar("_FunctionTypeVar", bound=Callable[..., Any])
+
+
+class Span(TypedDict):
+    """Information about a timed section of code execution."""
+
+    name: str
+    category: str
+    start_ns: int
+    end_ns: int  # noqa: vulture
+    thread_id: int  # noqa: vulture
+    attributes: Dict[str, Any]
+
+
+SpanHookAlias = Callable[[Span], None]
+"""Alias of a callback that is called with every finished span."""
+
+
+class TracingHooks:
+    """
+    Thread-safe registry of hooks that receive spans.
+
+    Timestamps of spans are monotonic (:func:`time.perf_counter_ns`) values in nanoseconds.
+    """
+
+    def __init__(self) -> None:
+        """Create registry without hooks."""
+        self.__hooks: Tuple[SpanHookAlias, ...] = ()
+        self.__lock = Lock()
+
+    @property  # noqa: vulture
+    def hooks(self) -> Tuple[SpanHookAlias, ...]:
+        """Get registered hooks."""
+        return self.__hooks
+
+    @property  # noqa: vulture
+    def enabled(self) -> bool:
+        """Get flag whether spans are emitted (at least one hook is registered)."""
+        return bool(self.__hooks)
+
+    def add_hook(self, hook: SpanHookAlias) -> None:
+        """
+        Register a hook.
+
+        :param hook: Callable to call with every finished span.
+
+        :raise TypeError: Provided value is not callable.
+        :raise ValueError: Provided hook is already registered.
+        """
+        if not callable(hook):
+            raise TypeError(f"Provided value is not callable. Actual type: {type(hook)}.")
+        with self.__lock:
+            if hook in self.__hooks:
+                raise ValueError("Provided hook is already registered.")
+            self.__hooks = (*self.__hooks, hook)
+
+    def remove_hook(self, hook: SpanHookAlias) -> None:
+        """
+        Unregister a hook.
+
+        :param hook: Hook to remove.
+
+        :raise ValueError: Provided hook is not registered.
+        """
+        with self.__lock:
+            if hook not in self.__hooks:
+                raise ValueError("Provided hook is not registered.")
+            self.__hooks = tuple(registered_hook for registered_hook in self.__hooks if registered_hook != hook)
+
+    def clear(self) -> None:
+        """Unregister all hooks."""
+        with self.__lock:
+            self.__hooks = ()
+
+    def emit(self, span: Span) -> None:
+        """
+        Pass a finished span to all registered hooks.
+
+        :param span: Span to emit.
+        """
+        for hook in self.__hooks:
+            hook(span)
+
+    @contextmanager
+    def __span(self, name: str, category: str, attributes: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+        """
+        Measure execution of the code inside the context and emit it as a span.
+
+        :param name: Name of the span.
+        :param category: Category of the span.
+        :param attributes: Additional information about the span.
+
+        :return: Attributes of the span (they can be updated inside the context).
+        """
+        start_ns = perf_counter_ns()
+        try:
+            yield attributes
+        except BaseException as exception:
+            attributes["exception"] = type(exception).__name__
+            raise
+        finally:
+            self.emit(Span(name=name,
+                           category=category,
+                           start_ns=start_ns,
+                           end_ns=perf_counter_ns(),
+                           thread_id=get_ident(),
+                           attributes=attributes))
+
+    def span(self, name: str, category: str, **attributes: Any) -> ContextManager[Optional[Dict[str, Any]]]:
+        """
+        Get context manager that measures execution of the code inside the context.
+
+        :param name: Name of the span.
+        :param category: Category of the span (e.g. `transport`).
+        :param attributes: Additional information about the span.
+
+        :return: Context manager that emits a span on exit. It provides attributes of the span
+            (or None when no hook is registered).
+        """
+        if not self.__hooks:
+            return nullcontext()
+        return self.__span(name=name, category=category, attributes=attributes)
+
+    def traced(self, category: str, name: Optional[str] = None) -> Callable[[_FunctionTypeVar], _FunctionTypeVar]:
+        """
+        Get decorator that emits a span for each call of the decorated function (either sync or async).
+
+        :param category: Category of the spans.
+        :param name: Name of the spans.
+            Leave None to use qualified name of the decorated function.
+
+        :return: Function decorator.
+        """
+        def decorator(function: _FunctionTypeVar) -> _FunctionTypeVar:
+            span_name = function.__qualname__ if name is None else name
+            if iscoroutinefunction(function):
+                @wraps(function)
+                async def traced_function(*args: Any, **kwargs: Any) -> Any:
+                    if not self.__hooks:
+                        return await function(*args, **kwargs)
+                    with self.__span(name=span_name, category=category, attributes={"async": True}):
+                        return await function(*args, **kwargs)
+            else:
+                @wraps(function)
+                def traced_function(*args: Any, **kwargs: Any) -> Any:
+                    if not self.__hooks:
+                        return function(*args, **kwargs)
+                    with self.__span(name=span_name, category=category, attributes={}):
+                        return function(*args, **kwargs)
+            return traced_function  # type: ignore
+        return decorator
+
+
+TRACING_HOOKS = TracingHooks()
+"""Registry of hooks that receive spans emitted by the package."""
+
+
+class SpansRecorder:
+    """Hook that stores all received spans."""
+
+    def __init__(self) -> None:
+        """Create recorder without spans."""
+        self.__spans: List[Span] = []
+        self.__lock = Lock()
+
+    def __call__(self, span: Span) -> None:
+        """
+        Store a span.
+
+        :param span: Span to store.
+        """
+        with self.__lock:
+            self.__spans.append(span)
+
+    @property
+    def spans(self) -> Tuple[Span, ...]:
+        """Get stored spans in the order of finishing."""
+        with self.__lock:
+            return tuple(self.__spans)
+
+    def clear(self) -> None:
+        """Remove all stored spans."""
+        with self.__lock:
+            self.__spans.clear()
+
+
+def export_chrome_trace(spans: Iterable[Span], file_path: str) -> None:
+    """
+    Save spans in Trace Event Format.
+
+    The format is described in `Trace Event Format
+    <https://docs.google.com/document/d/1CvAClvFfyA5R-PhYUmn5OOQtYMH4h6I0nSsKchNAySU>`_ document.
+    Saved file can be opened with `Perfetto UI <https://ui.perfetto.dev>`_ or `chrome://tracing` in Chrome browser.
+
+    :param spans: Spans to save.
+    :param file_path: Path to the JSON file to create.
+    """
+    process_id = getpid()
+    trace_events = [{"name": span["name"],
+                     "cat": span["category"],
+                     "ph": "X",
+                     "ts": span["start_ns"] / 1000.,
+                     "dur": (span["end_ns"] - span["start_ns"]) / 1000.,
+                     "pid": process_id,
+                     "tid": span["thread_id"],
+                     "args": span["attributes"]}
+                    for span in spans]
+    with open(file_path, "w", encoding="utf-8") as file:
+        dump({"traceEvents": trace_events, "displayTimeUnit": "ms"}, file, default=str)